@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark the compact game encoding (notation.move_codec).
+
+Encodes every game of tests/data/replay_corpus.jsonl (or freshly generated
+random or engine self-play games) and reports bytes per game for the codec,
+the move_history dicts as JSON and coordinate text, plus encode and decode
+throughput. The information content of the moves under the fitted rank
+table is compared with the uniform model (log2 of the number of legal moves
+per ply); the difference is what the table gains, before the codec's few
+bytes of framing per game.
+
+--fit plays engine self-play games, fits a rank frequency table on them and
+prints it in the RANK_RUNS format of notation/move_codec.py.
+
+Usage:
+    python3 benchmarks/bench_move_codec.py --repeat 3
+    python3 benchmarks/bench_move_codec.py --games 2000 --seed 5
+    python3 benchmarks/bench_move_codec.py --engine 20 --seed 100
+    python3 benchmarks/bench_move_codec.py --fit 60
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from engine.tournament import play_game
+from game.game_session import GameSession
+from notation.archive import move_name, random_games, read_jsonl, replay_game
+from notation.move_codec import (
+    CUMULATIVE, RANK_FREQUENCIES, decode_moves, encode_history, encode_moves, fit_rank_table, move_ranks,
+)
+
+CORPUS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'replay_corpus.jsonl'))
+
+
+def random_histories(count, seed, max_plies):
+    """Move histories of random self-play games."""
+    return [replay_game(game)[0].move_history for game in random_games(count, seed, max_plies)]
+
+
+def engine_histories(count, seed, max_plies, depth=2):
+    """Move histories of engine self-play games (a fixed-depth search on both sides)."""
+    player = {'name': 'search', 'kind': 'search', 'depth': depth}
+    histories = []
+    for index in range(count):
+        moves, _, _ = play_game(player, player, max_plies, seed=seed + 2 * index)
+        session = GameSession()
+        for start, end in moves:
+            session.submit_move(start, end)
+        histories.append(session.move_history)
+    return histories
+
+
+def best_time(function, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Move codec benchmark")
+    parser.add_argument('--games', type=int, help="generate this many random games instead of using the corpus")
+    parser.add_argument('--engine', type=int, metavar='GAMES', help="play this many engine games instead")
+    parser.add_argument('--fit', type=int, metavar='GAMES', help="fit the rank table on this many engine games")
+    parser.add_argument('--seed', type=int, default=1, help="seed for generated games")
+    parser.add_argument('--max-plies', type=int, default=200, help="ply limit per generated game")
+    parser.add_argument('--repeat', type=int, default=3, help="timed passes (best is reported)")
+    args = parser.parse_args(argv)
+
+    if args.fit:
+        histories = engine_histories(args.fit, args.seed, args.max_plies)
+        ranks = [rank for history in histories
+                 for rank in move_ranks([(move['start'], move['end']) for move in history])]
+        print(f"RANK_RUNS = {fit_rank_table(ranks)}")
+        return
+    if args.engine:
+        histories = engine_histories(args.engine, args.seed, args.max_plies)
+    elif args.games:
+        histories = random_histories(args.games, args.seed, args.max_plies)
+    else:
+        histories = [replay_game(game)[0].move_history for game in read_jsonl(CORPUS_PATH)]
+    moves = [[(move['start'], move['end']) for move in history] for history in histories]
+    games = len(histories)
+    plies = sum(len(history) for history in histories)
+
+    encode_time, encoded = best_time(lambda: [encode_moves(game) for game in moves], args.repeat)
+    decode_time, decoded = best_time(lambda: [decode_moves(data) for data in encoded], args.repeat)
+    if decoded != moves or [encode_history(history) for history in histories] != encoded:
+        raise SystemExit("Decoded games differ from the originals")
+
+    ranks = [rank for game in moves for rank in move_ranks(game)]
+    table = sum(math.log2(CUMULATIVE[count] / RANK_FREQUENCIES[rank]) for rank, count in ranks) / 8
+    uniform = sum(math.log2(count) for _, count in ranks) / 8
+    sizes = [
+        ('move codec', sum(len(data) for data in encoded)),
+        ('rank table', table),
+        ('uniform', uniform),
+        ('history JSON', sum(len(json.dumps(history)) for history in histories)),
+        ('coordinates', sum(len(' '.join(map(move_name, game))) for game in moves)),
+    ]
+    print(f"{games} games, {plies} plies")
+    for name, size in sizes:
+        print(f"{name:<13} {size / games:>9.1f} bytes/game  {size * 8 / plies:>7.2f} bits/ply")
+    print(f"rank table gain over the uniform model: {1 - table / uniform:+.1%}")
+    print(f"encode        {encode_time:.3f}s  {plies / encode_time:>10,.0f} plies/s")
+    print(f"decode        {decode_time:.3f}s  {plies / decode_time:>10,.0f} plies/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark move-notation parsing.
+
+Parses a generated log of coordinate and numeric moves with
+notation.move_parser.parse_moves and with a copy of the previous
+multi-pass InputHandler parser, and reports moves parsed per second for
+both. A SAN game replayed through parse_moves is timed separately, since
+SAN has to be resolved against the position.
+
+Usage:
+    python3 benchmarks/bench_move_parser.py --moves 200000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from notation.move_parser import parse_moves
+from notation.san import PGN_SQUARES
+from pieces.piece_codes import WHITE
+from utils.position import algebraic_to_index, index_to_algebraic, is_valid_position, parse_numeric_position
+
+SAN_GAME = ('e4 e5 Nf3 Nc6 Bb5 a6 Ba4 Nf6 Nc3 Be7 d3 b5 Bb3 d6 a3 Bg4 '
+            'h3 Bh5 g4 Bg6 Nh4 Nd4 Nxg6 hxg6 Be3 c5').split()
+
+
+def legacy_parse_move(move_input):
+    """The parser InputHandler used before the single-pass parser."""
+    move_input = move_input.strip().lower()
+    if ' ' in move_input:
+        parts = move_input.split()
+        if len(parts) == 2:
+            return legacy_parse_positions(parts[0], parts[1])
+    if ',' in move_input:
+        parts = move_input.split(',')
+        if len(parts) == 4:
+            start_pos = parse_numeric_position(f"{parts[0]},{parts[1]}")
+            end_pos = parse_numeric_position(f"{parts[2]},{parts[3]}")
+            if start_pos and end_pos:
+                return start_pos, end_pos
+        elif len(parts) == 2:
+            return legacy_parse_positions(parts[0], parts[1])
+    return None, None
+
+
+def legacy_parse_positions(start_str, end_str):
+    start_str = start_str.strip()
+    end_str = end_str.strip()
+    if is_valid_position(start_str) and is_valid_position(end_str):
+        start_pos = algebraic_to_index(start_str)
+        end_pos = algebraic_to_index(end_str)
+        if start_pos and end_pos:
+            return start_pos, end_pos
+    if ',' in start_str and ',' in end_str:
+        start_pos = parse_numeric_position(start_str)
+        end_pos = parse_numeric_position(end_str)
+        if start_pos and end_pos:
+            return start_pos, end_pos
+    return None, None
+
+
+def move_log(count, seed=1):
+    """Return a list of random move lines in the formats both parsers accept."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        start = rng.randrange(8), rng.randrange(8)
+        end = rng.randrange(8), rng.randrange(8)
+        style = rng.randrange(4)
+        if style == 0:
+            lines.append(f"{index_to_algebraic(*start)} {index_to_algebraic(*end)}\n")
+        elif style == 1:
+            lines.append(f"{index_to_algebraic(*start)},{index_to_algebraic(*end)}\n")
+        elif style == 2:
+            lines.append(f"{start[0]},{start[1]} {end[0]},{end[1]}\n")
+        else:
+            lines.append(f"{start[0]},{start[1]},{end[0]},{end[1]}\n")
+    return lines
+
+
+def best_time(function, repeat):
+    """Return the fastest of several runs of function() in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Move parser benchmark")
+    parser.add_argument('--moves', type=int, default=100000, help="moves in the generated log")
+    parser.add_argument('--repeat', type=int, default=3, help="timed passes (best one is reported)")
+    args = parser.parse_args(argv)
+
+    lines = move_log(args.moves)
+    if list(parse_moves(lines)) != [legacy_parse_move(line) for line in lines]:
+        raise SystemExit("Parsers disagree on the generated log")
+
+    legacy_seconds = best_time(lambda: [legacy_parse_move(line) for line in lines], args.repeat)
+    seconds = best_time(lambda: list(parse_moves(lines)), args.repeat)
+    board = ChessBoard().board
+    san_seconds = best_time(lambda: list(parse_moves(SAN_GAME, board, WHITE, PGN_SQUARES)), args.repeat)
+
+    print(f"{'parser':<22} {'moves':>8} {'seconds':>8} {'moves/s':>10}")
+    print(f"{'legacy InputHandler':<22} {len(lines):>8} {legacy_seconds:>8.3f} {len(lines) / legacy_seconds:>10.0f}")
+    print(f"{'parse_moves':<22} {len(lines):>8} {seconds:>8.3f} {len(lines) / seconds:>10.0f}")
+    print(f"{'parse_moves (SAN)':<22} {len(SAN_GAME):>8} {san_seconds:>8.3f} {len(SAN_GAME) / san_seconds:>10.0f}")
+    print(f"speedup: {legacy_seconds / seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
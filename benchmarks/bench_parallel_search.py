@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark Lazy SMP scaling.
+
+Runs the parallel search from the starting position with 1..N workers and
+reports nodes per second and the wall-clock time at which each depth was
+first completed by any worker.
+
+Usage:
+    python3 benchmarks/bench_parallel_search.py --workers 4 --time 5
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from engine.parallel_search import parallel_search
+from pieces.piece_codes import WHITE
+
+
+def run(workers, time_limit, max_depth):
+    """Search once with a worker count; return (result, {depth: seconds})."""
+    started = time.monotonic()
+    depth_times = {}
+
+    def record(worker_id, result):
+        depth_times.setdefault(result.depth, time.monotonic() - started)
+
+    result = parallel_search(ChessBoard(), WHITE, workers=workers, time_limit=time_limit,
+                             max_depth=max_depth, on_iteration=record)
+    return result, depth_times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lazy SMP scaling benchmark")
+    parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count(),
+                        help="highest worker count to try")
+    parser.add_argument('--time', type=float, default=5.0, help="seconds per search")
+    parser.add_argument('--depth', type=int, default=64, help="maximum depth")
+    args = parser.parse_args(argv)
+
+    baseline_nps = None
+    print(f"{'workers':>7} {'depth':>5} {'nodes':>10} {'nodes/s':>10} {'speedup':>8}  time to depth (s)")
+    for workers in range(1, args.workers + 1):
+        result, depth_times = run(workers, args.time, args.depth)
+        nps = result.nodes / result.elapsed if result.elapsed else 0.0
+        baseline_nps = baseline_nps or nps
+        timeline = ' '.join(f"d{depth}={seconds:.2f}" for depth, seconds in sorted(depth_times.items()))
+        print(f"{workers:>7} {result.depth:>5} {result.nodes:>10} {nps:>10.0f} "
+              f"{nps / baseline_nps if baseline_nps else 0:>8.2f}  {timeline}")
+
+
+if __name__ == "__main__":
+    main()
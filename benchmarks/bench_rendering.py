@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark board rendering.
+
+Plays random games and renders every position into an in-memory stream
+with the previous print-based ChessBoard.render and with each
+BoardRenderer mode, reporting frames per second and bytes per frame.
+
+Usage:
+    python3 benchmarks/bench_rendering.py --frames 5000
+"""
+
+import argparse
+import io
+import os
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.board_renderer import RENDER_MODES, BoardRenderer
+from board.chess_board import ChessBoard
+from moves.move_generator import generate_moves
+from pieces.piece_codes import symbol_of
+
+
+def legacy_render(board):
+    """ChessBoard.render before buffered rendering."""
+    print("\n  a b c d e f g h")
+    print("  " + "-" * 15)
+    for i, row in enumerate(board):
+        row_str = f"{8 - i}|"
+        for code in row:
+            row_str += symbol_of(code) or '.'
+            row_str += ' '
+        print(row_str + f"|{8 - i}")
+    print("  " + "-" * 15)
+    print("  a b c d e f g h\n")
+
+
+def game_positions(count, seed=1):
+    """Return successive positions of random games."""
+    rng = random.Random(seed)
+    positions = []
+    board, side = ChessBoard(), 0
+    while len(positions) < count:
+        positions.append([row[:] for row in board.board])
+        moves = generate_moves(board.board, side)
+        board.move_piece(*rng.choice(moves))
+        if board.is_king_captured(side ^ 1):
+            board, side = ChessBoard(), 0
+        else:
+            side ^= 1
+    return positions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Board rendering benchmark")
+    parser.add_argument('--frames', type=int, default=5000, help="positions to render")
+    args = parser.parse_args(argv)
+
+    positions = game_positions(args.frames)
+    print(f"{'renderer':<16} {'frames/s':>10} {'bytes/frame':>12}")
+
+    stream = io.StringIO()
+    started = time.perf_counter()
+    with redirect_stdout(stream):
+        for board in positions:
+            legacy_render(board)
+    elapsed = time.perf_counter() - started
+    print(f"{'legacy print':<16} {len(positions) / elapsed:>10.0f} {stream.tell() / len(positions):>12.1f}")
+
+    for mode in RENDER_MODES:
+        stream = io.StringIO()
+        renderer = BoardRenderer(mode, stream)
+        started = time.perf_counter()
+        for board in positions:
+            renderer.render(board)
+        elapsed = time.perf_counter() - started
+        print(f"{mode:<16} {len(positions) / elapsed:>10.0f} {stream.tell() / len(positions):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Replay benchmark over the stored game corpus.
+
+Replays tests/data/replay_corpus.jsonl through ChessBoard.validate_move and
+move_piece, checks every final position hash and reports plies per second.
+The throughput relative to a calibration loop (game.replay.calibrate) is
+compared with the baseline in tests/data/replay_baseline.json, which the
+throughput test in tests/test_replay.py also reads.
+
+Usage:
+    python3 benchmarks/bench_replay.py --repeat 5
+    python3 benchmarks/bench_replay.py --update-baseline
+    python3 benchmarks/bench_replay.py --generate 120 --seed 2024
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from game.replay import calibrate, decode_moves, final_hash, load_corpus, relative_throughput, replay_corpus
+from notation.archive import ArchiveGame, random_games, write_archive
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'tests', 'data'))
+CORPUS_PATH = os.path.join(DATA_DIR, 'replay_corpus.jsonl')
+BASELINE_PATH = os.path.join(DATA_DIR, 'replay_baseline.json')
+
+
+def generate_corpus(path, count, seed, max_plies):
+    """Record seeded self-play games (random legal moves) with their final hashes."""
+    games = []
+    for index, game in enumerate(random_games(count, seed, max_plies)):
+        tags = {'seed': seed, 'game': index, 'final_hash': f"{final_hash(decode_moves(game.moves)):016x}"}
+        games.append(ArchiveGame(game.moves, game.result, tags))
+    write_archive(path, games)
+    return games
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay throughput benchmark")
+    parser.add_argument('--repeat', type=int, default=5, help="timed passes (best is reported)")
+    parser.add_argument('--update-baseline', action='store_true', help="store the measured throughput")
+    parser.add_argument('--generate', type=int, metavar='GAMES', help="rewrite the corpus with this many games")
+    parser.add_argument('--seed', type=int, default=2024, help="seed for --generate")
+    parser.add_argument('--max-plies', type=int, default=200, help="ply limit per game for --generate")
+    args = parser.parse_args(argv)
+
+    if args.generate:
+        games = generate_corpus(CORPUS_PATH, args.generate, args.seed, args.max_plies)
+        print(f"Wrote {len(games)} games ({sum(len(game.moves) for game in games)} plies) to {CORPUS_PATH}")
+
+    calibration = calibrate(args.repeat)
+    report = replay_corpus(load_corpus(CORPUS_PATH), args.repeat)
+    rate = report.plies / report.elapsed
+    relative = relative_throughput(report, calibration)
+    print(f"{report.games} games, {report.plies} plies in {report.elapsed:.3f}s: {rate:,.0f} plies/s "
+          f"({relative:.3f} plies per calibration round)")
+    if report.mismatches:
+        print(f"Final position mismatches in games {report.mismatches}")
+        return 1
+
+    if args.update_baseline:
+        with open(BASELINE_PATH, 'w') as handle:
+            json.dump({'relative_throughput': round(relative, 4), 'plies_per_second': round(rate),
+                       'calibration_per_second': round(calibration), 'games': report.games,
+                       'plies': report.plies}, handle, indent=2)
+            handle.write("\n")
+        print(f"Baseline written to {BASELINE_PATH}")
+    elif os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as handle:
+            baseline = json.load(handle)['relative_throughput']
+        print(f"Baseline {baseline:.3f} plies per calibration round ({relative / baseline:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark sliding-piece attack sets.
+
+Computes the full attack set of every rook, bishop and queen in a set of
+random-game positions three ways: magic-bitboard lookups (moves.magic), the
+move generator's precomputed rays (move_generator.SLIDER_RAYS), and
+is_path_clear on every aligned target square (how Rook, Bishop and Queen
+validate a single move). Reports the best of several passes.
+
+Usage:
+    python3 benchmarks/bench_slider_attacks.py --positions 500 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from moves.magic import load_tables, occupancy
+from moves.move_generator import SLIDER_RAYS, generate_moves
+from pieces.bishop import Bishop
+from pieces.piece_codes import BISHOP, QUEEN, ROOK, TYPE_MASK
+from pieces.queen import Queen
+from pieces.rook import Rook
+
+SLIDERS = (BISHOP, ROOK, QUEEN)
+
+
+def sample_positions(count, seed):
+    """Positions (board, slider squares) from random games."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        board = ChessBoard()
+        side = 0
+        for _ in range(80):
+            moves = generate_moves(board.board, side)
+            if not moves or board.is_king_captured('white') or board.is_king_captured('black'):
+                break
+            grid = [row[:] for row in board.board]
+            sliders = [(row, col) for row in range(8) for col in range(8) if grid[row][col] & TYPE_MASK in SLIDERS]
+            positions.append((grid, sliders))
+            board.move_piece(*rng.choice(moves))
+            side ^= 1
+    return positions[:count]
+
+
+def with_magic(positions, rook, bishop):
+    total = 0
+    for grid, sliders in positions:
+        occupied = occupancy(grid)
+        for row, col in sliders:
+            square = row * 8 + col
+            kind = grid[row][col] & TYPE_MASK
+            attacks = 0
+            if kind != BISHOP:
+                attacks = rook.attacks(square, occupied)
+            if kind != ROOK:
+                attacks |= bishop.attacks(square, occupied)
+            total += bin(attacks).count('1')
+    return total
+
+
+def with_rays(positions):
+    total = 0
+    for grid, sliders in positions:
+        for start in sliders:
+            for ray in SLIDER_RAYS[grid[start[0]][start[1]] & TYPE_MASK][start]:
+                for row, col in ray:
+                    total += 1
+                    if grid[row][col]:
+                        break
+    return total
+
+
+def with_path_clear(positions, pieces):
+    total = 0
+    for grid, sliders in positions:
+        for start in sliders:
+            piece = pieces[grid[start[0]][start[1]] & TYPE_MASK]
+            for row in range(8):
+                for col in range(8):
+                    if (row, col) != start and piece.is_valid_move(start, (row, col), grid):
+                        total += 1
+    return total
+
+
+def best_time(function, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sliding attack benchmark")
+    parser.add_argument('--positions', type=int, default=500, help="positions to sample")
+    parser.add_argument('--repeat', type=int, default=5, help="timed passes (best is reported)")
+    parser.add_argument('--seed', type=int, default=1, help="seed for the random games")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    rook, bishop = load_tables()
+    print(f"Loaded magic tables in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    positions = sample_positions(args.positions, args.seed)
+    sets = sum(len(sliders) for _, sliders in positions)
+    pieces = {ROOK: Rook('white'), BISHOP: Bishop('white'), QUEEN: Queen('white')}
+    results = [
+        ('magic lookup', best_time(lambda: with_magic(positions, rook, bishop), args.repeat)),
+        ('ray tables', best_time(lambda: with_rays(positions), args.repeat)),
+        ('is_path_clear', best_time(lambda: with_path_clear(positions, pieces), args.repeat)),
+    ]
+    counts = {total for _, (_, total) in results}
+    if len(counts) != 1:
+        raise SystemExit(f"Attack counts differ: {results}")
+    print(f"{len(positions)} positions, {sets} attack sets, {counts.pop()} attacked squares")
+    for name, (elapsed, _) in results:
+        print(f"{name:<14} {elapsed:.4f}s  {sets / elapsed:>12,.0f} sets/s")
+
+
+if __name__ == "__main__":
+    main()
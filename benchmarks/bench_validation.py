@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Benchmark move validation with integer piece codes.
+
+Validates every (start, end) pair of a set of positions with the current
+ChessBoard.validate_move and with a copy of the previous string-based
+implementation (symbols on the board, color checks through isupper() and
+'white'/'black' comparisons), and reports the best of several passes as
+validations per second for both.
+
+Usage:
+    python3 benchmarks/bench_validation.py --repeat 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from moves.move_generator import generate_moves
+from pieces.bishop import Bishop
+from pieces.king import King
+from pieces.knight import Knight
+from pieces.piece import Piece
+from pieces.piece_codes import COLOR_NAMES, symbol_of
+from pieces.queen import Queen
+from pieces.rook import Rook
+
+
+class LegacyPawn(Piece):
+    """Pawn rules as written before integer codes (string board)."""
+
+    def __init__(self, color):
+        super().__init__(color, 'P' if color == 'white' else 'p')
+
+    def is_valid_move(self, start, end, board):
+        start_row, start_col = start
+        end_row, end_col = end
+        direction = 1 if self.color == 'white' else -1
+        start_rank = 1 if self.color == 'white' else 6
+        if start_col == end_col and end_row == start_row + direction:
+            return board[end_row][end_col] is None
+        if start_col == end_col and start_row == start_rank and end_row == start_row + 2 * direction:
+            middle_row = start_row + direction
+            return board[middle_row][end_col] is None and board[end_row][end_col] is None
+        if abs(end_col - start_col) == 1 and end_row == start_row + direction:
+            target = board[end_row][end_col]
+            if target is not None:
+                target_color = 'white' if target.isupper() else 'black'
+                return target_color != self.color
+        return False
+
+
+class LegacyBoard:
+    """The string-symbol board and validate_move before integer codes."""
+
+    def __init__(self, board):
+        self.board = [[symbol_of(code) for code in row] for row in board]
+        pieces = [LegacyPawn('white'), LegacyPawn('black')]
+        for cls in (Rook, Knight, Bishop, Queen, King):
+            pieces += [cls('white'), cls('black')]
+        self.piece_map = {piece.symbol: piece for piece in pieces}
+
+    def get_piece(self, position):
+        row, col = position
+        return self.board[row][col]
+
+    def is_position_valid(self, position):
+        row, col = position
+        return 0 <= row < 8 and 0 <= col < 8
+
+    def get_piece_color(self, symbol):
+        if symbol is None:
+            return None
+        return 'white' if symbol.isupper() else 'black'
+
+    def validate_move(self, start, end, current_player):
+        if not self.is_position_valid(start):
+            return False, "Starting position is out of bounds"
+        if not self.is_position_valid(end):
+            return False, "Ending position is out of bounds"
+        piece_symbol = self.get_piece(start)
+        if piece_symbol is None:
+            return False, "No piece at starting position"
+        piece_color = self.get_piece_color(piece_symbol)
+        if piece_color != current_player:
+            return False, f"That piece belongs to {piece_color}, not {current_player}"
+        target_symbol = self.get_piece(end)
+        if target_symbol is not None:
+            target_color = self.get_piece_color(target_symbol)
+            if target_color == current_player:
+                return False, "Cannot capture your own piece"
+        piece = self.piece_map.get(piece_symbol)
+        if piece and not piece.is_valid_move(start, end, self.board):
+            return False, f"Invalid move for {piece_symbol}"
+        return True, ""
+
+
+def sample_positions(count, seed=1):
+    """Return (board, side) pairs from random games out of the start position."""
+    rng = random.Random(seed)
+    positions = []
+    board = ChessBoard()
+    side = 0
+    while len(positions) < count:
+        positions.append(([row[:] for row in board.board], side))
+        moves = generate_moves(board.board, side)
+        if not moves or len(positions) % 30 == 0:
+            board, side = ChessBoard(), 0
+            continue
+        board.move_piece(*rng.choice(moves))
+        if board.is_king_captured(side ^ 1):
+            board, side = ChessBoard(), 0
+            continue
+        side ^= 1
+    return positions
+
+
+def time_validation(boards, squares):
+    """Validate every square pair on every board; return (validations, seconds)."""
+    started = time.perf_counter()
+    for board, player in boards:
+        validate = board.validate_move
+        for start in squares:
+            for end in squares:
+                validate(start, end, player)
+    return len(boards) * len(squares) ** 2, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Move validation benchmark")
+    parser.add_argument('--positions', type=int, default=20, help="positions to validate")
+    parser.add_argument('--repeat', type=int, default=3, help="timed passes (best one is reported)")
+    args = parser.parse_args(argv)
+
+    squares = [(row, col) for row in range(8) for col in range(8)]
+    positions = sample_positions(args.positions)
+
+    current = []
+    legacy = []
+    for grid, side in positions:
+        board = ChessBoard()
+        board.board = grid
+        current.append((board, side))
+        legacy.append((LegacyBoard(grid), COLOR_NAMES[side]))
+
+    for (board, side), (old, color) in zip(current, legacy):
+        for start in squares:
+            for end in squares:
+                if board.validate_move(start, end, side)[0] != old.validate_move(start, end, color)[0]:
+                    raise SystemExit(f"Validation mismatch for {start} -> {end}")
+
+    legacy_seconds = seconds = float('inf')
+    for _ in range(args.repeat):
+        legacy_calls, elapsed = time_validation(legacy, squares)
+        legacy_seconds = min(legacy_seconds, elapsed)
+        calls, elapsed = time_validation(current, squares)
+        seconds = min(seconds, elapsed)
+    legacy_rate = legacy_calls / legacy_seconds
+    rate = calls / seconds
+    print(f"{'implementation':<16} {'validations':>12} {'seconds':>8} {'per second':>12}")
+    print(f"{'string symbols':<16} {legacy_calls:>12} {legacy_seconds:>8.3f} {legacy_rate:>12.0f}")
+    print(f"{'integer codes':<16} {calls:>12} {seconds:>8.3f} {rate:>12.0f}")
+    print(f"speedup: {rate / legacy_rate:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
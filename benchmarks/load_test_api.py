@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Local load test for the HTTP API.
+
+Starts the API on a local port in a background thread and runs client
+threads that each play random games (create, list legal moves, submit a
+move, fetch the FEN) for a fixed duration. Reports requests per second and
+latency percentiles per endpoint.
+
+Usage (needs Flask from requirements.txt):
+    python3 benchmarks/load_test_api.py --clients 8 --seconds 10
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from server.session_store import SessionStore
+
+
+def call(base, method, path, body=None):
+    """Send one request; return the decoded JSON body (or None)."""
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(base + path, data=data, method=method,
+                                     headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request) as response:
+            payload = response.read()
+    except urllib.error.HTTPError as error:
+        payload = error.read()
+    return json.loads(payload) if payload else None
+
+
+def client(base, deadline, seed, latencies):
+    """Play random games until the deadline, recording latency per endpoint."""
+    rng = random.Random(seed)
+
+    def timed(name, method, path, body=None):
+        started = time.perf_counter()
+        result = call(base, method, path, body)
+        latencies[name].append(time.perf_counter() - started)
+        return result
+
+    game_id = None
+    while time.monotonic() < deadline:
+        if game_id is None:
+            game_id = timed('create', 'POST', '/games')['id']
+        moves = timed('legal_moves', 'GET', f'/games/{game_id}/moves')['moves']
+        if not moves:
+            game_id = None
+            continue
+        played = timed('submit_move', 'POST', f'/games/{game_id}/moves', rng.choice(moves))
+        timed('fen', 'GET', f'/games/{game_id}/fen')
+        if played.get('result', '*') != '*' or played.get('moves_played', 0) >= 200:
+            timed('delete', 'DELETE', f'/games/{game_id}')
+            game_id = None
+
+
+def percentile(values, fraction):
+    """Return the value at a fraction (0..1) of the sorted list."""
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP API load test")
+    parser.add_argument('--clients', type=int, default=8, help="concurrent client threads")
+    parser.add_argument('--seconds', type=float, default=10.0, help="test duration")
+    parser.add_argument('--port', type=int, default=0, help="port to serve on (0 picks a free one)")
+    args = parser.parse_args(argv)
+
+    try:
+        from werkzeug.serving import make_server
+        from server.api import create_app
+    except ImportError:
+        raise SystemExit("Flask is required: pip install -r requirements.txt")
+
+    server = make_server('127.0.0.1', args.port, create_app(SessionStore(max_sessions=args.clients * 4)),
+                         threaded=True)
+    base = f"http://127.0.0.1:{server.server_port}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    latencies = defaultdict(list)
+    per_client = [defaultdict(list) for _ in range(args.clients)]
+    started = time.monotonic()
+    deadline = started + args.seconds
+    threads = [
+        threading.Thread(target=client, args=(base, deadline, seed, per_client[seed]))
+        for seed in range(args.clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+    server.shutdown()
+
+    for recorded in per_client:
+        for name, values in recorded.items():
+            latencies[name].extend(values)
+    total = sum(len(values) for values in latencies.values())
+    print(f"{total} requests in {elapsed:.1f}s from {args.clients} clients: {total / elapsed:.0f} req/s")
+    print(f"{'endpoint':<12} {'count':>7} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8}")
+    for name in sorted(latencies):
+        values = sorted(latencies[name])
+        print(f"{name:<12} {len(values):>7} {percentile(values, 0.5) * 1000:>8.2f} "
+              f"{percentile(values, 0.9) * 1000:>8.2f} {percentile(values, 0.99) * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# This file marks the analytics directory as a package.
@@ -0,0 +1,228 @@
+"""
+Duplicate games and positions across game archives.
+
+Every game is replayed on a board and each position it reaches is keyed by
+its Zobrist hash (board.zobrist); each game is keyed by a hash of its
+normalized move list, so the same game written in SAN and in coordinates
+counts as one. Keys go through external merge sorts (analytics.external_sort),
+so archives larger than memory can be processed:
+
+1. Stream all games once, adding (position key, 1) and (game key, game index)
+   records to two sorters.
+2. Merge the position runs, summing the counts, to get every distinct
+   position with its number of occurrences.
+3. Merge the game runs; the first index of each game key is kept. The kept
+   indices are sorted again and a second pass writes those games in their
+   original order.
+
+Usage (from the src directory):
+    python3 -m analytics.dedup games/*.jsonl archive.pgn -o unique.jsonl --positions positions.txt
+"""
+
+import argparse
+import hashlib
+import heapq
+from collections import Counter, namedtuple
+
+from analytics.external_sort import RUN_RECORDS, ExternalSorter, sum_counts
+from board.zobrist import BLACK_TO_MOVE_KEY, move_hash_delta, position_hash
+from game.game_session import GameSession
+from notation.archive import format_record, move_name, open_archive, read_archive
+from notation.fen import board_to_fen
+from notation.move_parser import parse_move
+from notation.san import PGN_SQUARES
+
+DedupReport = namedtuple('DedupReport', [
+    'games', 'unique_games', 'positions', 'unique_positions', 'frequencies', 'most_common',
+])
+
+
+def replay_positions(game):
+    """
+    Replay an archived game, stopping at an unreadable or illegal move.
+
+    Args:
+        game: ArchiveGame
+
+    Yields:
+        Tuples (key, board, side, move) for the starting position and after
+        every played move; board is the live 2D list of piece codes (copy it
+        to keep it) and move is the (start, end) that led there, None first
+    """
+    session = GameSession()
+    side = session.side_to_move
+    key = position_hash(session.board.board, side)
+    yield key, session.board.board, side, None
+    for text in game.moves:
+        board = session.board.board
+        start, end = parse_move(text, board, side, PGN_SQUARES)
+        if start is None:
+            return
+        piece, captured = board[start[0]][start[1]], board[end[0]][end[1]]
+        if not session.submit_move(start, end).ok:
+            return
+        key ^= move_hash_delta(piece, start, end, captured) ^ BLACK_TO_MOVE_KEY
+        side ^= 1
+        yield key, session.board.board, side, (start, end)
+
+
+def game_key(played, moves):
+    """
+    Hash a game's moves into a 64-bit key.
+
+    Args:
+        played: Names of the replayed moves ('e2e4', ...)
+        moves: The archived move texts; the ones after the replayed prefix
+            are included verbatim
+
+    Returns:
+        Unsigned 64-bit integer
+    """
+    text = ' '.join(played + [str(move) for move in moves[len(played):]])
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _iter_games(paths):
+    """Stream the games of several archives in order."""
+    for path in paths:
+        yield from read_archive(path)
+
+
+def _first_indices(game_sorter, run_records, directory):
+    """Sort the first game index of every distinct game key."""
+    kept = ExternalSorter(1, run_records, directory)
+    previous = None
+    for key, index in game_sorter:
+        if key != previous:
+            kept.add((index,))
+            previous = key
+    return kept
+
+
+def _count_positions(position_sorter, frequencies_path, top):
+    """Merge the position counts into a histogram and the most frequent keys."""
+    histogram = Counter()
+    most_common = []
+    handle = open(frequencies_path, 'w', encoding='utf-8') if frequencies_path else None
+    try:
+        for key, count in position_sorter:
+            histogram[count] += 1
+            if handle is not None:
+                handle.write(f"{key:016x} {count}\n")
+            if len(most_common) < top:
+                heapq.heappush(most_common, (count, -key))
+            elif top and (count, -key) > most_common[0]:
+                heapq.heapreplace(most_common, (count, -key))
+    finally:
+        if handle is not None:
+            handle.close()
+    ranked = sorted(((count, -negative_key) for count, negative_key in most_common),
+                    key=lambda item: (-item[0], item[1]))
+    return histogram, [(key, count) for count, key in ranked]
+
+
+def _second_pass(paths, kept, output, wanted):
+    """Write the kept games and find FENs for the wanted position keys."""
+    fens = {}
+    kept_indices = (index for (index,) in kept) if output else iter(())
+    next_kept = next(kept_indices, None)
+    handle = open_archive(output, 'wt') if output else None
+    try:
+        for index, game in enumerate(_iter_games(paths)):
+            if index == next_kept:
+                handle.write(format_record(game))
+                next_kept = next(kept_indices, None)
+            if len(fens) < len(wanted):
+                for key, board, side, _ in replay_positions(game):
+                    if key in wanted and key not in fens:
+                        fens[key] = board_to_fen(board, side)
+            elif next_kept is None:
+                break
+    finally:
+        if handle is not None:
+            handle.close()
+    return fens
+
+
+def dedup_archives(paths, output=None, frequencies=None, top=10, run_records=RUN_RECORDS, directory=None):
+    """
+    Find duplicate games and count positions across archives.
+
+    Args:
+        paths: Archive paths (.jsonl, .pgn, optionally .gz)
+        output: Optional JSONL path receiving the first copy of every game
+        frequencies: Optional text path receiving one 'key count' line per
+            distinct position (hex Zobrist key), sorted by key
+        top: Number of most frequent positions to report with their FEN
+        run_records: Records held in memory per sort run
+        directory: Directory for temporary run files
+
+    Returns:
+        DedupReport; frequencies maps an occurrence count to the number of
+        positions seen that many times, most_common lists (key, count, fen)
+    """
+    positions = ExternalSorter(2, run_records, directory, combine=sum_counts)
+    games = ExternalSorter(2, run_records, directory)
+    kept = None
+    try:
+        game_count = 0
+        for index, game in enumerate(_iter_games(paths)):
+            played = []
+            for key, _, _, move in replay_positions(game):
+                positions.add((key, 1))
+                if move is not None:
+                    played.append(move_name(move))
+            games.add((game_key(played, game.moves), index))
+            game_count += 1
+
+        histogram, most_common = _count_positions(positions, frequencies, top)
+        kept = _first_indices(games, run_records, directory)
+        unique_games = kept.count
+        fens = {}
+        if output or most_common:
+            fens = _second_pass(paths, kept, output, {key for key, _ in most_common})
+        return DedupReport(
+            game_count, unique_games, positions.count, sum(histogram.values()), dict(histogram),
+            [(key, count, fens.get(key)) for key, count in most_common],
+        )
+    finally:
+        positions.close()
+        games.close()
+        if kept is not None:
+            kept.close()
+
+
+def format_report(report):
+    """Format a DedupReport for the terminal."""
+    lines = [
+        f"Games: {report.games} ({report.unique_games} unique, "
+        f"{report.games - report.unique_games} duplicates)",
+        f"Positions: {report.positions} ({report.unique_positions} unique)",
+        "Positions by occurrences:",
+    ]
+    for count in sorted(report.frequencies):
+        lines.append(f"  {count:>8} times: {report.frequencies[count]} positions")
+    lines.append("Most frequent positions:")
+    for key, count, fen in report.most_common:
+        lines.append(f"  {count:>8}  {key:016x}  {fen}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Deduplicate games and count positions across archives")
+    parser.add_argument('archives', nargs='+', help="JSONL or PGN archives (optionally .gz)")
+    parser.add_argument('-o', '--output', help="write the unique games to this JSONL file")
+    parser.add_argument('--positions', help="write 'key count' for every distinct position to this file")
+    parser.add_argument('--top', type=int, default=10, help="most frequent positions to list")
+    parser.add_argument('--run-records', type=int, default=RUN_RECORDS,
+                        help="records sorted in memory before spilling a run to disk")
+    parser.add_argument('--tmp', help="directory for temporary run files")
+    args = parser.parse_args(argv)
+
+    report = dedup_archives(args.archives, args.output, args.positions, args.top, args.run_records, args.tmp)
+    print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+External merge sort for fixed-size integer records.
+
+Records are tuples of unsigned 64-bit integers. They are buffered in memory
+up to a run size, sorted, and written to temporary run files; iterating the
+sorter merges the runs with a heap, so the data set can be much larger than
+memory. An optional combine function folds equal keys while runs are written
+and while they are merged (for example to sum occurrence counts).
+"""
+
+import heapq
+import os
+import struct
+import tempfile
+
+RUN_RECORDS = 1 << 20
+READ_RECORDS = 4096
+
+
+def _read_run(path, record):
+    """Stream the records of one run file."""
+    with open(path, 'rb') as handle:
+        while True:
+            block = handle.read(record.size * READ_RECORDS)
+            if not block:
+                return
+            yield from record.iter_unpack(block)
+
+
+def _combined(records, combine):
+    """Fold neighbouring records that share a first field."""
+    current = None
+    for item in records:
+        if current is not None and item[0] == current[0]:
+            current = combine(current, item)
+            continue
+        if current is not None:
+            yield current
+        current = item
+    if current is not None:
+        yield current
+
+
+def sum_counts(first, second):
+    """Combine two (key, count) records by adding the counts."""
+    return first[0], first[1] + second[1]
+
+
+class ExternalSorter:
+    """Sorts more records than fit in memory by spilling sorted runs to disk."""
+
+    def __init__(self, fields=1, run_records=RUN_RECORDS, directory=None, combine=None):
+        """
+        Initialize an empty sorter.
+
+        Args:
+            fields: Number of unsigned 64-bit integers per record
+            run_records: Records buffered in memory before a run is written
+            directory: Where run files go (the system temp directory by default)
+            combine: Optional function (record, record) -> record applied to
+                neighbouring records with the same first field
+        """
+        self.record = struct.Struct('<' + 'Q' * fields)
+        self.run_records = run_records
+        self.combine = combine
+        self.runs = []
+        self.count = 0
+        self._buffer = []
+        self._directory = tempfile.mkdtemp(prefix='sort-', dir=directory)
+
+    def add(self, record):
+        """Add one record (a tuple of integers)."""
+        self._buffer.append(record)
+        self.count += 1
+        if len(self._buffer) >= self.run_records:
+            self._spill()
+
+    def _sorted_buffer(self):
+        """Sort (and combine) the in-memory records."""
+        self._buffer.sort()
+        records = self._buffer
+        if self.combine is not None:
+            records = _combined(records, self.combine)
+        return records
+
+    def _spill(self):
+        """Write the buffer as a sorted run file."""
+        path = os.path.join(self._directory, f'run-{len(self.runs):05d}')
+        pack = self.record.pack
+        with open(path, 'wb') as handle:
+            handle.write(b''.join(pack(*item) for item in self._sorted_buffer()))
+        self.runs.append(path)
+        self._buffer = []
+
+    def __iter__(self):
+        """Yield every record in sorted order (combined if requested)."""
+        if self.runs and self._buffer:
+            self._spill()
+        if self.runs:
+            records = heapq.merge(*(_read_run(path, self.record) for path in self.runs))
+            if self.combine is not None:
+                records = _combined(records, self.combine)
+        else:
+            records = self._sorted_buffer()
+        yield from records
+
+    def close(self):
+        """Delete the run files."""
+        for path in self.runs:
+            os.remove(path)
+        self.runs = []
+        self._buffer = []
+        os.rmdir(self._directory)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
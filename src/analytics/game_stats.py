@@ -0,0 +1,182 @@
+"""
+Mergeable aggregate statistics over played games.
+
+GameStats only holds counters and an opening trie bounded by the opening
+depth, so its size does not grow with the number of games. Partial results
+computed in different processes are combined with merge().
+"""
+
+from collections import Counter
+
+from notation.archive import move_name
+
+
+class OpeningTrie:
+    """Counts move sequences up to a fixed depth."""
+
+    def __init__(self, depth=6):
+        """
+        Initialize an empty trie.
+
+        Args:
+            depth: Number of plies recorded per game
+        """
+        self.depth = depth
+        # Each node is [count, {move: child node}]
+        self.root = [0, {}]
+
+    def add(self, moves):
+        """Count the first depth moves of one game."""
+        node = self.root
+        node[0] += 1
+        for move in moves[:self.depth]:
+            child = node[1].get(move)
+            if child is None:
+                child = node[1][move] = [0, {}]
+            child[0] += 1
+            node = child
+
+    def merge(self, other):
+        """Add the counts of another trie into this one."""
+        stack = [(self.root, other.root)]
+        while stack:
+            mine, theirs = stack.pop()
+            mine[0] += theirs[0]
+            for move, their_child in theirs[1].items():
+                my_child = mine[1].get(move)
+                if my_child is None:
+                    mine[1][move] = _copy_node(their_child)
+                else:
+                    stack.append((my_child, their_child))
+
+    def count(self, moves):
+        """Return how many games started with a move sequence."""
+        node = self.root
+        for move in moves:
+            node = node[1].get(move)
+            if node is None:
+                return 0
+        return node[0]
+
+    def most_common(self, length=None, limit=10):
+        """
+        List the most frequent opening sequences of a given length.
+
+        Args:
+            length: Plies per sequence (defaults to the trie depth)
+            limit: Number of sequences to return
+
+        Returns:
+            List of (tuple of moves, count), most frequent first
+        """
+        length = self.depth if length is None else length
+        found = []
+        stack = [((), self.root)]
+        while stack:
+            moves, node = stack.pop()
+            if len(moves) == length:
+                found.append((moves, node[0]))
+                continue
+            for move, child in node[1].items():
+                stack.append((moves + (move,), child))
+        found.sort(key=lambda item: (-item[1], item[0]))
+        return found[:limit]
+
+
+def _copy_node(node):
+    """Deep-copy a trie node."""
+    return [node[0], {move: _copy_node(child) for move, child in node[1].items()}]
+
+
+class GameStats:
+    """Win rates, lengths, captures and openings over a set of games."""
+
+    def __init__(self, opening_depth=6):
+        """
+        Initialize empty statistics.
+
+        Args:
+            opening_depth: Plies recorded in the opening trie
+        """
+        self.games = 0
+        self.invalid = 0
+        self.winners = Counter()
+        self.total_plies = 0
+        self.captures = Counter()
+        self.openings = OpeningTrie(opening_depth)
+
+    def add_session(self, session, archived_result=None):
+        """
+        Record a replayed game.
+
+        Args:
+            session: GameSession holding the game's state and move history
+            archived_result: Result from the archive ('1-0', '0-1', ...), used
+                when the game ended without a king capture
+        """
+        state = session.game_state
+        history = state.move_history
+        self.games += 1
+        winner = state.winner
+        if winner is None:
+            winner = {'1-0': 'white', '0-1': 'black'}.get(archived_result, 'none')
+        self.winners[winner] += 1
+        self.total_plies += len(history)
+        for move in history:
+            captured = move.get('captured')
+            if captured:
+                self.captures[captured.upper()] += 1
+        self.openings.add([move_name((move['start'], move['end'])) for move in history[:self.openings.depth]])
+
+    def merge(self, other):
+        """Add another GameStats (e.g. from a worker process) into this one."""
+        self.games += other.games
+        self.invalid += other.invalid
+        self.winners.update(other.winners)
+        self.total_plies += other.total_plies
+        self.captures.update(other.captures)
+        self.openings.merge(other.openings)
+        return self
+
+    @property
+    def average_length(self):
+        """Average number of plies per game."""
+        return self.total_plies / self.games if self.games else 0.0
+
+    def win_rates(self):
+        """Return {'white', 'black', 'none'} -> fraction of games."""
+        return {
+            color: (self.winners[color] / self.games if self.games else 0.0)
+            for color in ('white', 'black', 'none')
+        }
+
+    def to_dict(self, top=10):
+        """Summarize as plain data (for JSON output)."""
+        return {
+            'games': self.games,
+            'invalid_games': self.invalid,
+            'win_rates': self.win_rates(),
+            'average_length': self.average_length,
+            'captures': dict(self.captures.most_common()),
+            'openings': [
+                {'moves': list(moves), 'games': count}
+                for moves, count in self.openings.most_common(limit=top)
+            ],
+        }
+
+    def summary_table(self, top=10):
+        """Format a human-readable report."""
+        rates = self.win_rates()
+        lines = [
+            f"Games: {self.games} ({self.invalid} stopped at an unreadable or illegal move)",
+            f"White wins: {rates['white']:.1%}  Black wins: {rates['black']:.1%}  "
+            f"Undecided: {rates['none']:.1%}",
+            f"Average length: {self.average_length:.1f} plies",
+            "Captures by piece: " + ", ".join(
+                f"{piece} {count}" for piece, count in self.captures.most_common()
+            ),
+            f"Most common openings ({self.openings.depth} plies):",
+        ]
+        for moves, count in self.openings.most_common(limit=top):
+            lines.append(f"  {count:>8}  {' '.join(moves)}")
+        return "\n".join(lines)
@@ -0,0 +1,134 @@
+"""
+Minimal reader and writer for NumPy's .npy format (version 1.0).
+
+Only what the training-data shards need: little-endian integer columns,
+written from array.array buffers and read back through mmap as zero-copy
+memoryviews, so numpy is not required. Files written here load with
+numpy.load(path, mmap_mode='r') as well.
+
+Format: the magic b'\\x93NUMPY', version bytes 1 0, a little-endian uint16
+header length, then a Python-literal dict {'descr', 'fortran_order',
+'shape'} padded with spaces to a multiple of 64 bytes and ending in a
+newline, then the raw data in C order.
+"""
+
+import ast
+import mmap
+import struct
+import sys
+
+MAGIC = b'\x93NUMPY'
+VERSION = b'\x01\x00'
+ALIGNMENT = 64
+
+# array.array / memoryview type code -> numpy dtype string (little-endian)
+DTYPES = {'b': '|i1', 'B': '|u1', 'h': '<i2', 'H': '<u2', 'i': '<i4', 'I': '<u4', 'q': '<i8', 'Q': '<u8'}
+TYPECODES = {descr: code for code, descr in DTYPES.items()}
+
+
+def _header(descr, shape):
+    """Build the padded header for an array."""
+    shape_text = f"({shape[0]},)" if len(shape) == 1 else f"({', '.join(str(size) for size in shape)})"
+    text = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': {shape_text}, }}"
+    prefix = len(MAGIC) + len(VERSION) + 2
+    padding = -(prefix + len(text) + 1) % ALIGNMENT
+    text = text + ' ' * padding + '\n'
+    return MAGIC + VERSION + struct.pack('<H', len(text)) + text.encode('latin1')
+
+
+def write_npy(path, values, shape=None):
+    """
+    Write an array.array as a .npy file.
+
+    Args:
+        path: Destination path
+        values: array.array with one of the DTYPES type codes
+        shape: Optional shape tuple (defaults to one dimension); its
+            product must equal len(values)
+
+    Returns:
+        Number of bytes written
+    """
+    shape = tuple(shape) if shape is not None else (len(values),)
+    count = 1
+    for size in shape:
+        count *= size
+    if count != len(values):
+        raise ValueError(f"Shape {shape} does not match {len(values)} values")
+    if values.itemsize > 1 and sys.byteorder != 'little':
+        values = type(values)(values.typecode, values)
+        values.byteswap()
+    header = _header(DTYPES[values.typecode], shape)
+    with open(path, 'wb') as handle:
+        handle.write(header)
+        handle.write(values.tobytes())
+    return len(header) + len(values) * values.itemsize
+
+
+def read_header(buffer):
+    """
+    Parse the header of a .npy file held in a buffer.
+
+    Returns:
+        Tuple (type code, shape, data offset)
+
+    Raises:
+        ValueError: If the buffer is not a supported .npy file
+    """
+    if bytes(buffer[:6]) != MAGIC:
+        raise ValueError("Not a .npy file")
+    major = buffer[6]
+    if major == 1:
+        (length,), start = struct.unpack_from('<H', buffer, 8), 10
+    elif major in (2, 3):
+        (length,), start = struct.unpack_from('<I', buffer, 8), 12
+    else:
+        raise ValueError(f"Unsupported .npy version {major}")
+    header = ast.literal_eval(bytes(buffer[start:start + length]).decode('latin1'))
+    if header.get('fortran_order'):
+        raise ValueError("Fortran-ordered arrays are not supported")
+    descr = header['descr'].replace('=', '<')
+    if descr not in TYPECODES:
+        raise ValueError(f"Unsupported dtype {header['descr']!r}")
+    return TYPECODES[descr], tuple(header['shape']), start + length
+
+
+class NpyFile:
+    """A memory-mapped .npy file exposed as a flat memoryview."""
+
+    def __init__(self, path):
+        """
+        Map a file.
+
+        Args:
+            path: .npy file path
+        """
+        self.path = path
+        with open(path, 'rb') as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self.typecode, self.shape, offset = read_header(self._mmap)
+        if self.typecode in 'bB' or sys.byteorder == 'little':
+            self.values = memoryview(self._mmap)[offset:].cast(self.typecode)
+        else:
+            raise ValueError("Memory-mapped reading needs a little-endian machine")
+
+    def __len__(self):
+        return self.shape[0] if self.shape else 0
+
+    def close(self):
+        """
+        Release the view and the mapping.
+
+        Slices of values handed out earlier (e.g. training batches) keep the
+        mapping alive; it is then unmapped once the last of them is
+        garbage collected instead of raising BufferError here.
+        """
+        if self._mmap is None:
+            return
+        self.values.release()
+        self.values = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+        self._mmap = None
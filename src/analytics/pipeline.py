@@ -0,0 +1,113 @@
+"""
+Streaming analytics over game archives.
+
+Archives are split into tasks (one per PGN or gzipped file, byte ranges of
+CHUNK_BYTES for plain JSONL files), each task replays its games through a
+GameSession and returns a GameStats, and the partial results are merged as
+they arrive. Workers only hold one game at a time plus their counters.
+
+Usage (from the src directory):
+    python3 -m analytics.pipeline games/*.jsonl archive.pgn -j 4 --openings 6 --top 10
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+
+from analytics.game_stats import GameStats
+from notation.archive import is_pgn, read_archive, read_jsonl, replay_game
+
+CHUNK_BYTES = 8 << 20
+
+
+def plan_tasks(paths, chunk_bytes=CHUNK_BYTES):
+    """
+    Split archives into independent tasks.
+
+    Returns:
+        List of (path, start, end) tuples; start and end are None for tasks
+        that read a whole file
+    """
+    tasks = []
+    for path in paths:
+        if is_pgn(path) or path.endswith('.gz'):
+            tasks.append((path, None, None))
+            continue
+        size = os.path.getsize(path)
+        for start in range(0, max(size, 1), chunk_bytes):
+            tasks.append((path, start, min(start + chunk_bytes, size)))
+    return tasks
+
+
+def analyse_games(games, opening_depth=6):
+    """
+    Aggregate statistics over an iterable of ArchiveGame tuples.
+
+    Returns:
+        GameStats
+    """
+    stats = GameStats(opening_depth)
+    for game in games:
+        session, complete = replay_game(game)
+        if not complete:
+            stats.invalid += 1
+        stats.add_session(session, game.result)
+    return stats
+
+
+def _analyse_task(task):
+    """Worker entry point: analyse one (path, start, end, opening depth) task."""
+    path, start, end, opening_depth = task
+    if start is None:
+        games = read_archive(path)
+    else:
+        games = read_jsonl(path, start, end)
+    return analyse_games(games, opening_depth)
+
+
+def analyse_archives(paths, processes=1, opening_depth=6, chunk_bytes=CHUNK_BYTES):
+    """
+    Compute statistics over several archives.
+
+    Args:
+        paths: Archive paths (.jsonl, .pgn, optionally .gz)
+        processes: Worker processes (1 runs in this process)
+        opening_depth: Plies recorded in the opening trie
+        chunk_bytes: Size of the byte ranges plain JSONL files are split into
+
+    Returns:
+        Merged GameStats
+    """
+    tasks = [task + (opening_depth,) for task in plan_tasks(paths, chunk_bytes)]
+    total = GameStats(opening_depth)
+    if processes <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            total.merge(_analyse_task(task))
+        return total
+    with multiprocessing.Pool(min(processes, len(tasks))) as pool:
+        for partial in pool.imap_unordered(_analyse_task, tasks):
+            total.merge(partial)
+    return total
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Aggregate statistics over game archives")
+    parser.add_argument('archives', nargs='+', help="JSONL or PGN archives (optionally .gz)")
+    parser.add_argument('-j', '--processes', type=int, default=multiprocessing.cpu_count(),
+                        help="worker processes")
+    parser.add_argument('--openings', type=int, default=6, help="plies per opening sequence")
+    parser.add_argument('--top', type=int, default=10, help="opening sequences to list")
+    parser.add_argument('--json', action='store_true', help="print JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    stats = analyse_archives(args.archives, args.processes, args.openings)
+    if args.json:
+        print(json.dumps(stats.to_dict(args.top), indent=2))
+    else:
+        print(stats.summary_table(args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""
+Export archived games as columnar training data.
+
+Every position a game reaches is written as one row of four columns:
+
+- planes: 12 uint64 bitboards, one per piece (white pawn .. white king, then
+  black pawn .. black king); bit row * 8 + col is set where the piece stands
+- side: uint8 side to move (0 White, 1 Black)
+- result: int8 game result from White's point of view (1, 0 or -1); a
+  captured king decides it, otherwise the archived result tag
+- ply: uint16 number of moves played before the position
+
+Rows are buffered in array.array columns and flushed to a shard of .npy
+files (analytics.npy) every shard_rows rows, so memory stays flat however
+large the archives are. Archives are split into tasks like the analytics
+pipeline and each worker process writes its own shards; the parent only
+collects row counts and writes manifest.json.
+
+A shard directory looks like:
+    manifest.json
+    part-00000-0000.planes.npy
+    part-00000-0000.side.npy
+    ...
+
+TrainingData maps the shards read-only and hands out zero-copy memoryviews
+(numpy.load(path, mmap_mode='r') works on the same files).
+
+Usage (from the src directory):
+    python3 -m analytics.training_data games/*.jsonl archive.pgn -o shards/ -j 4
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from array import array
+from collections import namedtuple
+
+from analytics.dedup import replay_positions
+from analytics.npy import NpyFile, write_npy
+from analytics.pipeline import CHUNK_BYTES, plan_tasks
+from notation.archive import read_archive, read_jsonl
+from pieces.piece_codes import BLACK, COLOR_SHIFT, KING, TYPE_MASK, WHITE
+
+PLANES = 12
+SHARD_ROWS = 1 << 16
+MANIFEST = 'manifest.json'
+COLUMNS = {'planes': 'Q', 'side': 'B', 'result': 'b', 'ply': 'H'}
+RESULT_VALUES = {'1-0': 1, '0-1': -1}
+
+ExportReport = namedtuple('ExportReport', ['games', 'positions', 'shards', 'elapsed'])
+
+
+def board_planes(board):
+    """
+    Pack a board into per-piece bitboards.
+
+    Args:
+        board: The chess board (2D list of piece codes)
+
+    Returns:
+        List of PLANES integers
+    """
+    planes = [0] * PLANES
+    for row in range(8):
+        cells = board[row]
+        for col in range(8):
+            piece = cells[col]
+            if piece:
+                planes[(piece >> COLOR_SHIFT) * 6 + (piece & TYPE_MASK) - 1] |= 1 << (row * 8 + col)
+    return planes
+
+
+def game_result(board, side, result):
+    """
+    Result of a replayed game from White's point of view.
+
+    Args:
+        board: Final board
+        side: Side to move in the final position
+        result: Archived result tag ('1-0', '0-1', '1/2-1/2', '*')
+
+    Returns:
+        1, 0 or -1
+    """
+    king = KING | (side << COLOR_SHIFT)
+    if not any(king in row for row in board):
+        return 1 if side == BLACK else -1
+    return RESULT_VALUES.get(result, 0)
+
+
+class ShardWriter:
+    """Buffers rows and writes them as numbered shards."""
+
+    def __init__(self, directory, prefix, shard_rows=SHARD_ROWS):
+        """
+        Initialize a writer.
+
+        Args:
+            directory: Output directory (must exist)
+            prefix: Shard name prefix, unique per writer
+            shard_rows: Rows per shard
+        """
+        self.directory = directory
+        self.prefix = prefix
+        self.shard_rows = shard_rows
+        self.shards = []
+        self._reset()
+
+    def _reset(self):
+        self.columns = {name: array(code) for name, code in COLUMNS.items()}
+
+    def add_game(self, rows, result):
+        """
+        Add the positions of one game.
+
+        Args:
+            rows: List of (planes, side, ply) tuples
+            result: Game result from White's point of view
+        """
+        columns = self.columns
+        for planes, side, ply in rows:
+            columns['planes'].extend(planes)
+            columns['side'].append(side)
+            columns['result'].append(result)
+            columns['ply'].append(min(ply, 0xFFFF))
+            if len(columns['side']) >= self.shard_rows:
+                self.flush()
+                columns = self.columns
+
+    def flush(self):
+        """Write buffered rows as a shard (nothing when the buffer is empty)."""
+        rows = len(self.columns['side'])
+        if not rows:
+            return
+        name = f"{self.prefix}-{len(self.shards):04d}"
+        for column, values in self.columns.items():
+            shape = (rows, PLANES) if column == 'planes' else (rows,)
+            write_npy(os.path.join(self.directory, f"{name}.{column}.npy"), values, shape)
+        self.shards.append({'name': name, 'rows': rows})
+        self._reset()
+
+
+def export_games(games, writer):
+    """
+    Replay games into a shard writer.
+
+    Args:
+        games: Iterable of ArchiveGame tuples
+        writer: ShardWriter
+
+    Returns:
+        Tuple (games, positions)
+    """
+    count = positions = 0
+    for game in games:
+        rows = []
+        board, side = None, WHITE
+        for _, board, side, _ in replay_positions(game):
+            rows.append((board_planes(board), side, len(rows)))
+        writer.add_game(rows, game_result(board, side, game.result))
+        count += 1
+        positions += len(rows)
+    return count, positions
+
+
+def _export_task(task):
+    """Worker entry point: export one (index, path, start, end, directory, shard rows) task."""
+    index, path, start, end, directory, shard_rows = task
+    games = read_archive(path) if start is None else read_jsonl(path, start, end)
+    writer = ShardWriter(directory, f"part-{index:05d}", shard_rows)
+    count, positions = export_games(games, writer)
+    writer.flush()
+    return index, count, positions, writer.shards
+
+
+def export_archives(paths, directory, processes=1, shard_rows=SHARD_ROWS, chunk_bytes=CHUNK_BYTES):
+    """
+    Export archives as training-data shards.
+
+    Args:
+        paths: Archive paths (.jsonl, .pgn, optionally .gz)
+        directory: Output directory (created if missing)
+        processes: Worker processes writing shards in parallel (1 runs in
+            this process)
+        shard_rows: Rows per shard
+        chunk_bytes: Size of the byte ranges plain JSONL files are split into
+
+    Returns:
+        ExportReport
+    """
+    started = time.perf_counter()
+    os.makedirs(directory, exist_ok=True)
+    tasks = [(index,) + task + (directory, shard_rows) for index, task in enumerate(plan_tasks(paths, chunk_bytes))]
+    if processes <= 1 or len(tasks) <= 1:
+        results = [_export_task(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(min(processes, len(tasks))) as pool:
+            results = list(pool.imap_unordered(_export_task, tasks))
+    results.sort()
+    shards = [shard for result in results for shard in result[3]]
+    games = sum(result[1] for result in results)
+    positions = sum(result[2] for result in results)
+    manifest = {
+        'columns': {name: {'typecode': code, 'width': PLANES if name == 'planes' else 1}
+                    for name, code in COLUMNS.items()},
+        'games': games,
+        'positions': positions,
+        'shards': shards,
+    }
+    with open(os.path.join(directory, MANIFEST), 'w', encoding='utf-8') as handle:
+        json.dump(manifest, handle, indent=2)
+    return ExportReport(games, positions, len(shards), time.perf_counter() - started)
+
+
+class TrainingData:
+    """Read-only, memory-mapped view of an exported shard directory."""
+
+    def __init__(self, directory):
+        """
+        Map every shard listed in the manifest.
+
+        Args:
+            directory: Directory written by export_archives
+        """
+        with open(os.path.join(directory, MANIFEST), encoding='utf-8') as handle:
+            self.manifest = json.load(handle)
+        self.shards = []
+        for shard in self.manifest['shards']:
+            self.shards.append({
+                column: NpyFile(os.path.join(directory, f"{shard['name']}.{column}.npy")) for column in COLUMNS
+            })
+        self._offsets = []
+        total = 0
+        for shard in self.shards:
+            self._offsets.append(total)
+            total += len(shard['side'])
+        self._length = total
+
+    def __len__(self):
+        return self._length
+
+    def column(self, shard, name):
+        """
+        Get one column of a shard.
+
+        Args:
+            shard: Shard index
+            name: Column name ('planes' is flattened, PLANES values per row)
+
+        Returns:
+            memoryview over the mapped file
+        """
+        return self.shards[shard][name].values
+
+    def position(self, index):
+        """
+        Get one row.
+
+        Args:
+            index: Row number across all shards
+
+        Returns:
+            Tuple (planes tuple, side, result, ply)
+        """
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        shard = len(self._offsets) - 1
+        while self._offsets[shard] > index:
+            shard -= 1
+        files = self.shards[shard]
+        row = index - self._offsets[shard]
+        planes = tuple(files['planes'].values[row * PLANES:(row + 1) * PLANES])
+        return planes, files['side'].values[row], files['result'].values[row], files['ply'].values[row]
+
+    def batches(self, size):
+        """
+        Iterate over the rows in batches without copying.
+
+        Args:
+            size: Rows per batch (a batch never spans two shards)
+
+        Yields:
+            Dicts of column name -> memoryview slice; a batch may outlive
+            close(), which keeps its shard mapped until it is freed
+        """
+        for files in self.shards:
+            rows = len(files['side'])
+            for start in range(0, rows, size):
+                stop = min(start + size, rows)
+                batch = {}
+                for name, npy in files.items():
+                    width = PLANES if name == 'planes' else 1
+                    batch[name] = npy.values[start * width:stop * width]
+                yield batch
+
+    def close(self):
+        """Unmap all shards."""
+        for files in self.shards:
+            for npy in files.values():
+                npy.close()
+        self.shards = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Export game archives as .npy training shards")
+    parser.add_argument('archives', nargs='+', help="JSONL or PGN archives (optionally .gz)")
+    parser.add_argument('-o', '--output', required=True, help="shard directory")
+    parser.add_argument('-j', '--processes', type=int, default=multiprocessing.cpu_count(),
+                        help="worker processes")
+    parser.add_argument('--shard-rows', type=int, default=SHARD_ROWS, help="positions per shard")
+    args = parser.parse_args(argv)
+
+    report = export_archives(args.archives, args.output, args.processes, args.shard_rows)
+    print(f"{report.games} games, {report.positions} positions, {report.shards} shards "
+          f"in {report.elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
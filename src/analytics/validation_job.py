@@ -0,0 +1,318 @@
+"""
+Resumable batch validation of archived games.
+
+Every game is replayed from the starting position through
+ChessBoard.validate_move, so a rule regression shows up as archived moves
+that are suddenly rejected. Archives are split into chunks with
+analytics.pipeline.plan_tasks and the chunks are validated in a process
+pool. Each finished chunk reports its throughput.
+
+The parent process records finished chunks, with their counts and illegal
+moves, in a JSON checkpoint file. The file is rewritten atomically (a
+temporary file moved into place) at most every checkpoint_seconds, and
+always when the job finishes or is interrupted. Running the job again with
+the same checkpoint skips the chunks it lists, so a job that dies only
+redoes the chunks finished since the last write. A checkpoint is only
+resumed for the same archives, unchanged on disk, split the same way.
+
+Usage (from the src directory):
+    python3 -m analytics.validation_job games/*.jsonl --checkpoint job.json -j 4
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter, namedtuple
+
+from analytics.pipeline import CHUNK_BYTES, plan_tasks
+from board.chess_board import ChessBoard
+from notation.archive import read_archive, read_jsonl
+from notation.move_parser import parse_move
+from notation.san import PGN_SQUARES
+from pieces.piece_codes import KING, TYPE_MASK, WHITE
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_SECONDS = 30.0
+# Illegal moves kept per chunk for the report (all of them are counted)
+MAX_EXAMPLES = 100
+
+UNPARSEABLE = "Cannot parse move"
+AFTER_GAME_OVER = "Move after the king was captured"
+
+ChunkResult = namedtuple('ChunkResult', ['index', 'games', 'moves', 'illegal', 'errors', 'examples', 'seconds'])
+IllegalMove = namedtuple('IllegalMove', ['path', 'game', 'ply', 'move', 'error'])
+JobReport = namedtuple('JobReport', ['chunks', 'done', 'resumed', 'games', 'moves', 'illegal', 'errors',
+                                     'examples', 'run_moves', 'seconds', 'complete'])
+
+
+class CheckpointMismatchError(ValueError):
+    """Raised when a checkpoint was written for other archives or settings."""
+
+
+def validate_game(moves):
+    """
+    Replay one game's moves through ChessBoard.validate_move.
+
+    Args:
+        moves: Move strings in the standard orientation (coordinates or SAN)
+
+    Returns:
+        Tuple (moves validated, None) when every move is legal, otherwise
+        (moves validated, (ply, move text, error)) for the first bad move
+    """
+    board = ChessBoard()
+    side = WHITE
+    over = False
+    for ply, text in enumerate(moves):
+        if over:
+            return ply, (ply, text, AFTER_GAME_OVER)
+        start, end = parse_move(text, board.board, side, PGN_SQUARES)
+        if start is None:
+            return ply, (ply, text, UNPARSEABLE)
+        is_valid, error = board.validate_move(start, end, side)
+        if not is_valid:
+            return ply + 1, (ply, text, error)
+        captured = board.get_code(end)
+        board.move_piece(start, end)
+        over = captured & TYPE_MASK == KING
+        side ^= 1
+    return len(moves), None
+
+
+def validate_chunk(task):
+    """
+    Worker entry point: validate one (index, path, start, end, max examples) task.
+
+    Returns:
+        ChunkResult; examples holds (game number in the chunk, ply, move,
+        error) for the first max examples illegal games
+    """
+    index, path, start, end, max_examples = task
+    started = time.perf_counter()
+    games = read_archive(path) if start is None else read_jsonl(path, start, end)
+    count = moves = illegal = 0
+    errors = Counter()
+    examples = []
+    for number, game in enumerate(games):
+        validated, bad = validate_game(game.moves)
+        count += 1
+        moves += validated
+        if bad is not None:
+            illegal += 1
+            errors[bad[2]] += 1
+            if len(examples) < max_examples:
+                examples.append((number,) + bad)
+    return ChunkResult(index, count, moves, illegal, dict(errors), examples, time.perf_counter() - started)
+
+
+def _fingerprint(paths, chunk_bytes):
+    """What a checkpoint must match to be resumed: files, sizes, mtimes and chunking."""
+    files = []
+    for path in paths:
+        status = os.stat(path)
+        files.append([os.path.abspath(path), status.st_size, status.st_mtime_ns])
+    return {'version': CHECKPOINT_VERSION, 'chunk_bytes': chunk_bytes, 'files': files}
+
+
+def load_checkpoint(path, fingerprint):
+    """
+    Read the finished chunks from a checkpoint.
+
+    Args:
+        path: Checkpoint file (a missing file means nothing is done)
+        fingerprint: Expected job fingerprint
+
+    Returns:
+        Dict mapping chunk index to ChunkResult
+
+    Raises:
+        CheckpointMismatchError: If the checkpoint belongs to a different job
+    """
+    if path is None or not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as handle:
+        checkpoint = json.load(handle)
+    if checkpoint.get('job') != fingerprint:
+        raise CheckpointMismatchError(f"Checkpoint {path} was written for other archives or settings")
+    done = {}
+    for fields in checkpoint['chunks']:
+        result = ChunkResult(*fields)
+        done[result.index] = result._replace(examples=[tuple(example) for example in result.examples])
+    return done
+
+
+def write_checkpoint(path, fingerprint, done, complete=False):
+    """Atomically write the finished chunks to a checkpoint file."""
+    checkpoint = {
+        'job': fingerprint,
+        'complete': complete,
+        'chunks': [list(done[index]) for index in sorted(done)],
+    }
+    temporary = f"{path}.tmp"
+    with open(temporary, 'w', encoding='utf-8') as handle:
+        json.dump(checkpoint, handle)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, path)
+
+
+def summarize(tasks, done, resumed, run_moves, seconds):
+    """
+    Merge chunk results into a JobReport.
+
+    run_moves is the number of moves validated by this run (resumed chunks
+    excluded), for the throughput figure.
+
+    Game numbers in the examples are counted from 1 within each archive,
+    which needs the game counts of every earlier chunk of the same file; for
+    an unfinished job they are numbered within their chunk instead.
+    """
+    complete = len(done) == len(tasks)
+    offsets = {}
+    seen = Counter()
+    for index, (path, _, _) in enumerate(tasks):
+        offsets[index] = seen[path]
+        if index in done:
+            seen[path] += done[index].games
+    errors = Counter()
+    examples = []
+    for index in sorted(done):
+        result = done[index]
+        errors.update(result.errors)
+        offset = offsets[index] if complete else 0
+        path = tasks[index][0]
+        examples.extend(IllegalMove(path, offset + number + 1, ply, move, error)
+                        for number, ply, move, error in result.examples)
+    return JobReport(
+        len(tasks), len(done), resumed,
+        sum(result.games for result in done.values()),
+        sum(result.moves for result in done.values()),
+        sum(result.illegal for result in done.values()),
+        dict(errors.most_common()), examples, run_moves, seconds, complete,
+    )
+
+
+def run_job(paths, checkpoint=None, processes=1, chunk_bytes=CHUNK_BYTES,
+            checkpoint_seconds=CHECKPOINT_SECONDS, max_examples=MAX_EXAMPLES,
+            max_chunks=None, on_chunk=None):
+    """
+    Validate archives chunk by chunk, resuming from a checkpoint.
+
+    Args:
+        paths: Archive paths (.jsonl, .pgn, optionally .gz)
+        checkpoint: Optional checkpoint file; finished chunks listed in it
+            are skipped and it is kept up to date
+        processes: Worker processes (1 runs in this process)
+        chunk_bytes: Size of the byte ranges plain JSONL files are split into
+        checkpoint_seconds: Minimum time between checkpoint writes
+        max_examples: Illegal moves kept per chunk
+        max_chunks: Stop after this many new chunks (the job can be resumed)
+        on_chunk: Optional callback(ChunkResult, finished, total) for
+            progress reports
+
+    Returns:
+        JobReport over every finished chunk, resumed ones included
+
+    Raises:
+        CheckpointMismatchError: If the checkpoint belongs to a different job
+    """
+    started = time.perf_counter()
+    fingerprint = _fingerprint(paths, chunk_bytes)
+    tasks = plan_tasks(paths, chunk_bytes)
+    done = load_checkpoint(checkpoint, fingerprint)
+    resumed = len(done)
+    pending = [(index, path, start, end, max_examples)
+               for index, (path, start, end) in enumerate(tasks) if index not in done]
+    if max_chunks is not None:
+        pending = pending[:max_chunks]
+
+    last_write = time.monotonic()
+    run_moves = 0
+
+    def record(result):
+        nonlocal last_write, run_moves
+        done[result.index] = result
+        run_moves += result.moves
+        if on_chunk is not None:
+            on_chunk(result, len(done), len(tasks))
+        if checkpoint is not None and time.monotonic() - last_write >= checkpoint_seconds:
+            write_checkpoint(checkpoint, fingerprint, done)
+            last_write = time.monotonic()
+
+    try:
+        if processes <= 1 or len(pending) <= 1:
+            for task in pending:
+                record(validate_chunk(task))
+        else:
+            with multiprocessing.Pool(min(processes, len(pending))) as pool:
+                for result in pool.imap_unordered(validate_chunk, pending):
+                    record(result)
+    finally:
+        # Also runs on KeyboardInterrupt, so an interrupted job keeps its progress
+        if checkpoint is not None:
+            write_checkpoint(checkpoint, fingerprint, done, len(done) == len(tasks))
+    return summarize(tasks, done, resumed, run_moves, time.perf_counter() - started)
+
+
+def format_chunk(result, finished, total, tasks):
+    """One progress line for a finished chunk."""
+    path, start, end = tasks[result.index]
+    where = os.path.basename(path) if start is None else f"{os.path.basename(path)}[{start}:{end}]"
+    rate = result.moves / result.seconds if result.seconds else 0.0
+    return (f"chunk {finished}/{total} {where}: {result.games} games, {result.moves} moves, "
+            f"{result.illegal} illegal, {result.seconds:.2f}s ({rate:,.0f} moves/s)")
+
+
+def format_report(report):
+    """Final summary of a JobReport."""
+    status = "complete" if report.complete else f"incomplete ({report.done}/{report.chunks} chunks)"
+    rate = report.run_moves / report.seconds if report.seconds else 0.0
+    lines = [
+        f"{status}: {report.games} games, {report.moves} moves, {report.illegal} games with an illegal move",
+        f"resumed {report.resumed} chunks; this run validated {report.run_moves} moves in "
+        f"{report.seconds:.2f}s ({rate:,.0f} moves/s)",
+    ]
+    for error, count in report.errors.items():
+        lines.append(f"  {count:>8}  {error}")
+    for example in report.examples:
+        lines.append(f"  {example.path} game {example.game} ply {example.ply + 1}: {example.move}: {example.error}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Command line entry point; exits with status 1 when an illegal move was found."""
+    parser = argparse.ArgumentParser(description="Re-validate archived games, resumably")
+    parser.add_argument('archives', nargs='+', help="JSONL or PGN archives (optionally .gz)")
+    parser.add_argument('--checkpoint', help="checkpoint file to resume from and keep up to date")
+    parser.add_argument('--restart', action='store_true', help="ignore an existing checkpoint")
+    parser.add_argument('-j', '--processes', type=int, default=multiprocessing.cpu_count(),
+                        help="worker processes")
+    parser.add_argument('--chunk-bytes', type=int, default=CHUNK_BYTES, help="JSONL chunk size in bytes")
+    parser.add_argument('--interval', type=float, default=CHECKPOINT_SECONDS,
+                        help="seconds between checkpoint writes")
+    parser.add_argument('--examples', type=int, default=MAX_EXAMPLES, help="illegal moves listed per chunk")
+    args = parser.parse_args(argv)
+
+    if args.restart and args.checkpoint and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+    tasks = plan_tasks(args.archives, args.chunk_bytes)
+    try:
+        report = run_job(args.archives, args.checkpoint, args.processes, args.chunk_bytes, args.interval,
+                         args.examples,
+                         on_chunk=lambda result, finished, total: print(
+                             format_chunk(result, finished, total, tasks), flush=True))
+    except CheckpointMismatchError as error:
+        parser.error(str(error))
+    except KeyboardInterrupt:
+        print(f"\ninterrupted; progress saved to {args.checkpoint}" if args.checkpoint else "\ninterrupted",
+              file=sys.stderr)
+        return 130
+    print(format_report(report))
+    return 1 if report.illegal else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
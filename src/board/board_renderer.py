@@ -1,16 +1,149 @@
-def render_board(board):
-    for row in board:
-        print(" | ".join(row))
-        print("-" * (len(row) * 4 - 1))
-
-def display_chess_board(chess_board):
-    rendered_board = []
-    for row in chess_board:
-        rendered_row = []
-        for piece in row:
-            if piece is None:
-                rendered_row.append(" . ")
+import sys
+
+from pieces.piece_codes import SYMBOL_BY_CODE
+from utils.position import index_to_algebraic
+
+FILE_LABELS = "  a b c d e f g h"
+BORDER = "  " + "-" * 15
+
+# Screen layout of a frame: labels, border, 8 board rows, border, labels and
+# a blank line; the cursor is left on PROMPT_LINE.
+FIRST_ROW_LINE = 3
+PROMPT_LINE = 14
+
+CELLS = [symbol or '.' for symbol in SYMBOL_BY_CODE]
+SQUARE_NAMES = [[index_to_algebraic(row, col) for col in range(8)] for row in range(8)]
+
+RENDER_MODES = ('full', 'ansi', 'diff', 'headless')
+
+
+def display_chess_board(board, stream=None):
+    """
+    Print a board of piece codes with a single write.
+
+    Args:
+        board: The chess board (2D list of piece codes)
+        stream: Writable text stream (defaults to sys.stdout)
+    """
+    (stream or sys.stdout).write(format_board(board))
+
+
+def format_board(board):
+    """
+    Format a board of piece codes as the text ChessBoard.render prints.
+
+    Args:
+        board: The chess board (2D list of piece codes)
+
+    Returns:
+        String with row and column labels, ending in a blank line
+    """
+    lines = ["", FILE_LABELS, BORDER]
+    for i, row in enumerate(board):
+        rank = 8 - i
+        lines.append(f"{rank}|{' '.join([CELLS[code] for code in row])} |{rank}")
+    lines += [BORDER, FILE_LABELS, "", ""]
+    return "\n".join(lines)
+
+
+class BoardRenderer:
+    """
+    Renders successive positions, sending only what changed.
+
+    Modes:
+        full: the whole board every frame (the classic console output)
+        ansi: the whole board once, then ANSI cursor moves that redraw only
+            the changed squares
+        diff: a compact one-line message per frame listing changed squares
+            as name + symbol ('.' for empty), e.g. "e2. e4P", for spectators
+        headless: nothing is formatted or written
+    """
+
+    def __init__(self, mode='full', stream=None):
+        """
+        Initialize a renderer.
+
+        Args:
+            mode: One of RENDER_MODES
+            stream: Writable text stream (defaults to sys.stdout at write time)
+        """
+        if mode not in RENDER_MODES:
+            raise ValueError(f"Unknown render mode: {mode}")
+        self.mode = mode
+        self.stream = stream
+        self._last = None
+
+    @property
+    def headless(self):
+        """Check if rendering is skipped entirely."""
+        return self.mode == 'headless'
+
+    def reset(self):
+        """Forget the last frame so the next one is drawn in full."""
+        self._last = None
+
+    def _changes(self, board):
+        """Return [(row, col, code)] for squares that differ from the last frame."""
+        last = self._last
+        changes = []
+        for row_index, row in enumerate(board):
+            previous = last[row_index]
+            if row != previous:
+                for col, code in enumerate(row):
+                    if code != previous[col]:
+                        changes.append((row_index, col, code))
+        return changes
+
+    def frame(self, board):
+        """
+        Build the text for the next frame and remember the board.
+
+        Args:
+            board: The chess board (2D list of piece codes)
+
+        Returns:
+            Text to write; empty when nothing changed (or in headless mode)
+        """
+        if self.mode == 'headless':
+            return ""
+        if self._last is None or self.mode == 'full':
+            if self.mode == 'ansi':
+                text = "\x1b[H\x1b[2J" + format_board(board)[1:]
+            elif self.mode == 'diff':
+                text = " ".join(
+                    SQUARE_NAMES[row][col] + CELLS[code]
+                    for row, line in enumerate(board) for col, code in enumerate(line)
+                ) + "\n"
             else:
-                rendered_row.append(f" {piece.symbol} ")
-        rendered_board.append(rendered_row)
-    render_board(rendered_board)
\ No newline at end of file
+                text = format_board(board)
+        else:
+            changes = self._changes(board)
+            if not changes:
+                text = ""
+            elif self.mode == 'ansi':
+                parts = [
+                    f"\x1b[{FIRST_ROW_LINE + row};{3 + 2 * col}H{CELLS[code]}"
+                    for row, col, code in changes
+                ]
+                parts.append(f"\x1b[{PROMPT_LINE};1H\x1b[J")
+                text = "".join(parts)
+            else:
+                text = " ".join(SQUARE_NAMES[row][col] + CELLS[code] for row, col, code in changes) + "\n"
+        if self.mode != 'full':
+            self._last = [row[:] for row in board]
+        return text
+
+    def render(self, board):
+        """
+        Write the next frame with a single write call.
+
+        Args:
+            board: The chess board (2D list of piece codes)
+        """
+        if self.mode == 'headless':
+            return
+        text = self.frame(board)
+        if text:
+            stream = self.stream or sys.stdout
+            stream.write(text)
+            stream.flush()
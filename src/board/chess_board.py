@@ -1,9 +1,18 @@
+import sys
+
 from pieces.pawn import Pawn
 from pieces.rook import Rook
 from pieces.knight import Knight
 from pieces.bishop import Bishop
 from pieces.queen import Queen
 from pieces.king import King
+from moves.move_generator import piece_moves, side_targets, squares_to_mask
+from pieces.piece_codes import (
+    BISHOP, BLACK_BIT, COLOR_NAMES, COLOR_SHIFT, EMPTY, KING, KNIGHT, PAWN, QUEEN, ROOK,
+    SYMBOL_BY_CODE, code_of, side_of, symbol_of,
+)
+
+BACK_RANK = (ROOK, KNIGHT, BISHOP, QUEEN, KING, BISHOP, KNIGHT, ROOK)
 
 
 class ChessBoard:
@@ -14,53 +23,64 @@ class ChessBoard:
         self.piece_map = self._create_piece_map()
 
     def _initialize_board(self):
-        """Initialize an 8x8 chess board with pieces in starting positions."""
-        board = [[None for _ in range(8)] for _ in range(8)]
+        """
+        Initialize an 8x8 chess board with pieces in starting positions.
+
+        Squares hold integer piece codes (see pieces.piece_codes), 0 when empty.
+        """
+        board = [[EMPTY for _ in range(8)] for _ in range(8)]
         
         # Setup white pieces (row 0 and 1)
-        board[0] = ['R', 'N', 'B', 'Q', 'K', 'B', 'N', 'R']
-        board[1] = ['P'] * 8
+        board[0] = list(BACK_RANK)
+        board[1] = [PAWN] * 8
         
         # Setup black pieces (row 6 and 7)
-        board[6] = ['p'] * 8
-        board[7] = ['r', 'n', 'b', 'q', 'k', 'b', 'n', 'r']
+        board[6] = [PAWN | BLACK_BIT] * 8
+        board[7] = [kind | BLACK_BIT for kind in BACK_RANK]
         
         return board
 
     def _create_piece_map(self):
-        """Create a mapping of symbols to piece objects for move validation."""
-        return {
-            'P': Pawn('white'), 'p': Pawn('black'),
-            'R': Rook('white'), 'r': Rook('black'),
-            'N': Knight('white'), 'n': Knight('black'),
-            'B': Bishop('white'), 'b': Bishop('black'),
-            'Q': Queen('white'), 'q': Queen('black'),
-            'K': King('white'), 'k': King('black'),
-        }
+        """Create a mapping of piece codes to piece objects for move validation."""
+        pieces = [
+            Pawn('white'), Pawn('black'),
+            Rook('white'), Rook('black'),
+            Knight('white'), Knight('black'),
+            Bishop('white'), Bishop('black'),
+            Queen('white'), Queen('black'),
+            King('white'), King('black'),
+        ]
+        return {piece.code: piece for piece in pieces}
 
     def render(self):
         """Display the chess board with row and column labels."""
-        print("\n  a b c d e f g h")
-        print("  " + "-" * 15)
-        for i, row in enumerate(self.board):
-            row_str = f"{8 - i}|"
-            for piece in row:
-                row_str += piece if piece else '.'
-                row_str += ' '
-            print(row_str + f"|{8 - i}")
-        print("  " + "-" * 15)
-        print("  a b c d e f g h\n")
+        from board.board_renderer import format_board
+        sys.stdout.write(format_board(self.board))
 
     def get_piece(self, position):
-        """Get the piece at the given position."""
+        """Get the symbol of the piece at the given position (None if empty)."""
+        row, col = position
+        return symbol_of(self.board[row][col])
+
+    def get_code(self, position):
+        """Get the integer piece code at the given position (0 if empty)."""
         row, col = position
         return self.board[row][col]
 
+    def set_piece(self, position, symbol):
+        """Place the piece with the given symbol on a square (None empties it)."""
+        row, col = position
+        self.board[row][col] = code_of(symbol)
+
+    def clear(self):
+        """Remove every piece from the board."""
+        self.board = [[EMPTY for _ in range(8)] for _ in range(8)]
+
     def move_piece(self, start, end):
         """Move a piece from start to end position."""
         piece = self.board[start[0]][start[1]]
         self.board[end[0]][end[1]] = piece
-        self.board[start[0]][start[1]] = None
+        self.board[start[0]][start[1]] = EMPTY
 
     def is_position_valid(self, position):
         """Check if a position is within board boundaries."""
@@ -69,17 +89,57 @@ class ChessBoard:
 
     def is_king_captured(self, color):
         """Check if the king of the given color is still on the board."""
-        king_symbol = 'K' if color == 'white' else 'k'
+        king_code = KING | (side_of(color) << COLOR_SHIFT)
         for row in self.board:
-            if king_symbol in row:
+            if king_code in row:
                 return False
         return True
 
     def get_piece_color(self, symbol):
-        """Get the color of a piece from its symbol."""
-        if symbol is None:
+        """Get the color of a piece from its symbol (or piece code)."""
+        if not symbol:
             return None
-        return 'white' if symbol.isupper() else 'black'
+        if isinstance(symbol, str):
+            symbol = code_of(symbol)
+        return COLOR_NAMES[symbol >> COLOR_SHIFT]
+
+    def targets_from(self, square, as_mask=False):
+        """
+        List every square the piece on a square can move to.
+
+        Gives the same answers as calling validate_move for each destination
+        (with the piece's own color), computed in one pass over its direction
+        tables.
+
+        Args:
+            square: Tuple (row, col) of the piece
+            as_mask: Return a 64-bit mask (bit row * 8 + col) instead of a list
+
+        Returns:
+            List of (row, col) destinations (or mask); empty for an empty or
+            out-of-bounds square
+        """
+        if not self.is_position_valid(square):
+            return 0 if as_mask else []
+        targets = piece_moves(self.board, square)
+        return squares_to_mask(targets) if as_mask else targets
+
+    def all_targets(self, color, as_mask=False):
+        """
+        Map every piece of a color to the squares it can move to.
+
+        Args:
+            color: 'white' or 'black' (or side 0 / 1)
+            as_mask: Give each piece's destinations as a 64-bit mask
+
+        Returns:
+            Dict of (row, col) -> list of destinations (or mask), with an
+            entry for each of the color's pieces
+        """
+        targets = side_targets(self.board, side_of(color))
+        if as_mask:
+            return {square: squares_to_mask(ends) for square, ends in targets.items()}
+        return targets
 
     def validate_move(self, start, end, current_player):
         """
@@ -88,37 +148,43 @@ class ChessBoard:
         Args:
             start: Tuple (row, col) starting position
             end: Tuple (row, col) ending position
-            current_player: 'white' or 'black'
+            current_player: 'white' or 'black' (or side 0 / 1)
             
         Returns:
             Tuple (is_valid, error_message)
+
+        Raises:
+            ValueError: If current_player is not a side
         """
+        side = side_of(current_player)
+        start_row, start_col = start
+        end_row, end_col = end
+
         # Check if positions are valid
-        if not self.is_position_valid(start):
+        if not (0 <= start_row < 8 and 0 <= start_col < 8):
             return False, "Starting position is out of bounds"
-        if not self.is_position_valid(end):
+        if not (0 <= end_row < 8 and 0 <= end_col < 8):
             return False, "Ending position is out of bounds"
         
         # Check if there's a piece at start position
-        piece_symbol = self.get_piece(start)
-        if piece_symbol is None:
+        board = self.board
+        piece_code = board[start_row][start_col]
+        if piece_code == EMPTY:
             return False, "No piece at starting position"
         
         # Check if piece belongs to current player
-        piece_color = self.get_piece_color(piece_symbol)
-        if piece_color != current_player:
-            return False, f"That piece belongs to {piece_color}, not {current_player}"
+        piece_side = piece_code >> COLOR_SHIFT
+        if piece_side != side:
+            return False, f"That piece belongs to {COLOR_NAMES[piece_side]}, not {COLOR_NAMES[side]}"
         
         # Check if trying to capture own piece
-        target_symbol = self.get_piece(end)
-        if target_symbol is not None:
-            target_color = self.get_piece_color(target_symbol)
-            if target_color == current_player:
-                return False, "Cannot capture your own piece"
+        target_code = board[end_row][end_col]
+        if target_code != EMPTY and target_code >> COLOR_SHIFT == side:
+            return False, "Cannot capture your own piece"
         
         # Check if move is valid for this piece type
-        piece = self.piece_map.get(piece_symbol)
-        if piece and not piece.is_valid_move(start, end, self.board):
-            return False, f"Invalid move for {piece_symbol}"
+        piece = self.piece_map.get(piece_code)
+        if piece and not piece.is_valid_move(start, end, board):
+            return False, f"Invalid move for {SYMBOL_BY_CODE[piece_code]}"
         
         return True, ""
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""
+Zobrist position hashing.
+
+A position key is the XOR of one fixed random 64-bit number per
+(piece code, square) pair, plus a side-to-move key when Black is to move.
+The keys are generated from a fixed seed so hashes are stable across runs
+and can be stored on disk (opening books, dedup indexes).
+"""
+
+import random
+
+from pieces.piece_codes import BLACK, EMPTY, PIECE_CODES, side_of
+
+_rng = random.Random(0x5A0B1257)
+PIECE_KEYS = [None] * 16
+for _code in sorted(PIECE_CODES):
+    PIECE_KEYS[_code] = tuple(tuple(_rng.getrandbits(64) for _ in range(8)) for _ in range(8))
+BLACK_TO_MOVE_KEY = _rng.getrandbits(64)
+del _rng, _code
+
+
+def position_hash(board, side):
+    """
+    Compute the Zobrist key of a position.
+
+    Args:
+        board: The chess board (2D list of piece codes)
+        side: Side to move, 0 for White and 1 for Black (or 'white' / 'black')
+
+    Returns:
+        Unsigned 64-bit integer key
+    """
+    key = BLACK_TO_MOVE_KEY if side_of(side) == BLACK else 0
+    for row_index, row in enumerate(board):
+        for col, code in enumerate(row):
+            if code != EMPTY:
+                key ^= PIECE_KEYS[code][row_index][col]
+    return key
+
+
+def move_hash_delta(code, start, end, captured=EMPTY):
+    """
+    Return the XOR delta for moving a piece from start to end.
+
+    XOR the result into a key (together with BLACK_TO_MOVE_KEY for the side
+    switch) to update it incrementally instead of rehashing the board.
+    """
+    keys = PIECE_KEYS[code]
+    delta = keys[start[0]][start[1]] ^ keys[end[0]][end[1]]
+    if captured != EMPTY:
+        delta ^= PIECE_KEYS[captured][end[0]][end[1]]
+    return delta
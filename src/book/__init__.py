@@ -0,0 +1 @@
+# This file marks the book directory as a package.
\ No newline at end of file
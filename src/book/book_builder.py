@@ -0,0 +1,91 @@
+"""
+Build an opening book from PGN archives.
+
+Every game is replayed from the starting position for the first plies, and
+each (position, move) pair is counted. The counts become the record weights
+of a book file readable by book.opening_book.OpeningBook.
+
+Usage (from the src directory):
+    python3 -m book.book_builder games.pgn [more.pgn ...] -o book.bin --plies 16
+"""
+
+import argparse
+from collections import Counter
+
+from board.zobrist import position_hash
+from book.opening_book import RECORD
+from moves.move_generator import encode_move
+from notation.pgn import read_games, replay
+
+MAX_WEIGHT = 0xFFFF
+
+
+def count_book_moves(sources, max_plies=16):
+    """
+    Count (position hash, encoded move) occurrences over PGN sources.
+
+    Args:
+        sources: Iterable of PGN paths or open files
+        max_plies: Number of plies per game to include
+
+    Returns:
+        Tuple (Counter of (key, move) pairs, number of games read)
+    """
+    counts = Counter()
+    games = 0
+    for source in sources:
+        for game in read_games(source):
+            games += 1
+            for board, side, move in replay(game.moves, max_plies):
+                counts[(position_hash(board.board, side), encode_move(*move))] += 1
+    return counts, games
+
+
+def write_book(counts, output_path, min_count=1):
+    """
+    Write counted moves as a sorted book file.
+
+    Args:
+        counts: Mapping of (key, move) to occurrence count
+        output_path: Destination path
+        min_count: Drop moves seen fewer times than this
+
+    Returns:
+        Number of records written
+    """
+    written = 0
+    with open(output_path, 'wb') as handle:
+        for (key, move), count in sorted(counts.items()):
+            if count < min_count:
+                continue
+            handle.write(RECORD.pack(key, move, min(count, MAX_WEIGHT)))
+            written += 1
+    return written
+
+
+def build_book(sources, output_path, max_plies=16, min_count=1):
+    """
+    Build a book file from PGN archives.
+
+    Returns:
+        Tuple (records written, games read)
+    """
+    counts, games = count_book_moves(sources, max_plies)
+    return write_book(counts, output_path, min_count), games
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Build an opening book from PGN files")
+    parser.add_argument('pgn', nargs='+', help="PGN archives to read")
+    parser.add_argument('-o', '--output', default='book.bin', help="book file to write")
+    parser.add_argument('--plies', type=int, default=16, help="plies per game to include")
+    parser.add_argument('--min-count', type=int, default=1, help="drop rarer moves")
+    args = parser.parse_args(argv)
+
+    records, games = build_book(args.pgn, args.output, args.plies, args.min_count)
+    print(f"Wrote {records} records from {games} games to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
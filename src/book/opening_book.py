@@ -0,0 +1,125 @@
+"""
+Opening book reader.
+
+A book file is a flat array of fixed-size little-endian records
+(position hash: uint64, move: uint16, weight: uint16), sorted by position
+hash. The file is memory-mapped and searched with a binary search, so a
+lookup touches only a handful of records and the book is never loaded into
+Python objects.
+"""
+
+import mmap
+import random
+import struct
+
+from board.zobrist import position_hash
+from moves.move_generator import decode_move
+
+RECORD = struct.Struct('<QHH')
+RECORD_SIZE = RECORD.size
+KEY = struct.Struct('<Q')
+
+
+class OpeningBook:
+    """Memory-mapped, binary-searched opening book."""
+
+    def __init__(self, path):
+        """
+        Open a book file.
+
+        Args:
+            path: Path to a book written by book.book_builder
+        """
+        self._file = open(path, 'rb')
+        self._map = None
+        self.size = 0
+        length = self._file.seek(0, 2)
+        if length % RECORD_SIZE:
+            self._file.close()
+            raise ValueError(f"{path} is not a book file (size {length} is not a multiple of {RECORD_SIZE})")
+        if length:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.size = length // RECORD_SIZE
+
+    def close(self):
+        """Release the memory map and file handle."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __len__(self):
+        return self.size
+
+    def _lower_bound(self, key):
+        """Return the index of the first record whose hash is >= key."""
+        low, high = 0, self.size
+        unpack_key = KEY.unpack_from
+        data = self._map
+        while low < high:
+            middle = (low + high) // 2
+            if unpack_key(data, middle * RECORD_SIZE)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def lookup(self, key):
+        """
+        Find the book entries for a position hash.
+
+        Args:
+            key: Zobrist key from board.zobrist.position_hash
+
+        Returns:
+            List of (encoded move, weight) tuples, in file order
+        """
+        entries = []
+        if not self.size:
+            return entries
+        index = self._lower_bound(key)
+        unpack = RECORD.unpack_from
+        while index < self.size:
+            entry_key, move, weight = unpack(self._map, index * RECORD_SIZE)
+            if entry_key != key:
+                break
+            entries.append((move, weight))
+            index += 1
+        return entries
+
+    def probe(self, board, side):
+        """
+        Find the book moves for a position.
+
+        Args:
+            board: The chess board (2D list of piece codes)
+            side: Side to move, 0 for White and 1 for Black (or 'white' / 'black')
+
+        Returns:
+            List of ((start, end), weight) tuples, highest weight first
+        """
+        entries = self.lookup(position_hash(board, side))
+        entries.sort(key=lambda entry: entry[1], reverse=True)
+        return [(decode_move(move), weight) for move, weight in entries]
+
+    def choose_move(self, board, side, rng=None):
+        """
+        Pick a book move at random, proportionally to its weight.
+
+        Returns:
+            Tuple (start, end) or None when the position is not in the book
+        """
+        entries = self.probe(board, side)
+        if not entries:
+            return None
+        rng = rng or random
+        moves = [move for move, _ in entries]
+        weights = [max(weight, 1) for _, weight in entries]
+        return rng.choices(moves, weights=weights)[0]
@@ -0,0 +1,234 @@
+"""
+Endgame tablebase probing.
+
+A table covers one material signature such as 'KQvK' (White's pieces, then
+Black's). Every placement of those pieces, with either side to move, has a
+slot in a flat array:
+
+    index = (((sq0 * 64 + sq1) * 64 + ...) * 2) + side_to_move
+
+where sqN = row * 8 + col of the Nth piece in signature order and
+side_to_move is 0 for White, 1 for Black. Each slot is one signed byte:
+positive n means the side to move captures the enemy king in n plies,
+negative n means it loses in n plies, and 0 is a draw (or an impossible
+placement).
+
+Tables are stored with the stronger side as White. Positions where Black
+has the stronger material are mirrored (colors swapped, rows flipped) before
+probing, which preserves pawn directions.
+"""
+
+import mmap
+import os
+from collections import namedtuple
+
+from pieces.piece_codes import BLACK_BIT, COLOR_SHIFT, CODE_BY_SYMBOL, EMPTY, TYPE_LETTERS, TYPE_MASK, side_of
+
+MAGIC = b'CTB1'
+HEADER_SIZE = 16
+MAX_PIECES = 4
+PIECE_ORDER = 'KQRBNP'
+PIECE_VALUES = {'K': 0, 'Q': 9, 'R': 5, 'B': 3, 'N': 3, 'P': 1}
+
+TablebaseResult = namedtuple('TablebaseResult', ['outcome', 'plies'])
+
+
+def _sort_letters(letters):
+    """Order piece letters K, Q, R, B, N, P."""
+    return ''.join(sorted(letters, key=PIECE_ORDER.index))
+
+
+def _strength(letters):
+    """Material strength used to decide which side a table stores as White."""
+    return sum(PIECE_VALUES[letter] for letter in letters), [-PIECE_ORDER.index(l) for l in letters]
+
+
+def canonical_signature(white, black):
+    """
+    Build the canonical signature for two sides' piece letters.
+
+    Args:
+        white: White piece letters, e.g. 'KQ'
+        black: Black piece letters, e.g. 'K'
+
+    Returns:
+        Tuple (signature, mirrored) where mirrored means the sides were
+        swapped to put the stronger material on White.
+    """
+    white, black = _sort_letters(white.upper()), _sort_letters(black.upper())
+    if _strength(black) > _strength(white):
+        return f"{black}v{white}", True
+    return f"{white}v{black}", False
+
+
+class Material:
+    """Piece layout of one signature and its index arithmetic."""
+
+    def __init__(self, signature):
+        """
+        Parse a signature such as 'KQvK'.
+
+        Args:
+            signature: Canonical signature string
+        """
+        white, black = signature.split('v')
+        if white[:1] != 'K' or black[:1] != 'K':
+            raise ValueError(f"Both sides need a king: {signature}")
+        self.signature = signature
+        self.codes = tuple(CODE_BY_SYMBOL[symbol] for symbol in white + black.lower())
+        self.size = 2 * 64 ** len(self.codes)
+
+    def index(self, squares, side):
+        """Return the slot of a placement (squares in signature order) and side to move."""
+        index = 0
+        for square in squares:
+            index = index * 64 + square
+        return index * 2 + side
+
+    def placement(self, index):
+        """Invert index(): return (squares tuple, side to move)."""
+        side = index & 1
+        index >>= 1
+        squares = []
+        for _ in self.codes:
+            index, square = divmod(index, 64)
+            squares.append(square)
+        return tuple(reversed(squares)), side
+
+    def __repr__(self):
+        return f"Material({self.signature!r})"
+
+
+def locate(pieces, side):
+    """
+    Map a list of (piece code, square) pieces onto a canonical table slot.
+
+    Args:
+        pieces: List of (piece code, row * 8 + col) pairs
+        side: Side to move, 0 for White and 1 for Black
+
+    Returns:
+        Tuple (signature, index) or None when the material is not covered
+    """
+    if len(pieces) > MAX_PIECES:
+        return None
+    white = ''.join(TYPE_LETTERS[code & TYPE_MASK] for code, _ in pieces if not code >> COLOR_SHIFT)
+    black = ''.join(TYPE_LETTERS[code & TYPE_MASK] for code, _ in pieces if code >> COLOR_SHIFT)
+    if 'K' not in white or 'K' not in black:
+        return None
+    signature, mirrored = canonical_signature(white, black)
+    if mirrored:
+        pieces = [(code ^ BLACK_BIT, (7 - square // 8) * 8 + square % 8) for code, square in pieces]
+        side ^= 1
+
+    material = Material(signature)
+    remaining = list(pieces)
+    squares = []
+    for wanted in material.codes:
+        for position, (candidate, square) in enumerate(remaining):
+            if candidate == wanted:
+                squares.append(square)
+                del remaining[position]
+                break
+    return signature, material.index(squares, side)
+
+
+def table_path(directory, signature):
+    """Return the file path of a signature's table."""
+    return os.path.join(directory, f"{signature}.ctb")
+
+
+def decode_value(value):
+    """Turn a stored signed byte into a TablebaseResult."""
+    if value > 0:
+        return TablebaseResult('win', value)
+    if value < 0:
+        return TablebaseResult('loss', -value)
+    return TablebaseResult('draw', 0)
+
+
+class Tablebase:
+    """Probes memory-mapped tables in a directory."""
+
+    def __init__(self, directory):
+        """
+        Initialize a tablebase over a directory of .ctb files.
+
+        Args:
+            directory: Directory containing tables written by the generator
+        """
+        self.directory = directory
+        self._tables = {}
+
+    def _table(self, signature):
+        """Open (once) and return the memory map for a signature, or None."""
+        if signature in self._tables:
+            return self._tables[signature]
+        table = None
+        path = table_path(self.directory, signature)
+        if os.path.exists(path):
+            with open(path, 'rb') as handle:
+                table = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            if table[:4] != MAGIC:
+                table.close()
+                raise ValueError(f"{path} is not a tablebase file")
+        self._tables[signature] = table
+        return table
+
+    def has_table(self, signature):
+        """Check if a table for signature is available."""
+        return self._table(signature) is not None
+
+    def probe_value(self, signature, index):
+        """
+        Read a raw slot.
+
+        Returns:
+            Signed distance (see module docstring) or None if the table is missing
+        """
+        table = self._table(signature)
+        if table is None:
+            return None
+        value = table[HEADER_SIZE + index]
+        return value - 256 if value > 127 else value
+
+    def probe_pieces(self, pieces, side):
+        """
+        Probe a position given as (piece code, square) pairs.
+
+        Returns:
+            Signed distance or None when no table covers the position
+        """
+        located = locate(pieces, side)
+        if located is None:
+            return None
+        return self.probe_value(*located)
+
+    def probe(self, board, side):
+        """
+        Probe a board position.
+
+        Args:
+            board: The chess board (2D list of piece codes)
+            side: Side to move, 0 for White and 1 for Black (or 'white' / 'black')
+
+        Returns:
+            TablebaseResult from the side to move's point of view, or None
+        """
+        side = side_of(side)
+        pieces = []
+        for row_index, row in enumerate(board):
+            for col, code in enumerate(row):
+                if code != EMPTY:
+                    pieces.append((code, row_index * 8 + col))
+                    if len(pieces) > MAX_PIECES:
+                        return None
+        value = self.probe_pieces(pieces, side)
+        return None if value is None else decode_value(value)
+
+    def close(self):
+        """Release all memory maps."""
+        for table in self._tables.values():
+            if table is not None:
+                table.close()
+        self._tables = {}
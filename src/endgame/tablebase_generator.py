@@ -0,0 +1,290 @@
+"""
+Retrograde-analysis tablebase generator.
+
+Generation runs in two phases:
+
+1. A forward scan over every slot (split across worker processes) counts
+   each position's moves using the ChessBoard move rules. Moves that capture
+   the enemy king are immediate wins; other captures leave the table and are
+   resolved by probing the smaller, already generated table.
+2. A level-by-level backward pass propagates results through un-moves:
+   a position that lost in n plies makes all its predecessors wins in n + 1,
+   and a position whose moves all lead to opponent wins is a loss in
+   (longest of those) + 1. Whatever is never resolved is a draw.
+
+The sub-tables a signature needs are generated first, so asking for 'KQvK'
+also writes 'KvK'. Pure-Python generation of 3-piece tables takes seconds to
+minutes; 4-piece tables are 64 times larger and are meant for the
+multi-process path.
+
+Usage (from the src directory):
+    python3 -m endgame.tablebase_generator KQvK KRvK -d tables -j 4
+"""
+
+import argparse
+import os
+from array import array
+from multiprocessing import Pool
+
+from board.chess_board import ChessBoard
+from endgame.tablebase import (
+    HEADER_SIZE, MAGIC, Material, Tablebase, canonical_signature, table_path,
+)
+from moves.move_generator import piece_moves
+from pieces.piece_codes import COLOR_SHIFT, EMPTY, KING, PAWN, TYPE_MASK, WHITE
+
+MAX_DISTANCE = 127
+CHUNK_SIZE = 1 << 15
+
+
+def sub_signatures(signature):
+    """List the canonical signatures reachable by capturing one non-king piece."""
+    white, black = signature.split('v')
+    found = set()
+    for position in range(1, len(white)):
+        found.add(canonical_signature(white[:position] + white[position + 1:], black)[0])
+    for position in range(1, len(black)):
+        found.add(canonical_signature(white, black[:position] + black[position + 1:])[0])
+    return sorted(found)
+
+
+def _place(grid, codes, squares):
+    """Put pieces on a scratch grid; return False if two share a square."""
+    for code, square in zip(codes, squares):
+        row, col = divmod(square, 8)
+        if grid[row][col] != EMPTY:
+            _clear(grid, squares)
+            return False
+        grid[row][col] = code
+    return True
+
+
+def _clear(grid, squares):
+    """Remove pieces from a scratch grid."""
+    for square in squares:
+        grid[square // 8][square % 8] = EMPTY
+
+
+def scan_range(signature, directory, start, stop):
+    """
+    Forward-scan slots [start, stop) of a table.
+
+    Returns:
+        Tuple (start, values, counts, sub_wins, sub_losses) where values holds
+        immediate king-capture wins, counts the number of non-king-capture
+        moves (255 for impossible placements), sub_wins maps slot -> shortest
+        win through a capture, and sub_losses lists (slot, distance) for
+        captures into positions the opponent wins.
+    """
+    material = Material(signature)
+    codes = material.codes
+    tablebase = Tablebase(directory)
+    board = ChessBoard()
+    board.clear()
+    grid = board.board
+
+    values = array('b', bytes(stop - start))
+    counts = array('B', bytes(stop - start))
+    sub_wins = {}
+    sub_losses = []
+
+    for index in range(start, stop):
+        squares, side = material.placement(index)
+        if not _place(grid, codes, squares):
+            counts[index - start] = 255
+            continue
+
+        count = 0
+        best_win = 0
+        for code, square in zip(codes, squares):
+            if code >> COLOR_SHIFT != side:
+                continue
+            start_pos = divmod(square, 8)
+            for end in piece_moves(grid, start_pos):
+                target = grid[end[0]][end[1]]
+                if target == EMPTY:
+                    count += 1
+                    continue
+                if target & TYPE_MASK == KING:
+                    best_win = 1
+                    break
+                count += 1
+                pieces = [
+                    (other, end[0] * 8 + end[1] if other_square == square else other_square)
+                    for other, other_square in zip(codes, squares)
+                    if other_square != end[0] * 8 + end[1]
+                ]
+                value = tablebase.probe_pieces(pieces, side ^ 1)
+                if value < 0 and (best_win == 0 or -value + 1 < best_win):
+                    best_win = -value + 1
+                elif value > 0:
+                    sub_losses.append((index, value))
+            if best_win == 1:
+                break
+
+        _clear(grid, squares)
+        if best_win == 1:
+            values[index - start] = 1
+        else:
+            counts[index - start] = count
+            if best_win:
+                sub_wins[index] = best_win
+
+    tablebase.close()
+    return start, values, counts, sub_wins, sub_losses
+
+
+def _scan_task(task):
+    """Pool adapter for scan_range."""
+    return scan_range(*task)
+
+
+def _predecessors(grid, codes, squares, side):
+    """
+    Yield (squares, side) of positions with a quiet move into this one.
+
+    The previous mover is the side not to move now. Non-pawn moves are
+    reversible on the same occupancy; pawns step back one square, or two
+    from their starting row.
+    """
+    mover = side ^ 1
+    for position, (code, square) in enumerate(zip(codes, squares)):
+        if code >> COLOR_SHIFT != mover:
+            continue
+        row, col = divmod(square, 8)
+        if code & TYPE_MASK == PAWN:
+            direction = 1 if mover == WHITE else -1
+            start_rank = 1 if mover == WHITE else 6
+            origins = []
+            back = row - direction
+            if 0 <= back < 8 and grid[back][col] == EMPTY:
+                origins.append((back, col))
+                if back - direction == start_rank and grid[back - direction][col] == EMPTY:
+                    origins.append((back - direction, col))
+        else:
+            origins = [end for end in piece_moves(grid, (row, col)) if grid[end[0]][end[1]] == EMPTY]
+        for origin in origins:
+            moved = list(squares)
+            moved[position] = origin[0] * 8 + origin[1]
+            yield tuple(moved), side ^ 1
+
+
+def generate_table(signature, directory, processes=1, verbose=False):
+    """
+    Generate one table (and any missing sub-tables).
+
+    Args:
+        signature: Material signature such as 'KQvK'
+        directory: Output directory
+        processes: Worker processes for the forward scan
+        verbose: Print progress
+
+    Returns:
+        Path of the written table
+    """
+    white, black = signature.split('v')
+    signature = canonical_signature(white, black)[0]
+    path = table_path(directory, signature)
+    if os.path.exists(path):
+        return path
+    os.makedirs(directory, exist_ok=True)
+    for sub in sub_signatures(signature):
+        generate_table(sub, directory, processes, verbose)
+
+    material = Material(signature)
+    size = material.size
+    values = array('b', bytes(size))
+    counts = array('B', bytes(size))
+    win_at = {}
+    loss_events = {}
+
+    tasks = [(signature, directory, start, min(start + CHUNK_SIZE, size))
+             for start in range(0, size, CHUNK_SIZE)]
+    if processes > 1:
+        with Pool(processes) as pool:
+            results = pool.imap_unordered(_scan_task, tasks)
+            chunks = list(results)
+    else:
+        chunks = [scan_range(*task) for task in tasks]
+    for start, chunk_values, chunk_counts, sub_wins, sub_losses in chunks:
+        values[start:start + len(chunk_values)] = chunk_values
+        counts[start:start + len(chunk_counts)] = chunk_counts
+        for index, distance in sub_wins.items():
+            win_at.setdefault(distance, []).append(index)
+        for index, distance in sub_losses:
+            loss_events.setdefault(distance, []).append(index)
+
+    # Positions without any move stay draws; remember them so the
+    # backward pass never counts them down to a loss.
+    for index in range(size):
+        if counts[index] == 0 and values[index] == 0:
+            counts[index] = 255
+
+    board = ChessBoard()
+    board.clear()
+    grid = board.board
+    codes = material.codes
+    frontier = [index for index in range(size) if values[index] == 1]
+
+    level = 1
+    while level < MAX_DISTANCE and (frontier or win_at or loss_events):
+        for index in win_at.pop(level, ()):
+            if values[index] == 0:
+                values[index] = level
+                frontier.append(index)
+        next_frontier = []
+        for index in loss_events.pop(level, ()):
+            if values[index] == 0 and counts[index] != 255:
+                counts[index] -= 1
+                if counts[index] == 0:
+                    values[index] = -(level + 1)
+                    next_frontier.append(index)
+
+        for index in frontier:
+            lost = values[index] < 0
+            squares, side = material.placement(index)
+            _place(grid, codes, squares)
+            for previous in _predecessors(grid, codes, squares, side):
+                previous_index = material.index(*previous)
+                if values[previous_index] != 0:
+                    continue
+                if lost:
+                    values[previous_index] = level + 1
+                    next_frontier.append(previous_index)
+                elif counts[previous_index] != 255:
+                    counts[previous_index] -= 1
+                    if counts[previous_index] == 0:
+                        values[previous_index] = -(level + 1)
+                        next_frontier.append(previous_index)
+            _clear(grid, squares)
+
+        if verbose:
+            print(f"{signature}: level {level}: {len(frontier)} positions")
+        frontier = next_frontier
+        level += 1
+
+    temporary = path + '.tmp'
+    with open(temporary, 'wb') as handle:
+        handle.write(MAGIC + signature.encode('ascii').ljust(HEADER_SIZE - len(MAGIC), b'\0'))
+        handle.write(values.tobytes())
+    os.replace(temporary, path)
+    return path
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Generate endgame tablebases")
+    parser.add_argument('signatures', nargs='+', help="material signatures, e.g. KQvK KRvK")
+    parser.add_argument('-d', '--directory', default='tables', help="output directory")
+    parser.add_argument('-j', '--processes', type=int, default=os.cpu_count() or 1,
+                        help="worker processes for the forward scan")
+    parser.add_argument('-v', '--verbose', action='store_true', help="print progress")
+    args = parser.parse_args(argv)
+
+    for signature in args.signatures:
+        path = generate_table(signature, args.directory, args.processes, args.verbose)
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
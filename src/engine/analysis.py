@@ -0,0 +1,234 @@
+"""
+Game review: multi-PV analysis of every position of a finished game.
+
+The game is replayed on a ChessBoard and each position before a move becomes
+a task. Workers in a process pool run Searcher.search_lines on it, asking
+for the best few lines and always scoring the move actually played. The
+score drop of the played move against the best line (from the mover's point
+of view, in centipawns) marks mistakes and blunders.
+
+The result can be written as PGN: SAN moves with $2 (mistake) and $4
+(blunder) NAGs, a comment with the played move's score and the best line,
+and the best line as a variation. notation.pgn reads such files back as the
+bare moves.
+
+Usage (from the src directory):
+    python3 -m engine.analysis games.jsonl --game 1 --lines 3 --depth 3 -j 4 -o review.pgn
+"""
+
+import argparse
+import multiprocessing
+import sys
+from collections import namedtuple
+
+from board.chess_board import ChessBoard
+from engine.evaluation import MATE_SCORE, MATE_THRESHOLD
+from engine.search import Searcher
+from notation.archive import read_archive, replay_game
+from notation.san import move_to_san
+from pieces.piece_codes import EMPTY, KING, TYPE_MASK, WHITE
+
+MISTAKE = 100
+BLUNDER = 300
+NAG_MISTAKE = '$2'
+NAG_BLUNDER = '$4'
+
+Line = namedtuple('Line', ['move', 'score', 'pv'])
+PlyAnalysis = namedtuple('PlyAnalysis', ['ply', 'side', 'played', 'score', 'lines', 'loss', 'nag', 'depth'])
+
+
+def replay_positions(moves):
+    """
+    Replay moves on a ChessBoard, stopping at an illegal move or a king capture.
+
+    Args:
+        moves: List of (start, end) tuples
+
+    Returns:
+        List of (board copy, side, move) for each position before a move
+    """
+    board = ChessBoard()
+    side = WHITE
+    positions = []
+    for start, end in moves:
+        if not board.validate_move(start, end, side)[0]:
+            break
+        positions.append(([row[:] for row in board.board], side, (start, end)))
+        captured = board.get_code(end)
+        board.move_piece(start, end)
+        if captured & TYPE_MASK == KING:
+            break
+        side ^= 1
+    return positions
+
+
+def annotate(loss, mistake=MISTAKE, blunder=BLUNDER):
+    """NAG for a score drop in centipawns ('' when the move is fine)."""
+    if loss >= blunder:
+        return NAG_BLUNDER
+    if loss >= mistake:
+        return NAG_MISTAKE
+    return ''
+
+
+def analyse_position(task):
+    """
+    Worker entry point: analyse one (ply, board, side, played, lines, depth, time) task.
+
+    Returns:
+        PlyAnalysis (nag and loss use the default thresholds)
+    """
+    ply, board, side, played, lines, depth, time_limit = task
+    results = Searcher().search_lines(board, side, lines, depth, time_limit, include=played)
+    found = [Line(result.move, result.score, result.pv) for result in results]
+    best = found[0].score if found else 0
+    score = next((line.score for line in found if line.move == played), best)
+    if len(found) > lines:
+        found = found[:lines]
+    loss = max(best - score, 0)
+    return PlyAnalysis(ply, side, played, score, found, loss, annotate(loss),
+                       results[0].depth if results else 0)
+
+
+def analyse_game(moves, lines=3, depth=3, time_limit=None, processes=1, mistake=MISTAKE, blunder=BLUNDER):
+    """
+    Analyse every position of a game.
+
+    Args:
+        moves: List of (start, end) tuples from the starting position (for
+            a GameState.move_history use analyse_history)
+        lines: Principal variations per position
+        depth: Search depth per position
+        time_limit: Optional seconds per position
+        processes: Worker processes (1 analyses in this process)
+        mistake: Score drop (centipawns) marked as a mistake
+        blunder: Score drop marked as a blunder
+
+    Returns:
+        List of PlyAnalysis in ply order
+    """
+    tasks = [
+        (ply, board, side, move, lines, depth, time_limit)
+        for ply, (board, side, move) in enumerate(replay_positions(moves))
+    ]
+    if processes <= 1 or len(tasks) <= 1:
+        results = [analyse_position(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(min(processes, len(tasks))) as pool:
+            results = pool.map(analyse_position, tasks, chunksize=1)
+    return [result._replace(nag=annotate(result.loss, mistake, blunder)) for result in results]
+
+
+def analyse_history(move_history, **options):
+    """Analyse a GameState.move_history list (options as for analyse_game)."""
+    return analyse_game([(move['start'], move['end']) for move in move_history], **options)
+
+
+def format_score(score):
+    """Score in pawns from the mover's side, or plies up to a king capture such as '#3' / '#-2'."""
+    if abs(score) > MATE_THRESHOLD:
+        plies = MATE_SCORE - abs(score) + 1
+        return f"#{plies}" if score > 0 else f"#-{plies}"
+    return f"{score / 100:+.2f}"
+
+
+def _san_line(board, side, pv):
+    """SAN text of a line played from a position."""
+    grid = [row[:] for row in board]
+    sans = []
+    for start, end in pv:
+        sans.append(move_to_san(grid, side, (start, end)))
+        grid[end[0]][end[1]] = grid[start[0]][start[1]]
+        grid[start[0]][start[1]] = EMPTY
+        side ^= 1
+    return sans
+
+
+def format_pgn(moves, analysis, tags=None, result='*'):
+    """
+    Write an analysed game as annotated PGN.
+
+    Args:
+        moves: The game's (start, end) moves
+        analysis: List of PlyAnalysis from analyse_game
+        tags: Optional dict of PGN tags
+        result: Result token for the movetext
+
+    Returns:
+        PGN text; each move carries its score in a comment, and moves that
+        are not the engine's first choice get the best score and line as a
+        variation
+    """
+    header = dict(tags or {})
+    header.setdefault('Result', result)
+    tokens = []
+    for (board, side, move), entry in zip(replay_positions(moves), analysis):
+        number = entry.ply // 2 + 1
+        # Every move has a comment, so Black's moves are numbered too
+        prefix = f"{number}." if side == WHITE else f"{number}..."
+        tokens.append(prefix)
+        tokens.append(move_to_san(board, side, move))
+        if entry.nag:
+            tokens.append(entry.nag)
+        best = entry.lines[0] if entry.lines else None
+        if best is None or best.move == move:
+            tokens.append(f"{{{format_score(entry.score)}}}")
+        else:
+            tokens.append(f"{{{format_score(entry.score)}, best {format_score(best.score)}}}")
+            tokens.append(f"({prefix} {' '.join(_san_line(board, side, best.pv))})")
+    tokens.append(result)
+    lines = [f'[{name} "{value}"]' for name, value in header.items()]
+    return '\n'.join(lines) + '\n\n' + ' '.join(tokens) + '\n'
+
+
+def summarize(analysis):
+    """Counts of mistakes and blunders per color plus the average loss (each capped at 1000 cp)."""
+    summary = {}
+    for color, side in (('white', 0), ('black', 1)):
+        entries = [entry for entry in analysis if entry.side == side]
+        summary[color] = {
+            'moves': len(entries),
+            'mistakes': sum(entry.nag == NAG_MISTAKE for entry in entries),
+            'blunders': sum(entry.nag == NAG_BLUNDER for entry in entries),
+            'average_loss': round(sum(min(entry.loss, 1000) for entry in entries) / max(len(entries), 1), 1),
+        }
+    return summary
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Annotate a game with multi-PV analysis")
+    parser.add_argument('archive', help="JSONL or PGN archive (optionally .gz)")
+    parser.add_argument('--game', type=int, default=1, help="game number in the archive (from 1)")
+    parser.add_argument('--lines', type=int, default=3, help="principal variations per position")
+    parser.add_argument('--depth', type=int, default=3, help="search depth per position")
+    parser.add_argument('--time', type=float, help="seconds per position")
+    parser.add_argument('--mistake', type=int, default=MISTAKE, help="score drop (centipawns) for a mistake")
+    parser.add_argument('--blunder', type=int, default=BLUNDER, help="score drop (centipawns) for a blunder")
+    parser.add_argument('-j', '--processes', type=int, default=multiprocessing.cpu_count(),
+                        help="worker processes")
+    parser.add_argument('-o', '--output', help="write the annotated PGN here instead of stdout")
+    args = parser.parse_args(argv)
+
+    game = next((game for index, game in enumerate(read_archive(args.archive), 1) if index == args.game), None)
+    if game is None:
+        parser.error(f"{args.archive} has no game {args.game}")
+    session, complete = replay_game(game)
+    if not complete:
+        print(f"Warning: only the first {len(session.move_history)} moves could be replayed", file=sys.stderr)
+    moves = [(move['start'], move['end']) for move in session.move_history]
+    analysis = analyse_game(moves, args.lines, args.depth, args.time, args.processes, args.mistake, args.blunder)
+    tags = {name.capitalize(): value for name, value in game.tags.items()}
+    text = format_pgn(moves, analysis, tags, game.result or session.result())
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            handle.write(text)
+    else:
+        sys.stdout.write(text)
+    for color, counts in summarize(analysis).items():
+        print(f"{color.capitalize()}: {counts['mistakes']} mistakes, {counts['blunders']} blunders, "
+              f"average loss {counts['average_loss']} cp", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
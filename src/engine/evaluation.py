@@ -0,0 +1,70 @@
+"""
+Static position evaluation.
+
+Scores are in centipawns from the point of view of the side to move. Kings
+carry no material value: losing the king ends the game, which the search
+scores separately.
+"""
+
+from pieces.piece_codes import (
+    BISHOP, BLACK, COLOR_SHIFT, EMPTY, KING, KNIGHT, PAWN, QUEEN, ROOK, WHITE, make_code, side_of,
+)
+
+# Indexed by piece type (code & TYPE_MASK)
+PIECE_VALUES = (0, 100, 320, 330, 500, 900, 0)
+
+MATE_SCORE = 30000
+MATE_THRESHOLD = MATE_SCORE - 1000
+
+
+def _centrality(row, col):
+    """Return 0 (edge) to 6 (centre) for a square."""
+    return int(7 - abs(row - 3.5) - abs(col - 3.5))
+
+
+def _build_square_values():
+    """Precompute material plus square bonus, indexed [piece code][row][col]."""
+    values = [None] * 16
+    for kind in (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING):
+        for side in (WHITE, BLACK):
+            table = []
+            for row in range(8):
+                advance = row if side == WHITE else 7 - row
+                line = []
+                for col in range(8):
+                    if kind == PAWN:
+                        bonus = advance * 6 + _centrality(row, col) * 2
+                    elif kind in (KNIGHT, BISHOP):
+                        bonus = _centrality(row, col) * 5
+                    elif kind == KING:
+                        bonus = -_centrality(row, col) * 3
+                    else:
+                        bonus = _centrality(row, col)
+                    line.append(PIECE_VALUES[kind] + bonus)
+                table.append(tuple(line))
+            values[make_code(side, kind)] = tuple(table)
+    return values
+
+
+SQUARE_VALUES = _build_square_values()
+
+
+def evaluate(board, side):
+    """
+    Evaluate a position.
+
+    Args:
+        board: The chess board (2D list of piece codes)
+        side: Side to move, 0 for White and 1 for Black (or 'white' / 'black')
+
+    Returns:
+        Integer score in centipawns, positive when the side to move is better
+    """
+    side = side_of(side)
+    score = 0
+    for row_index, row in enumerate(board):
+        for col, code in enumerate(row):
+            if code != EMPTY:
+                value = SQUARE_VALUES[code][row_index][col]
+                score += -value if code >> COLOR_SHIFT else value
+    return -score if side else score
@@ -0,0 +1,117 @@
+"""
+Lazy SMP parallel search.
+
+Several worker processes run the same iterative-deepening search from the
+root position. They share one transposition table in a
+multiprocessing.shared_memory block, so results found by one worker cut
+the trees of the others. Helpers start at staggered depths and shuffle
+their quiet moves to avoid searching in lockstep. When the time budget runs
+out the main process stops all workers and returns the deepest completed
+result.
+"""
+
+import multiprocessing
+import queue
+import time
+from multiprocessing import shared_memory
+
+from engine.search import SearchResult, Searcher
+from engine.transposition import TranspositionTable
+from pieces.piece_codes import side_of
+
+
+def _worker(worker_id, grid, side, table_name, entries, max_depth, stop_event, results):
+    """Run one searcher against the shared table, reporting each iteration."""
+    block = shared_memory.SharedMemory(name=table_name)
+    table = TranspositionTable(entries, block.buf)
+    searcher = Searcher(table, seed=worker_id if worker_id else None)
+
+    def report(result):
+        results.put((worker_id, result))
+
+    try:
+        final = searcher.search(grid, side, max_depth, stop_event=stop_event,
+                                start_depth=1 + worker_id % 2, on_iteration=report)
+        results.put((worker_id, final._replace(depth=-1)))
+    finally:
+        table.release()
+        block.close()
+
+
+def parallel_search(board, color, workers=None, time_limit=1.0, max_depth=64,
+                    table_entries=1 << 18, on_iteration=None):
+    """
+    Search a position with several processes sharing a transposition table.
+
+    Args:
+        board: ChessBoard instance
+        color: Side to move, 'white' or 'black' (or side 0 / 1)
+        workers: Number of processes (defaults to the CPU count)
+        time_limit: Budget in seconds
+        max_depth: Deepest iteration any worker runs
+        table_entries: Shared transposition table size
+        on_iteration: Optional callback receiving (worker_id, SearchResult)
+            for every completed iteration
+
+    Returns:
+        SearchResult of the deepest completed iteration, with nodes summed
+        over all workers
+    """
+    workers = workers or multiprocessing.cpu_count()
+    grid = [row[:] for row in board.board]
+    table, block = TranspositionTable.create_shared(table_entries)
+    stop_event = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(
+            target=_worker,
+            args=(worker_id, grid, side_of(color), block.name, table_entries, max_depth, stop_event, results),
+            daemon=True,
+        )
+        for worker_id in range(workers)
+    ]
+
+    started = time.monotonic()
+    deadline = started + time_limit
+    best = SearchResult(None, 0, 0, 0, 0.0, [])
+    nodes = {}
+    finished = 0
+    try:
+        for process in processes:
+            process.start()
+        while finished < workers:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                worker_id, result = results.get(timeout=remaining)
+            except queue.Empty:
+                break
+            nodes[worker_id] = result.nodes
+            if result.depth < 0:
+                finished += 1
+                continue
+            if on_iteration is not None:
+                on_iteration(worker_id, result)
+            if result.depth > best.depth or (result.depth == best.depth and best.move is None):
+                best = result
+
+        stop_event.set()
+        while finished < workers:
+            try:
+                worker_id, result = results.get(timeout=1.0)
+            except queue.Empty:
+                break
+            nodes[worker_id] = result.nodes
+            if result.depth < 0:
+                finished += 1
+        for process in processes:
+            process.join(timeout=1.0)
+            if process.is_alive():
+                process.terminate()
+    finally:
+        table.release()
+        block.close()
+        block.unlink()
+
+    return best._replace(nodes=sum(nodes.values()), elapsed=time.monotonic() - started)
@@ -0,0 +1,91 @@
+"""
+Configurable move-choosing players for automated games.
+
+A player is described by a plain dict (so it can be read from JSON and sent
+to worker processes):
+
+    {"name": "depth3", "kind": "search", "depth": 3, "time": 0.5, "book": "book.bin"}
+
+kind is 'search' (alpha-beta search, the default) or 'random' (uniform over
+the legal moves). depth and time limit the search per move; book is an
+optional opening book consulted before searching.
+"""
+
+import random
+
+from engine.search import Searcher
+from moves.move_generator import generate_moves
+
+PLAYER_KINDS = ('search', 'random')
+
+
+def validate_config(config):
+    """
+    Check a player configuration.
+
+    Raises:
+        ValueError: If the name is missing or the kind is unknown
+    """
+    if not isinstance(config, dict) or not config.get('name'):
+        raise ValueError(f"Player configuration needs a name: {config!r}")
+    kind = config.get('kind', 'search')
+    if kind not in PLAYER_KINDS:
+        raise ValueError(f"Unknown player kind {kind!r} (expected one of {', '.join(PLAYER_KINDS)})")
+    return config
+
+
+class Player:
+    """Chooses moves according to a player configuration."""
+
+    def __init__(self, config, seed=None):
+        """
+        Initialize a player.
+
+        Args:
+            config: Player configuration dict (see the module docstring)
+            seed: Optional seed for random choices and search move shuffling
+        """
+        validate_config(config)
+        self.name = config['name']
+        self.kind = config.get('kind', 'search')
+        self.depth = config.get('depth', 3)
+        self.time_limit = config.get('time')
+        self.rng = random.Random(seed)
+        self.searcher = Searcher(seed=seed) if self.kind == 'search' else None
+        self.book = None
+        if config.get('book'):
+            from book.opening_book import OpeningBook
+            self.book = OpeningBook(config['book'])
+
+    def choose_move(self, board, side, time_limit=None):
+        """
+        Pick a move.
+
+        Args:
+            board: The chess board (2D list of piece codes); it is not changed
+            side: Side to move, 0 for White and 1 for Black
+            time_limit: Optional thinking time in seconds (from a game clock);
+                the configured time is used when it is None
+
+        Returns:
+            Tuple (start, end), or None when the side has no moves
+        """
+        if self.book is not None:
+            move = self.book.choose_move(board, side, self.rng)
+            if move is not None:
+                return move
+        if self.searcher is not None:
+            if time_limit is None:
+                time_limit = self.time_limit
+            move = self.searcher.search(board, side, self.depth, time_limit).move
+            if move is not None:
+                return move
+        # Random players, and searches that ran out of time before depth 1
+        moves = generate_moves(board, side)
+        return self.rng.choice(moves) if moves else None
+
+    def close(self):
+        """Release the opening book, if any."""
+        if self.book is not None:
+            self.book.close()
+            self.book = None
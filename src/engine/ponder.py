@@ -0,0 +1,140 @@
+"""
+Pondering: searching on the opponent's time.
+
+After the engine plays a move, the second move of its principal variation is
+the reply it expects. Ponderer plays that reply on a copy of the board and
+keeps searching the resulting position in a background thread while the
+opponent thinks. Both searches use one Searcher, so everything found while
+pondering stays in its transposition table.
+
+When the engine is asked for its next move:
+- ponder hit (the opponent played the expected reply): the background search
+  simply continues until the normal thinking time, counted from when
+  pondering started, is used up, so after a long think by the opponent the
+  answer is ready at once;
+- ponder miss: the background search is stopped (it checks the stop event
+  every CHECK_INTERVAL nodes) and a normal search runs, reusing the table.
+"""
+
+import threading
+import time
+
+from board.zobrist import position_hash
+from engine.search import Searcher
+from pieces.piece_codes import EMPTY
+
+PONDER_HIT = 'hit'
+PONDER_MISS = 'miss'
+
+
+class Ponderer:
+    """Engine player that keeps searching during the opponent's turn."""
+
+    def __init__(self, time_limit=1.0, max_depth=64, searcher=None, ponder=True):
+        """
+        Initialize a pondering engine.
+
+        Args:
+            time_limit: Thinking time per move in seconds
+            max_depth: Deepest iteration to search
+            searcher: Optional Searcher (its transposition table is kept
+                between moves); a new one is created otherwise
+            ponder: False to only search on the engine's own time
+        """
+        self.ponder = ponder
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.searcher = searcher or Searcher()
+        self.hits = 0
+        self.misses = 0
+        self.last_ponder = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._ponder_key = None
+        self._ponder_started = 0.0
+        self._ponder_result = None
+        self._lock = threading.Lock()
+
+    @property
+    def pondering(self):
+        """Check if a background search is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _record(self, result):
+        """Keep the latest completed ponder iteration (called from the thread)."""
+        with self._lock:
+            self._ponder_result = result
+
+    def _ponder(self, board, side):
+        """Background thread body: search until stopped."""
+        self.searcher.search(board, side, self.max_depth, stop_event=self._stop, on_iteration=self._record)
+
+    def start_pondering(self, board, side, result):
+        """
+        Start searching the expected reply to the engine's last move.
+
+        Args:
+            board: The chess board (2D list of piece codes) after the engine's move
+            side: The engine's side (0 for White, 1 for Black)
+            result: SearchResult of the move just played; its pv predicts the reply
+
+        Returns:
+            The predicted (start, end) reply, or None when there is nothing to ponder
+        """
+        self.stop()
+        if not self.ponder or result is None or len(result.pv) < 2:
+            return None
+        start, end = result.pv[1]
+        grid = [row[:] for row in board]
+        grid[end[0]][end[1]] = grid[start[0]][start[1]]
+        grid[start[0]][start[1]] = EMPTY
+        self._ponder_key = position_hash(grid, side)
+        self._ponder_result = None
+        self._ponder_started = time.monotonic()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._ponder, args=(grid, side), daemon=True)
+        self._thread.start()
+        return result.pv[1]
+
+    def stop(self):
+        """Stop any background search and wait for it to finish."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def best_move(self, board, side):
+        """
+        Choose a move, using the ponder search when the opponent played the expected reply.
+
+        Args:
+            board: The chess board (2D list of piece codes); it is not changed
+            side: Side to move (the engine's side)
+
+        Returns:
+            SearchResult (move is None if the side has no moves)
+        """
+        if self._thread is not None and position_hash(board, side) == self._ponder_key:
+            remaining = self.time_limit - (time.monotonic() - self._ponder_started)
+            if remaining > 0:
+                self._thread.join(remaining)
+            self.stop()
+            self.last_ponder = PONDER_HIT
+            self.hits += 1
+            with self._lock:
+                result = self._ponder_result
+            if result is not None and result.move is not None:
+                return result
+        elif self._thread is not None:
+            self.stop()
+            self.last_ponder = PONDER_MISS
+            self.misses += 1
+        else:
+            self.last_ponder = None
+        grid = [row[:] for row in board]
+        return self.searcher.search(grid, side, self.max_depth, self.time_limit)
+
+    def close(self):
+        """Stop pondering."""
+        self.stop()
+
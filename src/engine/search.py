@@ -0,0 +1,370 @@
+"""
+Alpha-beta search.
+
+Iterative-deepening negamax with a transposition table, history and
+counter-move ordering (moves.ordering), and a captures-only quiescence
+search that skips captures losing material by static exchange. Capturing
+the enemy king ends the game, so a position where the side to move can take
+the king scores MATE_SCORE minus the ply. search_lines lists the best few
+root moves with their own lines (multi-PV) for analysis.
+"""
+
+import random
+import time
+from collections import namedtuple
+
+from board.zobrist import BLACK_TO_MOVE_KEY, move_hash_delta, position_hash
+from engine.evaluation import MATE_SCORE, MATE_THRESHOLD, evaluate
+from engine.transposition import EXACT, LOWER_BOUND, NO_MOVE, UPPER_BOUND, TranspositionTable
+from moves.exchange import see
+from moves.move_generator import decode_move, encode_move, generate_moves
+from moves.ordering import MoveOrdering, move_index
+from pieces.piece_codes import BLACK_BIT, EMPTY, KING, TYPE_MASK, side_of
+
+SearchResult = namedtuple('SearchResult', ['move', 'score', 'depth', 'nodes', 'elapsed', 'pv'])
+
+INFINITY = MATE_SCORE + 1
+CHECK_INTERVAL = 1023
+
+
+class SearchStopped(Exception):
+    """Raised inside the search when the time budget or stop signal is hit."""
+
+
+def _score_to_table(score, ply):
+    """Make mate scores relative to the stored position."""
+    if score > MATE_THRESHOLD:
+        return score + ply
+    if score < -MATE_THRESHOLD:
+        return score - ply
+    return score
+
+
+def _score_from_table(score, ply):
+    """Undo _score_to_table for the probing ply."""
+    if score > MATE_THRESHOLD:
+        return score - ply
+    if score < -MATE_THRESHOLD:
+        return score + ply
+    return score
+
+
+class Searcher:
+    """Single-threaded iterative-deepening searcher."""
+
+    def __init__(self, table=None, seed=None, ordering=None):
+        """
+        Initialize a searcher.
+
+        Args:
+            table: TranspositionTable to use (possibly shared with other
+                searchers); a private one is created otherwise
+            seed: Optional seed that shuffles the order of equally scored
+                moves, used to diversify parallel helpers
+            ordering: moves.ordering.MoveOrdering to use; a private one is
+                created otherwise (its history is aged at each search)
+        """
+        self.table = table if table is not None else TranspositionTable()
+        self.rng = random.Random(seed) if seed is not None else None
+        self.ordering = ordering if ordering is not None else MoveOrdering()
+        self.nodes = 0
+        self._deadline = None
+        self._stop_event = None
+
+    def _check_stop(self):
+        """Raise SearchStopped when the budget is exhausted."""
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            raise SearchStopped()
+        if self._stop_event is not None and self._stop_event.is_set():
+            raise SearchStopped()
+
+    def _quiescence(self, board, side, alpha, beta, ply):
+        """Search captures only until the position is quiet."""
+        self.nodes += 1
+        if not self.nodes & CHECK_INTERVAL:
+            self._check_stop()
+
+        moves = generate_moves(board, side)
+        enemy_king = KING | (BLACK_BIT if side == 0 else 0)
+        for start, end in moves:
+            if board[end[0]][end[1]] == enemy_king:
+                return MATE_SCORE - ply
+
+        stand_pat = evaluate(board, side)
+        if stand_pat >= beta:
+            return stand_pat
+        alpha = max(alpha, stand_pat)
+
+        # Captures that lose material by static exchange cannot raise alpha
+        # once the opponent recaptures, so they are not searched
+        captures = [
+            move for move in moves
+            if board[move[1][0]][move[1][1]] != EMPTY and see(board, move[0], move[1]) >= 0
+        ]
+        for start, end in self.ordering.ordered(board, captures):
+            piece = board[start[0]][start[1]]
+            captured = board[end[0]][end[1]]
+            board[end[0]][end[1]] = piece
+            board[start[0]][start[1]] = EMPTY
+            try:
+                score = -self._quiescence(board, side ^ 1, -beta, -alpha, ply + 1)
+            finally:
+                board[start[0]][start[1]] = piece
+                board[end[0]][end[1]] = captured
+            if score >= beta:
+                return score
+            alpha = max(alpha, score)
+        return alpha
+
+    def _negamax(self, board, side, depth, alpha, beta, ply, key, previous=None):
+        """Alpha-beta search of one node; returns (score, best move).
+
+        previous is the move_index of the move that led here, for counter moves.
+        """
+        if depth <= 0:
+            return self._quiescence(board, side, alpha, beta, ply), None
+
+        self.nodes += 1
+        if not self.nodes & CHECK_INTERVAL:
+            self._check_stop()
+
+        moves = generate_moves(board, side)
+        enemy_king = KING | (BLACK_BIT if side == 0 else 0)
+        for move in moves:
+            end = move[1]
+            if board[end[0]][end[1]] == enemy_king:
+                return MATE_SCORE - ply, move
+        if not moves:
+            return 0, None
+
+        original_alpha = alpha
+        table_move = None
+        entry = self.table.probe(key)
+        if entry is not None:
+            move_code, entry_depth, flag, entry_score = entry
+            if move_code != NO_MOVE:
+                table_move = decode_move(move_code)
+            if entry_depth >= depth and ply > 0:
+                entry_score = _score_from_table(entry_score, ply)
+                if flag == EXACT:
+                    return entry_score, table_move
+                if flag == LOWER_BOUND and entry_score >= beta:
+                    return entry_score, table_move
+                if flag == UPPER_BOUND and entry_score <= alpha:
+                    return entry_score, table_move
+
+        if self.rng is not None:
+            self.rng.shuffle(moves)
+        best_score = -INFINITY
+        best_move = None
+        opponent = side ^ 1
+        tried = []
+        for start, end in self.ordering.ordered(board, moves, table_move, previous):
+            piece = board[start[0]][start[1]]
+            captured = board[end[0]][end[1]]
+            child_key = key ^ move_hash_delta(piece, start, end, captured) ^ BLACK_TO_MOVE_KEY
+            board[end[0]][end[1]] = piece
+            board[start[0]][start[1]] = EMPTY
+            try:
+                score = -self._negamax(board, opponent, depth - 1, -beta, -alpha, ply + 1, child_key,
+                                       move_index(piece, end))[0]
+            finally:
+                board[start[0]][start[1]] = piece
+                board[end[0]][end[1]] = captured
+            if score > best_score:
+                best_score = score
+                best_move = (start, end)
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                self.ordering.record_cutoff(board, (start, end), depth, previous, tried)
+                break
+            if captured == EMPTY:
+                tried.append((start, end))
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.table.store(key, encode_move(*best_move), depth, flag, _score_to_table(best_score, ply))
+        return best_score, best_move
+
+    def principal_variation(self, board, side, max_length):
+        """Follow table moves from a position to build the expected line."""
+        board = [row[:] for row in board]
+        line = []
+        key = position_hash(board, side)
+        seen = set()
+        while len(line) < max_length and key not in seen:
+            seen.add(key)
+            entry = self.table.probe(key)
+            if entry is None or entry[0] == NO_MOVE:
+                break
+            move = decode_move(entry[0])
+            if move not in generate_moves(board, side):
+                break
+            start, end = move
+            piece, captured = board[start[0]][start[1]], board[end[0]][end[1]]
+            line.append(move)
+            if captured & TYPE_MASK == KING:
+                break
+            key ^= move_hash_delta(piece, start, end, captured) ^ BLACK_TO_MOVE_KEY
+            board[end[0]][end[1]] = piece
+            board[start[0]][start[1]] = EMPTY
+            side ^= 1
+        return line
+
+    def _search_root(self, board, side, depth, key, moves):
+        """Search the root over a subset of its moves; returns (score, best move)."""
+        enemy_king = KING | (BLACK_BIT if side == 0 else 0)
+        for move in moves:
+            end = move[1]
+            if board[end[0]][end[1]] == enemy_king:
+                return MATE_SCORE, move
+        alpha = -INFINITY
+        best_move = None
+        for start, end in moves:
+            piece = board[start[0]][start[1]]
+            captured = board[end[0]][end[1]]
+            child_key = key ^ move_hash_delta(piece, start, end, captured) ^ BLACK_TO_MOVE_KEY
+            board[end[0]][end[1]] = piece
+            board[start[0]][start[1]] = EMPTY
+            try:
+                score = -self._negamax(board, side ^ 1, depth - 1, -INFINITY, -alpha, 1, child_key,
+                                       move_index(piece, end))[0]
+            finally:
+                board[start[0]][start[1]] = piece
+                board[end[0]][end[1]] = captured
+            if score > alpha:
+                alpha = score
+                best_move = (start, end)
+        return alpha, best_move
+
+    def _line(self, board, side, move, depth):
+        """Principal variation starting with a given root move."""
+        start, end = move
+        if board[end[0]][end[1]] & TYPE_MASK == KING:
+            return [move]
+        grid = [row[:] for row in board]
+        grid[end[0]][end[1]] = grid[start[0]][start[1]]
+        grid[start[0]][start[1]] = EMPTY
+        return [move] + self.principal_variation(grid, side ^ 1, depth - 1)
+
+    def search_lines(self, board, side, lines=3, max_depth=64, time_limit=None, stop_event=None, include=None):
+        """
+        Multi-PV search: the best few root moves, each with its own line.
+
+        Every iteration finds the best move, then the best of the remaining
+        moves, and so on, each search excluding the moves already listed.
+        Moves are searched with the previous iteration's lines first.
+
+        Args:
+            board: The chess board (2D list of piece codes); it is restored
+                before returning
+            side: Side to move, 0 for White and 1 for Black
+            lines: Number of principal variations
+            max_depth: Deepest iteration to run
+            time_limit: Optional budget in seconds
+            stop_event: Optional event that aborts the search when set
+            include: Optional root move that is scored at every iteration
+                even if it is not among the best lines (reported last, after
+                the lines, when it is not one of them)
+
+        Returns:
+            List of SearchResult, best first, from the deepest completed
+            iteration (empty if none completed or the side has no moves)
+        """
+        started = time.monotonic()
+        self.nodes = 0
+        self.ordering.age()
+        self._deadline = started + time_limit if time_limit is not None else None
+        self._stop_event = stop_event
+        key = position_hash(board, side)
+        moves = generate_moves(board, side)
+        results = []
+        try:
+            for depth in range(1, max_depth + 1):
+                previous = [result.move for result in results]
+                remaining = previous + [move for move in self.ordering.ordered(board, moves) if move not in previous]
+                current = []
+                while remaining and len(current) < lines:
+                    score, move = self._search_root(board, side, depth, key, remaining)
+                    remaining.remove(move)
+                    current.append(SearchResult(move, score, depth, self.nodes, time.monotonic() - started,
+                                                self._line(board, side, move, depth)))
+                if include is not None and include in remaining:
+                    score, move = self._search_root(board, side, depth, key, [include])
+                    current.append(SearchResult(move, score, depth, self.nodes, time.monotonic() - started,
+                                                self._line(board, side, move, depth)))
+                results = current
+                if not results or abs(results[0].score) > MATE_THRESHOLD:
+                    break
+        except SearchStopped:
+            pass
+        finally:
+            self._deadline = None
+            self._stop_event = None
+        return results
+
+    def search(self, board, side, max_depth=64, time_limit=None, stop_event=None,
+               start_depth=1, on_iteration=None):
+        """
+        Search a position by iterative deepening.
+
+        Args:
+            board: The chess board (2D list of piece codes); it is restored
+                before returning
+            side: Side to move, 0 for White and 1 for Black
+            max_depth: Deepest iteration to run
+            time_limit: Optional budget in seconds
+            stop_event: Optional event that aborts the search when set
+            start_depth: First iteration depth
+            on_iteration: Optional callback receiving each completed SearchResult
+
+        Returns:
+            SearchResult of the deepest completed iteration (move is None if
+            no iteration completed or the side has no moves)
+        """
+        started = time.monotonic()
+        self.nodes = 0
+        self.ordering.age()
+        self._deadline = started + time_limit if time_limit is not None else None
+        self._stop_event = stop_event
+        key = position_hash(board, side)
+        result = SearchResult(None, 0, 0, 0, 0.0, [])
+
+        for depth in range(start_depth, max_depth + 1):
+            try:
+                score, move = self._negamax(board, side, depth, -INFINITY, INFINITY, 0, key)
+            except SearchStopped:
+                break
+            result = SearchResult(
+                move, score, depth, self.nodes, time.monotonic() - started,
+                self.principal_variation(board, side, depth) or ([move] if move else []),
+            )
+            if on_iteration is not None:
+                on_iteration(result)
+            if move is None or abs(score) > MATE_THRESHOLD:
+                break
+
+        self._deadline = None
+        self._stop_event = None
+        return result._replace(nodes=self.nodes, elapsed=time.monotonic() - started)
+
+
+def search(board, color, max_depth=64, time_limit=None):
+    """
+    Search a ChessBoard position with a private transposition table.
+
+    Args:
+        board: ChessBoard instance
+        color: Side to move, 'white' or 'black' (or side 0 / 1)
+        max_depth: Deepest iteration to run
+        time_limit: Optional budget in seconds
+
+    Returns:
+        SearchResult
+    """
+    grid = [row[:] for row in board.board]
+    return Searcher().search(grid, side_of(color), max_depth, time_limit)
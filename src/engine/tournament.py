@@ -0,0 +1,326 @@
+"""
+Engine-vs-engine tournaments.
+
+Pairings (round robin or gauntlet, with colors alternating between rounds)
+are played in a process pool. Each game is driven through ChessBoard and
+GameState directly, without rendering, and capped at a number of plies
+(a game reaching the cap is a draw). With a time control (see game.clock)
+each game has a chess clock, every search gets its budget from
+allocate_time and a fallen flag loses the game. Results are streamed to a JSONL
+archive as they finish, one record per game:
+
+    {"moves": ["e2e4", ...], "result": "1-0", "tags": {"white": ..., "black": ..., ...}}
+
+At the end each player's score is turned into an Elo estimate relative to
+the average of its opponents, with a 95% error bar from the spread of its
+game scores.
+
+Usage (from the src directory):
+    python3 -m engine.tournament players.json --rounds 4 -j 4 --output results.jsonl
+    python3 -m engine.tournament players.json --gauntlet depth3 --max-plies 200
+    python3 -m engine.tournament players.json --time-control 10+0.1 -j 4
+
+players.json is a list of player configurations (see engine.player).
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import time
+from collections import namedtuple
+
+from board.chess_board import ChessBoard
+from engine.player import Player, validate_config
+from game.clock import GameClock, format_time_control, parse_time_control
+from game.game_state import GameState
+from notation.archive import ArchiveGame, format_record, move_name, open_archive
+from pieces.piece_codes import COLOR_NAMES, EMPTY, KING, TYPE_MASK
+
+DRAW = '1/2-1/2'
+MAX_PLIES = 200
+# Two-sided 95% interval of the normal distribution
+Z_95 = 1.959964
+
+GameTask = namedtuple('GameTask', ['index', 'round', 'white', 'black', 'max_plies', 'seed', 'time_control'])
+Standing = namedtuple('Standing', ['name', 'games', 'wins', 'draws', 'losses', 'score', 'elo', 'error'])
+
+
+def round_robin(names, rounds=1):
+    """
+    Pair every player with every other one.
+
+    Colors swap from one round to the next, so with an even number of rounds
+    each pair plays the same number of games with each color.
+
+    Returns:
+        List of (round, white name, black name)
+    """
+    pairings = []
+    for round_index in range(rounds):
+        for first in range(len(names)):
+            for second in range(first + 1, len(names)):
+                white, black = names[first], names[second]
+                if round_index % 2:
+                    white, black = black, white
+                pairings.append((round_index, white, black))
+    return pairings
+
+
+def gauntlet(champion, names, rounds=1):
+    """
+    Pair one player against each of the others.
+
+    Returns:
+        List of (round, white name, black name), colors alternating by round
+    """
+    pairings = []
+    for round_index in range(rounds):
+        for name in names:
+            if name == champion:
+                continue
+            if round_index % 2:
+                pairings.append((round_index, name, champion))
+            else:
+                pairings.append((round_index, champion, name))
+    return pairings
+
+
+def play_game(white, black, max_plies=MAX_PLIES, seed=None, time_control=None):
+    """
+    Play one game between two player configurations.
+
+    Args:
+        white: Player configuration dict for White
+        black: Player configuration dict for Black
+        max_plies: Plies after which the game is drawn
+        seed: Optional seed for both players
+        time_control: Optional TimeControl (or its text) for a chess clock
+
+    Returns:
+        Tuple (list of (start, end) moves, result, termination) where
+        termination is 'king captured', 'no moves', 'time forfeit' or
+        'ply limit'
+    """
+    players = (Player(white, seed), Player(black, None if seed is None else seed + 1))
+    board = ChessBoard()
+    clock = GameClock(time_control) if time_control is not None else None
+    state = GameState(clock)
+    moves = []
+    termination = 'ply limit'
+    if clock is not None:
+        clock.start()
+    try:
+        while len(moves) < max_plies:
+            side = state.side_to_move
+            time_limit = clock.think_time(side) if clock is not None else None
+            move = players[side].choose_move(board.board, side, time_limit)
+            if state.is_game_over:
+                termination = 'time forfeit'
+                break
+            if move is None:
+                termination = 'no moves'
+                break
+            start, end = move
+            valid, error = board.validate_move(start, end, side)
+            if not valid:
+                raise RuntimeError(f"{players[side].name} chose an invalid move {move_name(move)}: {error}")
+            piece, captured = board.get_piece(start), board.get_piece(end)
+            captured_code = board.get_code(end)
+            board.move_piece(start, end)
+            state.add_move(start, end, piece, captured)
+            moves.append(move)
+            if captured_code != EMPTY and captured_code & TYPE_MASK == KING:
+                state.set_game_over(COLOR_NAMES[side])
+                termination = 'king captured'
+                break
+            state.switch_player()
+            if state.is_game_over:
+                termination = 'time forfeit'
+                break
+    finally:
+        for player in players:
+            player.close()
+
+    if state.winner is None:
+        result = DRAW
+    else:
+        result = '1-0' if state.winner == 'white' else '0-1'
+    return moves, result, termination
+
+
+def _play_task(task):
+    """Worker entry point: play one GameTask and return its archive record."""
+    started = time.perf_counter()
+    moves, result, termination = play_game(task.white, task.black, task.max_plies, task.seed, task.time_control)
+    tags = {
+        'white': task.white['name'],
+        'black': task.black['name'],
+        'round': task.round + 1,
+        'game': task.index + 1,
+        'termination': termination,
+        'seconds': round(time.perf_counter() - started, 4),
+    }
+    if task.time_control is not None:
+        tags['time_control'] = format_time_control(task.time_control)
+    return ArchiveGame([move_name(move) for move in moves], result, tags)
+
+
+def elo_from_score(fraction):
+    """Elo difference implied by an expected score (0 < fraction < 1)."""
+    if fraction <= 0:
+        return -math.inf
+    if fraction >= 1:
+        return math.inf
+    return -400.0 * math.log10(1.0 / fraction - 1.0)
+
+
+def standings(games):
+    """
+    Compute each player's record and Elo estimate.
+
+    The Elo is relative to the player's opponents on average; the error is
+    half the width of the 95% interval of the score, converted to Elo.
+
+    Args:
+        games: Iterable of ArchiveGame records from a tournament
+
+    Returns:
+        List of Standing tuples, best score first
+    """
+    records = {}
+    for game in games:
+        white, black = game.tags['white'], game.tags['black']
+        white_points = {'1-0': 1.0, '0-1': 0.0}.get(game.result, 0.5)
+        records.setdefault(white, []).append(white_points)
+        records.setdefault(black, []).append(1.0 - white_points)
+
+    table = []
+    for name, points in records.items():
+        count = len(points)
+        score = sum(points)
+        fraction = score / count
+        deviation = math.sqrt(sum((point - fraction) ** 2 for point in points) / count)
+        margin = Z_95 * deviation / math.sqrt(count)
+        low = elo_from_score(fraction - margin)
+        high = elo_from_score(fraction + margin)
+        table.append(Standing(
+            name, count, points.count(1.0), points.count(0.5), points.count(0.0), score,
+            elo_from_score(fraction), (high - low) / 2,
+        ))
+    table.sort(key=lambda row: (-row.score / row.games, row.name))
+    return table
+
+
+def run_tournament(players, pairings, output=None, max_plies=MAX_PLIES, processes=1, seed=0,
+                   on_result=None, time_control=None):
+    """
+    Play every pairing and stream the results.
+
+    Args:
+        players: List of player configuration dicts
+        pairings: List of (round, white name, black name) from round_robin or gauntlet
+        output: Optional JSONL path; each game is appended as it finishes
+        max_plies: Plies after which a game is drawn
+        processes: Worker processes (1 plays in this process)
+        seed: Base seed; game i uses seed + 2 * i for White and the next for Black
+        on_result: Optional callback receiving each finished ArchiveGame
+        time_control: Optional TimeControl (or its text) giving every game a clock
+
+    Returns:
+        Tuple (list of ArchiveGame in finishing order, elapsed seconds)
+    """
+    by_name = {}
+    for config in players:
+        validate_config(config)
+        by_name[config['name']] = config
+    if time_control is not None and not isinstance(time_control, tuple):
+        time_control = parse_time_control(time_control)
+    tasks = [
+        GameTask(index, round_index, by_name[white], by_name[black], max_plies, seed + 2 * index, time_control)
+        for index, (round_index, white, black) in enumerate(pairings)
+    ]
+
+    started = time.perf_counter()
+    games = []
+    handle = open_archive(output, 'wt') if output else None
+    pool = multiprocessing.Pool(min(processes, len(tasks))) if processes > 1 and len(tasks) > 1 else None
+    try:
+        results = pool.imap_unordered(_play_task, tasks) if pool is not None else map(_play_task, tasks)
+        for game in results:
+            games.append(game)
+            if handle is not None:
+                handle.write(format_record(game))
+                handle.flush()
+            if on_result is not None:
+                on_result(game)
+    finally:
+        if pool is not None:
+            pool.terminate()
+        if handle is not None:
+            handle.close()
+    return games, time.perf_counter() - started
+
+
+def format_standings(table, games, elapsed):
+    """Format the standings and throughput for the terminal."""
+    plies = sum(len(game.moves) for game in games)
+    lines = [f"{'player':<16} {'games':>5} {'+':>4} {'=':>4} {'-':>4} {'score':>6} {'elo':>12}"]
+    for row in table:
+        elo = f"{row.elo:+.0f}" if math.isfinite(row.elo) else f"{row.elo:+}"
+        error = f"±{row.error:.0f}" if math.isfinite(row.error) else "±inf"
+        lines.append(f"{row.name:<16} {row.games:>5} {row.wins:>4} {row.draws:>4} {row.losses:>4} "
+                     f"{row.score:>6.1f} {elo:>6} {error:>5}")
+    rate = len(games) / elapsed if elapsed else 0.0
+    lines.append(f"{len(games)} games, {plies} plies in {elapsed:.1f}s: "
+                 f"{rate:.2f} games/s, {plies / elapsed if elapsed else 0.0:.0f} plies/s")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Play an engine-vs-engine tournament")
+    parser.add_argument('players', help="JSON file with a list of player configurations")
+    parser.add_argument('--rounds', type=int, default=2, help="games per pairing (colors alternate)")
+    parser.add_argument('--gauntlet', metavar='NAME', help="pair NAME against every other player only")
+    parser.add_argument('--max-plies', type=int, default=MAX_PLIES, help="plies before a game is drawn")
+    parser.add_argument('-j', '--processes', type=int, default=multiprocessing.cpu_count(),
+                        help="worker processes")
+    parser.add_argument('--seed', type=int, default=0, help="base seed for the players")
+    parser.add_argument('--output', help="JSONL file receiving one record per game")
+    parser.add_argument('--time-control', metavar='BASE[+INC][dDELAY]',
+                        help="give every game a clock, e.g. 10+0.1 (seconds)")
+    args = parser.parse_args(argv)
+
+    time_control = None
+    if args.time_control:
+        try:
+            time_control = parse_time_control(args.time_control)
+        except ValueError as error:
+            parser.error(str(error))
+
+    with open(args.players) as handle:
+        players = json.load(handle)
+    try:
+        names = [validate_config(config)['name'] for config in players]
+    except ValueError as error:
+        parser.error(str(error))
+    if args.gauntlet:
+        if args.gauntlet not in names:
+            parser.error(f"Unknown player {args.gauntlet!r}")
+        pairings = gauntlet(args.gauntlet, names, args.rounds)
+    else:
+        pairings = round_robin(names, args.rounds)
+
+    def progress(game):
+        print(f"{game.tags['white']} - {game.tags['black']}: {game.result} "
+              f"({len(game.moves)} plies, {game.tags['termination']})")
+
+    games, elapsed = run_tournament(players, pairings, args.output, args.max_plies, args.processes,
+                                    args.seed, progress, time_control)
+    print()
+    print(format_standings(standings(games), games, elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Transposition table over a flat byte buffer.
+
+Each entry is two little-endian uint64 words: (key XOR data, data). A reader
+accepts an entry only if the stored check word XOR data equals its key, so
+entries torn by concurrent writers from other processes are rejected instead
+of returning garbage. That makes the table safe to share between processes
+through multiprocessing.shared_memory without locks.
+
+Data word layout (low to high bits):
+    12 bits move (moves.move_generator.encode_move), 8 bits depth,
+    2 bits bound flag, 16 bits score + 32768.
+"""
+
+import struct
+
+from multiprocessing import shared_memory
+
+ENTRY = struct.Struct('<QQ')
+ENTRY_SIZE = ENTRY.size
+MASK64 = (1 << 64) - 1
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+NO_MOVE = 0xFFF
+
+
+class TranspositionTable:
+    """Fixed-size, always-replace-if-deeper hash table of search results."""
+
+    def __init__(self, entries=1 << 16, buffer=None):
+        """
+        Initialize a table.
+
+        Args:
+            entries: Number of slots
+            buffer: Optional writable buffer of entries * ENTRY_SIZE bytes
+                (e.g. SharedMemory.buf); a private bytearray is used otherwise
+        """
+        self.entries = entries
+        self.buffer = buffer if buffer is not None else bytearray(entries * ENTRY_SIZE)
+
+    @classmethod
+    def create_shared(cls, entries=1 << 16):
+        """
+        Create a table backed by a new shared memory block.
+
+        Returns:
+            Tuple (table, SharedMemory); the caller owns the block and must
+            close() and unlink() it
+        """
+        block = shared_memory.SharedMemory(create=True, size=entries * ENTRY_SIZE)
+        block.buf[:entries * ENTRY_SIZE] = bytes(entries * ENTRY_SIZE)
+        return cls(entries, block.buf), block
+
+    def probe(self, key):
+        """
+        Look up a position.
+
+        Returns:
+            Tuple (move, depth, flag, score) or None; move is NO_MOVE when unknown
+        """
+        check, data = ENTRY.unpack_from(self.buffer, (key % self.entries) * ENTRY_SIZE)
+        if data == 0 or check ^ data != key:
+            return None
+        return (data & 0xFFF, (data >> 12) & 0xFF, (data >> 20) & 0x3, ((data >> 22) & 0xFFFF) - 32768)
+
+    def store(self, key, move, depth, flag, score):
+        """Store a result unless the slot holds a deeper search of the same position."""
+        offset = (key % self.entries) * ENTRY_SIZE
+        check, data = ENTRY.unpack_from(self.buffer, offset)
+        if data and check ^ data == key and (data >> 12) & 0xFF > depth:
+            return
+        data = (move & 0xFFF) | (depth & 0xFF) << 12 | (flag & 0x3) << 20 | ((score + 32768) & 0xFFFF) << 22
+        ENTRY.pack_into(self.buffer, offset, (key ^ data) & MASK64, data)
+
+    def clear(self):
+        """Empty the table."""
+        self.buffer[:] = bytes(len(self.buffer))
+
+    def release(self):
+        """Drop the reference to the buffer so a shared block can be closed."""
+        self.buffer = None
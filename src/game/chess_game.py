@@ -1,15 +1,55 @@
-from board.chess_board import ChessBoard
+from board.board_renderer import BoardRenderer
+from game.clock import GameClock
+from game.game_session import GameSession
 from game.game_state import GameState
 from input.input_handler import InputHandler
+from notation.move_parser import CONSOLE_SQUARES
+from notation.san import square_names
+from pieces.piece_codes import COLOR_NAMES
+
+SQUARE_LABELS = square_names(CONSOLE_SQUARES)
 
 
 class ChessGame:
-    """Main chess game controller."""
+    """Console front end: prompts, messages and rendering over a GameSession."""
     
-    def __init__(self):
-        self.board = ChessBoard()
-        self.game_state = GameState()
+    def __init__(self, renderer=None, engine=None, engine_side=None, time_control=None):
+        """
+        Initialize a console game.
+
+        Args:
+            renderer: BoardRenderer used to draw the board (full redraws by default)
+            engine: Optional engine.ponder.Ponderer that plays one side
+            engine_side: Side the engine plays (0 for White, 1 for Black)
+            time_control: Optional game.clock.TimeControl (or its text); the
+                engine then budgets its thinking time from its clock
+        """
+        clock = GameClock(time_control) if time_control is not None else None
+        self.session = GameSession(game_state=GameState(clock))
+        self.board = self.session.board
+        self.game_state = self.session.game_state
         self.input_handler = InputHandler()
+        self.renderer = renderer or BoardRenderer()
+        self.engine = engine
+        self.engine_side = engine_side
+
+    def _engine_move(self):
+        """Let the engine choose a move, then ponder on the expected reply."""
+        side = self.session.side_to_move
+        clock = self.game_state.clock
+        if clock is not None:
+            self.engine.time_limit = clock.think_time(side)
+        result = self.engine.best_move(self.board.board, side)
+        if result.move is None:
+            return None
+        start, end = result.move
+        ponder = f", ponder {self.engine.last_ponder}" if self.engine.last_ponder else ""
+        print(f"{COLOR_NAMES[side].capitalize()} (engine) plays {SQUARE_LABELS[start]} {SQUARE_LABELS[end]} "
+              f"(depth {result.depth}, {result.elapsed:.2f}s{ponder})")
+        outcome = self.session.submit_move(start, end)
+        if outcome.ok and not outcome.game_over:
+            self.engine.start_pondering(self.board.board, side, result)
+        return outcome
 
     def start_game(self):
         """Start and run the chess game loop."""
@@ -19,19 +59,45 @@ class ChessGame:
         print("\nHow to play:")
         print("- Enter moves in format: 'e2 e4' (algebraic notation)")
         print("- Or use numeric format: '1,3 2,3'")
+        print("- SAN such as 'Nf6' also works, using the board's labels")
         print("- White pieces: P R N B Q K (uppercase)")
         print("- Black pieces: p r n b q k (lowercase)")
         print("- Game ends when a King is captured")
         print("- Type 'quit' to exit\n")
         
-        self.board.render()
+        self.renderer.render(self.board.board)
         
-        while not self.game_state.is_game_over:
-            # Get current player
-            current_player = self.game_state.current_player
+        try:
+            self._play()
+        finally:
+            if self.engine is not None:
+                self.engine.close()
+
+    def _play(self):
+        """Run turns until the game ends or a player quits."""
+        while not self.session.is_over:
+            current_player = self.session.current_player
+
+            if self.engine is not None and self.session.side_to_move == self.engine_side:
+                result = self._engine_move()
+                if result is None:
+                    print("The engine has no moves.")
+                    break
+                if self.game_state.lost_on_time:
+                    break
+                self._report(current_player, result)
+                if result.game_over:
+                    break
+                continue
             
-            # Get move input
-            move_input = self.input_handler.get_move_input(current_player)
+            self._show_clock()
+
+            # Get move input, waiting no longer than the player's clock allows
+            clock = self.game_state.clock
+            timeout = clock.time_to_flag() if clock is not None else None
+            move_input = self.input_handler.get_move_input(current_player, timeout)
+            if move_input is None:
+                continue  # the flag fell; the loop condition ends the game
             
             # Check for quit command
             if move_input.lower() in ['quit', 'exit', 'q']:
@@ -39,48 +105,74 @@ class ChessGame:
                 break
             
             # Parse move
-            start, end = self.input_handler.parse_move(move_input)
+            start, end = self.input_handler.parse_move(
+                move_input, self.board.board, self.session.side_to_move
+            )
             
             if start is None or end is None:
                 print("❌ Invalid input format. Try 'e2 e4' or '1,3 2,3'\n")
                 continue
             
-            # Validate move
-            is_valid, error_message = self.board.validate_move(start, end, current_player)
+            # Validate and execute move
+            result = self.session.submit_move(start, end)
             
-            if not is_valid:
-                print(f"❌ {error_message}\n")
+            if self.game_state.lost_on_time:
+                break
+
+            if not result.ok:
+                print(f"❌ {result.error}\n")
                 continue
             
-            # Execute move
-            piece = self.board.get_piece(start)
-            captured_piece = self.board.get_piece(end)
-            self.board.move_piece(start, end)
-            
-            # Record move
-            self.game_state.add_move(start, end, piece)
-            
-            # Display board
-            self.board.render()
-            
-            # Show move feedback
-            if captured_piece:
-                print(f"✓ {current_player.capitalize()} captured {captured_piece}!")
-            
-            # Check for king capture (win condition)
-            opponent = 'black' if current_player == 'white' else 'white'
-            if self.board.is_king_captured(opponent):
-                self.game_state.set_game_over(current_player)
-                print("=" * 50)
-                print(f"🎉 GAME OVER! {current_player.upper()} WINS!")
-                print(f"    {opponent.capitalize()}'s King has been captured!")
-                print("=" * 50)
-                print(f"\nTotal moves: {len(self.game_state.move_history)}")
+            self._report(current_player, result)
+            if result.game_over:
                 break
-            
-            # Switch player
-            self.game_state.switch_player()
-            print()
+
+        # A flag can fall during any turn, whichever way the loop ended
+        if self.game_state.lost_on_time:
+            self._report_time_forfeit()
+
+    def _show_clock(self):
+        """Print both players' remaining time in clocked games."""
+        clock = self.game_state.clock
+        if clock is not None:
+            times = clock.to_dict()
+            print(f"⏱  White {_format_seconds(times['white'])} | Black {_format_seconds(times['black'])}")
+
+    def _report_time_forfeit(self):
+        """Announce a game lost on time."""
+        winner = self.game_state.winner
+        loser = 'black' if winner == 'white' else 'white'
+        print("=" * 50)
+        print(f"⏰ GAME OVER! {loser.capitalize()} ran out of time. {winner.upper()} WINS!")
+        print("=" * 50)
+
+    def _report(self, current_player, result):
+        """Show the board and the outcome of a played move."""
+        # Display board
+        self.renderer.render(self.board.board)
+        
+        # Show move feedback
+        if result.captured:
+            print(f"✓ {current_player.capitalize()} captured {result.captured}! "
+                  f"(exchange: {result.exchange:+d})")
+        
+        # Check for king capture (win condition)
+        if result.game_over:
+            opponent = 'black' if current_player == 'white' else 'white'
+            print("=" * 50)
+            print(f"🎉 GAME OVER! {current_player.upper()} WINS!")
+            print(f"    {opponent.capitalize()}'s King has been captured!")
+            print("=" * 50)
+            print(f"\nTotal moves: {len(self.session.move_history)}")
+            return
+        
+        print()
+
+
+def _format_seconds(seconds):
+    """Format a clock reading as m:ss.t."""
+    minutes, seconds = divmod(seconds, 60)
+    return f"{int(minutes)}:{seconds:04.1f}"
 
 
 def main():
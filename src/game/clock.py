@@ -0,0 +1,205 @@
+"""
+Chess clocks.
+
+A GameClock keeps both players' remaining time as integer nanoseconds read
+from time.monotonic_ns, so it is unaffected by wall-clock changes and never
+accumulates float rounding. Only the running side's turn start is stored;
+nothing ticks in the background. Flag fall is found by comparing the clock
+against the running side's deadline whenever the game is looked at (a move,
+a status request), so thousands of clocked games cost nothing while their
+players think.
+
+Time controls are written BASE[+INCREMENT][dDELAY] in seconds, e.g. '300',
+'180+2' or '60d3':
+- increment (Fischer): added to the mover's clock after each move;
+- delay (simple/US delay): the first DELAY seconds of every turn are free.
+
+allocate_time turns the remaining time into a thinking budget for a search.
+"""
+
+import math
+import time
+from collections import namedtuple
+
+from pieces.piece_codes import WHITE
+
+NS_PER_SECOND = 1_000_000_000
+# Moves a search budget assumes are still to be played when nothing is known
+MOVES_TO_GO = 30
+# Share of the increment a search may spend on top of its slice
+INCREMENT_SHARE = 0.75
+# Never plan to use more than this fraction of the remaining time on one move
+MAX_FRACTION = 0.5
+MIN_THINK = 0.01
+# Longest initial time, increment or delay accepted (about 31 years)
+MAX_SECONDS = 1e9
+
+TimeControl = namedtuple('TimeControl', ['initial', 'increment', 'delay'])
+
+
+def parse_time_control(text):
+    """
+    Read a time control such as '300', '180+2' or '60d3'.
+
+    Returns:
+        TimeControl (seconds)
+
+    Raises:
+        ValueError: If the text is malformed, a value is negative, not finite
+            or above MAX_SECONDS, or the initial time is zero
+    """
+    base, _, delay = str(text).strip().lower().partition('d')
+    initial, _, increment = base.partition('+')
+    try:
+        control = TimeControl(float(initial), float(increment or 0), float(delay or 0))
+    except ValueError:
+        raise ValueError(f"Invalid time control {text!r} (expected BASE[+INC][dDELAY])") from None
+    return _checked(control, text)
+
+
+def _checked(control, text):
+    """Return control if every value is usable, otherwise raise ValueError."""
+    if not all(math.isfinite(value) and value <= MAX_SECONDS for value in control):
+        raise ValueError(f"Invalid time control {text!r} (values must be finite and at most {MAX_SECONDS:g}s)")
+    if control.initial <= 0 or control.increment < 0 or control.delay < 0:
+        raise ValueError(f"Invalid time control {text!r}")
+    return control
+
+
+def format_time_control(control):
+    """Write a TimeControl back in parse_time_control's format."""
+    text = f"{control.initial:g}"
+    if control.increment:
+        text += f"+{control.increment:g}"
+    if control.delay:
+        text += f"d{control.delay:g}"
+    return text
+
+
+def allocate_time(remaining, increment=0.0, moves_to_go=None):
+    """
+    Decide how long a search may think.
+
+    Args:
+        remaining: Seconds left on the mover's clock
+        increment: Seconds added after the move
+        moves_to_go: Moves until the next time control, if known
+
+    Returns:
+        Seconds to think (at least MIN_THINK, at most MAX_FRACTION of the
+        remaining time unless that is less than MIN_THINK)
+    """
+    budget = remaining / max(moves_to_go or MOVES_TO_GO, 1) + increment * INCREMENT_SHARE
+    return max(MIN_THINK, min(budget, remaining * MAX_FRACTION))
+
+
+class GameClock:
+    """Two-player clock driven by a monotonic nanosecond counter."""
+
+    def __init__(self, control, now=time.monotonic_ns):
+        """
+        Initialize a stopped clock.
+
+        Args:
+            control: TimeControl, or text for parse_time_control
+            now: Function returning the time in integer nanoseconds
+
+        Raises:
+            ValueError: If the time control is invalid
+        """
+        if isinstance(control, TimeControl):
+            self.control = _checked(control, format_time_control(control))
+        else:
+            self.control = parse_time_control(control)
+        self._now = now
+        self._increment = round(self.control.increment * NS_PER_SECOND)
+        self._delay = round(self.control.delay * NS_PER_SECOND)
+        self.reset()
+
+    def reset(self):
+        """Restore the initial time and stop the clock."""
+        initial = round(self.control.initial * NS_PER_SECOND)
+        self._remaining = [initial, initial]
+        self.running = None
+        self.flagged = None
+        self._turn_started = 0
+
+    def _used(self, now):
+        """Time charged to the running side so far this turn."""
+        return max(0, now - self._turn_started - self._delay)
+
+    def start(self, side=WHITE):
+        """Start the given side's clock."""
+        self.running = side
+        self._turn_started = self._now()
+
+    def stop(self):
+        """Charge the running side for its turn and stop the clock."""
+        if self.running is not None:
+            side = self.running
+            self._remaining[side] -= self._used(self._now())
+            self.running = None
+            if self._remaining[side] <= 0:
+                self.flagged = side
+
+    def press(self):
+        """
+        End the running side's turn and start the opponent's.
+
+        Returns:
+            True if the move was made in time (or the clock was not running);
+            False if the mover's flag had fallen, in which case the clock
+            stays stopped
+        """
+        side = self.running
+        if side is None:
+            return self.flagged is None
+        self.stop()
+        if self.flagged is not None:
+            return False
+        self._remaining[side] += self._increment
+        self.start(side ^ 1)
+        return True
+
+    def remaining_ns(self, side):
+        """Nanoseconds left for a side, counting the running turn."""
+        remaining = self._remaining[side]
+        if side == self.running:
+            remaining -= self._used(self._now())
+        return max(remaining, 0)
+
+    def remaining(self, side):
+        """Seconds left for a side."""
+        return self.remaining_ns(side) / NS_PER_SECOND
+
+    def deadline_ns(self):
+        """Clock reading at which the running side's flag falls (None when stopped)."""
+        if self.running is None:
+            return None
+        return self._turn_started + self._delay + self._remaining[self.running]
+
+    def time_to_flag(self):
+        """Seconds until the running side's flag falls (None when stopped), for timed waits."""
+        deadline = self.deadline_ns()
+        if deadline is None:
+            return None
+        return max(deadline - self._now(), 0) / NS_PER_SECOND
+
+    def check_flag(self):
+        """
+        Check the running side against its deadline.
+
+        Returns:
+            The side whose flag has fallen (the clock is then stopped), or None
+        """
+        if self.flagged is None and self.running is not None and self._now() >= self.deadline_ns():
+            self.stop()
+        return self.flagged
+
+    def think_time(self, side, moves_to_go=None):
+        """Thinking budget for a side's search (see allocate_time)."""
+        return allocate_time(self.remaining(side), self.control.increment + self.control.delay, moves_to_go)
+
+    def to_dict(self):
+        """Remaining seconds per color for status reports."""
+        return {'white': round(self.remaining(WHITE), 3), 'black': round(self.remaining(WHITE ^ 1), 3)}
@@ -0,0 +1,158 @@
+"""
+Headless game session.
+
+GameSession applies the game rules to a ChessBoard and GameState without
+any printing or prompting, so bots, servers and tests can drive games at
+full speed. The console ChessGame is a thin adapter over it.
+"""
+
+from collections import namedtuple
+
+from board.chess_board import ChessBoard
+from game.game_state import GameState
+from moves.exchange import see
+from moves.move_generator import generate_moves, side_targets
+from notation.fen import board_to_fen, history_counters
+from notation.move_parser import CONSOLE_SQUARES, parse_move
+from pieces.piece_codes import COLOR_NAMES, EMPTY, KING, TYPE_MASK, symbol_of
+
+MoveResult = namedtuple('MoveResult', ['ok', 'error', 'piece', 'captured', 'game_over', 'winner', 'exchange'])
+
+GAME_ONGOING = '*'
+WHITE_WINS = '1-0'
+BLACK_WINS = '0-1'
+
+
+class GameSession:
+    """One game, driven through method calls only."""
+
+    def __init__(self, board=None, game_state=None):
+        """
+        Initialize a session.
+
+        Args:
+            board: Optional ChessBoard to continue from (a new one by default)
+            game_state: Optional GameState to continue from
+        """
+        self.board = board or ChessBoard()
+        self.game_state = game_state or GameState()
+
+    @property
+    def side_to_move(self):
+        """Side to move, 0 for White and 1 for Black."""
+        return self.game_state.side_to_move
+
+    @property
+    def current_player(self):
+        """Side to move as 'white' or 'black'."""
+        return self.game_state.current_player
+
+    @property
+    def is_over(self):
+        """Check if the game has finished."""
+        return self.game_state.is_game_over
+
+    @property
+    def winner(self):
+        """Winning color name, or None while the game is running."""
+        return self.game_state.winner
+
+    @property
+    def move_history(self):
+        """List of recorded moves (see GameState.add_move)."""
+        return self.game_state.move_history
+
+    def legal_moves(self):
+        """
+        List the moves available to the side to move.
+
+        Returns:
+            List of (start, end) tuples; empty once the game is over
+        """
+        if self.game_state.is_game_over:
+            return []
+        return generate_moves(self.board.board, self.game_state.side_to_move)
+
+    def legal_targets(self):
+        """
+        Map each piece of the side to move to its destinations.
+
+        Returns:
+            Dict of (row, col) -> list of (row, col); empty once the game is over
+        """
+        if self.game_state.is_game_over:
+            return {}
+        return side_targets(self.board.board, self.game_state.side_to_move)
+
+    def submit_move(self, start, end):
+        """
+        Play a move for the side to move.
+
+        Args:
+            start: Tuple (row, col) starting position
+            end: Tuple (row, col) ending position
+
+        Returns:
+            MoveResult; ok is False (with an error message) when the move was
+            rejected and the position is unchanged. For captures, exchange
+            holds the static exchange evaluation in centipawns (negative when
+            the capture loses material); it is None for quiet moves
+        """
+        state = self.game_state
+        if state.is_game_over:
+            error = f"{state.current_player.capitalize()} lost on time" if state.lost_on_time else "The game is over"
+            return MoveResult(False, error, None, None, True, state.winner, None)
+
+        side = state.side_to_move
+        is_valid, error_message = self.board.validate_move(start, end, side)
+        if not is_valid:
+            return MoveResult(False, error_message, None, None, False, None, None)
+
+        grid = self.board.board
+        captured_code = grid[end[0]][end[1]]
+        piece = symbol_of(grid[start[0]][start[1]])
+        captured = symbol_of(captured_code)
+        exchange = see(grid, start, end) if captured_code != EMPTY else None
+        self.board.move_piece(start, end)
+        state.add_move(start, end, piece, captured)
+
+        if captured_code != EMPTY and captured_code & TYPE_MASK == KING:
+            state.set_game_over(COLOR_NAMES[side])
+        else:
+            state.switch_player()
+        return MoveResult(True, "", piece, captured, state.is_game_over, state.winner, exchange)
+
+    def submit_text(self, text, squares=CONSOLE_SQUARES):
+        """
+        Parse a move in any notation accepted by notation.move_parser and play it.
+
+        Args:
+            text: Move text such as 'e2 e4' or 'Nf3'
+            squares: Square name table (console labels by default)
+
+        Returns:
+            MoveResult, or None when the text is not a move
+        """
+        start, end = parse_move(text, self.board.board, self.game_state.side_to_move, squares)
+        if start is None:
+            return None
+        return self.submit_move(start, end)
+
+    def result(self):
+        """
+        Get the game result.
+
+        Returns:
+            '1-0' or '0-1' once a king has been captured or a flag has
+            fallen, '*' while running
+        """
+        self.game_state.check_clock()
+        winner = self.game_state.winner
+        if winner is None:
+            return GAME_ONGOING
+        return WHITE_WINS if winner == 'white' else BLACK_WINS
+
+    def fen(self):
+        """Return the current position as a FEN string."""
+        halfmove, fullmove = history_counters(self.game_state.move_history)
+        return board_to_fen(self.board.board, self.game_state.side_to_move, halfmove, fullmove)
@@ -1,38 +1,89 @@
+from pieces.piece_codes import COLOR_NAMES, WHITE, side_of
+
+
 class GameState:
     """Manages the state of the chess game."""
-    
-    def __init__(self):
-        self.current_player = 'white'
+
+    def __init__(self, clock=None):
+        """
+        Initialize the game state.
+
+        Args:
+            clock: Optional game.clock.GameClock; it starts for Black after
+                White's first move and a fallen flag ends the game
+        """
+        self.side_to_move = WHITE
         self._is_game_over = False
         self.winner = None
         self.move_history = []
+        self.clock = clock
+        self.lost_on_time = False
 
     @property
     def is_game_over(self):
-        """Property to check if game is over."""
+        """Property to check if game is over (checking the clock, if any)."""
+        if not self._is_game_over and self.clock is not None:
+            self.check_clock()
         return self._is_game_over
 
+    def check_clock(self):
+        """
+        End the game if the side to move has run out of time.
+
+        Returns:
+            True if the game was lost on time
+        """
+        if self.clock is not None and not self._is_game_over and self.clock.check_flag() is not None:
+            self._lose_on_time(self.clock.flagged)
+        return self.lost_on_time
+
+    def _lose_on_time(self, side):
+        self.lost_on_time = True
+        self.set_game_over(COLOR_NAMES[side ^ 1])
+
+    @property
+    def current_player(self):
+        """Property for the side to move as 'white' or 'black'."""
+        return COLOR_NAMES[self.side_to_move]
+
+    @current_player.setter
+    def current_player(self, color):
+        self.side_to_move = side_of(color)
+
     def switch_player(self):
-        """Switch turn to the other player."""
-        self.current_player = 'black' if self.current_player == 'white' else 'white'
+        """Switch turn to the other player, pressing the clock if there is one."""
+        self.side_to_move ^= 1
+        clock = self.clock
+        if clock is None:
+            return
+        if clock.running is None and clock.flagged is None:
+            clock.start(self.side_to_move)
+        elif not clock.press():
+            self._lose_on_time(clock.flagged)
 
     def set_game_over(self, winner):
         """Set the game as over with a winner."""
         self.winner = winner
         self._is_game_over = True
+        if self.clock is not None:
+            self.clock.stop()
 
-    def add_move(self, start, end, piece):
-        """Add a move to the history."""
+    def add_move(self, start, end, piece, captured=None):
+        """Add a move to the history (captured is the taken piece's symbol, if any)."""
         self.move_history.append({
             'start': start,
             'end': end,
             'piece': piece,
-            'player': self.current_player
+            'captured': captured,
+            'player': COLOR_NAMES[self.side_to_move]
         })
 
     def reset_game(self):
         """Reset the game state to initial values."""
-        self.current_player = 'white'
+        self.side_to_move = WHITE
         self._is_game_over = False
         self.winner = None
-        self.move_history = []
\ No newline at end of file
+        self.move_history = []
+        self.lost_on_time = False
+        if self.clock is not None:
+            self.clock.reset()
@@ -0,0 +1,144 @@
+"""
+Deterministic replay of recorded games.
+
+Replays move lists straight through ChessBoard.validate_move and
+ChessBoard.move_piece (no session bookkeeping), checks the Zobrist key of
+each final position against the recorded one and measures throughput in
+plies per second. Used by the replay regression test and
+benchmarks/bench_replay.py.
+
+Plies per second depend on the machine and its load, so the stored baseline
+is relative: replay throughput divided by the speed of a fixed calibration
+loop (board scans and method calls, like replay) timed in the same process.
+
+Corpus records are archive games (notation.archive) whose tags hold the
+expected 'final_hash' as a hex string.
+"""
+
+import time
+from collections import namedtuple
+
+from board.chess_board import ChessBoard
+from board.zobrist import position_hash
+from notation.archive import read_jsonl
+from notation.san import PGN_SQUARES
+from pieces.piece_codes import KING, TYPE_MASK, WHITE
+
+ReplayReport = namedtuple('ReplayReport', ['games', 'plies', 'elapsed', 'mismatches'])
+
+CALIBRATION_ROUNDS = 10000
+
+
+def decode_moves(moves):
+    """Turn coordinate moves ('e2e4') into (start, end) square pairs."""
+    return [(PGN_SQUARES[move[:2]], PGN_SQUARES[move[2:4]]) for move in moves]
+
+
+def replay_moves(moves, board=None):
+    """
+    Play a move list from the starting position, alternating sides.
+
+    Args:
+        moves: List of (start, end) square pairs
+        board: Optional ChessBoard to play on (a new one by default)
+
+    Returns:
+        Tuple (board, side to move, plies played); replay stops at the first
+        move validate_move rejects or after a king is captured
+    """
+    board = board or ChessBoard()
+    side = WHITE
+    played = 0
+    for start, end in moves:
+        if not board.validate_move(start, end, side)[0]:
+            break
+        captured = board.board[end[0]][end[1]]
+        board.move_piece(start, end)
+        played += 1
+        if captured & TYPE_MASK == KING:
+            break
+        side ^= 1
+    return board, side, played
+
+
+def load_corpus(path):
+    """
+    Load a replay corpus.
+
+    Returns:
+        List of (decoded moves, expected final hash or None) pairs
+    """
+    corpus = []
+    for game in read_jsonl(path):
+        expected = game.tags.get('final_hash')
+        corpus.append((decode_moves(game.moves), int(expected, 16) if expected else None))
+    return corpus
+
+
+def final_hash(moves):
+    """Zobrist key of the position after replaying a decoded move list."""
+    board, side, _ = replay_moves(moves)
+    return position_hash(board.board, side)
+
+
+def replay_corpus(corpus, repeat=1):
+    """
+    Replay every game of a corpus and time it.
+
+    Args:
+        corpus: List of (decoded moves, expected final hash) from load_corpus
+        repeat: Number of timed passes; the fastest one is reported
+
+    Returns:
+        ReplayReport; mismatches lists the indices of games whose final
+        position (or ply count) differs from the record
+    """
+    best = None
+    for _ in range(repeat):
+        boards = []
+        plies = 0
+        started = time.perf_counter()
+        for moves, _ in corpus:
+            board, side, played = replay_moves(moves)
+            boards.append((board, side, played))
+            plies += played
+        elapsed = time.perf_counter() - started
+        if best is None or elapsed < best:
+            best = elapsed
+    mismatches = [
+        index for index, ((moves, expected), (board, side, played)) in enumerate(zip(corpus, boards))
+        if played != len(moves) or (expected is not None and position_hash(board.board, side) != expected)
+    ]
+    return ReplayReport(len(corpus), plies, best, mismatches)
+
+
+def calibrate(repeat=5, rounds=CALIBRATION_ROUNDS):
+    """
+    Time a fixed interpreter workload.
+
+    Args:
+        repeat: Number of timed passes; the fastest one is reported
+        rounds: Board scans per pass
+
+    Returns:
+        Calibration rounds per second
+    """
+    board = ChessBoard()
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        total = 0
+        for _ in range(rounds):
+            for row in board.board:
+                for code in row:
+                    if code & TYPE_MASK == KING:
+                        total += board.is_position_valid((code, code))
+        elapsed = time.perf_counter() - started
+        if best is None or elapsed < best:
+            best = elapsed
+    return rounds / best
+
+
+def relative_throughput(report, calibration):
+    """Replay plies per second divided by calibration rounds per second."""
+    return report.plies / report.elapsed / calibration
@@ -1,85 +1,75 @@
-from utils.position import algebraic_to_index, parse_numeric_position, is_valid_position
+import io
+import os
+import select
+import sys
+
+from notation.move_parser import parse_move
+from pieces.piece_codes import WHITE
+
+PROMPT = "Enter move (e.g., 'e2 e4' or '1,3 2,3'): "
 
 
 class InputHandler:
     """Handles parsing and validation of user input."""
     
     @staticmethod
-    def parse_move(move_input):
+    def parse_move(move_input, board=None, side=WHITE):
         """
         Parse move input in various formats.
         
         Supported formats:
-        - Algebraic: "e2 e4" or "e2,e4"
+        - Algebraic: "e2 e4", "e2,e4" or "e2e4"
         - Numeric: "1,3 2,3" or "1,3,2,3"
+        - SAN: "Nf6" (only when the board is given)
         
         Args:
             move_input: String containing the move
+            board: The chess board (2D list of piece codes), used for SAN
+            side: Side to move, 0 for White and 1 for Black
             
         Returns:
             Tuple (start_pos, end_pos) or (None, None) if invalid
         """
-        move_input = move_input.strip().lower()
-        
-        # Try space separator first
-        if ' ' in move_input:
-            parts = move_input.split()
-            if len(parts) == 2:
-                return InputHandler._parse_positions(parts[0], parts[1])
-        
-        # Try comma separator with space: "e2,e4" or "1,3,2,3"
-        if ',' in move_input:
-            parts = move_input.split(',')
-            
-            # Format: "1,3,2,3" (4 parts)
-            if len(parts) == 4:
-                start = f"{parts[0]},{parts[1]}"
-                end = f"{parts[2]},{parts[3]}"
-                start_pos = parse_numeric_position(start)
-                end_pos = parse_numeric_position(end)
-                if start_pos and end_pos:
-                    return start_pos, end_pos
-            
-            # Format: "e2,e4" (2 parts)
-            elif len(parts) == 2:
-                return InputHandler._parse_positions(parts[0], parts[1])
-        
-        return None, None
+        return parse_move(move_input, board, side)
 
     @staticmethod
-    def _parse_positions(start_str, end_str):
-        """Parse individual position strings."""
-        start_str = start_str.strip()
-        end_str = end_str.strip()
-        
-        # Try algebraic notation (e.g., "e2")
-        if is_valid_position(start_str) and is_valid_position(end_str):
-            start_pos = algebraic_to_index(start_str)
-            end_pos = algebraic_to_index(end_str)
-            if start_pos and end_pos:
-                return start_pos, end_pos
-        
-        # Try numeric notation (e.g., "1,3")
-        if ',' in start_str and ',' in end_str:
-            start_pos = parse_numeric_position(start_str)
-            end_pos = parse_numeric_position(end_str)
-            if start_pos and end_pos:
-                return start_pos, end_pos
-        
-        return None, None
-
-    @staticmethod
-    def get_move_input(current_player):
+    def get_move_input(current_player, timeout=None):
         """
         Prompt user for move input.
         
+        With a timeout the prompt waits on standard input with select, so a
+        player whose clock runs out is not waited for. Where stdin cannot be
+        polled (Windows consoles, replaced streams) the prompt blocks as
+        without a timeout.
+        
         Args:
             current_player: 'white' or 'black'
+            timeout: Optional seconds to wait for a line
             
         Returns:
-            String containing user input
+            String containing user input, or None if the timeout passed first
         """
         player_name = current_player.capitalize()
         print(f"{player_name}'s turn")
-        move = input("Enter move (e.g., 'e2 e4' or '1,3 2,3'): ")
-        return move
+        if timeout is None or not _pollable(sys.stdin):
+            return input(PROMPT)
+        print(PROMPT, end="", flush=True)
+        ready, _, _ = select.select([sys.stdin], [], [], timeout)
+        if not ready:
+            print()
+            return None
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\r\n")
+
+
+def _pollable(stream):
+    """Whether select can wait on a stream (POSIX file descriptors only)."""
+    if os.name != "posix":
+        return False
+    try:
+        stream.fileno()
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        return False
+    return True
@@ -1,11 +1,154 @@
 """
 Main entry point for the Console Chess Game.
 Run this file to start the game.
+
+Options:
+    --profile [PATH]   Dump a cProfile capture of the session (default: chess.prof)
+    --stats FORMAT     Print hot-path call statistics on exit (table, json, prometheus)
+    --engine COLOR     Let the engine play white or black
+    --think SECONDS    Engine thinking time per move (default: 2.0)
+    --no-ponder        Do not search on the opponent's time
+    --time-control TC  Play with a clock, e.g. 300+2 (seconds, see game.clock);
+                       the engine then budgets its time from its clock
+
+One-shot commands:
+    validate [--standard] [FILE ...]
+        Replay the moves in FILE (or stdin), one per line, from the starting
+        position and exit with status 0 if they are all legal, 1 otherwise.
+        Moves use the console's square labels unless --standard is given.
+    memory [--json] [--check] [--count N]
+        Print bytes per board, game state, session and stored move and the
+        allocations of move validation, measured with tracemalloc (see
+        utils.memory); --check exits with status 1 over budget.
+
+Subsystems are imported where they are used, so one-shot commands only pay
+for the modules they need.
 """
 
-from game.chess_game import ChessGame
+import sys
+
+
+def parse_args(argv=None):
+    """Parse command line options."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Console Chess Game")
+    parser.add_argument('--profile', nargs='?', const='chess.prof', metavar='PATH',
+                        help="dump a cProfile capture of the session to PATH")
+    parser.add_argument('--stats', choices=['table', 'json', 'prometheus'],
+                        help="print hot-path call statistics when the game ends")
+    parser.add_argument('--engine', choices=['white', 'black'], help="let the engine play this color")
+    parser.add_argument('--think', type=float, default=2.0, metavar='SECONDS',
+                        help="engine thinking time per move")
+    parser.add_argument('--no-ponder', dest='ponder', action='store_false',
+                        help="do not search on the opponent's time")
+    parser.add_argument('--time-control', metavar='BASE[+INC][dDELAY]',
+                        help="play with a clock, e.g. 300+2 (seconds)")
+    args = parser.parse_args(argv)
+    if args.time_control:
+        from game.clock import parse_time_control
+        try:
+            args.time_control = parse_time_control(args.time_control)
+        except ValueError as error:
+            parser.error(str(error))
+    return args
+
+
+def run(args):
+    """Run one game session with the requested instrumentation."""
+    from game.chess_game import ChessGame
+
+    if args.stats:
+        from utils.instrumentation import instrumentation
+        instrumentation.enable()
+
+    engine = engine_side = None
+    if args.engine:
+        from engine.ponder import Ponderer
+        from pieces.piece_codes import side_of
+        engine = Ponderer(args.think, ponder=args.ponder)
+        engine_side = side_of(args.engine)
+
+    game = ChessGame(engine=engine, engine_side=engine_side, time_control=args.time_control)
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+    try:
+        if profiler:
+            profiler.enable()
+        game.start_game()
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            print(f"Profile written to {args.profile}")
+        if args.stats:
+            instrumentation.disable()
+            print(instrumentation.report(args.stats))
+
+
+def validate_moves(lines, squares=None, out=None):
+    """
+    Replay a move list from the starting position.
+
+    Args:
+        lines: Iterable of move strings, one per item (blank items are skipped)
+        squares: Square name table (console labels by default)
+        out: Stream for the report (defaults to sys.stdout)
+
+    Returns:
+        Exit status: 0 when every move was legal, 1 otherwise
+    """
+    from game.game_session import GameSession
+    from notation.move_parser import CONSOLE_SQUARES
+
+    out = out or sys.stdout
+    squares = squares or CONSOLE_SQUARES
+    session = GameSession()
+    played = 0
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        result = session.submit_text(line, squares)
+        if result is None:
+            out.write(f"line {number}: cannot parse or resolve {line.strip()!r}\n")
+            return 1
+        if not result.ok:
+            out.write(f"line {number}: {line.strip()}: {result.error}\n")
+            return 1
+        played += 1
+    out.write(f"ok: {played} moves, result {session.result()}\n")
+    return 0
+
+
+def validate_command(argv):
+    """Handle 'validate [--standard] [FILE ...]' without argparse."""
+    squares = None
+    if '--standard' in argv:
+        from notation.san import PGN_SQUARES
+        squares = PGN_SQUARES
+        argv = [arg for arg in argv if arg != '--standard']
+    if not argv or argv == ['-']:
+        return validate_moves(sys.stdin, squares)
+    status = 0
+    for path in argv:
+        with open(path) as handle:
+            status |= validate_moves(handle, squares)
+    return status
+
+
+def main(argv=None):
+    """Dispatch one-shot commands, otherwise start an interactive game."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['validate']:
+        return validate_command(argv[1:])
+    if argv[:1] == ['memory']:
+        from utils.memory import main as memory_main
+        return memory_main(argv[1:])
+    run(parse_args(argv))
+    return 0
 
 
 if __name__ == "__main__":
-    game = ChessGame()
-    game.start_game()
\ No newline at end of file
+    sys.exit(main())
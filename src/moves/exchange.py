@@ -0,0 +1,120 @@
+"""
+Static exchange evaluation (SEE).
+
+Estimates the material outcome of a sequence of captures on one square,
+where each side recaptures with its least valuable attacker and may stop
+whenever continuing would lose material. Nothing is moved on the board:
+pieces that have already captured are tracked in a set and treated as empty
+squares, so sliders lined up behind them (x-rays) join the exchange.
+
+Slider attacks are found by walking the rays out from the target square,
+the same straight-line geometry Piece.is_path_clear checks between two
+squares: the first piece met on a ray attacks the square if it moves along
+that line.
+"""
+
+from moves.move_generator import KING_TARGETS, KNIGHT_TARGETS, SLIDER_RAYS
+from pieces.piece_codes import BISHOP, COLOR_SHIFT, EMPTY, KING, KNIGHT, PAWN, QUEEN, ROOK, TYPE_MASK, WHITE
+
+# Indexed by piece type; capturing the king ends the game
+EXCHANGE_VALUES = (0, 100, 320, 330, 500, 900, 20000)
+
+ORTHOGONAL_RAYS = SLIDER_RAYS[ROOK]
+DIAGONAL_RAYS = SLIDER_RAYS[BISHOP]
+
+
+def _pawn_sources(square, side):
+    """Squares from which a pawn of side would capture on square."""
+    row, col = square
+    from_row = row - 1 if side == WHITE else row + 1
+    if not 0 <= from_row < 8:
+        return ()
+    return tuple((from_row, c) for c in (col - 1, col + 1) if 0 <= c < 8)
+
+
+def _slider_attackers(board, square, side, removed, rays, kinds, found):
+    """Add the first piece of side on each ray if it slides along that line."""
+    for ray in rays[square]:
+        for r, c in ray:
+            code = board[r][c]
+            if code == EMPTY or (r, c) in removed:
+                continue
+            if code >> COLOR_SHIFT == side and code & TYPE_MASK in kinds:
+                found.append((r, c))
+            break
+
+
+def attackers(board, square, side, removed=()):
+    """
+    List the pieces of a side that could capture on a square.
+
+    Args:
+        board: The chess board (2D list of piece codes)
+        square: Tuple (row, col) of the target
+        side: 0 for White, 1 for Black
+        removed: Squares to treat as empty (pieces already exchanged)
+
+    Returns:
+        List of (row, col) squares, in no particular order
+    """
+    found = []
+    for r, c in _pawn_sources(square, side):
+        if board[r][c] == PAWN | (side << COLOR_SHIFT) and (r, c) not in removed:
+            found.append((r, c))
+    for table, kind in ((KNIGHT_TARGETS, KNIGHT), (KING_TARGETS, KING)):
+        code = kind | (side << COLOR_SHIFT)
+        for r, c in table[square]:
+            if board[r][c] == code and (r, c) not in removed:
+                found.append((r, c))
+    _slider_attackers(board, square, side, removed, ORTHOGONAL_RAYS, (ROOK, QUEEN), found)
+    _slider_attackers(board, square, side, removed, DIAGONAL_RAYS, (BISHOP, QUEEN), found)
+    return found
+
+
+def _least_valuable(board, squares):
+    """Pick the attacker with the lowest exchange value."""
+    return min(squares, key=lambda square: EXCHANGE_VALUES[board[square[0]][square[1]] & TYPE_MASK])
+
+
+def see(board, start, end):
+    """
+    Evaluate the capture sequence started by moving start to end.
+
+    Args:
+        board: The chess board (2D list of piece codes); it is not modified
+        start: Tuple (row, col) of the moving piece
+        end: Tuple (row, col) of the target square (may be empty)
+
+    Returns:
+        Net material gain for the moving side, in centipawns (negative when
+        the capture loses material)
+    """
+    mover = board[start[0]][start[1]]
+    captured = board[end[0]][end[1]] & TYPE_MASK
+    gains = [EXCHANGE_VALUES[captured]]
+    if captured == KING:
+        return gains[0]
+    on_square = mover & TYPE_MASK
+    removed = {start}
+    side = (mover >> COLOR_SHIFT) ^ 1
+
+    while True:
+        candidates = attackers(board, end, side, removed)
+        if not candidates:
+            break
+        gains.append(EXCHANGE_VALUES[on_square] - gains[-1])
+        if on_square == KING:
+            break  # capturing the king ends the game
+        attacker = _least_valuable(board, candidates)
+        on_square = board[attacker[0]][attacker[1]] & TYPE_MASK
+        removed.add(attacker)
+        side ^= 1
+
+    for index in range(len(gains) - 1, 0, -1):
+        gains[index - 1] = -max(-gains[index - 1], gains[index])
+    return gains[0]
+
+
+def is_losing_capture(board, start, end, margin=0):
+    """Check if a capture loses more than margin centipawns by SEE."""
+    return see(board, start, end) < -margin
@@ -0,0 +1,300 @@
+"""
+Magic-bitboard attack tables for sliding pieces.
+
+Squares are numbered row * 8 + col, the bit order of move_generator.SQUARE_BITS,
+and a set of squares is a 64-bit Python int. For every square, the squares
+whose occupancy can block a rook (or bishop) ray are a "relevant mask"; the
+occupied squares under that mask, multiplied by a per-square magic number,
+give a perfect hash of the blocker configuration in their top bits:
+
+    attacks = table[offset + ((occupied & mask) * magic & MASK64) >> shift]
+
+so the attack set of a slider costs a mask, a multiply, a shift and an index
+instead of a walk along each ray. The magic numbers are found by a seeded
+random search, which is slow in Python, so the tables are shipped in
+TABLE_PATH and only read back at run time. To regenerate them:
+
+    python3 -m moves.magic            # (re)generate the table file
+"""
+
+import argparse
+import array
+import gzip
+import os
+import random
+import struct
+import sys
+
+from moves.move_generator import BISHOP_DIRECTIONS, ROOK_DIRECTIONS
+
+MASK64 = (1 << 64) - 1
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'magic_tables.bin.gz')
+FILE_MAGIC = b'MAG1'
+HEADER = struct.Struct('<4sII')
+SEED = 0x6D61676963
+
+
+def _square_bit(row, col):
+    return 1 << (row * 8 + col)
+
+
+def ray_attacks(square, occupied, directions):
+    """
+    Compute a slider's attack set by walking its rays (the reference method).
+
+    Args:
+        square: Square index (row * 8 + col)
+        occupied: Bitboard of occupied squares
+        directions: (row step, col step) pairs, e.g. ROOK_DIRECTIONS
+
+    Returns:
+        Bitboard of attacked squares, including the first blocker on each ray
+    """
+    row, col = divmod(square, 8)
+    attacks = 0
+    for dr, dc in directions:
+        r, c = row + dr, col + dc
+        while 0 <= r < 8 and 0 <= c < 8:
+            bit = _square_bit(r, c)
+            attacks |= bit
+            if occupied & bit:
+                break
+            r += dr
+            c += dc
+    return attacks
+
+
+def relevant_mask(square, directions):
+    """Bitboard of the squares whose occupancy changes a slider's attacks (edges excluded)."""
+    row, col = divmod(square, 8)
+    mask = 0
+    for dr, dc in directions:
+        r, c = row + dr, col + dc
+        while 0 <= r + dr < 8 and 0 <= c + dc < 8:
+            mask |= _square_bit(r, c)
+            r += dr
+            c += dc
+    return mask
+
+
+def _subsets(mask):
+    """Enumerate every subset of a bitboard (Carry-Rippler)."""
+    subset = 0
+    while True:
+        yield subset
+        subset = (subset - mask) & mask
+        if subset == 0:
+            return
+
+
+def find_magic(square, directions, rng, attempts=1 << 24):
+    """
+    Search for a magic number that hashes a square's blockers without collisions.
+
+    Returns:
+        Tuple (mask, magic, shift, attack list indexed by the hash)
+
+    Raises:
+        RuntimeError: If no magic is found within the attempts
+    """
+    mask = relevant_mask(square, directions)
+    bits = bin(mask).count('1')
+    shift = 64 - bits
+    occupancies = list(_subsets(mask))
+    attacks = [ray_attacks(square, occupied, directions) for occupied in occupancies]
+    size = 1 << bits
+    for _ in range(attempts):
+        magic = rng.getrandbits(64) & rng.getrandbits(64) & rng.getrandbits(64)
+        if bin((mask * magic) & 0xFF00000000000000).count('1') < 6:
+            continue
+        table = [None] * size
+        for occupied, attack in zip(occupancies, attacks):
+            index = ((occupied * magic) & MASK64) >> shift
+            if table[index] is None:
+                table[index] = attack
+            elif table[index] != attack:
+                break
+        else:
+            return mask, magic, shift, [attack or 0 for attack in table]
+    raise RuntimeError(f"No magic found for square {square}")
+
+
+class MagicTable:
+    """Attack lookups for one kind of slider."""
+
+    def __init__(self, masks, magics, shifts, attacks):
+        """
+        Initialize from per-square masks, magics and shifts and the packed attack sets.
+
+        Args:
+            masks: 64 relevant-occupancy masks
+            magics: 64 magic numbers
+            shifts: 64 right shifts (64 minus the mask's bit count)
+            attacks: array('Q') of attack sets, each square's block following the previous one
+        """
+        self.masks = list(masks)
+        self.magics = list(magics)
+        self.shifts = list(shifts)
+        self.offsets = []
+        offset = 0
+        for shift in self.shifts:
+            self.offsets.append(offset)
+            offset += 1 << (64 - shift)
+        if offset != len(attacks):
+            raise ValueError(f"Expected {offset} attack sets, found {len(attacks)}")
+        self.table = attacks
+        # Per-square (mask, magic, shift, offset) for the lookup hot path
+        self.entries = tuple(zip(self.masks, self.magics, self.shifts, self.offsets))
+
+    @classmethod
+    def generate(cls, directions, rng):
+        """Find magics for every square and build the table."""
+        masks, magics, shifts = [], [], []
+        attacks = array.array('Q')
+        for square in range(64):
+            mask, magic, shift, table = find_magic(square, directions, rng)
+            masks.append(mask)
+            magics.append(magic)
+            shifts.append(shift)
+            attacks.extend(table)
+        return cls(masks, magics, shifts, attacks)
+
+    def attacks(self, square, occupied):
+        """
+        Look up the attack set of a slider.
+
+        Args:
+            square: Square index (row * 8 + col)
+            occupied: Bitboard of occupied squares (the slider's own bit may be set)
+
+        Returns:
+            Bitboard of attacked squares, including the first blocker on each ray
+        """
+        mask, magic, shift, offset = self.entries[square]
+        return self.table[offset + (((occupied & mask) * magic & MASK64) >> shift)]
+
+
+def write_tables(path, rook, bishop):
+    """Write rook and bishop tables to a gzip-compressed file (little-endian)."""
+    # No name or timestamp in the gzip header, so the same tables give the same file
+    with open(path, 'wb') as raw, gzip.GzipFile('', 'wb', fileobj=raw, mtime=0) as handle:
+        handle.write(HEADER.pack(FILE_MAGIC, len(rook.table), len(bishop.table)))
+        for table in (rook, bishop):
+            handle.write(struct.pack('<64Q', *table.masks))
+            handle.write(struct.pack('<64Q', *table.magics))
+            handle.write(struct.pack('<64B', *table.shifts))
+            attacks = array.array('Q', table.table)
+            if sys.byteorder != 'little':
+                attacks.byteswap()
+            handle.write(attacks.tobytes())
+
+
+def read_tables(path):
+    """
+    Read tables written by write_tables.
+
+    Returns:
+        Tuple (rook MagicTable, bishop MagicTable)
+
+    Raises:
+        ValueError: If the file is not a table file or is truncated
+    """
+    try:
+        with gzip.open(path, 'rb') as handle:
+            data = handle.read()
+    except (EOFError, gzip.BadGzipFile) as error:
+        raise ValueError(f"{path} is not a magic table file") from error
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is not a magic table file")
+    file_magic, rook_size, bishop_size = HEADER.unpack_from(data)
+    if file_magic != FILE_MAGIC:
+        raise ValueError(f"{path} is not a magic table file")
+    offset = HEADER.size
+    tables = []
+    for size in (rook_size, bishop_size):
+        end = offset + 64 * 8 * 2 + 64 + size * 8
+        if end > len(data):
+            raise ValueError(f"{path} is truncated")
+        masks = struct.unpack_from('<64Q', data, offset)
+        magics = struct.unpack_from('<64Q', data, offset + 512)
+        shifts = struct.unpack_from('<64B', data, offset + 1024)
+        attacks = array.array('Q')
+        attacks.frombytes(data[offset + 1088:end])
+        if sys.byteorder != 'little':
+            attacks.byteswap()
+        tables.append(MagicTable(masks, magics, shifts, attacks))
+        offset = end
+    return tables[0], tables[1]
+
+
+def generate_tables(seed=SEED):
+    """Search for magics and build (rook, bishop) tables."""
+    rng = random.Random(seed)
+    return MagicTable.generate(ROOK_DIRECTIONS, rng), MagicTable.generate(BISHOP_DIRECTIONS, rng)
+
+
+_tables = None
+
+
+def load_tables():
+    """
+    Return the (rook, bishop) tables, reading TABLE_PATH once per process.
+
+    A missing or unreadable file is regenerated (the magic search takes
+    about half a minute) and written back when the directory is writable.
+    """
+    global _tables
+    if _tables is None:
+        try:
+            _tables = read_tables(TABLE_PATH)
+        except (OSError, ValueError):
+            _tables = generate_tables()
+            try:
+                write_tables(TABLE_PATH, *_tables)
+            except OSError:
+                pass
+    return _tables
+
+
+def occupancy(board):
+    """Bitboard of the occupied squares of a board (2D list of piece codes)."""
+    occupied = 0
+    bit = 1
+    for row in board:
+        for code in row:
+            if code:
+                occupied |= bit
+            bit <<= 1
+    return occupied
+
+
+def rook_attacks(square, occupied):
+    """Rook attack set from a square given the occupied squares."""
+    return load_tables()[0].attacks(square, occupied)
+
+
+def bishop_attacks(square, occupied):
+    """Bishop attack set from a square given the occupied squares."""
+    return load_tables()[1].attacks(square, occupied)
+
+
+def queen_attacks(square, occupied):
+    """Queen attack set from a square given the occupied squares."""
+    rook, bishop = load_tables()
+    return rook.attacks(square, occupied) | bishop.attacks(square, occupied)
+
+
+def main(argv=None):
+    """Command line entry point: generate the table file."""
+    parser = argparse.ArgumentParser(description="Generate magic-bitboard slider attack tables")
+    parser.add_argument('--output', default=TABLE_PATH, help="table file to write")
+    parser.add_argument('--seed', type=int, default=SEED, help="seed for the magic number search")
+    args = parser.parse_args(argv)
+
+    rook, bishop = generate_tables(args.seed)
+    write_tables(args.output, rook, bishop)
+    print(f"Wrote {len(rook.table)} rook and {len(bishop.table)} bishop attack sets to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
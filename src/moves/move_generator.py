@@ -0,0 +1,186 @@
+"""
+Move generation.
+
+Produces every move that ChessBoard.validate_move would accept for a side,
+using precomputed direction tables instead of testing all 64x64 square pairs.
+"""
+
+from pieces.piece_codes import (
+    BISHOP, COLOR_SHIFT, EMPTY, KING, KNIGHT, PAWN, QUEEN, ROOK, TYPE_MASK, WHITE, side_of,
+)
+
+KNIGHT_OFFSETS = ((2, 1), (2, -1), (-2, 1), (-2, -1), (1, 2), (1, -2), (-1, 2), (-1, -2))
+KING_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+ROOK_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+BISHOP_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+QUEEN_DIRECTIONS = ROOK_DIRECTIONS + BISHOP_DIRECTIONS
+
+SLIDER_DIRECTIONS = {ROOK: ROOK_DIRECTIONS, BISHOP: BISHOP_DIRECTIONS, QUEEN: QUEEN_DIRECTIONS}
+
+
+def _build_step_table(offsets):
+    """For every square, list the on-board squares one offset away."""
+    table = {}
+    for row in range(8):
+        for col in range(8):
+            table[(row, col)] = tuple(
+                (row + dr, col + dc) for dr, dc in offsets
+                if 0 <= row + dr < 8 and 0 <= col + dc < 8
+            )
+    return table
+
+
+def _build_ray_table(directions):
+    """For every square, list the rays of squares in each direction."""
+    table = {}
+    for row in range(8):
+        for col in range(8):
+            rays = []
+            for dr, dc in directions:
+                ray = []
+                r, c = row + dr, col + dc
+                while 0 <= r < 8 and 0 <= c < 8:
+                    ray.append((r, c))
+                    r += dr
+                    c += dc
+                if ray:
+                    rays.append(tuple(ray))
+            table[(row, col)] = tuple(rays)
+    return table
+
+
+KNIGHT_TARGETS = _build_step_table(KNIGHT_OFFSETS)
+KING_TARGETS = _build_step_table(KING_OFFSETS)
+SLIDER_RAYS = {kind: _build_ray_table(directions) for kind, directions in SLIDER_DIRECTIONS.items()}
+
+# Bit of each square in a 64-bit target mask (bit row * 8 + col, as in encode_move)
+SQUARE_BITS = {(row, col): 1 << (row * 8 + col) for row in range(8) for col in range(8)}
+
+
+def piece_moves(board, start):
+    """
+    Generate the destinations of the piece standing on start.
+
+    Args:
+        board: The chess board (2D list of piece codes)
+        start: Tuple (row, col) of the piece
+
+    Returns:
+        List of (row, col) destinations
+    """
+    row, col = start
+    code = board[row][col]
+    if code == EMPTY:
+        return []
+    side = code >> COLOR_SHIFT
+    kind = code & TYPE_MASK
+    targets = []
+
+    if kind == PAWN:
+        direction = 1 if side == WHITE else -1
+        start_rank = 1 if side == WHITE else 6
+        next_row = row + direction
+        if not 0 <= next_row < 8:
+            return targets
+        if board[next_row][col] == EMPTY:
+            targets.append((next_row, col))
+            jump_row = row + 2 * direction
+            if row == start_rank and board[jump_row][col] == EMPTY:
+                targets.append((jump_row, col))
+        for next_col in (col - 1, col + 1):
+            if 0 <= next_col < 8:
+                target = board[next_row][next_col]
+                if target != EMPTY and target >> COLOR_SHIFT != side:
+                    targets.append((next_row, next_col))
+        return targets
+
+    if kind == KNIGHT or kind == KING:
+        table = KNIGHT_TARGETS if kind == KNIGHT else KING_TARGETS
+        for r, c in table[start]:
+            target = board[r][c]
+            if target == EMPTY or target >> COLOR_SHIFT != side:
+                targets.append((r, c))
+        return targets
+
+    for ray in SLIDER_RAYS[kind][start]:
+        for r, c in ray:
+            target = board[r][c]
+            if target == EMPTY:
+                targets.append((r, c))
+                continue
+            if target >> COLOR_SHIFT != side:
+                targets.append((r, c))
+            break
+    return targets
+
+
+def squares_to_mask(squares):
+    """Pack (row, col) squares into a 64-bit mask."""
+    mask = 0
+    for square in squares:
+        mask |= SQUARE_BITS[square]
+    return mask
+
+
+def mask_to_squares(mask):
+    """Unpack a 64-bit mask into (row, col) squares in board order."""
+    squares = []
+    while mask:
+        low = mask & -mask
+        index = low.bit_length() - 1
+        squares.append((index >> 3, index & 7))
+        mask ^= low
+    return squares
+
+
+def side_targets(board, side):
+    """
+    Map every piece of a side to its destinations in one pass over the board.
+
+    Args:
+        board: The chess board (2D list of piece codes)
+        side: 0 for White, 1 for Black
+
+    Returns:
+        Dict of (row, col) -> list of (row, col) destinations, with an entry
+        (possibly empty) for each of the side's pieces
+    """
+    targets = {}
+    for row in range(8):
+        for col, code in enumerate(board[row]):
+            if code != EMPTY and code >> COLOR_SHIFT == side:
+                targets[(row, col)] = piece_moves(board, (row, col))
+    return targets
+
+
+def generate_moves(board, side):
+    """
+    Generate every valid move for a side.
+
+    Args:
+        board: The chess board (2D list of piece codes)
+        side: 0 for White, 1 for Black (or 'white' / 'black')
+
+    Returns:
+        List of (start, end) tuples in board order
+    """
+    side = side_of(side)
+    moves = []
+    for row in range(8):
+        for col, code in enumerate(board[row]):
+            if code != EMPTY and code >> COLOR_SHIFT == side:
+                start = (row, col)
+                for end in piece_moves(board, start):
+                    moves.append((start, end))
+    return moves
+
+
+def encode_move(start, end):
+    """Pack a move into 12 bits: start square in the high 6, end square in the low 6."""
+    return ((start[0] * 8 + start[1]) << 6) | (end[0] * 8 + end[1])
+
+
+def decode_move(code):
+    """Unpack a move produced by encode_move into (start, end)."""
+    start, end = code >> 6, code & 63
+    return (start >> 3, start & 7), (end >> 3, end & 7)
@@ -0,0 +1,180 @@
+"""
+Move ordering for alpha-beta search.
+
+Alpha-beta prunes most when the best move is searched first. MoveOrdering
+scores moves in four bands, highest first:
+
+1. the transposition-table move;
+2. captures, most valuable victim first and, among equal victims, least
+   valuable attacker first (MVV-LVA);
+3. the counter move: the quiet move that last refuted the opponent's
+   previous move;
+4. other quiet moves by their history score.
+
+Tables are flat, preallocated arrays indexed by piece code (color bit
+included) * 64 + square, with squares numbered row * 8 + col like
+encode_move:
+- history[piece * 64 + to] rises by depth * depth when a quiet move causes a
+  beta cutoff and falls by the same amount for the quiet moves tried before
+  it. Updates are damped towards +-HISTORY_MAX so scores stay bounded;
+- counters[piece * 64 + to] holds the encoded reply that refuted the move
+  that put piece on to (NO_COUNTER when empty).
+
+age() halves every history score between searches so old statistics fade
+without being thrown away.
+
+ordered() is lazy: each step selects the best remaining move, so a node that
+cuts off after the first few moves never pays for sorting the rest.
+"""
+
+from array import array
+
+from moves.exchange import EXCHANGE_VALUES
+from moves.move_generator import decode_move, encode_move
+from pieces.piece_codes import EMPTY, TYPE_MASK
+
+PIECE_SLOTS = 16
+TABLE_SIZE = PIECE_SLOTS * 64
+HISTORY_MAX = 1 << 14
+NO_COUNTER = 0xFFFF
+
+TABLE_MOVE_SCORE = 1 << 30
+CAPTURE_SCORE = 1 << 24
+COUNTER_SCORE = HISTORY_MAX + 1
+
+
+def move_index(piece, end):
+    """Table index for a piece arriving on a square."""
+    return piece * 64 + end[0] * 8 + end[1]
+
+
+class MoveOrdering:
+    """History and counter-move tables plus capture ordering."""
+
+    def __init__(self, history=True, counters=True):
+        """
+        Initialize empty tables.
+
+        Args:
+            history: False to order quiet moves without history scores
+            counters: False to ignore counter moves
+        """
+        self.use_history = history
+        self.use_counters = counters
+        self.history = array('i', bytes(4 * TABLE_SIZE))
+        self.counters = array('H', [NO_COUNTER]) * TABLE_SIZE
+
+    def clear(self):
+        """Forget all statistics."""
+        self.history = array('i', bytes(4 * TABLE_SIZE))
+        self.counters = array('H', [NO_COUNTER]) * TABLE_SIZE
+
+    def age(self, shift=1):
+        """Divide every history score by 2 ** shift (between searches)."""
+        history = self.history
+        for index in range(TABLE_SIZE):
+            if history[index]:
+                history[index] >>= shift
+
+    def counter_move(self, previous):
+        """
+        Counter move stored for the opponent's last move.
+
+        Args:
+            previous: move_index of the opponent's last move, or None
+
+        Returns:
+            (start, end) or None
+        """
+        if previous is None or not self.use_counters:
+            return None
+        code = self.counters[previous]
+        return None if code == NO_COUNTER else decode_move(code)
+
+    def score_moves(self, board, moves, table_move=None, previous=None):
+        """
+        Score moves for ordering (higher is searched first).
+
+        Args:
+            board: The chess board (2D list of piece codes)
+            moves: List of (start, end) tuples
+            table_move: Optional move from the transposition table
+            previous: Optional move_index of the opponent's last move
+
+        Returns:
+            List of integer scores, parallel to moves
+        """
+        counter = self.counter_move(previous)
+        history = self.history if self.use_history else None
+        scores = []
+        for move in moves:
+            start, end = move
+            target = board[end[0]][end[1]]
+            if move == table_move:
+                scores.append(TABLE_MOVE_SCORE)
+            elif target != EMPTY:
+                attacker = board[start[0]][start[1]] & TYPE_MASK
+                scores.append(CAPTURE_SCORE + EXCHANGE_VALUES[target & TYPE_MASK] * 10
+                              - EXCHANGE_VALUES[attacker] // 100)
+            elif move == counter:
+                scores.append(COUNTER_SCORE)
+            elif history is not None:
+                scores.append(history[board[start[0]][start[1]] * 64 + end[0] * 8 + end[1]])
+            else:
+                scores.append(0)
+        return scores
+
+    def ordered(self, board, moves, table_move=None, previous=None):
+        """
+        Yield moves best-first without sorting the whole list.
+
+        Args:
+            board: The chess board (2D list of piece codes); it may change
+                between steps (the scores are taken up front)
+            moves: List of (start, end) tuples; it is not changed
+            table_move: Optional move from the transposition table
+            previous: Optional move_index of the opponent's last move
+
+        Yields:
+            Moves in descending score order (ties keep list order)
+        """
+        scores = self.score_moves(board, moves, table_move, previous)
+        moves = list(moves)
+        while moves:
+            best = 0
+            best_score = scores[0]
+            for index in range(1, len(scores)):
+                if scores[index] > best_score:
+                    best = index
+                    best_score = scores[index]
+            del scores[best]
+            yield moves.pop(best)
+
+    def _bump(self, index, bonus):
+        value = self.history[index]
+        self.history[index] = value + bonus - value * abs(bonus) // HISTORY_MAX
+
+    def record_cutoff(self, board, move, depth, previous=None, tried=()):
+        """
+        Reward a quiet move that caused a beta cutoff.
+
+        Captures are ordered by MVV-LVA and are not recorded.
+
+        Args:
+            board: The chess board before the move
+            move: The (start, end) move that cut off
+            depth: Remaining depth of the node
+            previous: Optional move_index of the opponent's last move
+            tried: Quiet moves searched before it without a cutoff; their
+                history is lowered by the same amount
+        """
+        start, end = move
+        if board[end[0]][end[1]] != EMPTY:
+            return
+        bonus = min(depth * depth, HISTORY_MAX)
+        self._bump(move_index(board[start[0]][start[1]], end), bonus)
+        for other_start, other_end in tried:
+            if (other_start, other_end) != move:
+                self._bump(move_index(board[other_start[0]][other_start[1]], other_end), -bonus)
+        if previous is not None:
+            self.counters[previous] = encode_move(start, end)
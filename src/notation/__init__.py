@@ -0,0 +1 @@
+# This file marks the notation directory as a package.
\ No newline at end of file
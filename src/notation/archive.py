@@ -0,0 +1,203 @@
+"""
+Game archives: JSON Lines records and PGN files behind one streaming reader.
+
+A JSONL archive holds one game per line:
+
+    {"moves": ["e2e4", "e7e5", ...], "result": "1-0", "tags": {...}}
+
+Moves are coordinate pairs in the standard orientation (notation.san.PGN_SQUARES);
+SAN moves are accepted as well, since both are read with
+notation.move_parser. Archives ending in .gz are decompressed on the fly.
+Every reader is a generator, so archives of any size stream in constant
+memory.
+"""
+
+import gzip
+import json
+import random
+from collections import namedtuple
+
+from game.game_session import GameSession
+from notation.move_parser import parse_move
+from notation.pgn import read_games
+from notation.san import PGN_SQUARES, square_names
+
+ArchiveGame = namedtuple('ArchiveGame', ['moves', 'result', 'tags'])
+
+SQUARE_NAMES = square_names(PGN_SQUARES)
+
+
+def open_archive(path, mode='rt'):
+    """Open an archive file, transparently handling .gz compression."""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def is_pgn(path):
+    """Check if a path names a PGN archive (optionally gzipped)."""
+    return path.endswith('.pgn') or path.endswith('.pgn.gz')
+
+
+def move_name(move):
+    """Format a (start, end) move as standard coordinates, e.g. 'e2e4'."""
+    return SQUARE_NAMES[move[0]] + SQUARE_NAMES[move[1]]
+
+
+def parse_record(line):
+    """
+    Decode one JSONL line.
+
+    Returns:
+        ArchiveGame, or None for a blank line
+
+    Raises:
+        ValueError: If the line is not a JSON object with a moves list
+    """
+    line = line.strip()
+    if not line:
+        return None
+    record = json.loads(line)
+    if not isinstance(record, dict) or not isinstance(record.get('moves'), list):
+        raise ValueError(f"Not a game record: {line[:80]!r}")
+    return ArchiveGame(record['moves'], record.get('result'), record.get('tags') or {})
+
+
+def format_record(game):
+    """Encode an ArchiveGame as one JSONL line (with the newline)."""
+    record = {'moves': list(game.moves), 'result': game.result}
+    if game.tags:
+        record['tags'] = game.tags
+    return json.dumps(record, separators=(',', ':')) + "\n"
+
+
+def read_jsonl(path, start=0, end=None):
+    """
+    Stream games from a JSONL archive, optionally from a byte range.
+
+    A range covers the lines that start inside [start, end), so splitting a
+    file at arbitrary offsets assigns every line to exactly one range.
+    Ranges are only supported for uncompressed files.
+
+    Args:
+        path: Archive path
+        start: Byte offset to start from
+        end: Byte offset to stop at (None reads to the end)
+
+    Yields:
+        ArchiveGame tuples
+    """
+    if start or end is not None:
+        with open(path, 'rb') as handle:
+            if start:
+                handle.seek(start - 1)
+                handle.readline()
+            while end is None or handle.tell() < end:
+                line = handle.readline()
+                if not line:
+                    break
+                game = parse_record(line.decode('utf-8'))
+                if game is not None:
+                    yield game
+        return
+    with open_archive(path) as handle:
+        for line in handle:
+            game = parse_record(line)
+            if game is not None:
+                yield game
+
+
+def read_archive(path):
+    """
+    Stream games from a JSONL or PGN archive.
+
+    Args:
+        path: Archive path (.jsonl, .pgn, optionally .gz)
+
+    Yields:
+        ArchiveGame tuples
+    """
+    if is_pgn(path):
+        with open_archive(path) as handle:
+            for game in read_games(handle):
+                yield ArchiveGame(game.moves, game.result, game.tags)
+    else:
+        yield from read_jsonl(path)
+
+
+def write_archive(path, games):
+    """
+    Write games as a JSONL archive.
+
+    Args:
+        path: Destination path (.gz to compress)
+        games: Iterable of ArchiveGame tuples
+
+    Returns:
+        Number of games written
+    """
+    written = 0
+    with open_archive(path, 'wt') as handle:
+        for game in games:
+            handle.write(format_record(game))
+            written += 1
+    return written
+
+
+def session_record(session, tags=None):
+    """
+    Build an ArchiveGame from a GameSession's move history.
+
+    Args:
+        session: GameSession (finished or not)
+        tags: Optional dict of extra information
+
+    Returns:
+        ArchiveGame
+    """
+    moves = [move_name((move['start'], move['end'])) for move in session.move_history]
+    return ArchiveGame(moves, session.result(), tags or {})
+
+
+def random_games(count, seed=3, max_plies=120):
+    """
+    Play random legal games, for tests, benchmarks and reports.
+
+    Args:
+        count: Number of games
+        seed: Random seed
+        max_plies: Longest game (games end early when a king is captured)
+
+    Returns:
+        List of ArchiveGame
+    """
+    rng = random.Random(seed)
+    games = []
+    for _ in range(count):
+        session = GameSession()
+        while not session.is_over and len(session.move_history) < max_plies:
+            session.submit_move(*rng.choice(session.legal_moves()))
+        games.append(session_record(session))
+    return games
+
+
+def replay_game(game, max_plies=None):
+    """
+    Replay an archived game from the starting position.
+
+    Replay stops at the first move that cannot be parsed or is illegal.
+
+    Args:
+        game: ArchiveGame
+        max_plies: Optional limit on the number of moves replayed
+
+    Returns:
+        Tuple (GameSession after the replayed moves, True if every move was played)
+    """
+    session = GameSession()
+    moves = game.moves if max_plies is None else game.moves[:max_plies]
+    for text in moves:
+        start, end = parse_move(text, session.board.board, session.side_to_move, PGN_SQUARES)
+        if start is None or not session.submit_move(start, end).ok:
+            return session, False
+    return session, True
@@ -0,0 +1,96 @@
+"""
+Forsyth-Edwards Notation (FEN) for board positions.
+
+FEN lists ranks from 8 down to 1 in the standard orientation, where White's
+back rank is rank 1 (board row 0), matching notation.san.PGN_SQUARES. The
+game has no castling or en passant, so those fields are always '-'.
+"""
+
+from pieces.piece_codes import CODE_BY_SYMBOL, COLOR_NAMES, EMPTY, SIDES, SYMBOL_BY_CODE
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"
+
+
+def board_to_fen(board, side, halfmove=0, fullmove=1):
+    """
+    Format a position as FEN.
+
+    Args:
+        board: The chess board (2D list of piece codes)
+        side: Side to move, 0 for White and 1 for Black
+        halfmove: Plies since the last capture or pawn move
+        fullmove: Move number, starting at 1
+
+    Returns:
+        FEN string
+    """
+    ranks = []
+    for row in reversed(board):
+        text = ""
+        empty = 0
+        for code in row:
+            if code == EMPTY:
+                empty += 1
+                continue
+            if empty:
+                text += str(empty)
+                empty = 0
+            text += SYMBOL_BY_CODE[code]
+        if empty:
+            text += str(empty)
+        ranks.append(text)
+    return f"{'/'.join(ranks)} {COLOR_NAMES[side][0]} - - {halfmove} {fullmove}"
+
+
+def fen_to_board(fen):
+    """
+    Parse the placement and side-to-move fields of a FEN string.
+
+    Args:
+        fen: FEN string (the move counters are optional)
+
+    Returns:
+        Tuple (board as a 2D list of piece codes, side to move)
+
+    Raises:
+        ValueError: If the placement or side field is malformed
+    """
+    fields = fen.split()
+    if len(fields) < 2:
+        raise ValueError(f"FEN needs placement and side fields: {fen!r}")
+    ranks = fields[0].split('/')
+    if len(ranks) != 8:
+        raise ValueError(f"FEN placement needs 8 ranks: {fen!r}")
+    board = []
+    for rank in reversed(ranks):
+        row = []
+        for char in rank:
+            if char.isdigit():
+                row.extend([EMPTY] * int(char))
+            elif char in CODE_BY_SYMBOL:
+                row.append(CODE_BY_SYMBOL[char])
+            else:
+                raise ValueError(f"Unknown piece {char!r} in FEN: {fen!r}")
+        if len(row) != 8:
+            raise ValueError(f"FEN rank {rank!r} does not cover 8 squares")
+        board.append(row)
+    color = {'w': 'white', 'b': 'black'}.get(fields[1])
+    if color is None:
+        raise ValueError(f"FEN side to move must be 'w' or 'b': {fen!r}")
+    return board, SIDES[color]
+
+
+def history_counters(move_history):
+    """
+    Derive the FEN move counters from a GameState move history.
+
+    Returns:
+        Tuple (halfmove clock, fullmove number) for the position after the
+        last recorded move
+    """
+    halfmove = 0
+    for move in reversed(move_history):
+        if move['piece'] in ('P', 'p') or move.get('captured'):
+            break
+        halfmove += 1
+    return halfmove, len(move_history) // 2 + 1
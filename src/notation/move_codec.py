@@ -0,0 +1,373 @@
+"""
+Compact binary encoding of games.
+
+Each move is replaced by its rank in the legal moves (generate_moves) of
+the position it was played in, and the ranks are range coded. Moves are
+ranked like MoveOrdering.score_moves without its history tables: captures
+first, most valuable victim and then least valuable attacker first
+(MVV-LVA), then quiet moves by how much they improve the piece's square
+value (engine.evaluation.SQUARE_VALUES), ties by square. Players pick early
+ranks more often than late ones, so the model is a fixed, decreasing
+frequency table over ranks (RANK_RUNS), cut off at the number of legal
+moves. The table was fitted on engine self-play games with
+benchmarks/bench_move_codec.py --fit; nothing is stored or trained per game.
+
+Layout: the ply count as a little-endian base-128 varint, then the range
+coder output. The coder is the carry-propagating 32-bit coder used by LZMA;
+its always-zero first byte and any trailing zero bytes are dropped, and the
+decoder reads missing bytes as zeros.
+
+Engine games carry about 4.5 bits per ply under the table, against 4.7
+with every rank equally likely, and take 4.8 with the framing. Uniformly
+random games, which the table does not fit, take about 5.9 bits per ply.
+For comparison move_history as JSON takes some 85 bytes per ply and
+coordinate text 5 bytes.
+"""
+
+from bisect import bisect_right
+
+from board.chess_board import ChessBoard
+from engine.evaluation import SQUARE_VALUES
+from game.game_session import GameSession
+from moves.move_generator import generate_moves
+from moves.ordering import MoveOrdering
+from pieces.piece_codes import EMPTY, KING, TYPE_MASK, WHITE
+
+TOP = 1 << 24
+MASK32 = 0xFFFFFFFF
+
+# Rank frequencies as (frequency, number of ranks) runs, rank 0 first,
+# covering MAX_MOVES ranks; regenerate with bench_move_codec.py --fit
+RANK_RUNS = ((6352, 1), (3100, 1), (3028, 1), (1970, 4), (1761, 1), (1731, 1), (1544, 4), (565, 5), (406, 6),
+             (332, 14), (281, 4), (185, 2), (87, 212))
+MAX_MOVES = 256
+# What the fitted frequencies add up to before the floor of 1 per rank; the
+# coder allows totals up to 1 << 16
+FREQUENCY_SCALE = 60000
+
+
+def _expand(runs):
+    """Per-rank frequencies and their running sums from RANK_RUNS."""
+    frequencies = [frequency for frequency, count in runs for _ in range(count)]
+    cumulative = [0]
+    for frequency in frequencies:
+        cumulative.append(cumulative[-1] + frequency)
+    return frequencies, cumulative
+
+
+RANK_FREQUENCIES, CUMULATIVE = _expand(RANK_RUNS)
+
+_ORDERING = MoveOrdering(history=False, counters=False)
+
+
+class RangeEncoder:
+    """Range coder output side."""
+
+    def __init__(self):
+        self.low = 0
+        self.range = MASK32
+        self.cache = 0
+        self.cache_size = 1
+        self.output = bytearray()
+
+    def _shift_low(self):
+        if self.low < 0xFF000000 or self.low > MASK32:
+            carry = self.low >> 32
+            byte = self.cache
+            while True:
+                self.output.append((byte + carry) & 0xFF)
+                byte = 0xFF
+                self.cache_size -= 1
+                if not self.cache_size:
+                    break
+            self.cache = (self.low >> 24) & 0xFF
+        self.cache_size += 1
+        self.low = (self.low << 8) & MASK32
+
+    def encode(self, start, size, total):
+        """
+        Encode a symbol.
+
+        Args:
+            start: Cumulative frequency of the symbols before it
+            size: Its frequency
+            total: Sum of all frequencies (at most 1 << 16)
+        """
+        step = self.range // total
+        self.low += step * start
+        self.range = step * size
+        while self.range < TOP:
+            self.range <<= 8
+            self._shift_low()
+
+    def finish(self):
+        """
+        Flush the coder.
+
+        Returns:
+            The coded bytes, without the leading zero byte and trailing zeros
+        """
+        for _ in range(5):
+            self._shift_low()
+        return bytes(self.output[1:]).rstrip(b'\x00')
+
+
+class RangeDecoder:
+    """Range coder input side."""
+
+    def __init__(self, data, offset=0):
+        """
+        Start decoding.
+
+        Args:
+            data: Bytes written by RangeEncoder.finish
+            offset: Position of the coder output in data
+        """
+        self.data = data
+        self.position = offset
+        self.range = MASK32
+        self.code = 0
+        for _ in range(4):
+            self.code = (self.code << 8) | self._next_byte()
+
+    def _next_byte(self):
+        position = self.position
+        self.position += 1
+        return self.data[position] if position < len(self.data) else 0
+
+    def decode(self, total):
+        """
+        Find the next symbol's cumulative frequency.
+
+        Args:
+            total: Sum of all frequencies used when encoding
+
+        Returns:
+            A value in [start, start + size) of the coded symbol; call
+            consume with that symbol's start and size next
+        """
+        self._step = self.range // total
+        return min(self.code // self._step, total - 1)
+
+    def consume(self, start, size):
+        """Remove the symbol found by decode."""
+        self.code -= self._step * start
+        self.range = self._step * size
+        while self.range < TOP:
+            self.code = ((self.code << 8) | self._next_byte()) & MASK32
+            self.range <<= 8
+
+
+def _write_varint(output, value):
+    while value >= 0x80:
+        output.append(value & 0x7F | 0x80)
+        value >>= 7
+    output.append(value)
+
+
+def _read_varint(data):
+    value = shift = 0
+    for position, byte in enumerate(data):
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, position + 1
+        shift += 7
+    raise ValueError("Truncated game encoding")
+
+
+def _play(grid, start, end):
+    """Apply a move to a bare grid; returns True when it captured a king."""
+    captured = grid[end[0]][end[1]]
+    grid[end[0]][end[1]] = grid[start[0]][start[1]]
+    grid[start[0]][start[1]] = EMPTY
+    return captured & TYPE_MASK == KING
+
+
+def _starting_grid():
+    return ChessBoard().board
+
+
+def ranked_moves(grid, side):
+    """
+    Legal moves, likeliest first.
+
+    Args:
+        grid: The chess board (2D list of piece codes)
+        side: Side to move, 0 for White and 1 for Black
+
+    Returns:
+        List of (start, end) tuples: captures by MVV-LVA, then quiet moves
+        by their gain in engine.evaluation.SQUARE_VALUES, ties in square
+        order
+    """
+    legal = generate_moves(grid, side)
+    keys = []
+    for move, score in zip(legal, _ORDERING.score_moves(grid, legal)):
+        (row, col), (to_row, to_col) = move
+        if grid[to_row][to_col] == EMPTY:
+            # Quiet moves by how much the piece's square value improves
+            values = SQUARE_VALUES[grid[row][col]]
+            score = values[to_row][to_col] - values[row][col]
+        keys.append(-score)
+    return [move for _, move in sorted(zip(keys, legal))]
+
+
+def move_ranks(moves):
+    """
+    Rank of each move of a game among the ranked legal moves.
+
+    Args:
+        moves: List of (start, end) tuples from the starting position
+
+    Returns:
+        List of (rank, number of legal moves) pairs
+
+    Raises:
+        ValueError: If a move is not legal in its position
+    """
+    grid = _starting_grid()
+    side = WHITE
+    ranks = []
+    for ply, (start, end) in enumerate(moves):
+        legal = ranked_moves(grid, side)
+        try:
+            ranks.append((legal.index((tuple(start), tuple(end))), len(legal)))
+        except ValueError:
+            raise ValueError(f"Move {ply + 1} {start}->{end} is not legal") from None
+        if _play(grid, start, end):
+            break
+        side ^= 1
+    return ranks
+
+
+def fit_rank_table(ranks, scale=FREQUENCY_SCALE, rounds=100):
+    """
+    Fit a decreasing rank frequency table by maximum likelihood.
+
+    Under the table, a move of rank r among n legal moves has probability
+    f[r] / Z(n) with Z(n) = f[0] + ... + f[n - 1]. The frequencies come from
+    the minorize-maximize iteration f[r] = played[r] / S[r], where S[r] sums
+    1 / Z(n) over the positions with more than r legal moves. Every rank
+    gets half a count of smoothing, the result is made non-increasing and
+    scaled to about scale with a floor of 1, so every legal move stays
+    codable.
+
+    Args:
+        ranks: (rank, number of legal moves) pairs, e.g. from move_ranks
+        scale: Sum the frequencies are scaled to
+        rounds: Iterations of the fit
+
+    Returns:
+        Tuple of (frequency, number of ranks) runs over MAX_MOVES ranks,
+        in the RANK_RUNS format
+    """
+    played = [0.5] * MAX_MOVES
+    positions = [0] * (MAX_MOVES + 1)
+    for rank, count in ranks:
+        played[rank] += 1
+        positions[count] += 1
+    weights = [1.0] * MAX_MOVES
+    for _ in range(rounds):
+        _, cumulative = _expand((weight, 1) for weight in weights)
+        exposure = [0.0] * (MAX_MOVES + 1)
+        for count in range(MAX_MOVES, 0, -1):
+            exposure[count - 1] = exposure[count] + positions[count] / cumulative[count]
+        weights = [played[rank] / exposure[rank] if exposure[rank] else weights[rank]
+                   for rank in range(MAX_MOVES)]
+    for rank in range(1, MAX_MOVES):
+        weights[rank] = min(weights[rank], weights[rank - 1])
+    total = sum(weights)
+    runs = []
+    for weight in weights:
+        frequency = max(1, int(weight / total * scale))
+        if runs and runs[-1][0] == frequency:
+            runs[-1][1] += 1
+        else:
+            runs.append([frequency, 1])
+    return tuple((frequency, count) for frequency, count in runs)
+
+
+def encode_moves(moves):
+    """
+    Encode a game given as moves from the starting position.
+
+    Args:
+        moves: List of (start, end) tuples, White moving first
+
+    Returns:
+        bytes
+
+    Raises:
+        ValueError: If a move is not legal in its position, or follows a
+            king capture
+    """
+    output = bytearray()
+    _write_varint(output, len(moves))
+    coder = RangeEncoder()
+    grid = _starting_grid()
+    side = WHITE
+    over = False
+    for ply, (start, end) in enumerate(moves):
+        legal = ranked_moves(grid, side) if not over else ()
+        try:
+            index = legal.index((tuple(start), tuple(end)))
+        except ValueError:
+            raise ValueError(f"Move {ply + 1} {start}->{end} is not legal") from None
+        coder.encode(CUMULATIVE[index], RANK_FREQUENCIES[index], CUMULATIVE[len(legal)])
+        over = _play(grid, start, end)
+        side ^= 1
+    return bytes(output) + coder.finish()
+
+
+def decode_moves(data):
+    """
+    Decode bytes written by encode_moves.
+
+    Returns:
+        List of (start, end) tuples
+
+    Raises:
+        ValueError: If the ply count is truncated or the moves continue
+            past the end of the game
+    """
+    count, offset = _read_varint(data)
+    coder = RangeDecoder(data, offset)
+    grid = _starting_grid()
+    side = WHITE
+    moves = []
+    for _ in range(count):
+        legal = ranked_moves(grid, side)
+        if not legal:
+            raise ValueError("Game encoding continues past the end of the game")
+        index = bisect_right(CUMULATIVE, coder.decode(CUMULATIVE[len(legal)])) - 1
+        coder.consume(CUMULATIVE[index], RANK_FREQUENCIES[index])
+        move = legal[index]
+        moves.append(move)
+        if _play(grid, *move):
+            if len(moves) < count:
+                raise ValueError("Game encoding continues past the end of the game")
+        side ^= 1
+    return moves
+
+
+def encode_history(move_history):
+    """
+    Encode a GameState.move_history list.
+
+    Returns:
+        bytes (see encode_moves)
+    """
+    return encode_moves([(move['start'], move['end']) for move in move_history])
+
+
+def decode_history(data):
+    """
+    Rebuild a GameState.move_history list from encode_history output.
+
+    Returns:
+        List of move dicts as recorded by GameState.add_move
+    """
+    session = GameSession()
+    for start, end in decode_moves(data):
+        session.submit_move(start, end)
+    return session.move_history
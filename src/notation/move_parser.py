@@ -0,0 +1,109 @@
+"""
+Single-pass move parser for console input and move logs.
+
+One compiled regular expression recognises every supported format:
+
+- Coordinates: "e2 e4", "e2,e4", "e2-e4" or "e2e4" (any letter case)
+- Numeric: "1,3 2,3" or "1,3,2,3" (row,col pairs)
+- SAN: "Nf3", "exd5", "Qh4+" (needs the position to resolve)
+
+Square names are resolved with a precomputed 64-entry dict instead of
+per-call string arithmetic. CONSOLE_SQUARES matches the labels printed by
+ChessBoard.render (board row 0 is rank 8); pass notation.san.PGN_SQUARES for
+logs in the standard orientation.
+"""
+
+import re
+
+from notation.san import SAN_PATTERN, san_to_move
+from pieces.piece_codes import EMPTY, WHITE
+from utils.position import index_to_algebraic
+
+CONSOLE_SQUARES = {
+    index_to_algebraic(row, col): (row, col)
+    for row in range(8)
+    for col in range(8)
+}
+
+NUMERIC_SQUARES = {
+    f"{row},{col}": (row, col)
+    for row in range(8)
+    for col in range(8)
+}
+
+MOVE_PATTERN = re.compile(
+    r'\s*(?:'
+    r'(?P<start>[a-hA-H][1-8])(?:\s*[,\-]\s*|\s+)?(?P<end>[a-hA-H][1-8])'
+    r'|(?P<numeric_start>[0-7],[0-7])(?:\s*,\s*|\s+)(?P<numeric_end>[0-7],[0-7])'
+    r'|(?P<san>' + SAN_PATTERN.pattern.strip('^$') + r')'
+    r')\s*$'
+)
+
+NO_MOVE = (None, None)
+
+
+def _resolve(match, board, side, squares):
+    """Turn a MOVE_PATTERN match into (start, end)."""
+    start = match.group('start')
+    if start is not None:
+        return squares[start.lower()], squares[match.group('end').lower()]
+    numeric_start = match.group('numeric_start')
+    if numeric_start is not None:
+        return NUMERIC_SQUARES[numeric_start], NUMERIC_SQUARES[match.group('numeric_end')]
+    if board is None:
+        return NO_MOVE
+    return san_to_move(board, side, match.group('san'), squares) or NO_MOVE
+
+
+def parse_move(text, board=None, side=WHITE, squares=CONSOLE_SQUARES):
+    """
+    Parse one move in any supported format.
+
+    Args:
+        text: Move text such as 'e2 e4', '1,3,2,3' or 'Nf3'
+        board: The chess board (2D list of piece codes); only needed for SAN
+        side: Side to move, 0 for White and 1 for Black; only needed for SAN
+        squares: Square name table for coordinate and SAN moves
+
+    Returns:
+        Tuple (start_pos, end_pos) or (None, None) if invalid
+    """
+    match = MOVE_PATTERN.match(text)
+    if match is None:
+        return NO_MOVE
+    return _resolve(match, board, side, squares)
+
+
+def parse_moves(lines, board=None, side=WHITE, squares=CONSOLE_SQUARES):
+    """
+    Parse a stream of moves, one per item.
+
+    When a board is given the moves are played on a copy of it, so SAN moves
+    resolve against the current position; unparseable moves are not played.
+    Blank lines are skipped.
+
+    Args:
+        lines: Iterable of move strings (e.g. an open log file)
+        board: Optional starting position (2D list of piece codes)
+        side: Side to move in the starting position
+        squares: Square name table for coordinate and SAN moves
+
+    Yields:
+        Tuple (start_pos, end_pos) or (None, None) for each move
+    """
+    match_move = MOVE_PATTERN.match
+    if board is not None:
+        board = [row[:] for row in board]
+    for line in lines:
+        match = match_move(line)
+        if match is None:
+            if line.strip():
+                yield NO_MOVE
+            continue
+        move = _resolve(match, board, side, squares)
+        if board is not None and move[0] is not None:
+            (start_row, start_col), (end_row, end_col) = move
+            board[end_row][end_col] = board[start_row][start_col]
+            board[start_row][start_col] = EMPTY
+            side ^= 1
+        yield move
@@ -0,0 +1,120 @@
+"""
+Streaming PGN reader.
+
+Games are yielded one at a time, so archives of any size can be processed
+without loading them into memory.
+"""
+
+import re
+from collections import namedtuple
+
+from board.chess_board import ChessBoard
+from notation.san import PGN_SQUARES, san_to_move
+from pieces.piece_codes import WHITE
+
+PgnGame = namedtuple('PgnGame', ['tags', 'moves', 'result'])
+
+TAG_PATTERN = re.compile(r'^\[(\w+)\s+"(.*)"\]\s*$')
+COMMENT_PATTERN = re.compile(r'\{[^}]*\}|;[^\n]*')
+MOVE_NUMBER_PATTERN = re.compile(r'^\d+\.+')
+RESULTS = {'1-0', '0-1', '1/2-1/2', '*'}
+
+
+def _open_lines(source):
+    """Yield lines from a path, an open file or any iterable of strings."""
+    if isinstance(source, str):
+        with open(source, encoding='utf-8', errors='replace') as handle:
+            yield from handle
+    else:
+        yield from source
+
+
+def _strip_variations(text):
+    """Remove parenthesised variations, which may be nested."""
+    depth = 0
+    kept = []
+    for char in text:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth = max(depth - 1, 0)
+        elif depth == 0:
+            kept.append(char)
+    return ''.join(kept)
+
+
+def parse_movetext(text):
+    """
+    Extract SAN moves and the result from PGN movetext.
+
+    Returns:
+        Tuple (list of SAN strings, result string or None)
+    """
+    text = _strip_variations(COMMENT_PATTERN.sub(' ', text))
+    moves = []
+    result = None
+    for token in text.split():
+        token = MOVE_NUMBER_PATTERN.sub('', token)
+        if not token or token.startswith('$'):
+            continue
+        if token in RESULTS:
+            result = token
+            continue
+        moves.append(token)
+    return moves, result
+
+
+def read_games(source):
+    """
+    Read games from a PGN archive.
+
+    Args:
+        source: Path, open text file or iterable of lines
+
+    Yields:
+        PgnGame tuples (tags dict, list of SAN moves, result)
+    """
+    tags = {}
+    movetext = []
+    for line in _open_lines(source):
+        stripped = line.strip()
+        tag = TAG_PATTERN.match(stripped)
+        if tag:
+            if movetext:
+                moves, result = parse_movetext(' '.join(movetext))
+                yield PgnGame(tags, moves, result or tags.get('Result'))
+                tags, movetext = {}, []
+            tags[tag.group(1)] = tag.group(2)
+        elif stripped:
+            movetext.append(stripped)
+    if movetext or tags:
+        moves, result = parse_movetext(' '.join(movetext))
+        yield PgnGame(tags, moves, result or tags.get('Result'))
+
+
+def replay(sans, max_plies=None, squares=PGN_SQUARES):
+    """
+    Replay SAN moves from the starting position.
+
+    Replay stops at the first move that cannot be resolved under the game's
+    rules (castling, promotion, illegal or ambiguous moves).
+
+    Args:
+        sans: Iterable of SAN strings
+        max_plies: Optional limit on the number of moves replayed
+        squares: Square name table
+
+    Yields:
+        Tuples (board, side, move) with the board *before* the move is made
+    """
+    board = ChessBoard()
+    side = WHITE
+    for ply, san in enumerate(sans):
+        if max_plies is not None and ply >= max_plies:
+            return
+        move = san_to_move(board.board, side, san, squares)
+        if move is None:
+            return
+        yield board, side, move
+        board.move_piece(*move)
+        side ^= 1
@@ -0,0 +1,112 @@
+"""
+Standard Algebraic Notation (SAN) for moves on the ChessBoard.
+
+SAN only names the destination square, so resolving it needs the position:
+the moving piece is found among the generated moves of the side to move.
+
+Square names are looked up in a name -> (row, col) table. PGN_SQUARES uses
+the standard orientation found in PGN files from other systems, where
+White's back rank is rank 1 (board row 0).
+"""
+
+import re
+
+from moves.move_generator import generate_moves
+from pieces.piece_codes import EMPTY, TYPE_LETTERS, TYPE_MASK
+
+FILES = 'abcdefgh'
+
+PGN_SQUARES = {
+    f"{file}{rank}": (rank - 1, col)
+    for col, file in enumerate(FILES)
+    for rank in range(1, 9)
+}
+
+SAN_PATTERN = re.compile(
+    r'^(?P<piece>[KQRBN])?(?P<file>[a-h])?(?P<rank>[1-8])?x?'
+    r'(?P<target>[a-h][1-8])(?P<promotion>=?[QRBN])?[+#]?[!?]*$'
+)
+
+
+def square_names(squares):
+    """Invert a square table into (row, col) -> name."""
+    return {position: name for name, position in squares.items()}
+
+
+def san_to_move(board, side, san, squares=PGN_SQUARES):
+    """
+    Resolve a SAN move against a position.
+
+    Castling and promotion are not part of the game's rules, so moves using
+    them (and ambiguous or impossible moves) resolve to None.
+
+    Args:
+        board: The chess board (2D list of piece codes)
+        side: Side to move, 0 for White and 1 for Black
+        san: Move text such as 'Nf3', 'exd5' or 'Qh4+'
+        squares: Square name table
+
+    Returns:
+        Tuple (start, end) or None
+    """
+    match = SAN_PATTERN.match(san.strip())
+    if match is None or match.group('promotion'):
+        return None
+
+    end = squares[match.group('target')]
+    kind = match.group('piece') or 'P'
+    names = square_names(squares)
+    file_hint = match.group('file')
+    rank_hint = match.group('rank')
+
+    found = None
+    for start, move_end in generate_moves(board, side):
+        if move_end != end or TYPE_LETTERS[board[start[0]][start[1]] & TYPE_MASK] != kind:
+            continue
+        name = names[start]
+        if file_hint and name[0] != file_hint:
+            continue
+        if rank_hint and name[1] != rank_hint:
+            continue
+        if found is not None:
+            return None
+        found = (start, move_end)
+    return found
+
+
+def move_to_san(board, side, move, squares=PGN_SQUARES):
+    """
+    Format a move as SAN, adding the minimal disambiguation needed.
+
+    Args:
+        board: The chess board (2D list of piece codes) before the move
+        side: Side to move, 0 for White and 1 for Black
+        move: Tuple (start, end)
+        squares: Square name table
+
+    Returns:
+        SAN string
+    """
+    start, end = move
+    names = square_names(squares)
+    kind = TYPE_LETTERS[board[start[0]][start[1]] & TYPE_MASK]
+    capture = board[end[0]][end[1]] != EMPTY
+    target = names[end]
+
+    if kind == 'P':
+        return f"{names[start][0]}x{target}" if capture else target
+
+    rivals = [
+        other for other, other_end in generate_moves(board, side)
+        if other_end == end and other != start and TYPE_LETTERS[board[other[0]][other[1]] & TYPE_MASK] == kind
+    ]
+    hint = ''
+    if rivals:
+        start_name = names[start]
+        if all(names[other][0] != start_name[0] for other in rivals):
+            hint = start_name[0]
+        elif all(names[other][1] != start_name[1] for other in rivals):
+            hint = start_name[1]
+        else:
+            hint = start_name
+    return f"{kind}{hint}{'x' if capture else ''}{target}"
@@ -1,4 +1,5 @@
 from pieces.piece import Piece
+from pieces.piece_codes import COLOR_SHIFT, EMPTY, WHITE
 
 class Pawn(Piece):
     """Pawn piece - moves forward, captures diagonally."""
@@ -13,23 +14,22 @@ class Pawn(Piece):
         
         # White pawns move down (increasing row), black pawns move up (decreasing row)
         # White pieces are at row 0-1, Black pieces are at row 6-7
-        direction = 1 if self.color == 'white' else -1  # White moves down (+1), black moves up (-1)
-        start_rank = 1 if self.color == 'white' else 6  # Starting row for pawns
+        direction = 1 if self.side == WHITE else -1  # White moves down (+1), black moves up (-1)
+        start_rank = 1 if self.side == WHITE else 6  # Starting row for pawns
         
         # Forward move (one square)
         if start_col == end_col and end_row == start_row + direction:
-            return board[end_row][end_col] is None
+            return board[end_row][end_col] == EMPTY
         
         # Forward move (two squares from starting position)
         if start_col == end_col and start_row == start_rank and end_row == start_row + 2 * direction:
             middle_row = start_row + direction
-            return board[middle_row][end_col] is None and board[end_row][end_col] is None
+            return board[middle_row][end_col] == EMPTY and board[end_row][end_col] == EMPTY
         
         # Diagonal capture
         if abs(end_col - start_col) == 1 and end_row == start_row + direction:
             target = board[end_row][end_col]
-            if target is not None:
-                target_color = 'white' if target.isupper() else 'black'
-                return target_color != self.color
+            if target != EMPTY:
+                return target >> COLOR_SHIFT != self.side
         
         return False
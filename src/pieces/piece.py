@@ -1,3 +1,6 @@
+from pieces.piece_codes import code_of, side_of
+
+
 class Piece:
     """Base class for all chess pieces."""
     
@@ -11,6 +14,8 @@ class Piece:
         """
         self.color = color
         self.symbol = symbol
+        self.side = side_of(color)
+        self.code = code_of(symbol)
 
     def is_valid_move(self, start, end, board):
         """
@@ -19,7 +24,7 @@ class Piece:
         Args:
             start: Tuple (row, col) starting position
             end: Tuple (row, col) ending position
-            board: The chess board (2D list)
+            board: The chess board (2D list of piece codes)
             
         Returns:
             Boolean indicating if move is valid
@@ -41,7 +46,7 @@ class Piece:
         current_col = start_col + col_dir
         
         while (current_row, current_col) != (end_row, end_col):
-            if board[current_row][current_col] is not None:
+            if board[current_row][current_col]:
                 return False
             current_row += row_dir
             current_col += col_dir
@@ -0,0 +1,74 @@
+"""
+Integer piece encoding.
+
+Board squares hold small integers: the piece type in the low three bits and
+the color in bit 3, with 0 for an empty square. Sides are 0 (White) and
+1 (Black), so the opponent is side ^ 1 and a piece's side is code >> 3.
+Symbols ('P', 'k', ...) and color names ('white', 'black') only appear at
+the rendering and API edges through the conversion tables below.
+"""
+
+EMPTY = 0
+
+PAWN = 1
+KNIGHT = 2
+BISHOP = 3
+ROOK = 4
+QUEEN = 5
+KING = 6
+
+TYPE_MASK = 7
+COLOR_SHIFT = 3
+BLACK_BIT = 1 << COLOR_SHIFT
+
+WHITE = 0
+BLACK = 1
+
+COLOR_NAMES = ('white', 'black')
+SIDES = {'white': WHITE, 'black': BLACK}
+
+TYPE_LETTERS = '.PNBRQK'
+
+CODE_BY_SYMBOL = {}
+SYMBOL_BY_CODE = [None] * 16
+for _kind in range(PAWN, KING + 1):
+    _letter = TYPE_LETTERS[_kind]
+    CODE_BY_SYMBOL[_letter] = _kind
+    CODE_BY_SYMBOL[_letter.lower()] = _kind | BLACK_BIT
+    SYMBOL_BY_CODE[_kind] = _letter
+    SYMBOL_BY_CODE[_kind | BLACK_BIT] = _letter.lower()
+del _kind, _letter
+
+PIECE_CODES = tuple(CODE_BY_SYMBOL.values())
+
+
+def make_code(side, kind):
+    """Build a piece code from a side (0/1) and a piece type."""
+    return kind | (side << COLOR_SHIFT)
+
+
+def side_of(color):
+    """
+    Convert 'white'/'black' (or an already numeric side) to 0/1.
+
+    Raises:
+        ValueError: If color is neither a color name nor 0/1
+    """
+    if color == WHITE or color == BLACK:
+        return int(color)
+    side = SIDES.get(color) if isinstance(color, str) else None
+    if side is None:
+        raise ValueError(f"Unknown side {color!r} (expected 'white', 'black', 0 or 1)")
+    return side
+
+
+def code_of(symbol):
+    """Convert a symbol (or None) to a piece code."""
+    if symbol is None:
+        return EMPTY
+    return CODE_BY_SYMBOL[symbol]
+
+
+def symbol_of(code):
+    """Convert a piece code to its symbol, or None for an empty square."""
+    return SYMBOL_BY_CODE[code]
@@ -0,0 +1 @@
+# This file marks the server directory as a package.
@@ -0,0 +1,162 @@
+"""
+HTTP API for playing games.
+
+Endpoints (JSON in and out, standard square names such as 'e2' where White's
+back rank is rank 1):
+
+    POST   /games                 create a game -> {id, fen, side_to_move, result}; an
+                                  optional {time_control: '300+2'} adds a clock
+    GET    /games/<id>            game summary
+    DELETE /games/<id>            drop a game
+    GET    /games/<id>/fen        {fen}
+    GET    /games/<id>/moves      {moves: [{from, to}, ...]} legal moves
+    GET    /games/<id>/targets    {targets: {square: [squares]}} per piece; ?from=e2 for one
+    POST   /games/<id>/moves      play {from, to} or {move: 'e2e4' / 'Nf3'}
+
+Usage (from the src directory; needs Flask from requirements.txt):
+    python3 -m server.api --port 8000
+"""
+
+import argparse
+
+from flask import Flask, jsonify, request
+
+from notation.move_parser import parse_move
+from notation.san import PGN_SQUARES, square_names
+from server.session_store import SessionStore, StoreFullError, UnknownGameError
+
+SQUARE_NAMES = square_names(PGN_SQUARES)
+
+
+def _summary(game_id, session):
+    """JSON body describing a game (with remaining times for clocked games)."""
+    body = {
+        'id': game_id,
+        'fen': session.fen(),
+        'side_to_move': session.current_player,
+        'moves_played': len(session.move_history),
+        'result': session.result(),
+    }
+    clock = session.game_state.clock
+    if clock is not None:
+        body['clock'] = clock.to_dict()
+        body['lost_on_time'] = session.game_state.lost_on_time
+    return body
+
+
+def _error(message, status):
+    return jsonify({'error': message}), status
+
+
+def _requested_move(session, body):
+    """Turn a move request body into (start, end) or (None, None)."""
+    if 'move' in body:
+        return parse_move(str(body['move']), session.board.board, session.side_to_move, PGN_SQUARES)
+    start = PGN_SQUARES.get(str(body.get('from', '')).lower())
+    end = PGN_SQUARES.get(str(body.get('to', '')).lower())
+    return start, end
+
+
+def create_app(store=None):
+    """
+    Build the Flask application.
+
+    Args:
+        store: Optional SessionStore (a default-sized one is created otherwise)
+
+    Returns:
+        Flask app; the store is available as app.config['SESSION_STORE']
+    """
+    app = Flask(__name__)
+    store = store if store is not None else SessionStore()
+    app.config['SESSION_STORE'] = store
+
+    @app.errorhandler(UnknownGameError)
+    def unknown_game(error):
+        return _error(f"Unknown game {error.args[0]}", 404)
+
+    @app.errorhandler(StoreFullError)
+    def store_full(error):
+        return _error(str(error), 503)
+
+    @app.route('/games', methods=['POST'])
+    def create_game():
+        body = request.get_json(silent=True) or {}
+        time_control = body.get('time_control') if isinstance(body, dict) else None
+        try:
+            game_id, session = store.create(time_control)
+        except ValueError as error:
+            return _error(str(error), 400)
+        return jsonify(_summary(game_id, session)), 201
+
+    @app.route('/games/<game_id>', methods=['GET'])
+    def get_game(game_id):
+        with store.checkout(game_id) as session:
+            return jsonify(_summary(game_id, session))
+
+    @app.route('/games/<game_id>', methods=['DELETE'])
+    def delete_game(game_id):
+        if not store.remove(game_id):
+            raise UnknownGameError(game_id)
+        return '', 204
+
+    @app.route('/games/<game_id>/fen', methods=['GET'])
+    def get_fen(game_id):
+        with store.checkout(game_id) as session:
+            return jsonify({'fen': session.fen()})
+
+    @app.route('/games/<game_id>/moves', methods=['GET'])
+    def legal_moves(game_id):
+        with store.checkout(game_id) as session:
+            moves = session.legal_moves()
+        return jsonify({'moves': [{'from': SQUARE_NAMES[start], 'to': SQUARE_NAMES[end]} for start, end in moves]})
+
+    @app.route('/games/<game_id>/targets', methods=['GET'])
+    def legal_targets(game_id):
+        square = request.args.get('from')
+        if square is not None and square.lower() not in PGN_SQUARES:
+            return _error(f"Unknown square {square!r}", 400)
+        with store.checkout(game_id) as session:
+            targets = session.legal_targets()
+        if square is not None:
+            start = PGN_SQUARES[square.lower()]
+            targets = {start: targets.get(start, [])}
+        return jsonify({'targets': {
+            SQUARE_NAMES[start]: [SQUARE_NAMES[end] for end in ends] for start, ends in targets.items()
+        }})
+
+    @app.route('/games/<game_id>/moves', methods=['POST'])
+    def submit_move(game_id):
+        body = request.get_json(silent=True)
+        if not isinstance(body, dict):
+            return _error("Expected a JSON object", 400)
+        with store.checkout(game_id) as session:
+            start, end = _requested_move(session, body)
+            if start is None or end is None:
+                return _error("Could not read the move", 400)
+            result = session.submit_move(start, end)
+            if not result.ok:
+                return _error(result.error, 409 if result.game_over else 422)
+            summary = _summary(game_id, session)
+        summary['captured'] = result.captured
+        summary['exchange'] = result.exchange
+        return jsonify(summary)
+
+    return app
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Chess game HTTP API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--max-games', type=int, default=1024, help="games kept in memory")
+    parser.add_argument('--idle-timeout', type=float, default=600.0, help="seconds before idle games are evicted")
+    args = parser.parse_args(argv)
+
+    app = create_app(SessionStore(args.max_games, args.idle_timeout))
+    app.run(host=args.host, port=args.port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()
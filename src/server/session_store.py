@@ -0,0 +1,151 @@
+"""
+Bounded in-memory store of game sessions for the HTTP API.
+
+The store's own lock only guards the id -> entry mapping and is held for a
+dictionary operation at a time. Each game has its own lock, held while a
+request works on that game, so requests on different games run
+concurrently and requests on the same game are serialized.
+
+Games untouched for idle_timeout seconds are evicted whenever a new game is
+created (or evict_idle() is called). When the store is full of active games,
+creating another one raises StoreFullError.
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from game.clock import GameClock
+from game.game_session import GameSession
+from game.game_state import GameState
+
+
+class StoreFullError(Exception):
+    """Raised when no session slot is free."""
+
+
+class UnknownGameError(KeyError):
+    """Raised for game ids that do not exist (or were evicted)."""
+
+
+class _Entry:
+    """A session with its lock and last access time."""
+
+    __slots__ = ('session', 'lock', 'last_used')
+
+    def __init__(self, session, now):
+        self.session = session
+        self.lock = threading.Lock()
+        self.last_used = now
+
+
+class SessionStore:
+    """Thread-safe, bounded map of game id to GameSession."""
+
+    def __init__(self, max_sessions=1024, idle_timeout=600.0, clock=time.monotonic):
+        """
+        Initialize the store.
+
+        Args:
+            max_sessions: Most games kept at once
+            idle_timeout: Seconds after which an untouched game may be evicted
+            clock: Time source returning seconds (for tests)
+        """
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, game_id):
+        return game_id in self._entries
+
+    def evict_idle(self):
+        """
+        Drop games idle for longer than idle_timeout.
+
+        Returns:
+            Number of games evicted
+        """
+        cutoff = self._clock() - self.idle_timeout
+        evicted = 0
+        with self._lock:
+            # Entries are kept in access order, oldest first
+            while self._entries:
+                game_id, entry = next(iter(self._entries.items()))
+                if entry.last_used > cutoff:
+                    break
+                del self._entries[game_id]
+                evicted += 1
+        return evicted
+
+    def create(self, time_control=None):
+        """
+        Start a new game.
+
+        Args:
+            time_control: Optional game.clock.TimeControl (or its text); the
+                game then has a chess clock
+
+        Returns:
+            Tuple (game id, GameSession)
+
+        Raises:
+            StoreFullError: If max_sessions games are active
+            ValueError: If time_control is not a valid time control
+        """
+        self.evict_idle()
+        clock = GameClock(time_control) if time_control is not None else None
+        session = GameSession(game_state=GameState(clock))
+        entry = _Entry(session, self._clock())
+        with self._lock:
+            if len(self._entries) >= self.max_sessions:
+                raise StoreFullError(f"{self.max_sessions} games are already active")
+            game_id = secrets.token_hex(8)
+            while game_id in self._entries:
+                game_id = secrets.token_hex(8)
+            self._entries[game_id] = entry
+        return game_id, session
+
+    def _touch(self, game_id):
+        """Return the entry for game_id, marking it as just used."""
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is None:
+                raise UnknownGameError(game_id)
+            entry.last_used = self._clock()
+            self._entries.move_to_end(game_id)
+        return entry
+
+    @contextmanager
+    def checkout(self, game_id):
+        """
+        Hold a game's lock while working on it.
+
+        Args:
+            game_id: Id returned by create()
+
+        Yields:
+            The GameSession
+
+        Raises:
+            UnknownGameError: If the game does not exist (or was evicted)
+        """
+        entry = self._touch(game_id)
+        with entry.lock:
+            yield entry.session
+
+    def remove(self, game_id):
+        """
+        Delete a game.
+
+        Returns:
+            True if the game existed
+        """
+        with self._lock:
+            return self._entries.pop(game_id, None) is not None
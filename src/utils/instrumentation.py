@@ -0,0 +1,183 @@
+"""
+Opt-in call counting and timing for the game's hot paths.
+
+Instrumentation works by swapping the target methods for timing wrappers
+while it is enabled and putting the originals back when it is disabled, so
+a disabled instrumentation layer leaves the classes untouched and costs
+nothing at call time.
+"""
+
+import json
+import time
+from functools import wraps
+
+
+def default_targets():
+    """Return the (class, method name) pairs instrumented by default."""
+    from board.chess_board import ChessBoard
+    from input.input_handler import InputHandler
+    from pieces.pawn import Pawn
+    from pieces.rook import Rook
+    from pieces.knight import Knight
+    from pieces.bishop import Bishop
+    from pieces.queen import Queen
+    from pieces.king import King
+
+    return [
+        (ChessBoard, 'validate_move'),
+        (ChessBoard, 'move_piece'),
+        (ChessBoard, 'is_king_captured'),
+        (Pawn, 'is_valid_move'),
+        (Rook, 'is_valid_move'),
+        (Knight, 'is_valid_move'),
+        (Bishop, 'is_valid_move'),
+        (Queen, 'is_valid_move'),
+        (King, 'is_valid_move'),
+        (InputHandler, 'parse_move'),
+    ]
+
+
+class Instrumentation:
+    """Records call counts and cumulative time for a set of methods."""
+
+    def __init__(self, targets=None):
+        """
+        Initialize the instrumentation layer.
+
+        Args:
+            targets: Optional list of (class, method name) pairs. Defaults to
+                the board, piece and input hot paths.
+        """
+        self._targets = targets
+        self._originals = {}
+        self.stats = {}
+
+    @property
+    def enabled(self):
+        """Property to check if the wrappers are currently installed."""
+        return bool(self._originals)
+
+    def enable(self):
+        """Install timing wrappers on every target method."""
+        if self.enabled:
+            return
+        if self._targets is None:
+            self._targets = default_targets()
+        for cls, name in self._targets:
+            original = cls.__dict__[name]
+            self._originals[(cls, name)] = original
+            setattr(cls, name, self._wrap(f"{cls.__name__}.{name}", original))
+
+    def disable(self):
+        """Restore the original methods."""
+        for (cls, name), original in self._originals.items():
+            setattr(cls, name, original)
+        self._originals = {}
+
+    def reset(self):
+        """Clear all recorded statistics."""
+        self.stats.clear()
+
+    def _wrap(self, label, original):
+        """Build a wrapper that records calls and elapsed time for label."""
+        is_static = isinstance(original, staticmethod)
+        func = original.__func__ if is_static else original
+        stats = self.stats
+        clock = time.perf_counter_ns
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = clock() - started
+                record = stats.get(label)
+                if record is None:
+                    stats[label] = [1, elapsed]
+                else:
+                    record[0] += 1
+                    record[1] += elapsed
+
+        return staticmethod(wrapper) if is_static else wrapper
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.disable()
+        return False
+
+    def snapshot(self):
+        """
+        Return the recorded statistics.
+
+        Returns:
+            Dict mapping 'Class.method' to a dict with calls, total_seconds
+            and mean_seconds, sorted by total time descending.
+        """
+        rows = sorted(self.stats.items(), key=lambda item: item[1][1], reverse=True)
+        return {
+            label: {
+                'calls': calls,
+                'total_seconds': total_ns / 1e9,
+                'mean_seconds': total_ns / calls / 1e9,
+            }
+            for label, (calls, total_ns) in rows
+        }
+
+    def summary_table(self):
+        """Format the statistics as a fixed-width text table."""
+        lines = [f"{'function':<32}{'calls':>10}{'total ms':>12}{'mean us':>10}"]
+        lines.append("-" * len(lines[0]))
+        for label, row in self.snapshot().items():
+            lines.append(
+                f"{label:<32}{row['calls']:>10}"
+                f"{row['total_seconds'] * 1e3:>12.3f}{row['mean_seconds'] * 1e6:>10.2f}"
+            )
+        return "\n".join(lines)
+
+    def to_json(self):
+        """Format the statistics as a JSON document."""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, prefix='chess'):
+        """Format the statistics in the Prometheus text exposition format."""
+        calls_metric = f"{prefix}_calls_total"
+        seconds_metric = f"{prefix}_call_seconds_total"
+        lines = [
+            f"# HELP {calls_metric} Number of calls per instrumented function.",
+            f"# TYPE {calls_metric} counter",
+        ]
+        snapshot = self.snapshot()
+        for label, row in snapshot.items():
+            lines.append(f'{calls_metric}{{function="{label}"}} {row["calls"]}')
+        lines.append(f"# HELP {seconds_metric} Cumulative time spent per instrumented function.")
+        lines.append(f"# TYPE {seconds_metric} counter")
+        for label, row in snapshot.items():
+            lines.append(f'{seconds_metric}{{function="{label}"}} {row["total_seconds"]:.9f}')
+        return "\n".join(lines) + "\n"
+
+    def report(self, fmt='table'):
+        """
+        Export the statistics.
+
+        Args:
+            fmt: 'table', 'json' or 'prometheus'
+
+        Returns:
+            String containing the formatted report
+        """
+        formatters = {
+            'table': self.summary_table,
+            'json': self.to_json,
+            'prometheus': self.to_prometheus,
+        }
+        if fmt not in formatters:
+            raise ValueError(f"Unknown report format: {fmt}")
+        return formatters[fmt]()
+
+
+# Shared instance used by the game loop
+instrumentation = Instrumentation()
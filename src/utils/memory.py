@@ -0,0 +1,297 @@
+"""
+Memory and allocation report for game sessions.
+
+Everything is measured with tracemalloc, which traces every block the
+interpreter allocates:
+- footprints: build many objects, keep them alive, and divide the traced
+  memory that appeared between two snapshots by their number. This gives the
+  bytes (and blocks) per ChessBoard, per GameState, per GameSession and per
+  move stored in GameState.move_history;
+- hot path: call ChessBoard.validate_move over sampled legal and illegal
+  moves while keeping every result. Blocks still alive afterwards are the
+  allocations each call hands to its caller (a constant result such as
+  (True, "") costs none). A first pass that drops the results gives the
+  traced peak above the starting point, which bounds the temporaries a
+  call needs.
+
+tracemalloc slows the interpreter down several times, so the report is a
+separate mode and never runs inside a game.
+
+Usage (from the src directory):
+    python3 -m utils.memory --count 200 --json
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tracemalloc
+from collections import namedtuple
+
+# Budgets checked by the test suite and by --check (bytes)
+SESSION_BUDGET = 8 * 1024
+MOVE_BUDGET = 384
+
+Footprint = namedtuple('Footprint', ['name', 'count', 'bytes', 'blocks'])
+HotPath = namedtuple('HotPath', ['calls', 'legal', 'blocks_per_call', 'bytes_per_call', 'peak_bytes', 'sites'])
+
+# tracemalloc's own bookkeeping shows up in snapshots; leave it out
+_FILTERS = (tracemalloc.Filter(False, tracemalloc.__file__),)
+
+
+class _Tracing:
+    """Start tracemalloc for a block unless it is already running."""
+
+    def __enter__(self):
+        self.started = not tracemalloc.is_tracing()
+        if self.started:
+            tracemalloc.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.started:
+            tracemalloc.stop()
+        return False
+
+
+def _snapshot():
+    gc.collect()
+    return tracemalloc.take_snapshot().filter_traces(_FILTERS)
+
+
+def _growth(before, after, key='filename'):
+    """Total (bytes, blocks) that appeared between two snapshots."""
+    stats = after.compare_to(before, key)
+    return sum(stat.size_diff for stat in stats), sum(stat.count_diff for stat in stats)
+
+
+def measure(name, factory, count=100):
+    """
+    Average memory retained by objects built by a factory.
+
+    Args:
+        name: Label for the report
+        factory: Function called with no arguments
+        count: Objects to build (all kept alive until measured)
+
+    Returns:
+        Footprint with bytes and blocks per object
+    """
+    factory()  # first call pays for imports and caches
+    kept = [None] * count
+    with _Tracing():
+        before = _snapshot()
+        for index in range(count):
+            kept[index] = factory()
+        after = _snapshot()
+    size, blocks = _growth(before, after)
+    return Footprint(name, count, size / count, blocks / count)
+
+
+def move_lists(games):
+    """
+    Replay archived games into (start, end) lists, before any measurement.
+
+    Args:
+        games: ArchiveGame records, e.g. from notation.archive.random_games
+
+    Returns:
+        List of move lists
+    """
+    from notation.archive import replay_game
+
+    return [[(move['start'], move['end']) for move in replay_game(game)[0].move_history] for game in games]
+
+
+def move_footprint(games):
+    """
+    Average memory one played move adds to a GameSession.
+
+    The sessions are built before tracing starts, so the growth is the move
+    history entries (dict, player string, list slack) plus anything else a
+    move leaves behind in the session.
+
+    Args:
+        games: List of (start, end) move lists, e.g. from move_lists
+
+    Returns:
+        Footprint per stored move
+    """
+    from game.game_session import GameSession
+
+    sessions = [GameSession() for _ in games]
+    plies = sum(len(moves) for moves in games)
+    with _Tracing():
+        before = _snapshot()
+        for session, moves in zip(sessions, games):
+            for start, end in moves:
+                session.submit_move(start, end)
+        after = _snapshot()
+    size, blocks = _growth(before, after)
+    return Footprint('stored move', plies, size / max(plies, 1), blocks / max(plies, 1))
+
+
+def validation_allocations(games, illegal=4, seed=1, top=5):
+    """
+    Allocations made by ChessBoard.validate_move.
+
+    Every position of every game is validated with the move that was played
+    and with a few random square pairs, which are mostly illegal.
+
+    Args:
+        games: List of (start, end) move lists, e.g. from move_lists
+        illegal: Random square pairs tried per position
+        seed: Random seed for the square pairs
+        top: Allocation sites to keep for the report
+
+    Returns:
+        HotPath; sites lists (file:line, blocks, bytes) of retained blocks
+    """
+    from board.chess_board import ChessBoard
+    from pieces.piece_codes import WHITE
+
+    rng = random.Random(seed)
+    squares = [(row, col) for row in range(8) for col in range(8)]
+    calls = []
+    for moves in games:
+        board = ChessBoard()
+        side = WHITE
+        for start, end in moves:
+            grid = [row[:] for row in board.board]
+            calls.append((grid, start, end, side))
+            for _ in range(illegal):
+                calls.append((grid, rng.choice(squares), rng.choice(squares), side))
+            board.move_piece(start, end)
+            side ^= 1
+
+    board = ChessBoard()
+    validate = board.validate_move
+    validate((1, 4), (3, 4), WHITE)
+    results = [None] * len(calls)
+    # Only the game's own modules count; the report's loop is left out
+    source = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    own = (tracemalloc.Filter(True, os.path.join(source, '*')), tracemalloc.Filter(False, __file__))
+    with _Tracing():
+        # First pass drops the results: the peak is the temporaries alone
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for grid, start, end, side in calls:
+            board.board = grid
+            validate(start, end, side)
+        _, peak = tracemalloc.get_traced_memory()
+        before = _snapshot().filter_traces(own)
+        for index, (grid, start, end, side) in enumerate(calls):
+            board.board = grid
+            results[index] = validate(start, end, side)
+        after = _snapshot().filter_traces(own)
+    size, blocks = _growth(before, after)
+    sites = [
+        (f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.count_diff, stat.size_diff)
+        for stat in after.compare_to(before, 'lineno')[:top]
+        if stat.count_diff > 0
+    ]
+    count = max(len(calls), 1)
+    legal = sum(1 for result in results if result[0])
+    return HotPath(len(calls), legal, blocks / count, size / count, max(peak - current, 0), sites)
+
+
+def memory_report(count=100, games=20, seed=1):
+    """
+    Measure the per-object footprints and the validation hot path.
+
+    Args:
+        count: Objects built per footprint
+        games: Random games played for the per-move and hot-path figures
+        seed: Random seed for the games
+
+    Returns:
+        Dict with 'footprints' (name -> bytes/blocks per object) and
+        'validate_move' (hot-path allocation figures)
+    """
+    from board.chess_board import ChessBoard
+    from game.game_session import GameSession
+    from game.game_state import GameState
+    from notation.archive import random_games
+
+    played = move_lists(random_games(games, seed, max_plies=60))
+    footprints = [
+        measure('ChessBoard', ChessBoard, count),
+        measure('GameState', GameState, count),
+        measure('GameSession', GameSession, count),
+        move_footprint(played),
+    ]
+    hot = validation_allocations(played, seed=seed)
+    return {
+        'footprints': {
+            item.name: {'count': item.count, 'bytes': round(item.bytes, 1), 'blocks': round(item.blocks, 2)}
+            for item in footprints
+        },
+        'validate_move': {
+            'calls': hot.calls,
+            'legal': hot.legal,
+            'blocks_per_call': round(hot.blocks_per_call, 3),
+            'bytes_per_call': round(hot.bytes_per_call, 1),
+            'peak_bytes': hot.peak_bytes,
+            'sites': [{'site': site, 'blocks': blocks, 'bytes': size} for site, blocks, size in hot.sites],
+        },
+    }
+
+
+def format_report(report):
+    """Format a memory_report as text tables."""
+    lines = [f"{'object':<14}{'count':>8}{'bytes':>10}{'blocks':>8}"]
+    lines.append("-" * len(lines[0]))
+    for name, row in report['footprints'].items():
+        lines.append(f"{name:<14}{row['count']:>8}{row['bytes']:>10.1f}{row['blocks']:>8.2f}")
+    hot = report['validate_move']
+    lines.append("")
+    lines.append(f"validate_move: {hot['calls']} calls ({hot['legal']} legal), "
+                 f"{hot['blocks_per_call']:.3f} blocks / {hot['bytes_per_call']:.1f} bytes retained per call, "
+                 f"peak {hot['peak_bytes']} bytes")
+    for site in hot['sites']:
+        lines.append(f"  {site['site']}: {site['blocks']} blocks, {site['bytes']} bytes")
+    return "\n".join(lines)
+
+
+def check_budget(report, session_budget=SESSION_BUDGET, move_budget=MOVE_BUDGET):
+    """
+    Compare a report against the memory budgets.
+
+    Returns:
+        List of messages, empty when everything fits
+    """
+    footprints = report['footprints']
+    problems = []
+    session = footprints['GameSession']['bytes']
+    if session > session_budget:
+        problems.append(f"GameSession uses {session:.0f} bytes (budget {session_budget})")
+    move = footprints['stored move']['bytes']
+    if move > move_budget:
+        problems.append(f"a stored move uses {move:.0f} bytes (budget {move_budget})")
+    return problems
+
+
+def main(argv=None):
+    """Command line entry point; exits with status 1 when --check finds a budget exceeded."""
+    parser = argparse.ArgumentParser(description="Memory and allocation report for game sessions")
+    parser.add_argument('--count', type=int, default=100, help="objects built per footprint")
+    parser.add_argument('--games', type=int, default=20, help="random games for the per-move figures")
+    parser.add_argument('--seed', type=int, default=1, help="random seed")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    parser.add_argument('--check', action='store_true', help="fail when a budget is exceeded")
+    args = parser.parse_args(argv)
+
+    report = memory_report(args.count, args.games, args.seed)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    if args.check:
+        problems = check_budget(report)
+        for problem in problems:
+            print(problem, file=sys.stderr)
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+import unittest
+import io
+import os
+import sys
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from engine.analysis import (
+    NAG_BLUNDER, NAG_MISTAKE, analyse_game, analyse_history, annotate, format_pgn, format_score, summarize,
+)
+from engine.evaluation import MATE_SCORE
+from engine.search import Searcher
+from game.game_session import GameSession
+from moves.move_generator import generate_moves
+from notation.archive import random_games, replay_game
+from notation.pgn import read_games, replay
+from pieces.piece_codes import WHITE
+
+
+def session_moves(session):
+    return [(move['start'], move['end']) for move in session.move_history]
+
+
+class TestSearchLines(unittest.TestCase):
+    """Test the multi-PV search."""
+
+    def test_lines_are_distinct_and_sorted(self):
+        """Test the lines cover different moves, best first, and the first agrees with search."""
+        board = ChessBoard().board
+        lines = Searcher().search_lines(board, WHITE, lines=4, max_depth=2)
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(len({line.move for line in lines}), 4)
+        scores = [line.score for line in lines]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual(lines[0].score, Searcher().search(board, WHITE, 2).score)
+        for line in lines:
+            self.assertEqual(line.pv[0], line.move)
+            self.assertEqual(line.depth, 2)
+        self.assertEqual(board, ChessBoard().board)
+
+    def test_scores_match_single_move_search(self):
+        """Test every line's score equals a search of that move alone."""
+        board = ChessBoard().board
+        for line in Searcher().search_lines(board, WHITE, lines=3, max_depth=2):
+            start, end = line.move
+            grid = [row[:] for row in board]
+            grid[end[0]][end[1]] = grid[start[0]][start[1]]
+            grid[start[0]][start[1]] = 0
+            self.assertEqual(line.score, -Searcher().search(grid, WHITE ^ 1, 1).score)
+
+    def test_include_scores_a_weak_move(self):
+        """Test a move outside the lines is scored when asked for."""
+        board = ChessBoard().board
+        lines = Searcher().search_lines(board, WHITE, lines=1, max_depth=2)
+        weak = next(move for move in generate_moves(board, WHITE) if move != lines[0].move)
+        with_weak = Searcher().search_lines(board, WHITE, lines=1, max_depth=2, include=weak)
+        self.assertEqual([line.move for line in with_weak], [lines[0].move, weak])
+
+    def test_king_capture_line(self):
+        """Test a hanging king is the first line with a mate score."""
+        session = GameSession()
+        for text in ('e7 e5', 'f2 f3', 'd8 h4', 'g2 g4'):
+            session.submit_text(text)
+        lines = Searcher().search_lines(session.board.board, WHITE, lines=2, max_depth=3)
+        self.assertEqual(lines[0].score, MATE_SCORE)
+        self.assertEqual(format_score(lines[0].score), '#1')
+        self.assertEqual(format_score(-MATE_SCORE + 1), '#-2')
+        self.assertEqual(format_score(-35), '-0.35')
+
+
+class TestAnalysis(unittest.TestCase):
+    """Test game review."""
+
+    def setUp(self):
+        self.session, _ = replay_game(random_games(1, seed=8, max_plies=16)[0])
+        self.moves = session_moves(self.session)
+
+    def test_every_ply_is_analysed(self):
+        """Test one entry per ply with the played move scored against the best line."""
+        analysis = analyse_history(self.session.move_history, lines=2, depth=2)
+        self.assertEqual([entry.ply for entry in analysis], list(range(len(self.moves))))
+        for entry, move in zip(analysis, self.moves):
+            self.assertEqual(entry.played, move)
+            self.assertLessEqual(len(entry.lines), 2)
+            self.assertEqual(entry.loss, max(entry.lines[0].score - entry.score, 0))
+            self.assertEqual(entry.nag, annotate(entry.loss))
+
+    def test_parallel_matches_serial(self):
+        """Test a process pool gives the same analysis."""
+        serial = analyse_game(self.moves[:6], lines=2, depth=2)
+        parallel = analyse_game(self.moves[:6], lines=2, depth=2, processes=2)
+        self.assertEqual(serial, parallel)
+
+    def test_blunder_is_flagged(self):
+        """Test leaving the king en prise is a blunder."""
+        session = GameSession()
+        for text in ('e7 e5', 'f2 f3', 'd8 h4', 'g2 g4'):
+            session.submit_text(text)
+        analysis = analyse_history(session.move_history, lines=1, depth=2)
+        self.assertEqual(analysis[3].nag, NAG_BLUNDER)
+        self.assertEqual(summarize(analysis)['black']['blunders'], 1)
+
+    def test_annotate(self):
+        """Test the thresholds."""
+        self.assertEqual(annotate(50), '')
+        self.assertEqual(annotate(100), NAG_MISTAKE)
+        self.assertEqual(annotate(300), NAG_BLUNDER)
+        self.assertEqual(annotate(150, mistake=200), '')
+
+    def test_annotated_pgn_reads_back(self):
+        """Test the annotated PGN replays to the same moves."""
+        analysis = analyse_game(self.moves, lines=2, depth=2)
+        text = format_pgn(self.moves, analysis, {'Event': 'Review'}, self.session.result())
+        self.assertIn('[Event "Review"]', text)
+        self.assertIn('{', text)
+        game = next(read_games(io.StringIO(text)))
+        self.assertEqual([move for _, _, move in replay(game.moves)], self.moves)
+
+
+if __name__ == '__main__':
+    unittest.main()
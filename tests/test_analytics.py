@@ -0,0 +1,120 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from analytics.game_stats import GameStats, OpeningTrie
+from analytics.pipeline import analyse_archives, analyse_games, plan_tasks
+from notation.archive import ArchiveGame, random_games, read_archive, read_jsonl, replay_game, write_archive
+
+SAMPLE_PGN = """[Event "Sample"]
+[Result "1-0"]
+
+1. e4 e5 2. Nf3 Nc6 3. Bb5 a6 1-0
+
+[Event "Sample"]
+[Result "0-1"]
+
+1. e4 e5 2. Nf3 Nf6 0-1
+"""
+
+
+class TestArchive(unittest.TestCase):
+    """Test archive reading and writing."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.games = random_games(6)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_jsonl_round_trip(self):
+        """Test games survive writing and reading, compressed or not."""
+        for name in ('games.jsonl', 'games.jsonl.gz'):
+            path = os.path.join(self.directory.name, name)
+            self.assertEqual(write_archive(path, self.games), 6)
+            self.assertEqual(list(read_archive(path)), self.games)
+
+    def test_byte_ranges_cover_every_game_once(self):
+        """Test splitting at arbitrary offsets neither loses nor repeats games."""
+        path = os.path.join(self.directory.name, 'games.jsonl')
+        write_archive(path, self.games)
+        size = os.path.getsize(path)
+        for cut in (1, size // 3, size // 2, size - 1):
+            games = list(read_jsonl(path, 0, cut)) + list(read_jsonl(path, cut, size))
+            self.assertEqual(games, self.games)
+
+    def test_replay_matches_session(self):
+        """Test a recorded game replays to the same result."""
+        for game in self.games:
+            session, complete = replay_game(game)
+            self.assertTrue(complete)
+            self.assertEqual(session.result(), game.result)
+
+    def test_replay_stops_at_illegal_move(self):
+        """Test illegal moves end the replay."""
+        session, complete = replay_game(ArchiveGame(['e2e4', 'e2e4'], '*', {}))
+        self.assertFalse(complete)
+        self.assertEqual(len(session.move_history), 1)
+
+
+class TestGameStats(unittest.TestCase):
+    """Test aggregation and merging."""
+
+    def test_pgn_statistics(self):
+        """Test win rates, captures and openings from a PGN archive."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'sample.pgn')
+            with open(path, 'w') as handle:
+                handle.write(SAMPLE_PGN)
+            stats = analyse_archives([path], opening_depth=3)
+        self.assertEqual(stats.games, 2)
+        self.assertEqual(stats.win_rates()['white'], 0.5)
+        self.assertEqual(stats.average_length, 5.0)
+        self.assertEqual(stats.openings.count(['e2e4', 'e7e5', 'g1f3']), 2)
+        self.assertEqual(stats.openings.most_common(limit=1), [(('e2e4', 'e7e5', 'g1f3'), 2)])
+
+    def test_capture_counts(self):
+        """Test captured pieces are counted by type."""
+        stats = analyse_games([ArchiveGame(['e2e4', 'd7d5', 'e4d5'], None, {})])
+        self.assertEqual(stats.captures, {'P': 1})
+        self.assertEqual(stats.winners['none'], 1)
+
+    def test_merge_matches_single_pass(self):
+        """Test merging partial results equals analysing everything at once."""
+        games = random_games(8)
+        whole = analyse_games(games)
+        merged = analyse_games(games[:3]).merge(analyse_games(games[3:]))
+        self.assertEqual(merged.to_dict(), whole.to_dict())
+
+    def test_process_pool(self):
+        """Test chunked parallel analysis equals the serial result."""
+        games = random_games(10)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'games.jsonl')
+            write_archive(path, games)
+            chunk = os.path.getsize(path) // 4 + 1
+            self.assertEqual(len(plan_tasks([path], chunk)), 4)
+            parallel = analyse_archives([path], processes=2, chunk_bytes=chunk)
+        self.assertEqual(parallel.to_dict(), analyse_games(games).to_dict())
+        self.assertEqual(parallel.games, 10)
+
+    def test_trie_merge(self):
+        """Test trie counts add up when merged."""
+        first, second = OpeningTrie(2), OpeningTrie(2)
+        first.add(['a', 'b', 'c'])
+        second.add(['a', 'b'])
+        second.add(['a', 'd'])
+        first.merge(second)
+        self.assertEqual(first.count(['a']), 3)
+        self.assertEqual(first.count(['a', 'b']), 2)
+        self.assertEqual(first.count(['a', 'b', 'c']), 0)
+        self.assertEqual(GameStats().merge(GameStats()).games, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import importlib.util
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from notation.fen import START_FEN
+from server.session_store import SessionStore
+
+HAS_FLASK = importlib.util.find_spec('flask') is not None
+
+
+@unittest.skipUnless(HAS_FLASK, "Flask is not installed")
+class TestApi(unittest.TestCase):
+    """Test the HTTP endpoints through Flask's test client."""
+
+    def setUp(self):
+        from server.api import create_app
+        self.store = SessionStore(max_sessions=4)
+        self.client = create_app(self.store).test_client()
+        response = self.client.post('/games')
+        self.assertEqual(response.status_code, 201)
+        self.game = response.get_json()
+
+    def test_create_game(self):
+        """Test a new game starts from the initial position."""
+        self.assertEqual(self.game['fen'], START_FEN)
+        self.assertEqual(self.game['side_to_move'], 'white')
+        self.assertEqual(self.game['result'], '*')
+
+    def test_clocked_game(self):
+        """Test a time control adds remaining times and a bad one is rejected."""
+        response = self.client.post('/games', json={'time_control': '300+2'})
+        self.assertEqual(response.status_code, 201)
+        game = response.get_json()
+        self.assertEqual(game['clock'], {'white': 300.0, 'black': 300.0})
+        self.assertFalse(game['lost_on_time'])
+        self.assertEqual(self.client.post('/games', json={'time_control': 'soon'}).status_code, 400)
+        for time_control in ('inf', '1e300', '10+inf', 'nan'):
+            self.assertEqual(self.client.post('/games', json={'time_control': time_control}).status_code, 400)
+
+    def test_legal_moves(self):
+        """Test the 20 opening moves are listed with square names."""
+        moves = self.client.get(f"/games/{self.game['id']}/moves").get_json()['moves']
+        self.assertEqual(len(moves), 20)
+        self.assertIn({'from': 'e2', 'to': 'e4'}, moves)
+
+    def test_legal_targets(self):
+        """Test targets are grouped by piece and can be asked for one square."""
+        url = f"/games/{self.game['id']}/targets"
+        targets = self.client.get(url).get_json()['targets']
+        self.assertEqual(len(targets), 16)
+        self.assertEqual(sorted(targets['g1']), ['f3', 'h3'])
+        self.assertEqual(self.client.get(url + '?from=e2').get_json()['targets'], {'e2': ['e3', 'e4']})
+        self.assertEqual(self.client.get(url + '?from=e4').get_json()['targets'], {'e4': []})
+        self.assertEqual(self.client.get(url + '?from=z9').status_code, 400)
+
+    def test_submit_moves(self):
+        """Test moves by squares and by SAN update the position."""
+        url = f"/games/{self.game['id']}/moves"
+        response = self.client.post(url, json={'from': 'e2', 'to': 'e4'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['side_to_move'], 'black')
+        response = self.client.post(url, json={'move': 'e5'})
+        self.assertEqual(response.status_code, 200)
+        fen = self.client.get(f"/games/{self.game['id']}/fen").get_json()['fen']
+        self.assertEqual(fen, "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w - - 0 2")
+
+    def test_rejected_moves(self):
+        """Test unreadable and illegal moves get client errors."""
+        url = f"/games/{self.game['id']}/moves"
+        self.assertEqual(self.client.post(url, json={'from': 'z9', 'to': 'e4'}).status_code, 400)
+        self.assertEqual(self.client.post(url, data='not json').status_code, 400)
+        response = self.client.post(url, json={'from': 'e7', 'to': 'e5'})
+        self.assertEqual(response.status_code, 422)
+        self.assertIn('belongs to black', response.get_json()['error'])
+
+    def test_unknown_and_deleted_games(self):
+        """Test missing games return 404."""
+        self.assertEqual(self.client.get('/games/missing').status_code, 404)
+        self.assertEqual(self.client.delete(f"/games/{self.game['id']}").status_code, 204)
+        self.assertEqual(self.client.get(f"/games/{self.game['id']}").status_code, 404)
+
+    def test_store_full(self):
+        """Test a full store answers 503."""
+        for _ in range(3):
+            self.client.post('/games')
+        self.assertEqual(self.client.post('/games').status_code, 503)
+
+
+if __name__ == '__main__':
+    unittest.main()
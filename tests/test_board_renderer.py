@@ -0,0 +1,92 @@
+import unittest
+import io
+import sys
+import os
+from contextlib import redirect_stdout
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.board_renderer import BoardRenderer, display_chess_board, format_board
+from board.chess_board import ChessBoard
+
+
+class CountingStream(io.StringIO):
+    """StringIO that counts write calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class TestBoardRenderer(unittest.TestCase):
+    """Test buffered and diff-based rendering."""
+
+    def setUp(self):
+        self.board = ChessBoard()
+        self.stream = CountingStream()
+
+    def test_render_matches_format_board(self):
+        """Test ChessBoard.render prints the formatted board in one go."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.board.render()
+        self.assertEqual(output.getvalue(), format_board(self.board.board))
+        self.assertIn("8|R N B Q K B N R |8\n", output.getvalue())
+
+    def test_display_chess_board(self):
+        """Test the one-off display writes the formatted board once."""
+        display_chess_board(self.board.board, self.stream)
+        self.assertEqual(self.stream.writes, 1)
+        self.assertEqual(self.stream.getvalue(), format_board(self.board.board))
+
+    def test_full_mode_single_write_per_frame(self):
+        """Test every frame is one write of the whole board."""
+        renderer = BoardRenderer('full', self.stream)
+        renderer.render(self.board.board)
+        renderer.render(self.board.board)
+        self.assertEqual(self.stream.writes, 2)
+        self.assertEqual(self.stream.getvalue(), format_board(self.board.board) * 2)
+
+    def test_diff_mode_lists_changed_squares(self):
+        """Test the compact diff names only the squares that changed."""
+        renderer = BoardRenderer('diff', self.stream)
+        first = renderer.frame(self.board.board)
+        self.assertEqual(len(first.split()), 64)
+        self.board.move_piece((1, 4), (3, 4))
+        self.assertEqual(renderer.frame(self.board.board), "e7. e5P\n")
+        self.assertEqual(renderer.frame(self.board.board), "")
+
+    def test_ansi_mode_redraws_changed_squares(self):
+        """Test ANSI frames move the cursor to changed squares only."""
+        renderer = BoardRenderer('ansi', self.stream)
+        self.assertTrue(renderer.frame(self.board.board).startswith("\x1b[H\x1b[2J"))
+        self.board.move_piece((1, 4), (3, 4))
+        self.assertEqual(renderer.frame(self.board.board), "\x1b[4;11H.\x1b[6;11HP\x1b[14;1H\x1b[J")
+
+    def test_reset_forces_full_frame(self):
+        """Test reset() makes the next frame complete again."""
+        renderer = BoardRenderer('diff', self.stream)
+        renderer.frame(self.board.board)
+        renderer.reset()
+        self.assertEqual(len(renderer.frame(self.board.board).split()), 64)
+
+    def test_headless_writes_nothing(self):
+        """Test headless mode skips rendering."""
+        renderer = BoardRenderer('headless', self.stream)
+        self.assertTrue(renderer.headless)
+        renderer.render(self.board.board)
+        self.assertEqual(self.stream.writes, 0)
+
+    def test_unknown_mode(self):
+        """Test invalid modes are rejected."""
+        with self.assertRaises(ValueError):
+            BoardRenderer('fancy')
+
+
+if __name__ == '__main__':
+    unittest.main()
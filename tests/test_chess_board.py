@@ -104,12 +104,12 @@ class TestChessBoard(unittest.TestCase):
         self.assertFalse(self.board.is_king_captured('black'))
         
         # Remove white king
-        self.board.board[0][4] = None
+        self.board.set_piece((0, 4), None)
         self.assertTrue(self.board.is_king_captured('white'))
         self.assertFalse(self.board.is_king_captured('black'))
         
         # Remove black king
-        self.board.board[7][4] = None
+        self.board.set_piece((7, 4), None)
         self.assertTrue(self.board.is_king_captured('black'))
 
 
@@ -0,0 +1,215 @@
+import unittest
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+from unittest import mock
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.board_renderer import BoardRenderer
+from engine.tournament import GameTask, _play_task, play_game
+from game.clock import (
+    MIN_THINK, NS_PER_SECOND, GameClock, TimeControl, allocate_time, format_time_control, parse_time_control,
+)
+from game.chess_game import ChessGame
+from game.game_session import GameSession
+from game.game_state import GameState
+from pieces.piece_codes import BLACK, WHITE
+
+
+class FakeTime:
+    """Manually advanced nanosecond counter."""
+
+    def __init__(self):
+        self.now = 10 * NS_PER_SECOND
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += round(seconds * NS_PER_SECOND)
+
+
+class TestTimeControl(unittest.TestCase):
+    """Test time control parsing and time allocation."""
+
+    def test_parse(self):
+        """Test base, increment and delay forms."""
+        self.assertEqual(parse_time_control('300'), TimeControl(300.0, 0.0, 0.0))
+        self.assertEqual(parse_time_control('180+2'), TimeControl(180.0, 2.0, 0.0))
+        self.assertEqual(parse_time_control('60d3'), TimeControl(60.0, 0.0, 3.0))
+        self.assertEqual(format_time_control(parse_time_control('10+0.1d1')), '10+0.1d1')
+        for text in ('', 'abc', '0', '-5', '60+-1', '5+x'):
+            with self.assertRaises(ValueError):
+                parse_time_control(text)
+
+    def test_rejects_non_finite(self):
+        """Test infinite, NaN and huge values are refused before they reach the clock."""
+        for text in ('inf', '1e300', '10+inf', 'nan', '60dnan', '-inf'):
+            with self.assertRaises(ValueError):
+                parse_time_control(text)
+        with self.assertRaises(ValueError):
+            GameClock(TimeControl(float('inf'), 0.0, 0.0))
+
+    def test_allocate_time(self):
+        """Test the budget grows with the increment and never exceeds half the clock."""
+        self.assertAlmostEqual(allocate_time(300), 10.0)
+        self.assertAlmostEqual(allocate_time(300, 2), 11.5)
+        self.assertAlmostEqual(allocate_time(60, moves_to_go=10), 6.0)
+        self.assertAlmostEqual(allocate_time(1, 10), 0.5)
+        self.assertEqual(allocate_time(0), MIN_THINK)
+
+
+class TestGameClock(unittest.TestCase):
+    """Test the two-player clock."""
+
+    def setUp(self):
+        self.time = FakeTime()
+
+    def test_press_charges_and_adds_increment(self):
+        """Test time used is charged to the mover, who then gets the increment."""
+        clock = GameClock('60+2', self.time)
+        clock.start(WHITE)
+        self.time.advance(5)
+        self.assertAlmostEqual(clock.remaining(WHITE), 55)
+        self.assertTrue(clock.press())
+        self.assertEqual(clock.running, BLACK)
+        self.assertAlmostEqual(clock.remaining(WHITE), 57)
+        self.time.advance(1.5)
+        self.assertAlmostEqual(clock.remaining(BLACK), 58.5)
+        self.assertEqual(clock.to_dict(), {'white': 57.0, 'black': 58.5})
+
+    def test_delay(self):
+        """Test the delay is free and only the rest of the turn is charged."""
+        clock = GameClock('10d3', self.time)
+        clock.start(WHITE)
+        self.time.advance(2)
+        self.assertEqual(clock.remaining(WHITE), 10)
+        self.time.advance(2)
+        self.assertAlmostEqual(clock.remaining(WHITE), 9)
+        self.assertAlmostEqual(clock.time_to_flag(), 9)
+
+    def test_flag_is_found_at_the_deadline(self):
+        """Test flag fall is detected by comparing with the deadline."""
+        clock = GameClock('10', self.time)
+        clock.start(WHITE)
+        self.assertEqual(clock.deadline_ns(), self.time.now + 10 * NS_PER_SECOND)
+        self.time.advance(9.999)
+        self.assertIsNone(clock.check_flag())
+        self.time.advance(0.001)
+        self.assertEqual(clock.check_flag(), WHITE)
+        self.assertIsNone(clock.running)
+        self.assertEqual(clock.remaining(WHITE), 0)
+        self.assertFalse(clock.press())
+
+    def test_late_press_flags(self):
+        """Test a move made after the deadline does not count as in time."""
+        clock = GameClock('1', self.time)
+        clock.start(WHITE)
+        self.time.advance(2)
+        self.assertFalse(clock.press())
+        self.assertEqual(clock.flagged, WHITE)
+
+
+class TestClockedGames(unittest.TestCase):
+    """Test clocks in game state, sessions and tournaments."""
+
+    def setUp(self):
+        self.time = FakeTime()
+        self.session = GameSession(game_state=GameState(GameClock('5+1', self.time)))
+
+    def test_clock_starts_after_first_move(self):
+        """Test White's first move is untimed and then Black's clock runs."""
+        clock = self.session.game_state.clock
+        self.time.advance(100)
+        self.assertTrue(self.session.submit_move((1, 4), (3, 4)).ok)
+        self.assertEqual(clock.running, BLACK)
+        self.assertEqual(clock.remaining(WHITE), 5)
+        self.time.advance(2)
+        self.assertTrue(self.session.submit_move((6, 4), (4, 4)).ok)
+        self.assertAlmostEqual(clock.remaining(BLACK), 4)
+        self.assertEqual(clock.running, WHITE)
+
+    def test_flag_ends_game(self):
+        """Test the side to move loses once its flag falls, without any move being made."""
+        self.session.submit_move((1, 4), (3, 4))
+        self.time.advance(6)
+        self.assertTrue(self.session.is_over)
+        self.assertEqual(self.session.winner, 'white')
+        self.assertEqual(self.session.result(), '1-0')
+        self.assertTrue(self.session.game_state.lost_on_time)
+        result = self.session.submit_move((6, 4), (4, 4))
+        self.assertFalse(result.ok)
+        self.assertEqual(result.error, "Black lost on time")
+
+    def test_reset_game_resets_clock(self):
+        """Test a reset restores the initial times."""
+        self.session.submit_move((1, 4), (3, 4))
+        self.time.advance(6)
+        self.assertTrue(self.session.is_over)
+        self.session.game_state.reset_game()
+        self.assertFalse(self.session.is_over)
+        self.assertEqual(self.session.game_state.clock.remaining(BLACK), 5)
+
+    def test_tournament_game_with_clock(self):
+        """Test clocked tournament games finish and record their time control."""
+        white = {'name': 'searcher', 'kind': 'search', 'depth': 2}
+        black = {'name': 'random', 'kind': 'random'}
+        moves, result, termination = play_game(white, black, max_plies=20, seed=1, time_control='60+1')
+        self.assertIn(termination, ('king captured', 'ply limit', 'no moves'))
+        game = _play_task(GameTask(0, 0, white, black, 6, 1, parse_time_control('60+1')))
+        self.assertEqual(game.tags['time_control'], '60+1')
+
+    def test_tournament_time_forfeit(self):
+        """Test a player whose clock runs out loses the game."""
+        white = {'name': 'slow', 'kind': 'search', 'depth': 64, 'time': 0.2}
+        black = {'name': 'random', 'kind': 'random'}
+        moves, result, termination = play_game(white, black, max_plies=400, seed=1, time_control='0.02')
+        self.assertEqual((result, termination), ('0-1', 'time forfeit'))
+
+    def test_console_shows_clock(self):
+        """Test the console prints both clocks before each prompt."""
+        game = ChessGame(renderer=BoardRenderer('headless'), time_control='300+2')
+        with mock.patch('sys.stdin', io.StringIO()), mock.patch('builtins.input', side_effect=['e7 e5', 'quit']), \
+                redirect_stdout(io.StringIO()) as out:
+            game.start_game()
+        self.assertIn("White 5:00.0 | Black 5:00.0", out.getvalue())
+        self.assertEqual(game.game_state.clock.running, BLACK)
+
+    def test_console_reports_forfeit_after_invalid_input(self):
+        """Test a flag that falls while typing an unparseable move is still announced."""
+        game = ChessGame(renderer=BoardRenderer('headless'), time_control='1')
+        game.game_state.clock = GameClock('1', self.time)
+
+        def slow_black(prompt):
+            if game.session.side_to_move == BLACK:
+                self.time.advance(5)
+                return 'xx'
+            return 'e7 e5'
+
+        with mock.patch('sys.stdin', io.StringIO()), mock.patch('builtins.input', side_effect=slow_black), \
+                redirect_stdout(io.StringIO()) as out:
+            game.start_game()
+        self.assertEqual(game.game_state.winner, 'white')
+        self.assertTrue(game.game_state.lost_on_time)
+        self.assertIn("Black ran out of time. WHITE WINS!", out.getvalue())
+        self.assertEqual(out.getvalue().count("ran out of time"), 1)
+
+    @unittest.skipUnless(os.name == 'posix', "select on pipes needs POSIX")
+    def test_console_prompt_stops_at_flag(self):
+        """Test the prompt gives up when the clock runs out instead of waiting for Enter."""
+        game = ChessGame(renderer=BoardRenderer('headless'), time_control='0.2')
+        read_end, write_end = os.pipe()
+        os.write(write_end, b'e7 e5\n')  # White's move; Black never answers
+        with open(read_end) as stdin, mock.patch('sys.stdin', stdin), redirect_stdout(io.StringIO()) as out:
+            game.start_game()
+        os.close(write_end)
+        self.assertEqual(game.game_state.winner, 'white')
+        self.assertTrue(game.game_state.lost_on_time)
+        self.assertIn("Black ran out of time", out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+import os
+import random
+import sys
+import tempfile
+from collections import Counter
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from analytics.dedup import dedup_archives, format_report, replay_positions
+from analytics.external_sort import ExternalSorter, sum_counts
+from board.zobrist import position_hash
+from notation.archive import ArchiveGame, random_games, read_archive, write_archive
+from notation.fen import START_FEN
+
+SAMPLE_PGN = """[Event "Sample"]
+[Result "*"]
+
+1. e4 e5 2. Nf3 Nc6 *
+"""
+
+
+class TestExternalSorter(unittest.TestCase):
+    """Test the external merge sort."""
+
+    def test_sorts_across_runs(self):
+        """Test records spilled over many runs come back in order."""
+        rng = random.Random(1)
+        values = [rng.getrandbits(64) for _ in range(1000)]
+        with ExternalSorter(1, run_records=64) as sorter:
+            for value in values:
+                sorter.add((value,))
+            self.assertGreater(len(sorter.runs), 10)
+            self.assertEqual([value for (value,) in sorter], sorted(values))
+
+    def test_combines_counts(self):
+        """Test equal keys are summed within and across runs."""
+        rng = random.Random(2)
+        keys = [rng.randrange(50) for _ in range(500)]
+        for run_records in (37, 10000):
+            with ExternalSorter(2, run_records, combine=sum_counts) as sorter:
+                for key in keys:
+                    sorter.add((key, 1))
+                self.assertEqual(list(sorter), sorted(Counter(keys).items()))
+
+    def test_close_removes_runs(self):
+        """Test temporary files are deleted."""
+        sorter = ExternalSorter(1, run_records=2)
+        for value in range(5):
+            sorter.add((value,))
+        paths = list(sorter.runs)
+        sorter.close()
+        self.assertFalse(any(os.path.exists(path) for path in paths))
+
+
+class TestDedup(unittest.TestCase):
+    """Test game and position deduplication."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.games = random_games(8, seed=5, max_plies=30)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_replay_positions_keys(self):
+        """Test incremental keys match a full rehash of each position."""
+        for key, board, side, _ in replay_positions(self.games[0]):
+            self.assertEqual(key, position_hash(board, side))
+
+    def test_duplicates_across_archives(self):
+        """Test repeated games are dropped and positions are counted."""
+        write_archive(self.path('a.jsonl'), self.games + self.games[:3])
+        write_archive(self.path('b.jsonl.gz'), self.games[2:5] + [ArchiveGame(['e4', 'e5', 'Nf3', 'Nc6'], '*', {})])
+        with open(self.path('c.pgn'), 'w') as handle:
+            handle.write(SAMPLE_PGN)
+        paths = [self.path('a.jsonl'), self.path('b.jsonl.gz'), self.path('c.pgn')]
+
+        report = dedup_archives(paths, self.path('unique.jsonl'), self.path('positions.txt'),
+                                top=3, run_records=16, directory=self.directory.name)
+
+        self.assertEqual(report.games, 16)
+        self.assertEqual(report.unique_games, 9)
+        unique = list(read_archive(self.path('unique.jsonl')))
+        self.assertEqual(unique[:8], self.games)
+        self.assertEqual(unique[8].moves, ['e4', 'e5', 'Nf3', 'Nc6'])
+
+        expected = Counter()
+        for path in paths:
+            for game in read_archive(path):
+                expected.update(key for key, _, _, _ in replay_positions(game))
+        self.assertEqual(report.positions, sum(expected.values()))
+        self.assertEqual(report.unique_positions, len(expected))
+        self.assertEqual(report.frequencies, dict(Counter(expected.values())))
+        with open(self.path('positions.txt')) as handle:
+            written = {int(key, 16): int(count) for key, count in (line.split() for line in handle)}
+        self.assertEqual(written, dict(expected))
+
+        _, count, fen = report.most_common[0]
+        self.assertEqual(count, 16)
+        self.assertEqual(fen, START_FEN)
+        self.assertEqual([count for _, count, _ in report.most_common],
+                         sorted(expected.values(), reverse=True)[:3])
+        self.assertIn("9 unique, 7 duplicates", format_report(report))
+        self.assertFalse(any(name.startswith('sort-') for name in os.listdir(self.directory.name)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import random
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from moves.exchange import EXCHANGE_VALUES, attackers, is_losing_capture, see
+from moves.move_generator import generate_moves
+from pieces.piece_codes import BLACK, EMPTY, KING, TYPE_MASK, WHITE
+
+
+def value(code):
+    return EXCHANGE_VALUES[code & TYPE_MASK]
+
+
+def best_recapture(board, square, side):
+    """Reference exchange search that really makes the captures."""
+    candidates = [start for start, end in generate_moves(board, side) if end == square]
+    if not candidates:
+        return 0
+    start = min(candidates, key=lambda s: value(board[s[0]][s[1]]))
+    captured = board[square[0]][square[1]]
+    if captured & TYPE_MASK == KING:
+        return value(captured)
+    mover = board[start[0]][start[1]]
+    board[square[0]][square[1]], board[start[0]][start[1]] = mover, EMPTY
+    score = value(captured) - best_recapture(board, square, side ^ 1)
+    board[square[0]][square[1]], board[start[0]][start[1]] = captured, mover
+    return max(0, score)
+
+
+def reference_see(board, start, end):
+    mover, captured = board[start[0]][start[1]], board[end[0]][end[1]]
+    if captured & TYPE_MASK == KING:
+        return value(captured)
+    board[end[0]][end[1]], board[start[0]][start[1]] = mover, EMPTY
+    score = value(captured) - best_recapture(board, end, (mover >> 3) ^ 1)
+    board[end[0]][end[1]], board[start[0]][start[1]] = captured, mover
+    return score
+
+
+class TestExchange(unittest.TestCase):
+    """Test static exchange evaluation."""
+
+    def setUp(self):
+        self.board = ChessBoard()
+        self.board.clear()
+        self.board.set_piece((0, 4), 'K')
+        self.board.set_piece((7, 4), 'k')
+
+    def test_defended_pawn(self):
+        """Test a rook taking a defended pawn loses the exchange."""
+        self.board.set_piece((0, 3), 'R')
+        self.board.set_piece((4, 3), 'p')
+        self.board.set_piece((5, 2), 'p')
+        self.assertEqual(see(self.board.board, (0, 3), (4, 3)), 100 - 500)
+        self.assertTrue(is_losing_capture(self.board.board, (0, 3), (4, 3)))
+
+    def test_xray_rooks(self):
+        """Test a rook behind the capturing rook joins the exchange."""
+        self.board.set_piece((0, 3), 'R')
+        self.board.set_piece((1, 3), 'R')
+        self.board.set_piece((4, 3), 'p')
+        self.board.set_piece((7, 3), 'r')
+        self.assertEqual(attackers(self.board.board, (4, 3), WHITE), [(1, 3)])
+        self.assertEqual(attackers(self.board.board, (4, 3), WHITE, {(1, 3)}), [(0, 3)])
+        self.assertEqual(see(self.board.board, (1, 3), (4, 3)), 100)
+
+    def test_board_untouched(self):
+        """Test SEE does not make moves on the board."""
+        board = ChessBoard().board
+        before = [row[:] for row in board]
+        see(board, (1, 4), (6, 4))
+        self.assertEqual(board, before)
+
+    def test_pawn_attack_direction(self):
+        """Test pawns only attack forward diagonals."""
+        self.board.set_piece((3, 3), 'P')
+        self.board.set_piece((5, 3), 'p')
+        self.assertEqual(attackers(self.board.board, (4, 4), WHITE), [(3, 3)])
+        self.assertEqual(attackers(self.board.board, (4, 4), BLACK), [(5, 3)])
+        self.assertEqual(attackers(self.board.board, (2, 4), WHITE), [])
+
+    def test_matches_reference_on_random_positions(self):
+        """Test SEE against an exchange search that plays the captures."""
+        rng = random.Random(11)
+        checked = 0
+        for _ in range(40):
+            board, side = ChessBoard(), WHITE
+            for _ in range(rng.randrange(10, 60)):
+                moves = generate_moves(board.board, side)
+                for start, end in moves:
+                    if board.board[end[0]][end[1]] != EMPTY:
+                        self.assertEqual(see(board.board, start, end), reference_see(board.board, start, end))
+                        checked += 1
+                board.move_piece(*rng.choice(moves))
+                if board.is_king_captured(side ^ 1):
+                    break
+                side ^= 1
+        self.assertGreater(checked, 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
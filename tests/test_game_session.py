@@ -0,0 +1,101 @@
+import unittest
+import io
+import sys
+import os
+from contextlib import redirect_stdout
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from game.game_session import GameSession
+from moves.move_generator import generate_moves
+from pieces.piece_codes import BLACK, WHITE
+
+
+class TestGameSession(unittest.TestCase):
+    """Test the headless game API."""
+
+    def setUp(self):
+        self.session = GameSession()
+
+    def test_initial_state(self):
+        """Test a new session has White to move and no result."""
+        self.assertEqual(self.session.side_to_move, WHITE)
+        self.assertEqual(len(self.session.legal_moves()), 20)
+        self.assertEqual(self.session.result(), '*')
+
+    def test_submit_move(self):
+        """Test a legal move is played and the turn passes."""
+        result = self.session.submit_move((1, 4), (3, 4))
+        self.assertTrue(result.ok)
+        self.assertEqual(result.piece, 'P')
+        self.assertIsNone(result.captured)
+        self.assertIsNone(result.exchange)
+        self.assertFalse(result.game_over)
+        self.assertEqual(self.session.side_to_move, BLACK)
+        self.assertEqual(self.session.move_history[0]['player'], 'white')
+        self.assertEqual(self.session.legal_moves(), generate_moves(self.session.board.board, BLACK))
+
+    def test_legal_targets(self):
+        """Test targets cover the legal moves, grouped by piece."""
+        targets = self.session.legal_targets()
+        moves = [(start, end) for start, ends in targets.items() for end in ends]
+        self.assertEqual(sorted(moves), sorted(self.session.legal_moves()))
+        self.assertEqual(sorted(targets[(1, 4)]), [(2, 4), (3, 4)])
+
+    def test_rejected_move_leaves_position(self):
+        """Test illegal moves report an error without changing anything."""
+        before = [row[:] for row in self.session.board.board]
+        result = self.session.submit_move((6, 4), (4, 4))
+        self.assertFalse(result.ok)
+        self.assertIn("belongs to black", result.error)
+        self.assertEqual(self.session.board.board, before)
+        self.assertEqual(self.session.side_to_move, WHITE)
+
+    def test_capture_reports_exchange(self):
+        """Test captures report their static exchange evaluation."""
+        board = self.session.board
+        board.clear()
+        board.set_piece((0, 4), 'K')
+        board.set_piece((0, 3), 'R')
+        board.set_piece((4, 3), 'p')
+        board.set_piece((5, 2), 'p')
+        board.set_piece((7, 4), 'k')
+        result = self.session.submit_move((0, 3), (4, 3))
+        self.assertEqual(result.captured, 'p')
+        self.assertEqual(result.exchange, -400)
+
+    def test_king_capture_ends_game(self):
+        """Test capturing the king finishes the game with a result."""
+        board = self.session.board
+        board.clear()
+        board.set_piece((0, 4), 'K')
+        board.set_piece((3, 3), 'R')
+        board.set_piece((3, 7), 'k')
+        result = self.session.submit_move((3, 3), (3, 7))
+        self.assertTrue(result.game_over)
+        self.assertEqual(result.captured, 'k')
+        self.assertEqual(result.winner, 'white')
+        self.assertEqual(self.session.result(), '1-0')
+        self.assertEqual(self.session.legal_moves(), [])
+        self.assertFalse(self.session.submit_move((0, 4), (1, 4)).ok)
+
+    def test_submit_text(self):
+        """Test moves can be submitted in any supported notation."""
+        self.assertTrue(self.session.submit_text('1,4 3,4').ok)
+        # Console labels put Black's back rank on rank 1
+        self.assertEqual(self.session.submit_text('Nc3').piece, 'n')
+        self.assertIsNone(self.session.submit_text('hello'))
+
+    def test_no_output(self):
+        """Test a whole game runs without writing to stdout."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            while not self.session.is_over and len(self.session.move_history) < 200:
+                moves = self.session.legal_moves()
+                self.session.submit_move(*moves[len(self.session.move_history) % len(moves)])
+        self.assertEqual(output.getvalue(), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
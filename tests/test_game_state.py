@@ -88,7 +88,7 @@ class TestWinCondition(unittest.TestCase):
     def test_white_king_captured(self):
         """Test detection of white king capture."""
         # Remove white king
-        self.board.board[0][4] = None
+        self.board.set_piece((0, 4), None)
         
         self.assertTrue(self.board.is_king_captured('white'))
         self.assertFalse(self.board.is_king_captured('black'))
@@ -101,7 +101,7 @@ class TestWinCondition(unittest.TestCase):
     def test_black_king_captured(self):
         """Test detection of black king capture."""
         # Remove black king
-        self.board.board[7][4] = None
+        self.board.set_piece((7, 4), None)
         
         self.assertTrue(self.board.is_king_captured('black'))
         self.assertFalse(self.board.is_king_captured('white'))
@@ -126,7 +126,7 @@ class TestWinCondition(unittest.TestCase):
     def test_win_after_king_capture(self):
         """Test complete win scenario."""
         # Simulate a capture of black king
-        self.board.board[7][4] = None  # Remove black king
+        self.board.set_piece((7, 4), None)  # Remove black king
         
         # Check win condition
         if self.board.is_king_captured('black'):
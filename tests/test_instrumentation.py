@@ -0,0 +1,81 @@
+import unittest
+import json
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from input.input_handler import InputHandler
+from pieces.pawn import Pawn
+from utils.instrumentation import Instrumentation
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test hot-path call counting and report formats."""
+
+    def setUp(self):
+        """Set up a fresh instrumentation layer for each test."""
+        self.instrumentation = Instrumentation()
+
+    def tearDown(self):
+        """Make sure no wrappers leak into other tests."""
+        self.instrumentation.disable()
+
+    def test_disabled_leaves_methods_untouched(self):
+        """Test that methods are only replaced while enabled."""
+        original = ChessBoard.__dict__['validate_move']
+        self.instrumentation.enable()
+        self.assertIsNot(ChessBoard.__dict__['validate_move'], original)
+        self.instrumentation.disable()
+        self.assertIs(ChessBoard.__dict__['validate_move'], original)
+
+    def test_counts_calls(self):
+        """Test that calls are counted per method."""
+        with self.instrumentation:
+            board = ChessBoard()
+            board.validate_move((1, 4), (2, 4), 'white')
+            board.validate_move((1, 4), (3, 4), 'white')
+            board.move_piece((1, 4), (3, 4))
+            board.is_king_captured('black')
+            InputHandler.parse_move("e2 e4")
+
+        stats = self.instrumentation.snapshot()
+        self.assertEqual(stats['ChessBoard.validate_move']['calls'], 2)
+        self.assertEqual(stats['Pawn.is_valid_move']['calls'], 2)
+        self.assertEqual(stats['ChessBoard.move_piece']['calls'], 1)
+        self.assertEqual(stats['ChessBoard.is_king_captured']['calls'], 1)
+        self.assertEqual(stats['InputHandler.parse_move']['calls'], 1)
+
+    def test_static_method_still_static(self):
+        """Test that wrapped static methods keep working on the class."""
+        with self.instrumentation:
+            self.assertEqual(InputHandler.parse_move("1,3 2,3"), ((1, 3), (2, 3)))
+            self.assertEqual(InputHandler().parse_move("1,3 2,3"), ((1, 3), (2, 3)))
+
+    def test_report_formats(self):
+        """Test table, JSON and Prometheus exports."""
+        with self.instrumentation:
+            Pawn('white').is_valid_move((1, 4), (2, 4), ChessBoard().board)
+
+        self.assertIn('Pawn.is_valid_move', self.instrumentation.report('table'))
+        data = json.loads(self.instrumentation.report('json'))
+        self.assertEqual(data['Pawn.is_valid_move']['calls'], 1)
+        prometheus = self.instrumentation.report('prometheus')
+        self.assertIn('chess_calls_total{function="Pawn.is_valid_move"} 1', prometheus)
+        with self.assertRaises(ValueError):
+            self.instrumentation.report('xml')
+
+    def test_reset(self):
+        """Test that reset clears statistics while staying enabled."""
+        with self.instrumentation:
+            ChessBoard().is_king_captured('white')
+            self.instrumentation.reset()
+            self.assertEqual(self.instrumentation.snapshot(), {})
+            ChessBoard().is_king_captured('white')
+        self.assertEqual(self.instrumentation.snapshot()['ChessBoard.is_king_captured']['calls'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
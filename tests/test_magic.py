@@ -0,0 +1,83 @@
+import unittest
+import os
+import random
+import sys
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from moves.magic import (
+    bishop_attacks, load_tables, occupancy, queen_attacks, ray_attacks, read_tables, relevant_mask,
+    rook_attacks, write_tables,
+)
+from moves.move_generator import BISHOP_DIRECTIONS, ROOK_DIRECTIONS
+from pieces.bishop import Bishop
+from pieces.queen import Queen
+from pieces.rook import Rook
+
+
+def random_board(rng, density):
+    """A board with pawns scattered on a fraction of the squares."""
+    return [[1 if rng.random() < density else 0 for _ in range(8)] for _ in range(8)]
+
+
+class TestMagic(unittest.TestCase):
+    """Test magic-bitboard slider attacks."""
+
+    def test_parity_with_is_path_clear(self):
+        """Test attack sets contain exactly the targets the pieces accept."""
+        rng = random.Random(42)
+        checks = ((Rook('white'), rook_attacks), (Bishop('white'), bishop_attacks), (Queen('white'), queen_attacks))
+        for density in (0.0, 0.15, 0.4, 0.8):
+            for _ in range(6):
+                board = random_board(rng, density)
+                occupied = occupancy(board)
+                for square in range(64):
+                    start = divmod(square, 8)
+                    for piece, attacks in checks:
+                        attacked = attacks(square, occupied)
+                        for target in range(64):
+                            end = divmod(target, 8)
+                            expected = end != start and piece.is_valid_move(start, end, board)
+                            self.assertEqual(bool(attacked >> target & 1), expected, (piece.symbol, start, end))
+
+    def test_lookup_matches_ray_walk(self):
+        """Test every blocker subset of a few squares against the reference walk."""
+        rook, bishop = load_tables()
+        rng = random.Random(7)
+        for square in (0, 7, 27, 36, 63):
+            for table, directions in ((rook, ROOK_DIRECTIONS), (bishop, BISHOP_DIRECTIONS)):
+                mask = relevant_mask(square, directions)
+                for _ in range(200):
+                    occupied = rng.getrandbits(64)
+                    self.assertEqual(table.attacks(square, occupied), ray_attacks(square, occupied, directions))
+                    self.assertEqual(table.attacks(square, occupied & mask), table.attacks(square, occupied))
+
+    def test_occupancy(self):
+        """Test the occupancy bitboard of the starting position."""
+        self.assertEqual(occupancy(ChessBoard().board), 0xFFFF00000000FFFF)
+
+    def test_table_file_round_trip(self):
+        """Test tables survive writing and reading."""
+        rook, bishop = load_tables()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'tables.bin.gz')
+            write_tables(path, rook, bishop)
+            loaded_rook, loaded_bishop = read_tables(path)
+        self.assertEqual(loaded_rook.magics, rook.magics)
+        self.assertEqual(list(loaded_bishop.table), list(bishop.table))
+
+    def test_rejects_other_files(self):
+        """Test a file that is not a table file raises ValueError."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'other.bin.gz')
+            with open(path, 'wb') as handle:
+                handle.write(b'not gzip')
+            with self.assertRaises(ValueError):
+                read_tables(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import json
+import sys
+import os
+import io
+from contextlib import redirect_stdout
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from game.game_session import GameSession
+from notation.archive import random_games
+from utils.memory import (
+    MOVE_BUDGET, SESSION_BUDGET, check_budget, main, measure, memory_report, move_footprint, move_lists,
+    validation_allocations,
+)
+
+
+class TestFootprints(unittest.TestCase):
+    """Test per-object memory measurements."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.games = move_lists(random_games(5, max_plies=40))
+
+    def test_measure_counts_retained_objects(self):
+        """Test a factory of fixed-size objects is measured per object."""
+        footprint = measure('buffer', lambda: bytearray(10000), 20)
+        self.assertGreaterEqual(footprint.bytes, 10000)
+        self.assertLess(footprint.bytes, 10200)
+        self.assertAlmostEqual(footprint.blocks, 2, delta=0.2)  # object and buffer
+
+    def test_session_within_budget(self):
+        """Test a fresh GameSession stays under the per-session budget."""
+        footprint = measure('GameSession', GameSession, 50)
+        board = measure('ChessBoard', ChessBoard, 50)
+        self.assertGreater(footprint.bytes, board.bytes)
+        self.assertLessEqual(footprint.bytes, SESSION_BUDGET)
+
+    def test_stored_move_within_budget(self):
+        """Test each played move adds less than the per-move budget."""
+        footprint = move_footprint(self.games)
+        self.assertEqual(footprint.count, sum(len(moves) for moves in self.games))
+        self.assertGreater(footprint.bytes, 0)
+        self.assertLessEqual(footprint.bytes, MOVE_BUDGET)
+
+    def test_legal_validation_allocates_nothing(self):
+        """Test validating legal moves hands no new objects to the caller."""
+        hot = validation_allocations(self.games, illegal=0)
+        self.assertEqual(hot.legal, hot.calls)
+        self.assertEqual(hot.blocks_per_call, 0)
+        self.assertEqual(hot.sites, [])
+
+    def test_error_messages_are_the_allocations(self):
+        """Test retained blocks come from formatted error messages only."""
+        hot = validation_allocations(self.games, illegal=3)
+        self.assertLess(hot.legal, hot.calls)
+        self.assertGreater(hot.blocks_per_call, 0)
+        self.assertLessEqual(hot.blocks_per_call, 2)
+        for site, blocks, size in hot.sites:
+            self.assertIn('chess_board.py', site)
+
+
+class TestReport(unittest.TestCase):
+    """Test the report and budget check."""
+
+    def test_budget_check(self):
+        """Test the budget check passes now and names what is over budget."""
+        report = memory_report(count=20, games=3)
+        self.assertEqual(check_budget(report), [])
+        problems = check_budget(report, session_budget=100, move_budget=1)
+        self.assertEqual(len(problems), 2)
+        self.assertIn('GameSession', problems[0])
+
+    def test_json_output(self):
+        """Test the command line prints every footprint as JSON."""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            status = main(['--count', '10', '--games', '2', '--json', '--check'])
+        self.assertEqual(status, 0)
+        report = json.loads(out.getvalue())
+        self.assertEqual(set(report['footprints']), {'ChessBoard', 'GameState', 'GameSession', 'stored move'})
+        self.assertIn('peak_bytes', report['validate_move'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+import json
+import os
+import sys
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from game.game_session import GameSession
+from notation.archive import ArchiveGame, random_games, replay_game
+from notation.move_codec import (
+    CUMULATIVE, MAX_MOVES, RANK_FREQUENCIES, RangeDecoder, RangeEncoder, decode_history, decode_moves,
+    encode_history, encode_moves, fit_rank_table, move_ranks,
+)
+
+
+class TestRangeCoder(unittest.TestCase):
+    """Test the range coder on its own."""
+
+    def test_round_trip(self):
+        """Test mixed alphabets, skewed frequencies and carries decode exactly."""
+        symbols = [(index * 7919) % 251 for index in range(3000)]
+        encoder = RangeEncoder()
+        for symbol in symbols:
+            encoder.encode(symbol, 1, 251)
+        for _ in range(500):
+            encoder.encode(0, 65000, 65535)
+        data = encoder.finish()
+        decoder = RangeDecoder(data)
+        decoded = []
+        for _ in symbols:
+            value = decoder.decode(251)
+            decoder.consume(value, 1)
+            decoded.append(value)
+        self.assertEqual(decoded, symbols)
+        for _ in range(500):
+            self.assertLess(decoder.decode(65535), 65000)
+            decoder.consume(0, 65000)
+        self.assertLess(len(data), 3000)
+
+
+class TestMoveCodec(unittest.TestCase):
+    """Test the compact game encoding."""
+
+    def test_history_round_trip(self):
+        """Test move histories survive encoding, including finished games."""
+        for game in random_games(20, seed=11):
+            session, complete = replay_game(game)
+            self.assertTrue(complete)
+            data = encode_history(session.move_history)
+            self.assertEqual(decode_history(data), session.move_history)
+            self.assertLess(len(data), len(json.dumps(session.move_history)) / 50)
+
+    def test_empty_game(self):
+        """Test a game without moves."""
+        self.assertEqual(encode_moves([]), b'\x00')
+        self.assertEqual(decode_moves(b'\x00'), [])
+
+    def test_rejects_illegal_move(self):
+        """Test an illegal move cannot be encoded."""
+        with self.assertRaises(ValueError):
+            encode_moves([((1, 4), (4, 4))])
+
+    def test_rejects_move_after_game_end(self):
+        """Test no move can follow a king capture."""
+        game = next(game for game in random_games(10, seed=4) if game.result != '*')
+        session, _ = replay_game(game)
+        moves = [(move['start'], move['end']) for move in session.move_history]
+        with self.assertRaises(ValueError):
+            encode_moves(moves + [moves[0]])
+        data = bytearray(encode_moves(moves))
+        data[0] += 1
+        with self.assertRaises(ValueError):
+            decode_moves(bytes(data))
+
+    def test_truncated_count(self):
+        """Test a cut-off ply count raises ValueError."""
+        with self.assertRaises(ValueError):
+            decode_moves(b'\x80')
+
+    def test_session_moves(self):
+        """Test moves played through a session encode as the same game."""
+        session = GameSession()
+        for text in ('e7 e5', 'd2 d4', 'e5 d4'):
+            self.assertTrue(session.submit_text(text).ok)
+        moves = [(move['start'], move['end']) for move in session.move_history]
+        self.assertEqual(decode_moves(encode_moves(moves)), moves)
+
+
+class TestRankModel(unittest.TestCase):
+    """Test move ranking and the rank frequency table."""
+
+    def test_captures_rank_first(self):
+        """Test the only capture in a position gets rank 0."""
+        session, _ = replay_game(ArchiveGame(['e2e4', 'd7d5', 'e4d5', 'd8d5'], '*', {}))
+        moves = [(move['start'], move['end']) for move in session.move_history]
+        ranks = move_ranks(moves)
+        self.assertEqual([rank for rank, _ in ranks[2:]], [0, 0])
+        self.assertEqual(ranks[0][1], 20)
+
+    def test_table_is_decreasing(self):
+        """Test the shipped table covers every rank, decreases and fits the coder."""
+        self.assertEqual(len(RANK_FREQUENCIES), MAX_MOVES)
+        self.assertEqual(RANK_FREQUENCIES, sorted(RANK_FREQUENCIES, reverse=True))
+        self.assertGreaterEqual(min(RANK_FREQUENCIES), 1)
+        self.assertLessEqual(CUMULATIVE[-1], 1 << 16)
+
+    def test_fit_prefers_played_ranks(self):
+        """Test a fit on skewed ranks is decreasing and favours rank 0."""
+        ranks = [(0, 20)] * 60 + [(1, 20)] * 30 + [(rank, 30) for rank in range(30)]
+        runs = fit_rank_table(ranks)
+        frequencies = [frequency for frequency, count in runs for _ in range(count)]
+        self.assertEqual(len(frequencies), MAX_MOVES)
+        self.assertEqual(frequencies, sorted(frequencies, reverse=True))
+        self.assertGreater(frequencies[0], 2 * frequencies[2])
+        self.assertLessEqual(sum(frequencies), 1 << 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
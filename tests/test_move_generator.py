@@ -0,0 +1,123 @@
+import unittest
+import random
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from board.zobrist import position_hash, move_hash_delta, BLACK_TO_MOVE_KEY
+from moves.move_generator import generate_moves, encode_move, decode_move, mask_to_squares, squares_to_mask
+from pieces.piece_codes import BLACK, COLOR_NAMES, PAWN, WHITE
+
+ALL_SQUARES = [(row, col) for row in range(8) for col in range(8)]
+
+
+def validated_moves(board, color):
+    """Brute-force every square pair through validate_move."""
+    return sorted(
+        (start, end) for start in ALL_SQUARES for end in ALL_SQUARES
+        if board.validate_move(start, end, color)[0]
+    )
+
+
+class TestMoveGenerator(unittest.TestCase):
+    """Test generated moves match validate_move."""
+
+    def test_initial_position(self):
+        """Test the 20 opening moves for each side."""
+        board = ChessBoard()
+        for side in (WHITE, BLACK):
+            moves = generate_moves(board.board, side)
+            self.assertEqual(len(moves), 20)
+            self.assertEqual(sorted(moves), validated_moves(board, COLOR_NAMES[side]))
+
+    def test_random_games_match_validation(self):
+        """Test parity with validate_move along random games."""
+        rng = random.Random(7)
+        for _ in range(3):
+            board = ChessBoard()
+            side = WHITE
+            for _ in range(40):
+                moves = generate_moves(board.board, side)
+                self.assertEqual(sorted(moves), validated_moves(board, COLOR_NAMES[side]))
+                if not moves:
+                    break
+                board.move_piece(*rng.choice(moves))
+                if board.is_king_captured('black') or board.is_king_captured('white'):
+                    break
+                side ^= 1
+
+    def test_move_encoding_round_trip(self):
+        """Test 12-bit move packing."""
+        for start in ((0, 0), (1, 4), (7, 7)):
+            for end in ((0, 1), (3, 4), (7, 0)):
+                self.assertEqual(decode_move(encode_move(start, end)), (start, end))
+
+
+class TestTargets(unittest.TestCase):
+    """Test per-piece target lookups."""
+
+    def test_targets_match_validation(self):
+        """Test targets_from agrees with validate_move for every piece along random games."""
+        rng = random.Random(5)
+        board = ChessBoard()
+        side = WHITE
+        for _ in range(30):
+            color = COLOR_NAMES[side]
+            targets = board.all_targets(color)
+            masks = board.all_targets(side, as_mask=True)
+            for start, ends in targets.items():
+                expected = [end for end in ALL_SQUARES if board.validate_move(start, end, color)[0]]
+                self.assertEqual(sorted(ends), expected)
+                self.assertEqual(board.targets_from(start), ends)
+                self.assertEqual(mask_to_squares(masks[start]), expected)
+            moves = generate_moves(board.board, side)
+            self.assertEqual(sum(len(ends) for ends in targets.values()), len(moves))
+            board.move_piece(*rng.choice(moves))
+            if board.is_king_captured(side ^ 1):
+                break
+            side ^= 1
+
+    def test_initial_position(self):
+        """Test the opening targets of a knight and of a blocked rook."""
+        board = ChessBoard()
+        self.assertEqual(sorted(board.targets_from((0, 1))), [(2, 0), (2, 2)])
+        self.assertEqual(board.targets_from((0, 0)), [])
+        self.assertEqual(board.targets_from((0, 1), as_mask=True), (1 << 16) | (1 << 18))
+        self.assertEqual(len(board.all_targets('white')), 16)
+
+    def test_empty_and_invalid_squares(self):
+        """Test squares without a piece have no targets."""
+        board = ChessBoard()
+        self.assertEqual(board.targets_from((4, 4)), [])
+        self.assertEqual(board.targets_from((8, 0)), [])
+        self.assertEqual(board.targets_from((8, 0), as_mask=True), 0)
+
+    def test_mask_round_trip(self):
+        """Test square lists survive packing into a mask."""
+        squares = [(0, 0), (3, 5), (7, 7)]
+        self.assertEqual(mask_to_squares(squares_to_mask(squares)), squares)
+        self.assertEqual(squares_to_mask([(7, 7)]), 1 << 63)
+
+
+class TestZobrist(unittest.TestCase):
+    """Test position hashing."""
+
+    def test_side_to_move_changes_hash(self):
+        """Test the same placement hashes differently per side."""
+        board = ChessBoard()
+        self.assertNotEqual(position_hash(board.board, WHITE), position_hash(board.board, BLACK))
+
+    def test_incremental_update(self):
+        """Test move_hash_delta matches a full rehash."""
+        board = ChessBoard()
+        key = position_hash(board.board, WHITE)
+        key ^= move_hash_delta(PAWN, (1, 4), (3, 4)) ^ BLACK_TO_MOVE_KEY
+        board.move_piece((1, 4), (3, 4))
+        self.assertEqual(key, position_hash(board.board, BLACK))
+
+
+if __name__ == '__main__':
+    unittest.main()
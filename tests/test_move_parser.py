@@ -0,0 +1,86 @@
+import unittest
+import io
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from input.input_handler import InputHandler
+from notation.move_parser import CONSOLE_SQUARES, parse_move, parse_moves
+from notation.san import PGN_SQUARES
+from pieces.piece_codes import BLACK, WHITE
+from utils.position import algebraic_to_index, index_to_algebraic
+
+
+class TestParseMove(unittest.TestCase):
+    """Test the single-pass move parser."""
+
+    def test_square_table_matches_position_utils(self):
+        """Test the precomputed table agrees with algebraic_to_index."""
+        self.assertEqual(len(CONSOLE_SQUARES), 64)
+        for name, position in CONSOLE_SQUARES.items():
+            self.assertEqual(algebraic_to_index(name), position)
+
+    def test_coordinate_formats(self):
+        """Test every separator style gives the same move."""
+        expected = ((6, 4), (4, 4))
+        for text in ('e2 e4', 'e2,e4', 'E2 E4', ' e2  e4\n', 'e2 , e4', 'e2-e4', 'e2e4'):
+            self.assertEqual(parse_move(text), expected, text)
+
+    def test_numeric_formats(self):
+        """Test row,col pairs."""
+        for text in ('1,3 2,3', '1,3,2,3', '1,3, 2,3'):
+            self.assertEqual(parse_move(text), ((1, 3), (2, 3)), text)
+
+    def test_invalid_input(self):
+        """Test malformed and off-board moves are rejected."""
+        for text in ('', 'e2', 'e9 e4', 'i2 e4', '8,0 1,1', '1,3', 'e2 e4 e5', 'quit'):
+            self.assertEqual(parse_move(text), (None, None), text)
+
+    def test_all_square_pairs(self):
+        """Test parity with the position utilities for every square pair."""
+        names = [index_to_algebraic(row, col) for row in range(8) for col in range(8)]
+        for start in names:
+            for end in names:
+                self.assertEqual(parse_move(f"{start} {end}"),
+                                 (algebraic_to_index(start), algebraic_to_index(end)))
+
+    def test_san_needs_board(self):
+        """Test SAN resolves only against a position."""
+        board = ChessBoard().board
+        self.assertEqual(parse_move('Nf3'), (None, None))
+        self.assertEqual(parse_move('Nf3', board, WHITE, PGN_SQUARES), ((0, 6), (2, 5)))
+        self.assertEqual(parse_move('e5', board, BLACK, PGN_SQUARES), ((6, 4), (4, 4)))
+        # Console labels put White's back rank on rank 8
+        self.assertEqual(parse_move('Nf6', board, WHITE), ((0, 6), (2, 5)))
+
+    def test_input_handler_delegates(self):
+        """Test InputHandler.parse_move uses the same parser."""
+        self.assertEqual(InputHandler.parse_move('e2 e4'), ((6, 4), (4, 4)))
+        self.assertEqual(InputHandler.parse_move('Nf6', ChessBoard().board, WHITE), ((0, 6), (2, 5)))
+
+
+class TestParseMoves(unittest.TestCase):
+    """Test bulk parsing of move streams."""
+
+    def test_stream_of_coordinates(self):
+        """Test a log is parsed lazily, skipping blank lines."""
+        log = io.StringIO("1,3 3,3\n\n6,3,4,3\nbad\n")
+        moves = parse_moves(log)
+        self.assertEqual(next(moves), ((1, 3), (3, 3)))
+        self.assertEqual(list(moves), [((6, 3), (4, 3)), (None, None)])
+
+    def test_san_stream_follows_the_position(self):
+        """Test SAN moves resolve as the game advances."""
+        board = ChessBoard()
+        moves = list(parse_moves(['e4', 'e5', 'Nf3', 'Nc6', 'Bb5'], board.board, WHITE, PGN_SQUARES))
+        self.assertEqual(moves[2], ((0, 6), (2, 5)))
+        self.assertEqual(moves[3], ((7, 1), (5, 2)))
+        self.assertEqual(moves[4], ((0, 5), (4, 1)))
+        self.assertEqual(board.get_piece((1, 4)), 'P')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -67,7 +67,7 @@ class TestMoveValidator(unittest.TestCase):
         end = (1, 5)    # f2 (sideways)
         
         # First clear the destination
-        self.board.board[1][5] = None
+        self.board.set_piece((1, 5), None)
         
         is_valid, error = self.board.validate_move(start, end, 'white')
         self.assertFalse(is_valid)
@@ -84,8 +84,8 @@ class TestMoveValidator(unittest.TestCase):
     def test_valid_capture(self):
         """Test valid capture move."""
         # Move white pawn to position where it can capture
-        self.board.board[2][4] = 'P'  # White pawn at row 2, col 4
-        self.board.board[3][5] = 'p'  # Black pawn at row 3, col 5
+        self.board.set_piece((2, 4), 'P')  # White pawn at row 2, col 4
+        self.board.set_piece((3, 5), 'p')  # Black pawn at row 3, col 5
         
         start = (2, 4)
         end = (3, 5)
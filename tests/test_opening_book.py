@@ -0,0 +1,113 @@
+import unittest
+import io
+import tempfile
+import random
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from book.book_builder import build_book
+from book.opening_book import OpeningBook, RECORD_SIZE
+from notation.pgn import read_games, replay
+from notation.san import san_to_move, move_to_san
+from pieces.piece_codes import BLACK, WHITE
+
+SAMPLE_PGN = """[Event "Sample 1"]
+[Result "1-0"]
+
+1. e4 e5 2. Nf3 {main line} Nc6 3. Bb5 (3. Bc4 Bc5) a6 1-0
+
+[Event "Sample 2"]
+[Result "0-1"]
+
+1. e4 e5 2. Nf3 d6 $1 3. d4 exd4 0-1
+
+[Event "Sample 3"]
+[Result "*"]
+
+1. d4 d5 2. c4 *
+"""
+
+
+class TestPgn(unittest.TestCase):
+    """Test PGN reading and SAN resolution."""
+
+    def test_read_games(self):
+        """Test tags, movetext cleanup and results."""
+        games = list(read_games(io.StringIO(SAMPLE_PGN)))
+        self.assertEqual(len(games), 3)
+        self.assertEqual(games[0].tags['Event'], 'Sample 1')
+        self.assertEqual(games[0].moves, ['e4', 'e5', 'Nf3', 'Nc6', 'Bb5', 'a6'])
+        self.assertEqual(games[1].moves[-1], 'exd4')
+        self.assertEqual(games[2].result, '*')
+
+    def test_san_resolution(self):
+        """Test SAN maps onto board coordinates (White on rows 0-1)."""
+        board = ChessBoard()
+        self.assertEqual(san_to_move(board.board, WHITE, 'e4'), ((1, 4), (3, 4)))
+        self.assertEqual(san_to_move(board.board, WHITE, 'Nf3'), ((0, 6), (2, 5)))
+        self.assertEqual(san_to_move(board.board, BLACK, 'Nc6'), ((7, 1), (5, 2)))
+        self.assertIsNone(san_to_move(board.board, WHITE, 'O-O'))
+        self.assertIsNone(san_to_move(board.board, WHITE, 'Ke2'))
+
+    def test_replay_and_san_round_trip(self):
+        """Test every replayed move formats back to its SAN."""
+        game = next(read_games(io.StringIO(SAMPLE_PGN)))
+        replayed = [
+            move_to_san(board.board, side, move)
+            for board, side, move in replay(game.moves)
+        ]
+        self.assertEqual(replayed, game.moves)
+
+
+class TestOpeningBook(unittest.TestCase):
+    """Test building and probing an opening book."""
+
+    def setUp(self):
+        """Build a book from the sample games."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'book.bin')
+        self.records, self.games = build_book([io.StringIO(SAMPLE_PGN)], self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_file_layout(self):
+        """Test the book is a flat array of fixed-size records."""
+        self.assertEqual(self.games, 3)
+        self.assertEqual(os.path.getsize(self.path), self.records * RECORD_SIZE)
+
+    def test_probe_initial_position(self):
+        """Test weights reflect how often each move was played."""
+        board = ChessBoard()
+        with OpeningBook(self.path) as book:
+            self.assertEqual(len(book), self.records)
+            entries = book.probe(board.board, WHITE)
+        self.assertEqual(entries[0], (((1, 4), (3, 4)), 2))
+        self.assertEqual(entries[1], (((1, 3), (3, 3)), 1))
+
+    def test_probe_after_moves(self):
+        """Test lookups after replaying into the book."""
+        board = ChessBoard()
+        board.move_piece((1, 4), (3, 4))
+        board.move_piece((6, 4), (4, 4))
+        with OpeningBook(self.path) as book:
+            self.assertEqual(book.probe(board.board, WHITE), [(((0, 6), (2, 5)), 2)])
+            self.assertEqual(book.choose_move(board.board, WHITE, random.Random(1)), ((0, 6), (2, 5)))
+            board.move_piece((0, 6), (2, 5))
+            self.assertEqual(len(book.probe(board.board, BLACK)), 2)
+            self.assertIsNone(book.choose_move(board.board, WHITE))
+
+    def test_empty_book(self):
+        """Test an empty file is a valid, empty book."""
+        empty = os.path.join(self.directory.name, 'empty.bin')
+        open(empty, 'wb').close()
+        with OpeningBook(empty) as book:
+            self.assertEqual(book.probe(ChessBoard().board, WHITE), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
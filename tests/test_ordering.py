@@ -0,0 +1,108 @@
+import unittest
+import os
+import sys
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from engine.search import Searcher
+from moves.move_generator import generate_moves
+from moves.ordering import (
+    CAPTURE_SCORE, COUNTER_SCORE, HISTORY_MAX, TABLE_MOVE_SCORE, MoveOrdering, move_index,
+)
+from pieces.piece_codes import BLACK, WHITE, code_of
+
+
+def place(pieces):
+    """An otherwise empty board with pieces given as {(row, col): symbol}."""
+    board = [[0] * 8 for _ in range(8)]
+    for (row, col), symbol in pieces.items():
+        board[row][col] = code_of(symbol)
+    return board
+
+
+class TestMoveOrdering(unittest.TestCase):
+    """Test history, counter-move and capture ordering."""
+
+    def setUp(self):
+        self.ordering = MoveOrdering()
+        self.board = ChessBoard().board
+
+    def test_score_bands(self):
+        """Test table move, captures, counter move and history are ranked in that order."""
+        board = place({(3, 3): 'Q', (4, 4): 'p', (4, 3): 'r', (2, 3): 'P', (0, 4): 'K', (7, 4): 'k'})
+        moves = generate_moves(board, WHITE)
+        quiet = [move for move in moves if board[move[1][0]][move[1][1]] == 0]
+        previous = move_index(board[4][3], (4, 3))
+        self.ordering.record_cutoff(board, quiet[1], 3, previous)
+        scores = dict(zip(moves, self.ordering.score_moves(board, moves, quiet[0], previous)))
+        self.assertEqual(scores[quiet[0]], TABLE_MOVE_SCORE)
+        self.assertEqual(scores[quiet[1]], COUNTER_SCORE)
+        self.assertGreater(scores[((3, 3), (4, 3))], scores[((3, 3), (4, 4))])
+        self.assertGreater(scores[((3, 3), (4, 4))], CAPTURE_SCORE)
+        self.assertTrue(all(scores[move] < COUNTER_SCORE for move in quiet[2:]))
+
+    def test_mvv_lva(self):
+        """Test a pawn taking a piece comes before a queen taking the same piece."""
+        board = place({(2, 3): 'P', (3, 2): 'Q', (3, 4): 'n', (0, 4): 'K', (7, 4): 'k'})
+        captures = [((2, 3), (3, 4)), ((3, 2), (3, 4))]
+        self.assertEqual(list(self.ordering.ordered(board, captures[::-1])), captures)
+
+    def test_ordered_is_lazy_and_complete(self):
+        """Test moves come best-first, ties keep their order, and nothing is lost."""
+        moves = generate_moves(self.board, WHITE)
+        self.ordering.record_cutoff(self.board, moves[7], 4)
+        ordered = self.ordering.ordered(self.board, moves)
+        self.assertEqual(next(ordered), moves[7])
+        rest = list(ordered)
+        self.assertEqual(rest, [move for move in moves if move != moves[7]][:len(rest)])
+        self.assertEqual(sorted(rest + [moves[7]]), sorted(moves))
+
+    def test_record_cutoff(self):
+        """Test the cutoff move gains, tried moves lose and the counter move is stored."""
+        moves = generate_moves(self.board, WHITE)
+        previous = move_index(self.board[6][4], (4, 4))
+        self.ordering.record_cutoff(self.board, moves[3], 3, previous, tried=moves[:3])
+        history = self.ordering.history
+        index = move_index(self.board[moves[3][0][0]][moves[3][0][1]], moves[3][1])
+        self.assertEqual(history[index], 9)
+        for start, end in moves[:3]:
+            self.assertEqual(history[move_index(self.board[start[0]][start[1]], end)], -9)
+        self.assertEqual(self.ordering.counter_move(previous), moves[3])
+
+    def test_captures_are_not_recorded(self):
+        """Test captures leave the tables alone."""
+        board = place({(3, 3): 'Q', (4, 4): 'p', (0, 4): 'K', (7, 4): 'k'})
+        self.ordering.record_cutoff(board, ((3, 3), (4, 4)), 5, previous=0)
+        self.assertFalse(any(self.ordering.history))
+        self.assertIsNone(self.ordering.counter_move(0))
+
+    def test_history_is_bounded_and_ages(self):
+        """Test repeated rewards saturate below HISTORY_MAX and age() halves them."""
+        move = ((1, 4), (3, 4))
+        index = move_index(self.board[1][4], (3, 4))
+        for _ in range(2000):
+            self.ordering.record_cutoff(self.board, move, 20)
+        value = self.ordering.history[index]
+        self.assertLessEqual(value, HISTORY_MAX)
+        self.assertGreater(value, HISTORY_MAX // 2)
+        self.ordering.age()
+        self.assertEqual(self.ordering.history[index], value >> 1)
+        self.ordering.clear()
+        self.assertFalse(any(self.ordering.history))
+
+    def test_search_scores_unchanged(self):
+        """Test the ordering changes the work, not the search result."""
+        for side, opening in ((WHITE, ()), (BLACK, (((1, 4), (3, 4)),))):
+            board = ChessBoard()
+            for move in opening:
+                board.move_piece(*move)
+            plain = Searcher(ordering=MoveOrdering(history=False, counters=False))
+            full = Searcher()
+            self.assertEqual(plain.search([row[:] for row in board.board], side, 3).score,
+                             full.search([row[:] for row in board.board], side, 3).score)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from board.zobrist import position_hash
+from engine.evaluation import evaluate
+from moves.move_generator import generate_moves
+from pieces.piece_codes import (
+    BLACK, BLACK_BIT, COLOR_SHIFT, EMPTY, KING, PAWN, WHITE,
+    code_of, make_code, side_of, symbol_of,
+)
+
+
+class TestPieceCodes(unittest.TestCase):
+    """Test the integer piece encoding."""
+
+    def test_symbol_round_trip(self):
+        """Test every symbol maps to a code and back."""
+        for symbol in 'PNBRQKpnbrqk':
+            self.assertEqual(symbol_of(code_of(symbol)), symbol)
+        self.assertEqual(code_of(None), EMPTY)
+        self.assertIsNone(symbol_of(EMPTY))
+
+    def test_color_bit(self):
+        """Test the side is stored in the color bit."""
+        self.assertEqual(code_of('K'), KING)
+        self.assertEqual(code_of('p'), PAWN | BLACK_BIT)
+        self.assertEqual(make_code(BLACK, KING) >> COLOR_SHIFT, BLACK)
+        self.assertEqual(make_code(WHITE, PAWN) >> COLOR_SHIFT, WHITE)
+
+    def test_side_of(self):
+        """Test color names and numeric sides are both accepted."""
+        self.assertEqual(side_of('white'), WHITE)
+        self.assertEqual(side_of('black'), BLACK)
+        self.assertEqual(side_of(BLACK), BLACK)
+
+    def test_side_of_rejects_unknown_sides(self):
+        """Test anything but a color name or 0/1 raises ValueError."""
+        for color in ('White', 'red', '', 2, -1, None):
+            with self.assertRaises(ValueError):
+                side_of(color)
+
+
+class TestBoardEdges(unittest.TestCase):
+    """Test symbols only appear at the board's API edges."""
+
+    def test_board_stores_codes(self):
+        """Test squares hold integers while get_piece returns symbols."""
+        board = ChessBoard()
+        self.assertEqual(board.get_code((0, 4)), KING)
+        self.assertEqual(board.get_piece((0, 4)), 'K')
+        self.assertEqual(board.get_piece((7, 4)), 'k')
+        self.assertIsNone(board.get_piece((4, 4)))
+
+    def test_set_piece_and_clear(self):
+        """Test placing pieces by symbol."""
+        board = ChessBoard()
+        board.clear()
+        self.assertTrue(board.is_king_captured('white'))
+        board.set_piece((0, 4), 'K')
+        self.assertFalse(board.is_king_captured(WHITE))
+        board.set_piece((0, 4), None)
+        self.assertEqual(board.get_code((0, 4)), EMPTY)
+
+    def test_validate_move_accepts_numeric_side(self):
+        """Test validate_move takes a side number or a color name."""
+        board = ChessBoard()
+        self.assertEqual(board.validate_move((1, 4), (3, 4), WHITE), (True, ""))
+        self.assertEqual(board.validate_move((1, 4), (3, 4), 'white'), (True, ""))
+        self.assertFalse(board.validate_move((1, 4), (3, 4), BLACK)[0])
+
+    def test_validate_move_rejects_unknown_side(self):
+        """Test a misspelled color raises ValueError instead of failing later."""
+        with self.assertRaises(ValueError):
+            ChessBoard().validate_move((1, 4), (3, 4), 'White')
+
+    def test_entry_points_accept_color_names(self):
+        """Test color names give the same results as numeric sides."""
+        board = ChessBoard()
+        board.move_piece((1, 4), (3, 4))
+        grid = board.board
+        for name, side in (('white', WHITE), ('black', BLACK)):
+            self.assertEqual(generate_moves(grid, name), generate_moves(grid, side))
+            self.assertEqual(position_hash(grid, name), position_hash(grid, side))
+            self.assertEqual(evaluate(grid, name), evaluate(grid, side))
+        self.assertEqual(len(generate_moves(grid, 'white')), 30)
+        self.assertNotEqual(position_hash(grid, 'white'), position_hash(grid, 'black'))
+        self.assertEqual(evaluate(grid, 'white'), -evaluate(grid, 'black'))
+        with self.assertRaises(ValueError):
+            generate_moves(grid, 'White')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,12 +21,12 @@ class TestPieceMoves(unittest.TestCase):
         """Set up empty board for each test."""
         self.board = ChessBoard()
         # Clear the board
-        self.board.board = [[None for _ in range(8)] for _ in range(8)]
+        self.board.clear()
     
     def test_pawn_forward_one_square(self):
         """Test pawn moving forward one square."""
         pawn = Pawn('white')
-        self.board.board[1][4] = 'P'  # White pawn at row 1 (real board position)
+        self.board.set_piece((1, 4), 'P')  # White pawn at row 1 (real board position)
         
         # Valid move: row 1 to row 2
         self.assertTrue(pawn.is_valid_move((1, 4), (2, 4), self.board.board))
@@ -37,44 +37,44 @@ class TestPieceMoves(unittest.TestCase):
     def test_pawn_forward_two_squares_from_start(self):
         """Test pawn moving forward two squares from starting position."""
         pawn = Pawn('white')
-        self.board.board[1][4] = 'P'  # White pawn at starting position (row 1)
+        self.board.set_piece((1, 4), 'P')  # White pawn at starting position (row 1)
         
         # Valid move: two squares forward from start
         self.assertTrue(pawn.is_valid_move((1, 4), (3, 4), self.board.board))
         
         # Invalid if piece in the way
-        self.board.board[2][4] = 'p'
+        self.board.set_piece((2, 4), 'p')
         self.assertFalse(pawn.is_valid_move((1, 4), (3, 4), self.board.board))
     
     def test_pawn_capture_diagonally(self):
         """Test pawn capturing diagonally."""
         pawn = Pawn('white')
-        self.board.board[1][4] = 'P'  # White pawn at row 1
-        self.board.board[2][5] = 'p'  # Black pawn at row 2, col 5
+        self.board.set_piece((1, 4), 'P')  # White pawn at row 1
+        self.board.set_piece((2, 5), 'p')  # Black pawn at row 2, col 5
         
         # Valid diagonal capture
         self.assertTrue(pawn.is_valid_move((1, 4), (2, 5), self.board.board))
         
         # Invalid diagonal move without capture
-        self.board.board[2][5] = None
+        self.board.set_piece((2, 5), None)
         self.assertFalse(pawn.is_valid_move((1, 4), (2, 5), self.board.board))
     
     def test_rook_horizontal_movement(self):
         """Test rook moving horizontally."""
         rook = Rook('white')
-        self.board.board[0][0] = 'R'  # White rook at a1
+        self.board.set_piece((0, 0), 'R')  # White rook at a1
         
         # Valid horizontal move
         self.assertTrue(rook.is_valid_move((0, 0), (0, 5), self.board.board))
         
         # Invalid if piece blocking
-        self.board.board[0][3] = 'P'
+        self.board.set_piece((0, 3), 'P')
         self.assertFalse(rook.is_valid_move((0, 0), (0, 5), self.board.board))
     
     def test_rook_vertical_movement(self):
         """Test rook moving vertically."""
         rook = Rook('white')
-        self.board.board[0][0] = 'R'  # White rook at a1
+        self.board.set_piece((0, 0), 'R')  # White rook at a1
         
         # Valid vertical move
         self.assertTrue(rook.is_valid_move((0, 0), (5, 0), self.board.board))
@@ -85,7 +85,7 @@ class TestPieceMoves(unittest.TestCase):
     def test_knight_l_shape_movement(self):
         """Test knight moving in L-shape."""
         knight = Knight('white')
-        self.board.board[0][1] = 'N'  # White knight at b1
+        self.board.set_piece((0, 1), 'N')  # White knight at b1
         
         # Valid L-shape moves
         self.assertTrue(knight.is_valid_move((0, 1), (2, 0), self.board.board))  # a3
@@ -98,13 +98,13 @@ class TestPieceMoves(unittest.TestCase):
     def test_bishop_diagonal_movement(self):
         """Test bishop moving diagonally."""
         bishop = Bishop('white')
-        self.board.board[0][2] = 'B'  # White bishop at c1
+        self.board.set_piece((0, 2), 'B')  # White bishop at c1
         
         # Valid diagonal move
         self.assertTrue(bishop.is_valid_move((0, 2), (3, 5), self.board.board))
         
         # Invalid if piece blocking
-        self.board.board[1][3] = 'P'
+        self.board.set_piece((1, 3), 'P')
         self.assertFalse(bishop.is_valid_move((0, 2), (3, 5), self.board.board))
         
         # Invalid non-diagonal move
@@ -113,7 +113,7 @@ class TestPieceMoves(unittest.TestCase):
     def test_queen_combined_movement(self):
         """Test queen moving like rook and bishop."""
         queen = Queen('white')
-        self.board.board[0][3] = 'Q'  # White queen at d1
+        self.board.set_piece((0, 3), 'Q')  # White queen at d1
         
         # Valid horizontal move (like rook)
         self.assertTrue(queen.is_valid_move((0, 3), (0, 7), self.board.board))
@@ -130,7 +130,7 @@ class TestPieceMoves(unittest.TestCase):
     def test_king_one_square_movement(self):
         """Test king moving one square in any direction."""
         king = King('white')
-        self.board.board[0][4] = 'K'  # White king at e1
+        self.board.set_piece((0, 4), 'K')  # White king at e1
         
         # Valid one-square moves
         self.assertTrue(king.is_valid_move((0, 4), (0, 5), self.board.board))  # horizontal
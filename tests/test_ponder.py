@@ -0,0 +1,95 @@
+import unittest
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from unittest import mock
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.board_renderer import BoardRenderer
+from board.chess_board import ChessBoard
+from engine.ponder import PONDER_HIT, PONDER_MISS, Ponderer
+from game.chess_game import ChessGame
+from moves.move_generator import generate_moves
+from pieces.piece_codes import BLACK, WHITE
+
+
+def play(board, move):
+    start, end = move
+    board[end[0]][end[1]] = board[start[0]][start[1]]
+    board[start[0]][start[1]] = 0
+
+
+class TestPonder(unittest.TestCase):
+    """Test searching on the opponent's time."""
+
+    def setUp(self):
+        self.engine = Ponderer(time_limit=0.2, max_depth=3)
+        self.board = ChessBoard().board
+        self.result = self.engine.best_move(self.board, WHITE)
+        play(self.board, self.result.move)
+
+    def tearDown(self):
+        self.engine.close()
+
+    def test_ponder_hit_answers_at_once(self):
+        """Test the predicted reply is answered from the finished ponder search."""
+        predicted = self.engine.start_pondering(self.board, WHITE, self.result)
+        self.assertEqual(predicted, self.result.pv[1])
+        self.assertTrue(self.engine.pondering)
+        time.sleep(0.3)
+        play(self.board, predicted)
+        started = time.monotonic()
+        reply = self.engine.best_move(self.board, WHITE)
+        self.assertLess(time.monotonic() - started, 0.1)
+        self.assertEqual(self.engine.last_ponder, PONDER_HIT)
+        self.assertIn(reply.move, generate_moves(self.board, WHITE))
+        self.assertFalse(self.engine.pondering)
+
+    def test_ponder_miss_stops_and_searches(self):
+        """Test an unexpected reply stops pondering and searches the real position."""
+        predicted = self.engine.start_pondering(self.board, WHITE, self.result)
+        other = next(move for move in generate_moves(self.board, BLACK) if move != predicted)
+        play(self.board, other)
+        reply = self.engine.best_move(self.board, WHITE)
+        self.assertEqual(self.engine.last_ponder, PONDER_MISS)
+        self.assertEqual((self.engine.hits, self.engine.misses), (0, 1))
+        self.assertIn(reply.move, generate_moves(self.board, WHITE))
+        self.assertFalse(self.engine.pondering)
+
+    def test_stop_is_prompt(self):
+        """Test a running ponder search stops quickly."""
+        self.engine.start_pondering(self.board, WHITE, self.result)
+        time.sleep(0.05)
+        started = time.monotonic()
+        self.engine.stop()
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertFalse(self.engine.pondering)
+
+    def test_pondering_disabled(self):
+        """Test ponder=False never starts a background search."""
+        engine = Ponderer(time_limit=0.1, max_depth=2, ponder=False)
+        self.assertIsNone(engine.start_pondering(self.board, WHITE, self.result))
+        self.assertFalse(engine.pondering)
+
+
+class TestConsoleEngine(unittest.TestCase):
+    """Test the console game with an engine opponent."""
+
+    def test_engine_replies_to_human(self):
+        """Test the engine answers a human move and pondering stops on quit."""
+        engine = Ponderer(time_limit=0.05, max_depth=2)
+        game = ChessGame(renderer=BoardRenderer('headless'), engine=engine, engine_side=BLACK)
+        with mock.patch('builtins.input', side_effect=['e7 e5', 'quit']), redirect_stdout(io.StringIO()) as out:
+            game.start_game()
+        self.assertEqual(len(game.session.move_history), 2)
+        self.assertEqual(game.session.move_history[1]['player'], 'black')
+        self.assertIn("Black (engine) plays", out.getvalue())
+        self.assertFalse(engine.pondering)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import json
+import os
+import sys
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from game.replay import (
+    calibrate, decode_moves, final_hash, load_corpus, relative_throughput, replay_corpus, replay_moves,
+)
+from notation.archive import read_jsonl
+from pieces.piece_codes import BLACK, WHITE
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+CORPUS_PATH = os.path.join(DATA_DIR, 'replay_corpus.jsonl')
+BASELINE_PATH = os.path.join(DATA_DIR, 'replay_baseline.json')
+
+# The throughput check runs by default; REPLAY_BENCHMARK=0 skips it on hosts
+# too noisy to time anything
+BENCHMARK = os.environ.get('REPLAY_BENCHMARK', '1') != '0'
+# Fraction of the stored relative throughput that may be lost before the
+# regression test fails (lower it to tighten the check)
+TOLERANCE = float(os.environ.get('REPLAY_TOLERANCE', '0.5'))
+
+
+class TestReplay(unittest.TestCase):
+    """Test deterministic replay of the stored corpus."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.corpus = load_corpus(CORPUS_PATH)
+
+    def test_corpus_final_positions(self):
+        """Test every stored game replays in full to its recorded position."""
+        report = replay_corpus(self.corpus)
+        self.assertEqual(report.games, len(self.corpus))
+        self.assertEqual(report.plies, sum(len(moves) for moves, _ in self.corpus))
+        self.assertEqual(report.mismatches, [])
+
+    def test_results_match_final_positions(self):
+        """Test decisive games end with the loser to move and no king."""
+        for game in read_jsonl(CORPUS_PATH):
+            board, side, _ = replay_moves(decode_moves(game.moves))
+            if game.result == '1-0':
+                self.assertEqual(side, WHITE)
+                self.assertTrue(board.is_king_captured('black'))
+            elif game.result == '0-1':
+                self.assertEqual(side, BLACK)
+                self.assertTrue(board.is_king_captured('white'))
+
+    def test_changed_game_is_reported(self):
+        """Test a truncated game no longer matches its recorded hash."""
+        moves, expected = self.corpus[0]
+        self.assertEqual(final_hash(moves), expected)
+        report = replay_corpus([(moves[:-1], expected)])
+        self.assertEqual(report.mismatches, [0])
+
+    def test_replay_stops_at_illegal_move(self):
+        """Test replay stops at the first move validate_move rejects."""
+        moves = decode_moves(['e2e4', 'e7e5', 'e4e5', 'd7d5'])
+        _, side, played = replay_moves(moves)
+        self.assertEqual(played, 2)
+        self.assertEqual(side, WHITE)
+
+    def test_relative_throughput(self):
+        """Test the calibration and relative throughput are positive."""
+        report = replay_corpus(self.corpus)
+        self.assertGreater(relative_throughput(report, calibrate(repeat=1, rounds=100)), 0)
+
+    @unittest.skipUnless(BENCHMARK, "REPLAY_BENCHMARK=0 skips the throughput check")
+    def test_throughput_against_baseline(self):
+        """Test replay throughput relative to the calibration loop has not regressed."""
+        with open(BASELINE_PATH) as handle:
+            baseline = json.load(handle)['relative_throughput']
+        calibration = calibrate()
+        relative = relative_throughput(replay_corpus(self.corpus, repeat=5), calibration)
+        self.assertGreaterEqual(
+            relative, baseline * (1 - TOLERANCE),
+            f"Replay ran at {relative:.3f} plies per calibration round, baseline is {baseline:.3f} "
+            f"(update with benchmarks/bench_replay.py --update-baseline)",
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
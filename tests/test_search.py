@@ -0,0 +1,114 @@
+import unittest
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from engine.evaluation import MATE_SCORE, evaluate
+from engine.parallel_search import parallel_search
+from engine.search import Searcher, search
+from engine.transposition import ENTRY_SIZE, EXACT, LOWER_BOUND, TranspositionTable
+from moves.move_generator import encode_move, generate_moves
+from pieces.piece_codes import WHITE
+
+
+def empty_board():
+    """Return a ChessBoard with no pieces on it."""
+    board = ChessBoard()
+    board.clear()
+    return board
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """Test the lock-free table encoding."""
+
+    def test_store_and_probe(self):
+        """Test entries round-trip, including negative scores."""
+        table = TranspositionTable(entries=64)
+        move = encode_move((1, 4), (3, 4))
+        table.store(12345, move, 6, EXACT, -250)
+        self.assertEqual(table.probe(12345), (move, 6, EXACT, -250))
+        self.assertIsNone(table.probe(12345 + 64))
+
+    def test_shallower_result_does_not_replace(self):
+        """Test a deeper entry for the same key is kept."""
+        table = TranspositionTable(entries=64)
+        table.store(99, 1, 8, EXACT, 10)
+        table.store(99, 2, 3, LOWER_BOUND, 50)
+        self.assertEqual(table.probe(99), (1, 8, EXACT, 10))
+
+    def test_torn_entry_rejected(self):
+        """Test an entry whose check word does not match is ignored."""
+        table = TranspositionTable(entries=64)
+        table.store(7, 1, 4, EXACT, 10)
+        table.buffer[7 * ENTRY_SIZE] ^= 0xFF
+        self.assertIsNone(table.probe(7))
+
+    def test_shared_table(self):
+        """Test a shared-memory backed table behaves like a private one."""
+        table, block = TranspositionTable.create_shared(entries=128)
+        try:
+            table.store(5, 3, 2, EXACT, 42)
+            self.assertEqual(TranspositionTable(128, block.buf).probe(5), (3, 2, EXACT, 42))
+        finally:
+            table.release()
+            block.close()
+            block.unlink()
+
+
+class TestSearch(unittest.TestCase):
+    """Test the alpha-beta search."""
+
+    def test_initial_evaluation_is_balanced(self):
+        """Test the starting position evaluates to zero."""
+        self.assertEqual(evaluate(ChessBoard().board, WHITE), 0)
+
+    def test_captures_king(self):
+        """Test the search takes a hanging king immediately."""
+        board = empty_board()
+        board.set_piece((0, 0), 'K')
+        board.set_piece((3, 3), 'R')
+        board.set_piece((3, 7), 'k')
+        result = search(board, 'white', max_depth=3)
+        self.assertEqual(result.move, ((3, 3), (3, 7)))
+        self.assertEqual(result.score, MATE_SCORE)
+
+    def test_wins_material(self):
+        """Test the search captures an undefended queen."""
+        board = empty_board()
+        board.set_piece((0, 0), 'K')
+        board.set_piece((7, 7), 'k')
+        board.set_piece((2, 2), 'N')
+        board.set_piece((4, 3), 'q')
+        result = search(board, 'white', max_depth=2)
+        self.assertEqual(result.move, ((2, 2), (4, 3)))
+
+    def test_board_restored_and_move_legal(self):
+        """Test the search leaves the board untouched and returns a valid move."""
+        board = ChessBoard()
+        before = [row[:] for row in board.board]
+        grid = [row[:] for row in board.board]
+        result = Searcher().search(grid, WHITE, max_depth=3)
+        self.assertEqual(grid, before)
+        self.assertIn(result.move, generate_moves(board.board, WHITE))
+        self.assertEqual(result.depth, 3)
+        self.assertEqual(result.pv[0], result.move)
+
+
+class TestParallelSearch(unittest.TestCase):
+    """Test the multi-process search."""
+
+    def test_parallel_search_returns_valid_move(self):
+        """Test two workers sharing a table return a valid move within the budget."""
+        board = ChessBoard()
+        result = parallel_search(board, 'white', workers=2, time_limit=1.0, max_depth=3)
+        self.assertIn(result.move, generate_moves(board.board, WHITE))
+        self.assertGreaterEqual(result.depth, 1)
+        self.assertGreater(result.nodes, 0)
+        self.assertLess(result.elapsed, 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
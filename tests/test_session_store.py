@@ -0,0 +1,137 @@
+import unittest
+import threading
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from game.game_session import GameSession
+from notation.fen import START_FEN, board_to_fen, fen_to_board, history_counters
+from pieces.piece_codes import BLACK, WHITE
+from server.session_store import SessionStore, StoreFullError, UnknownGameError
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestFen(unittest.TestCase):
+    """Test FEN formatting and parsing."""
+
+    def test_start_position(self):
+        """Test the initial board formats as the standard start FEN."""
+        self.assertEqual(board_to_fen(ChessBoard().board, WHITE), START_FEN)
+
+    def test_round_trip(self):
+        """Test parsing inverts formatting."""
+        board = ChessBoard()
+        board.move_piece((1, 4), (3, 4))
+        fen = board_to_fen(board.board, BLACK, 0, 1)
+        self.assertEqual(fen, "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b - - 0 1")
+        self.assertEqual(fen_to_board(fen), (board.board, BLACK))
+
+    def test_malformed(self):
+        """Test bad FEN strings are rejected."""
+        for fen in ("", "8/8/8 w", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x", "9/8/8/8/8/8/8/8 w"):
+            with self.assertRaises(ValueError):
+                fen_to_board(fen)
+
+    def test_session_counters(self):
+        """Test the halfmove clock and move number follow the history."""
+        session = GameSession()
+        session.submit_move((0, 6), (2, 5))
+        session.submit_move((7, 6), (5, 5))
+        self.assertEqual(history_counters(session.move_history), (2, 2))
+        self.assertTrue(session.fen().endswith(" w - - 2 2"))
+        session.submit_move((1, 4), (3, 4))
+        self.assertTrue(session.fen().endswith(" b - - 0 2"))
+
+
+class TestSessionStore(unittest.TestCase):
+    """Test the bounded session store."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.store = SessionStore(max_sessions=2, idle_timeout=10.0, clock=self.clock)
+
+    def test_create_and_checkout(self):
+        """Test games are stored by id."""
+        game_id, session = self.store.create()
+        with self.store.checkout(game_id) as checked_out:
+            self.assertIs(checked_out, session)
+        self.assertIn(game_id, self.store)
+        with self.assertRaises(UnknownGameError):
+            with self.store.checkout('missing'):
+                pass
+
+    def test_bounded(self):
+        """Test the store refuses games beyond its size."""
+        self.store.create()
+        self.store.create()
+        with self.assertRaises(StoreFullError):
+            self.store.create()
+
+    def test_clocked_game(self):
+        """Test a time control gives the new game a clock."""
+        _, session = self.store.create('300+2')
+        self.assertEqual(session.game_state.clock.control.increment, 2.0)
+        self.assertIsNone(self.store.create()[1].game_state.clock)
+        for time_control in ('later', 'inf', '1e300', '10+inf', 'nan'):
+            with self.assertRaises(ValueError):
+                self.store.create(time_control)
+
+    def test_idle_eviction(self):
+        """Test idle games make room and recently used ones survive."""
+        old_id, _ = self.store.create()
+        self.clock.now = 5.0
+        busy_id, _ = self.store.create()
+        self.clock.now = 12.0
+        with self.store.checkout(busy_id):
+            pass
+        new_id, _ = self.store.create()
+        self.assertNotIn(old_id, self.store)
+        self.assertIn(busy_id, self.store)
+        self.assertIn(new_id, self.store)
+        self.clock.now = 30.0
+        self.assertEqual(self.store.evict_idle(), 2)
+        self.assertEqual(len(self.store), 0)
+
+    def test_remove(self):
+        """Test games can be deleted."""
+        game_id, _ = self.store.create()
+        self.assertTrue(self.store.remove(game_id))
+        self.assertFalse(self.store.remove(game_id))
+
+    def test_per_game_locking(self):
+        """Test a busy game does not block requests on other games."""
+        first, _ = self.store.create()
+        second, _ = self.store.create()
+        entered = threading.Event()
+        release = threading.Event()
+
+        def hold_first():
+            with self.store.checkout(first):
+                entered.set()
+                release.wait(5)
+
+        worker = threading.Thread(target=hold_first)
+        worker.start()
+        entered.wait(5)
+        try:
+            with self.store.checkout(second) as session:
+                self.assertTrue(session.submit_move((1, 4), (3, 4)).ok)
+        finally:
+            release.set()
+            worker.join()
+
+
+if __name__ == '__main__':
+    unittest.main()
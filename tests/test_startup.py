@@ -0,0 +1,94 @@
+import unittest
+import io
+import subprocess
+import sys
+import os
+
+# Add src directory to path
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, SRC)
+
+import main
+from notation.san import PGN_SQUARES
+
+PROJECT_PACKAGES = {
+    'main', 'analytics', 'board', 'book', 'endgame', 'engine', 'game', 'input', 'moves', 'notation', 'pieces',
+    'server', 'utils',
+}
+
+# Generous budget for the project's own modules (self time, microseconds) so
+# the test catches a heavy import creeping into startup, not machine noise.
+IMPORT_BUDGET_US = 150000
+
+# Optional subsystems a one-shot validation must not load
+OPTIONAL_MODULES = {
+    'argparse', 'cProfile', 'json', 'utils.instrumentation', 'game.chess_game',
+    'input.input_handler', 'board.board_renderer', 'book.opening_book',
+    'endgame.tablebase', 'engine.search', 'server.api', 'server.session_store', 'analytics.pipeline',
+    'analytics.training_data', 'analytics.validation_job', 'analytics.dedup',
+}
+
+
+def import_times(args, stdin=""):
+    """Run Python with -X importtime in src; return (completed process, {module: self us})."""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + args,
+        cwd=SRC, input=stdin, capture_output=True, text=True, timeout=60,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(self_us)
+    return completed, times
+
+
+def project_time(times):
+    """Sum the self time of the project's modules."""
+    return sum(us for name, us in times.items() if name.split('.')[0] in PROJECT_PACKAGES)
+
+
+class TestStartup(unittest.TestCase):
+    """Test startup stays lean."""
+
+    def test_importing_main_loads_no_subsystems(self):
+        """Test `import main` does not import the game modules."""
+        _, times = import_times(['-c', 'import main'])
+        self.assertIn('main', times)
+        loaded = {name for name in times if name.split('.')[0] in PROJECT_PACKAGES}
+        self.assertEqual(loaded, {'main'})
+
+    def test_validate_fast_path(self):
+        """Test the validate command runs within the import budget."""
+        completed, times = import_times(['main.py', 'validate', '--standard'], "e4\ne5\nNf3\n")
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertIn("ok: 3 moves", completed.stdout)
+        self.assertFalse(OPTIONAL_MODULES & set(times), OPTIONAL_MODULES & set(times))
+        self.assertLess(project_time(times), IMPORT_BUDGET_US)
+
+
+class TestValidateCommand(unittest.TestCase):
+    """Test the one-shot move list validation."""
+
+    def test_valid_list(self):
+        """Test a legal move list reports success."""
+        out = io.StringIO()
+        self.assertEqual(main.validate_moves(["e4", "", "e5", "Nf3"], PGN_SQUARES, out), 0)
+        self.assertEqual(out.getvalue(), "ok: 3 moves, result *\n")
+
+    def test_illegal_move(self):
+        """Test the first bad move is reported with its line number."""
+        out = io.StringIO()
+        self.assertEqual(main.validate_moves(["1,4 3,4", "1,3 4,3"], out=out), 1)
+        self.assertTrue(out.getvalue().startswith("line 2: 1,3 4,3: "))
+
+    def test_unparseable_move(self):
+        """Test text that is not a move fails validation."""
+        out = io.StringIO()
+        self.assertEqual(main.validate_moves(["hello"], out=out), 1)
+        self.assertIn("line 1: cannot parse", out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
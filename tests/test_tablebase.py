@@ -0,0 +1,144 @@
+import unittest
+import tempfile
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from board.chess_board import ChessBoard
+from endgame.tablebase import Material, Tablebase, TablebaseResult, canonical_signature, locate
+from endgame.tablebase_generator import generate_table, sub_signatures
+from pieces.piece_codes import BLACK, BLACK_BIT, KING, QUEEN, WHITE
+
+
+def empty_board():
+    """Return a ChessBoard with no pieces on it."""
+    board = ChessBoard()
+    board.clear()
+    return board
+
+
+class TestMaterial(unittest.TestCase):
+    """Test signatures and index arithmetic."""
+
+    def test_canonical_signature(self):
+        """Test the stronger side is stored as White."""
+        self.assertEqual(canonical_signature('KQ', 'K'), ('KQvK', False))
+        self.assertEqual(canonical_signature('K', 'QK'), ('KQvK', True))
+        self.assertEqual(sub_signatures('KQvKR'), ['KQvK', 'KRvK'])
+
+    def test_index_round_trip(self):
+        """Test placement() inverts index()."""
+        material = Material('KQvK')
+        self.assertEqual(material.size, 2 * 64 ** 3)
+        index = material.index((4, 27, 60), 1)
+        self.assertEqual(material.placement(index), ((4, 27, 60), 1))
+
+    def test_locate_mirrors_black_material(self):
+        """Test Black-side material maps onto the mirrored White slot."""
+        white_side = locate([(KING, 4), (QUEEN, 27), (KING | BLACK_BIT, 60)], WHITE)
+        black_side = locate([(KING | BLACK_BIT, 60), (QUEEN | BLACK_BIT, 35), (KING, 4)], BLACK)
+        self.assertEqual(white_side, ('KQvK', Material('KQvK').index((4, 27, 60), 0)))
+        self.assertEqual(black_side, white_side)
+        self.assertIsNone(locate([(KING, 4), (QUEEN, 27)], WHITE))
+
+
+class TestTablebaseGeneration(unittest.TestCase):
+    """Test generating and probing a small table."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Generate the bare-kings table once."""
+        cls.directory = tempfile.TemporaryDirectory()
+        generate_table('KvK', cls.directory.name)
+        cls.tablebase = Tablebase(cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tablebase.close()
+        cls.directory.cleanup()
+
+    def test_adjacent_kings_win_in_one(self):
+        """Test the side to move captures an adjacent king."""
+        board = empty_board()
+        board.set_piece((0, 4), 'K')
+        board.set_piece((1, 5), 'k')
+        self.assertEqual(self.tablebase.probe(board.board, WHITE), TablebaseResult('win', 1))
+        self.assertEqual(self.tablebase.probe(board.board, BLACK), TablebaseResult('win', 1))
+        self.assertEqual(self.tablebase.probe(board.board, 'white'), TablebaseResult('win', 1))
+
+    def test_distant_kings_draw(self):
+        """Test bare kings that cannot reach each other draw."""
+        board = empty_board()
+        board.set_piece((0, 0), 'K')
+        board.set_piece((7, 7), 'k')
+        self.assertEqual(self.tablebase.probe(board.board, WHITE), TablebaseResult('draw', 0))
+
+    def test_uncovered_positions(self):
+        """Test missing tables and large material return None."""
+        self.assertIsNone(self.tablebase.probe(ChessBoard().board, WHITE))
+        board = empty_board()
+        board.set_piece((0, 0), 'K')
+        board.set_piece((3, 3), 'Q')
+        board.set_piece((7, 7), 'k')
+        self.assertFalse(self.tablebase.has_table('KQvK'))
+        self.assertIsNone(self.tablebase.probe(board.board, WHITE))
+
+    def test_parallel_scan_matches(self):
+        """Test the multi-process scan writes an identical table."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = generate_table('KvK', directory, processes=2)
+            with open(path, 'rb') as parallel, open(os.path.join(self.directory.name, 'KvK.ctb'), 'rb') as serial:
+                self.assertEqual(parallel.read(), serial.read())
+
+
+def position(pieces):
+    """Return an otherwise empty board with {(row, col): symbol} placed."""
+    board = empty_board()
+    for square, symbol in pieces.items():
+        board.set_piece(square, symbol)
+    return board.board
+
+
+class TestTablebaseDistances(unittest.TestCase):
+    """Test distances to a king capture in a pawn ending."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Generate KPvK (and its KvK sub-table) once."""
+        cls.directory = tempfile.TemporaryDirectory()
+        generate_table('KPvK', cls.directory.name)
+        cls.tablebase = Tablebase(cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tablebase.close()
+        cls.directory.cleanup()
+
+    def test_cornered_king(self):
+        """Test every flight square covered loses in two and the quiet move before wins in three."""
+        board = position({(7, 0): 'k', (6, 2): 'K', (5, 1): 'P'})
+        self.assertEqual(self.tablebase.probe(board, BLACK), TablebaseResult('loss', 2))
+        self.assertEqual(self.tablebase.probe(board, WHITE), TablebaseResult('win', 3))
+
+    def test_black_pawn_is_mirrored(self):
+        """Test Black's pawn probes the mirrored White-pawn slot with the same distances."""
+        board = position({(0, 0): 'K', (1, 2): 'k', (2, 1): 'p'})
+        self.assertEqual(self.tablebase.probe(board, WHITE), TablebaseResult('loss', 2))
+        self.assertEqual(self.tablebase.probe(board, BLACK), TablebaseResult('win', 3))
+
+    def test_pawn_captures_forward_only(self):
+        """Test pawns capture towards the opponent for either color."""
+        ahead = position({(0, 0): 'K', (5, 3): 'P', (6, 4): 'k'})
+        self.assertEqual(self.tablebase.probe(ahead, WHITE), TablebaseResult('win', 1))
+        behind = position({(0, 0): 'K', (5, 3): 'P', (4, 4): 'k'})
+        self.assertEqual(self.tablebase.probe(behind, WHITE), TablebaseResult('draw', 0))
+        black_ahead = position({(7, 7): 'k', (2, 3): 'p', (1, 4): 'K'})
+        self.assertEqual(self.tablebase.probe(black_ahead, BLACK), TablebaseResult('win', 1))
+        black_behind = position({(7, 7): 'k', (2, 3): 'p', (3, 4): 'K'})
+        self.assertEqual(self.tablebase.probe(black_behind, BLACK), TablebaseResult('draw', 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
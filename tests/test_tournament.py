@@ -0,0 +1,115 @@
+import unittest
+import math
+import os
+import sys
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from engine.player import Player, validate_config
+from engine.tournament import (
+    elo_from_score, format_standings, gauntlet, play_game, round_robin, run_tournament, standings,
+)
+from board.chess_board import ChessBoard
+from notation.archive import ArchiveGame, move_name, read_jsonl, replay_game
+from pieces.piece_codes import WHITE
+
+RANDOM = {'name': 'random', 'kind': 'random'}
+SEARCH = {'name': 'depth1', 'depth': 1}
+
+
+def result_game(white, black, result):
+    return ArchiveGame([], result, {'white': white, 'black': black})
+
+
+class TestPairings(unittest.TestCase):
+    """Test tournament schedules."""
+
+    def test_round_robin_alternates_colors(self):
+        """Test every pair meets once per round with colors swapped each round."""
+        pairings = round_robin(['a', 'b', 'c'], rounds=2)
+        self.assertEqual(len(pairings), 6)
+        self.assertIn((0, 'a', 'b'), pairings)
+        self.assertIn((1, 'b', 'a'), pairings)
+        for name in 'abc':
+            as_white = sum(1 for _, white, _ in pairings if white == name)
+            self.assertEqual(as_white, 2)
+
+    def test_gauntlet(self):
+        """Test the champion meets each opponent, alternating colors."""
+        pairings = gauntlet('a', ['a', 'b', 'c'], rounds=2)
+        self.assertEqual(pairings, [(0, 'a', 'b'), (0, 'a', 'c'), (1, 'b', 'a'), (1, 'c', 'a')])
+
+
+class TestGames(unittest.TestCase):
+    """Test playing games between player configurations."""
+
+    def test_player_config_errors(self):
+        """Test configurations without a name or with an unknown kind are rejected."""
+        with self.assertRaises(ValueError):
+            validate_config({'kind': 'random'})
+        with self.assertRaises(ValueError):
+            validate_config({'name': 'x', 'kind': 'oracle'})
+
+    def test_search_player_takes_hanging_king(self):
+        """Test a search player captures an undefended king."""
+        board = ChessBoard()
+        board.clear()
+        board.set_piece((0, 0), 'K')
+        board.set_piece((3, 3), 'R')
+        board.set_piece((3, 7), 'k')
+        self.assertEqual(Player(SEARCH).choose_move(board.board, WHITE), ((3, 3), (3, 7)))
+
+    def test_games_are_reproducible_and_legal(self):
+        """Test a seeded game replays to the same result under the rules."""
+        moves, result, termination = play_game(RANDOM, RANDOM, max_plies=60, seed=4)
+        self.assertEqual(play_game(RANDOM, RANDOM, max_plies=60, seed=4), (moves, result, termination))
+        self.assertLessEqual(len(moves), 60)
+        if termination == 'ply limit':
+            self.assertEqual(result, '1/2-1/2')
+        session, complete = replay_game(ArchiveGame([move_name(move) for move in moves], result, {}))
+        self.assertTrue(complete)
+        self.assertEqual(session.result() if session.is_over else '1/2-1/2', result)
+
+
+class TestTournament(unittest.TestCase):
+    """Test running tournaments and rating the players."""
+
+    def test_elo_from_score(self):
+        """Test the logistic Elo curve."""
+        self.assertEqual(elo_from_score(0.5), 0.0)
+        self.assertAlmostEqual(elo_from_score(0.75), 190.85, places=2)
+        self.assertEqual(elo_from_score(1.0), math.inf)
+
+    def test_standings(self):
+        """Test scores, Elo and error bars from game results."""
+        games = [result_game('a', 'b', '1-0'), result_game('b', 'a', '1/2-1/2'),
+                 result_game('a', 'b', '0-1'), result_game('b', 'a', '0-1')]
+        table = standings(games)
+        self.assertEqual([row.name for row in table], ['a', 'b'])
+        first = table[0]
+        self.assertEqual((first.games, first.wins, first.draws, first.losses, first.score), (4, 2, 1, 1, 2.5))
+        self.assertAlmostEqual(first.elo, elo_from_score(2.5 / 4))
+        self.assertAlmostEqual(table[1].elo, -first.elo)
+        self.assertGreater(first.error, 0)
+
+    def test_run_tournament_streams_results(self):
+        """Test every pairing is played and written to the JSONL file."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results.jsonl')
+            seen = []
+            pairings = round_robin(['random', 'depth1'], rounds=2)
+            games, elapsed = run_tournament([RANDOM, SEARCH], pairings, path, max_plies=40,
+                                            processes=2, seed=1, on_result=seen.append)
+            self.assertEqual(len(games), 2)
+            self.assertEqual(seen, games)
+            self.assertEqual(sorted(read_jsonl(path), key=lambda game: game.tags['game']),
+                             sorted(games, key=lambda game: game.tags['game']))
+        self.assertEqual({(game.tags['white'], game.tags['black']) for game in games},
+                         {('random', 'depth1'), ('depth1', 'random')})
+        self.assertIn("2 games", format_standings(standings(games), games, elapsed))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+import unittest
+import os
+import sys
+import tempfile
+from array import array
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from analytics.dedup import replay_positions
+from analytics.npy import NpyFile, read_header, write_npy
+from analytics.training_data import (
+    PLANES, TrainingData, board_planes, export_archives, game_result,
+)
+from board.chess_board import ChessBoard
+from notation.archive import ArchiveGame, random_games, write_archive
+from pieces.piece_codes import BLACK, WHITE
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def expected_rows(games):
+    """Rows computed directly from the replayed boards."""
+    rows = []
+    for game in games:
+        positions = [(board_planes(board), side) for _, board, side, _ in replay_positions(game)]
+        _, board, side, _ = list(replay_positions(game))[-1]
+        result = game_result(board, side, game.result)
+        rows.extend((tuple(planes), side, result, ply) for ply, (planes, side) in enumerate(positions))
+    return rows
+
+
+class TestNpy(unittest.TestCase):
+    """Test the .npy writer and reader."""
+
+    def test_round_trip(self):
+        """Test values and shape survive a write and a memory-mapped read."""
+        values = array('Q', [0, 1, 2 ** 64 - 1, 12345678901234, 5, 6])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'values.npy')
+            write_npy(path, values, (3, 2))
+            with open(path, 'rb') as handle:
+                data = handle.read()
+            npy = NpyFile(path)
+            self.assertEqual((npy.typecode, npy.shape, len(npy)), ('Q', (3, 2), 3))
+            self.assertEqual(list(npy.values), list(values))
+            npy.close()
+        typecode, shape, offset = read_header(data)
+        self.assertEqual(offset % 64, 0)
+        self.assertEqual(len(data), offset + 6 * 8)
+
+    def test_shape_mismatch(self):
+        """Test a shape that does not match the values raises ValueError."""
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(ValueError):
+                write_npy(os.path.join(directory, 'bad.npy'), array('b', [1, 2, 3]), (2, 2))
+
+    def test_rejects_other_files(self):
+        """Test a file without the magic raises ValueError."""
+        with self.assertRaises(ValueError):
+            read_header(b'not an npy file')
+
+
+class TestTrainingData(unittest.TestCase):
+    """Test exporting games as training shards."""
+
+    def test_board_planes(self):
+        """Test the starting position packs into the expected bitboards."""
+        planes = board_planes(ChessBoard().board)
+        self.assertEqual(planes[0], 0xFF00)
+        self.assertEqual(planes[6], 0xFF << 48)
+        self.assertEqual(sum(bin(plane).count('1') for plane in planes), 32)
+        for first in range(PLANES):
+            for second in range(first + 1, PLANES):
+                self.assertEqual(planes[first] & planes[second], 0)
+
+    def test_game_result(self):
+        """Test a captured king decides the label before the result tag."""
+        board = ChessBoard().board
+        self.assertEqual(game_result(board, WHITE, '0-1'), -1)
+        self.assertEqual(game_result(board, WHITE, '*'), 0)
+        board[7][4] = 0
+        self.assertEqual(game_result(board, BLACK, '*'), 1)
+
+    def test_export_and_read(self):
+        """Test every replayed position is exported, in order, across shards."""
+        games = random_games(12, seed=5)
+        with tempfile.TemporaryDirectory() as directory:
+            archive = os.path.join(directory, 'games.jsonl')
+            write_archive(archive, games)
+            output = os.path.join(directory, 'shards')
+            report = export_archives([archive], output, shard_rows=50)
+            expected = expected_rows(games)
+            self.assertEqual((report.games, report.positions), (12, len(expected)))
+            self.assertEqual(report.shards, -(-len(expected) // 50))
+            with TrainingData(output) as data:
+                self.assertEqual(len(data), len(expected))
+                self.assertEqual([data.position(index) for index in range(len(data))], expected)
+                sides = []
+                for batch in data.batches(16):
+                    self.assertEqual(len(batch['planes']), len(batch['side']) * PLANES)
+                    sides.extend(batch['side'])
+                self.assertEqual(sides, [row[1] for row in expected])
+                with self.assertRaises(IndexError):
+                    data.position(len(expected))
+
+    def test_close_with_live_batches(self):
+        """Test leaving the with block while a batch is still referenced."""
+        with tempfile.TemporaryDirectory() as directory:
+            archive = os.path.join(directory, 'games.jsonl')
+            write_archive(archive, random_games(2, seed=4))
+            export_archives([archive], directory, shard_rows=20)
+            with TrainingData(directory) as data:
+                for batch in data.batches(8):
+                    pass
+                sides = list(batch['side'])
+            self.assertEqual(list(batch['side']), sides)
+            self.assertEqual(data.shards, [])
+            data.close()
+
+    def test_parallel_export_matches(self):
+        """Test several worker processes write the same rows as one."""
+        games = random_games(10, seed=9)
+        with tempfile.TemporaryDirectory() as directory:
+            archive = os.path.join(directory, 'games.jsonl')
+            write_archive(archive, games + [ArchiveGame(['e2e4', 'zz'], '*', {})])
+            rows = []
+            for processes in (1, 2):
+                output = os.path.join(directory, f'shards-{processes}')
+                export_archives([archive], output, processes=processes, shard_rows=40, chunk_bytes=512)
+                with TrainingData(output) as data:
+                    rows.append([data.position(index) for index in range(len(data))])
+            self.assertEqual(rows[0], rows[1])
+            self.assertEqual(rows[0][-2:], expected_rows(games[-1:] + [ArchiveGame(['e2e4', 'zz'], '*', {})])[-2:])
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_numpy_reads_shards(self):
+        """Test numpy memory-maps the exported files."""
+        games = random_games(3, seed=1)
+        with tempfile.TemporaryDirectory() as directory:
+            archive = os.path.join(directory, 'games.jsonl')
+            write_archive(archive, games)
+            export_archives([archive], directory)
+            planes = numpy.load(os.path.join(directory, 'part-00000-0000.planes.npy'), mmap_mode='r')
+            result = numpy.load(os.path.join(directory, 'part-00000-0000.result.npy'), mmap_mode='r')
+            expected = expected_rows(games)
+            self.assertEqual(planes.shape, (len(expected), PLANES))
+            self.assertEqual(planes.dtype, numpy.uint64)
+            self.assertEqual([tuple(int(value) for value in row) for row in planes], [row[0] for row in expected])
+            self.assertEqual(result.tolist(), [row[2] for row in expected])
+            del planes, result
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from analytics.pipeline import plan_tasks
+from analytics.validation_job import (
+    AFTER_GAME_OVER, UNPARSEABLE, CheckpointMismatchError, format_report, main, run_job, validate_game,
+)
+from notation.archive import ArchiveGame, random_games, write_archive
+
+
+class TestValidateGame(unittest.TestCase):
+    """Test replaying one game through ChessBoard.validate_move."""
+
+    def test_legal_game(self):
+        """Test a legal game validates every move."""
+        self.assertEqual(validate_game(['e2e4', 'e7e5', 'Nf3']), (3, None))
+
+    def test_first_illegal_move(self):
+        """Test the first rejected move is reported with its ply and error."""
+        validated, bad = validate_game(['e2e4', 'e7e5', 'e4e6', 'd7d5'])
+        self.assertEqual(validated, 3)
+        self.assertEqual(bad[:2], (2, 'e4e6'))
+        self.assertIn('Invalid move', bad[2])
+        self.assertEqual(validate_game(['e2e4', 'zz'])[1], (1, 'zz', UNPARSEABLE))
+
+    def test_move_after_king_capture(self):
+        """Test moves recorded after a king capture are illegal."""
+        game = random_games(1, seed=5)[0]
+        validated, bad = validate_game(game.moves)
+        self.assertIsNone(bad)
+        self.assertLess(validated, 120)  # the game ended with a king capture
+        self.assertEqual(validate_game(game.moves + ['a2a3'])[1][2], AFTER_GAME_OVER)
+
+
+class TestValidationJob(unittest.TestCase):
+    """Test chunked, checkpointed batch validation."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.games = random_games(12, max_plies=40)
+        self.games[4] = ArchiveGame(self.games[4].moves[:3] + ['a1a8'], '*', {})
+        self.games[9] = ArchiveGame(['e2e4', 'e2e4'], '*', {})
+        self.archive = self.path('games.jsonl')
+        write_archive(self.archive, self.games)
+        self.chunk_bytes = os.path.getsize(self.archive) // 5 + 1
+        self.checkpoint = self.path('job.json')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_full_run(self):
+        """Test every game is validated and the illegal ones are located."""
+        report = run_job([self.archive], chunk_bytes=self.chunk_bytes)
+        self.assertTrue(report.complete)
+        self.assertEqual(report.games, 12)
+        self.assertEqual(report.illegal, 2)
+        self.assertEqual(sorted((example.game, example.ply) for example in report.examples), [(5, 3), (10, 1)])
+        self.assertEqual(sum(report.errors.values()), 2)
+        self.assertIn('games with an illegal move', format_report(report))
+
+    def test_resume_matches_full_run(self):
+        """Test an interrupted job resumes where its checkpoint left off."""
+        full = run_job([self.archive], chunk_bytes=self.chunk_bytes)
+        progress = []
+        first = run_job([self.archive], self.checkpoint, chunk_bytes=self.chunk_bytes, checkpoint_seconds=0,
+                        max_chunks=2, on_chunk=lambda result, finished, total: progress.append(finished))
+        self.assertFalse(first.complete)
+        self.assertEqual(progress, [1, 2])
+        with open(self.checkpoint) as handle:
+            self.assertEqual(len(json.load(handle)['chunks']), 2)
+
+        second = run_job([self.archive], self.checkpoint, chunk_bytes=self.chunk_bytes)
+        self.assertTrue(second.complete)
+        self.assertEqual(second.resumed, 2)
+        self.assertEqual(second.run_moves, full.moves - first.moves)
+        self.assertEqual(second.done, len(plan_tasks([self.archive], self.chunk_bytes)))
+        self.assertEqual((second.games, second.moves, second.illegal, second.errors, second.examples),
+                         (full.games, full.moves, full.illegal, full.errors, full.examples))
+        with open(self.checkpoint) as handle:
+            self.assertTrue(json.load(handle)['complete'])
+
+    def test_checkpoint_for_other_job(self):
+        """Test a checkpoint is not resumed for changed archives or chunking."""
+        run_job([self.archive], self.checkpoint, chunk_bytes=self.chunk_bytes, max_chunks=1)
+        with self.assertRaises(CheckpointMismatchError):
+            run_job([self.archive], self.checkpoint, chunk_bytes=self.chunk_bytes * 2)
+        write_archive(self.archive, self.games[:6])
+        with self.assertRaises(CheckpointMismatchError):
+            run_job([self.archive], self.checkpoint, chunk_bytes=self.chunk_bytes)
+
+    def test_worker_errors_are_not_usage_errors(self):
+        """Test a ValueError from reading an archive propagates instead of printing usage."""
+        with open(self.archive, 'a') as handle:
+            handle.write('{"moves": "not a list"}\n')
+        with self.assertRaises(ValueError) as caught:
+            main([self.archive, '-j', '1'])
+        self.assertNotIsInstance(caught.exception, CheckpointMismatchError)
+
+    def test_mismatched_checkpoint_is_a_usage_error(self):
+        """Test the command line reports a foreign checkpoint as a usage error."""
+        run_job([self.archive], self.checkpoint, chunk_bytes=self.chunk_bytes, max_chunks=1)
+        with open(os.devnull, 'w') as devnull, redirect_stderr(devnull), redirect_stdout(devnull):
+            with self.assertRaises(SystemExit) as caught:
+                main([self.archive, '--checkpoint', self.checkpoint, '-j', '1'])
+        self.assertEqual(caught.exception.code, 2)
+
+    def test_process_pool(self):
+        """Test workers in a pool produce the same totals."""
+        serial = run_job([self.archive], chunk_bytes=self.chunk_bytes)
+        parallel = run_job([self.archive], processes=2, chunk_bytes=self.chunk_bytes)
+        self.assertEqual((parallel.games, parallel.moves, parallel.illegal, parallel.examples),
+                         (serial.games, serial.moves, serial.illegal, serial.examples))
+
+
+if __name__ == '__main__':
+    unittest.main()